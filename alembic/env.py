@@ -42,6 +42,22 @@ plans_spec = importlib.util.spec_from_file_location(
 plans_models = importlib.util.module_from_spec(plans_spec)
 plans_spec.loader.exec_module(plans_models)
 
+# Import shared models (job checkpoints)
+shared_spec = importlib.util.spec_from_file_location(
+    "shared_models",
+    os.path.join(os.path.dirname(os.path.dirname(__file__)), "src", "shared", "infrastructure", "database", "models.py")
+)
+shared_models = importlib.util.module_from_spec(shared_spec)
+shared_spec.loader.exec_module(shared_models)
+
+# Import orchestration models (onboarding workflow queue)
+orchestration_spec = importlib.util.spec_from_file_location(
+    "orchestration_models",
+    os.path.join(os.path.dirname(os.path.dirname(__file__)), "src", "orchestration", "infrastructure", "database", "models.py")
+)
+orchestration_models = importlib.util.module_from_spec(orchestration_spec)
+orchestration_spec.loader.exec_module(orchestration_models)
+
 
 config = context.config
 
@@ -0,0 +1,47 @@
+"""add_feature_usage_events_and_rollups
+
+Revision ID: 09ac21ef116a
+Revises: ef1b72b2daf8
+Create Date: 2026-10-18 09:12:40.118204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '09ac21ef116a'
+down_revision = 'ef1b72b2daf8'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('feature_usage_events',
+    sa.Column('id', sa.BigInteger(), sa.Identity(), nullable=False),
+    sa.Column('occurred_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('organization_id', sa.UUID(), nullable=False),
+    sa.Column('feature_name', sa.String(length=100), nullable=False),
+    sa.Column('amount', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('id', 'occurred_at'),
+    schema='contas'
+    )
+    op.create_index('ix_usage_event_org_feature_time', 'feature_usage_events', ['organization_id', 'feature_name', 'occurred_at'], unique=False, schema='contas')
+    for table_name in ('feature_usage_hourly', 'feature_usage_daily'):
+        op.create_table(table_name,
+        sa.Column('organization_id', sa.UUID(), nullable=False),
+        sa.Column('feature_name', sa.String(length=100), nullable=False),
+        sa.Column('bucket_start', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('total_usage', sa.BigInteger(), nullable=False),
+        sa.Column('event_count', sa.Integer(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('organization_id', 'feature_name', 'bucket_start'),
+        schema='contas'
+        )
+
+
+def downgrade() -> None:
+    op.drop_table('feature_usage_daily', schema='contas')
+    op.drop_table('feature_usage_hourly', schema='contas')
+    op.drop_index('ix_usage_event_org_feature_time', table_name='feature_usage_events', schema='contas')
+    op.drop_table('feature_usage_events', schema='contas')
@@ -0,0 +1,41 @@
+"""add_job_checkpoints_table
+
+Revision ID: 20fefa2d8dae
+Revises: 09ac21ef116a
+Create Date: 2026-10-18 11:03:27.540911
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '20fefa2d8dae'
+down_revision = '09ac21ef116a'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('job_checkpoints',
+    sa.Column('job_name', sa.String(length=100), nullable=False),
+    sa.Column('run_key', sa.String(length=100), nullable=False),
+    sa.Column('cursor', sa.String(length=255), nullable=True),
+    sa.Column('processed', sa.Integer(), nullable=False),
+    sa.Column('affected', sa.Integer(), nullable=False),
+    sa.Column('is_completed', sa.Boolean(), nullable=False),
+    sa.Column('details', postgresql.JSON(astext_type=sa.Text()), nullable=False),
+    sa.Column('started_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('completed_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    schema='contas'
+    )
+    op.create_index(op.f('ix_contas_job_checkpoints_job_name'), 'job_checkpoints', ['job_name'], unique=True, schema='contas')
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_contas_job_checkpoints_job_name'), table_name='job_checkpoints', schema='contas')
+    op.drop_table('job_checkpoints', schema='contas')
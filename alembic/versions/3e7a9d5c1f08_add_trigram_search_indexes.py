@@ -0,0 +1,60 @@
+"""add_trigram_search_indexes
+
+Revision ID: 3e7a9d5c1f08
+Revises: 8b1d4f2e6a9c
+Create Date: 2026-10-18 18:05:37.402119
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '3e7a9d5c1f08'
+down_revision = '8b1d4f2e6a9c'
+branch_labels = None
+depends_on = None
+
+# (index, table, column) searched with ILIKE '%term%'
+TRIGRAM_INDEXES = [
+    ('ix_users_email_trgm', 'users', 'email'),
+    ('ix_users_name_trgm', 'users', 'name'),
+    ('ix_organizations_name_trgm', 'organizations', 'name'),
+    ('ix_plans_name_trgm', 'plans', 'name'),
+    ('ix_plans_description_trgm', 'plans', 'description'),
+    ('ix_authorization_permissions_name_trgm', 'authorization_permissions', 'name'),
+    ('ix_authorization_permissions_description_trgm', 'authorization_permissions', 'description'),
+    ('ix_authorization_policies_name_trgm', 'authorization_policies', 'name'),
+    ('ix_authorization_policies_description_trgm', 'authorization_policies', 'description'),
+    ('ix_authorization_policies_resource_type_trgm', 'authorization_policies', 'resource_type'),
+    ('ix_authorization_policies_action_trgm', 'authorization_policies', 'action'),
+]
+
+
+def upgrade() -> None:
+    is_postgresql = op.get_bind().dialect.name == 'postgresql'
+    if not is_postgresql:
+        # Plain index elsewhere (SQLite in tests)
+        for index_name, table_name, column_name in TRIGRAM_INDEXES:
+            op.create_index(index_name, table_name, [column_name], unique=False, schema='contas')
+        return
+
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+    # Built concurrently so the tables stay writable; CONCURRENTLY cannot run in a transaction
+    with op.get_context().autocommit_block():
+        for index_name, table_name, column_name in TRIGRAM_INDEXES:
+            op.create_index(index_name, table_name, [column_name], unique=False, schema='contas',
+                            postgresql_using='gin', postgresql_ops={column_name: 'gin_trgm_ops'},
+                            postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        for index_name, table_name, _ in reversed(TRIGRAM_INDEXES):
+            op.drop_index(index_name, table_name=table_name, schema='contas')
+        return
+
+    with op.get_context().autocommit_block():
+        for index_name, table_name, _ in reversed(TRIGRAM_INDEXES):
+            op.drop_index(index_name, table_name=table_name, schema='contas',
+                          postgresql_concurrently=True)
@@ -0,0 +1,54 @@
+"""add_effective_user_permissions_table
+
+Revision ID: 5c3e81b0d4a7
+Revises: 20fefa2d8dae
+Create Date: 2026-10-18 13:21:05.370412
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5c3e81b0d4a7'
+down_revision = '20fefa2d8dae'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('effective_user_permissions',
+    sa.Column('id', sa.BigInteger(), sa.Identity(), nullable=False),
+    sa.Column('user_id', sa.UUID(), nullable=False),
+    sa.Column('organization_id', sa.UUID(), nullable=True),
+    sa.Column('permission_key', sa.String(length=150), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    schema='contas'
+    )
+    op.create_index('ix_effective_permission_lookup', 'effective_user_permissions', ['user_id', 'organization_id', 'permission_key'], unique=True, schema='contas')
+    # Backfill from the current assignments; later writes keep it in sync
+    op.execute("""
+        WITH RECURSIVE granted_roles(user_id, organization_id, role_id, depth) AS (
+            SELECT a.user_id, a.organization_id, a.role_id, 0
+            FROM contas.user_role_assignments a
+            JOIN contas.authorization_roles r ON r.id = a.role_id
+            WHERE a.is_active AND r.is_active
+            UNION
+            SELECT g.user_id, g.organization_id, parent.id, g.depth + 1
+            FROM granted_roles g
+            JOIN contas.authorization_roles child ON child.id = g.role_id
+            JOIN contas.authorization_roles parent ON parent.id = child.parent_role_id
+            WHERE parent.is_active AND g.depth < 10
+        )
+        INSERT INTO contas.effective_user_permissions (user_id, organization_id, permission_key)
+        SELECT DISTINCT g.user_id, g.organization_id, p.resource_type || ':' || lower(CAST(p.action AS VARCHAR))
+        FROM granted_roles g
+        JOIN contas.role_permissions rp ON rp.role_id = g.role_id
+        JOIN contas.authorization_permissions p ON p.id = rp.permission_id
+        WHERE p.is_active
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_effective_permission_lookup', table_name='effective_user_permissions', schema='contas')
+    op.drop_table('effective_user_permissions', schema='contas')
@@ -0,0 +1,43 @@
+"""add_application_api_keys_table
+
+Revision ID: 8b1d4f2e6a9c
+Revises: 5c3e81b0d4a7
+Create Date: 2026-10-18 16:42:10.118305
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '8b1d4f2e6a9c'
+down_revision = '5c3e81b0d4a7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('application_api_keys',
+    sa.Column('application_instance_id', sa.UUID(), nullable=False),
+    sa.Column('key_type', sa.String(length=50), nullable=False),
+    sa.Column('key_prefix', sa.String(length=32), nullable=False),
+    sa.Column('key_digest', sa.String(length=64), nullable=False),
+    sa.Column('is_active', sa.Boolean(), nullable=False),
+    sa.Column('expires_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('revoked_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('created_by', sa.UUID(), nullable=True),
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['application_instance_id'], ['contas.application_instances.id'], ),
+    sa.ForeignKeyConstraint(['created_by'], ['contas.users.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    schema='contas'
+    )
+    op.create_index('ix_application_api_keys_prefix', 'application_api_keys', ['key_prefix'], unique=True, schema='contas')
+    op.create_index(op.f('ix_contas_application_api_keys_application_instance_id'), 'application_api_keys', ['application_instance_id'], unique=False, schema='contas')
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_contas_application_api_keys_application_instance_id'), table_name='application_api_keys', schema='contas')
+    op.drop_index('ix_application_api_keys_prefix', table_name='application_api_keys', schema='contas')
+    op.drop_table('application_api_keys', schema='contas')
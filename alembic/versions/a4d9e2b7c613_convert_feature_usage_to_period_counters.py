@@ -0,0 +1,65 @@
+"""convert_feature_usage_to_period_counters
+
+Revision ID: a4d9e2b7c613
+Revises: f3a8c6d2b915
+Create Date: 2026-10-18 23:31:47.150284
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = 'a4d9e2b7c613'
+down_revision = 'f3a8c6d2b915'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('feature_usage', sa.Column('usage_period', sa.String(length=20), nullable=True), schema='contas')
+    op.add_column('feature_usage', sa.Column('period_start', sa.DateTime(timezone=True), nullable=True), schema='contas')
+    op.add_column('feature_usage', sa.Column('period_end', sa.DateTime(timezone=True), nullable=True), schema='contas')
+    op.add_column('feature_usage', sa.Column('current_usage', sa.Integer(), nullable=True), schema='contas')
+    op.add_column('feature_usage', sa.Column('limit_value', sa.Integer(), nullable=True), schema='contas')
+    op.add_column('feature_usage', sa.Column('metadata', postgresql.JSON(astext_type=sa.Text()), nullable=True), schema='contas')
+
+    # Each per-day row of the old schema becomes a daily counter
+    op.execute("""
+        UPDATE contas.feature_usage
+        SET usage_period = 'daily',
+            period_start = date_trunc('day', usage_date),
+            period_end = date_trunc('day', usage_date) + interval '1 day' - interval '1 microsecond',
+            current_usage = usage_count,
+            limit_value = -1,
+            metadata = usage_details
+    """)
+
+    for column in ('usage_period', 'period_start', 'period_end', 'current_usage', 'limit_value', 'metadata'):
+        op.alter_column('feature_usage', column, nullable=False, schema='contas')
+
+    # Old per-day columns are kept for history but no longer written
+    op.drop_index('ix_usage_lookup', table_name='feature_usage', schema='contas')
+    for column in ('resource_type', 'usage_count', 'usage_date', 'usage_details'):
+        op.alter_column('feature_usage', column, nullable=True, schema='contas')
+
+    op.create_index('ix_feature_usage_counter', 'feature_usage', ['organization_id', 'feature_name', 'usage_period', 'period_start'], unique=False, schema='contas')
+    op.create_index('ix_feature_usage_period_id', 'feature_usage', ['usage_period', 'period_start', 'id'], unique=False, schema='contas')
+
+
+def downgrade() -> None:
+    op.drop_index('ix_feature_usage_period_id', table_name='feature_usage', schema='contas')
+    op.drop_index('ix_feature_usage_counter', table_name='feature_usage', schema='contas')
+
+    # Counters written after the upgrade have no per-day columns
+    op.execute("DELETE FROM contas.feature_usage WHERE usage_date IS NULL")
+    for column in ('resource_type', 'usage_count', 'usage_date', 'usage_details'):
+        op.alter_column('feature_usage', column, nullable=False, schema='contas')
+    op.create_index('ix_usage_lookup', 'feature_usage', ['organization_id', 'resource_type', 'usage_date'], unique=False, schema='contas')
+
+    op.drop_column('feature_usage', 'metadata', schema='contas')
+    op.drop_column('feature_usage', 'limit_value', schema='contas')
+    op.drop_column('feature_usage', 'current_usage', schema='contas')
+    op.drop_column('feature_usage', 'period_end', schema='contas')
+    op.drop_column('feature_usage', 'period_start', schema='contas')
+    op.drop_column('feature_usage', 'usage_period', schema='contas')
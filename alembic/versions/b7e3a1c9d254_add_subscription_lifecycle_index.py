@@ -0,0 +1,23 @@
+"""add_subscription_lifecycle_index
+
+Revision ID: b7e3a1c9d254
+Revises: d42f6b8e0c15
+Create Date: 2026-10-18 21:14:52.118304
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'b7e3a1c9d254'
+down_revision = 'd42f6b8e0c15'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_subscriptions_status_ends_at', 'subscriptions', ['status', 'ends_at'], unique=False, schema='contas')
+
+
+def downgrade() -> None:
+    op.drop_index('ix_subscriptions_status_ends_at', table_name='subscriptions', schema='contas')
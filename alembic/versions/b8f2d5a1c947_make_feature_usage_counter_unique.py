@@ -0,0 +1,37 @@
+"""make_feature_usage_counter_unique
+
+Revision ID: b8f2d5a1c947
+Revises: a4d9e2b7c613
+Create Date: 2026-10-19 09:12:38.540127
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'b8f2d5a1c947'
+down_revision = 'a4d9e2b7c613'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Resets used to move every counter of a feature onto the current period;
+    # keep the highest counter of each period
+    op.execute("""
+        DELETE FROM contas.feature_usage AS duplicate
+        USING contas.feature_usage AS kept
+        WHERE duplicate.organization_id = kept.organization_id
+          AND duplicate.feature_name = kept.feature_name
+          AND duplicate.usage_period = kept.usage_period
+          AND duplicate.period_start = kept.period_start
+          AND (duplicate.current_usage, duplicate.id) < (kept.current_usage, kept.id)
+    """)
+
+    op.drop_index('ix_feature_usage_counter', table_name='feature_usage', schema='contas')
+    op.create_index('ix_feature_usage_counter', 'feature_usage', ['organization_id', 'feature_name', 'usage_period', 'period_start'], unique=True, schema='contas')
+
+
+def downgrade() -> None:
+    op.drop_index('ix_feature_usage_counter', table_name='feature_usage', schema='contas')
+    op.create_index('ix_feature_usage_counter', 'feature_usage', ['organization_id', 'feature_name', 'usage_period', 'period_start'], unique=False, schema='contas')
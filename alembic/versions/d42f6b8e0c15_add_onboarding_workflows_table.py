@@ -0,0 +1,46 @@
+"""add_onboarding_workflows_table
+
+Revision ID: d42f6b8e0c15
+Revises: 3e7a9d5c1f08
+Create Date: 2026-10-18 19:12:48.530614
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = 'd42f6b8e0c15'
+down_revision = '3e7a9d5c1f08'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('onboarding_workflows',
+    sa.Column('id', sa.String(length=36), nullable=False),
+    sa.Column('tenant_id', sa.String(length=36), nullable=False),
+    sa.Column('user_id', sa.String(length=36), nullable=False),
+    sa.Column('plan_id', sa.String(length=36), nullable=False),
+    sa.Column('tenant_name', sa.String(length=255), nullable=False),
+    sa.Column('tenant_domain', sa.String(length=255), nullable=True),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('completed_steps', postgresql.JSON(astext_type=sa.Text()), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('max_attempts', sa.Integer(), nullable=False),
+    sa.Column('next_attempt_at', sa.DateTime(), nullable=True),
+    sa.Column('locked_by', sa.String(length=100), nullable=True),
+    sa.Column('locked_until', sa.DateTime(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.Column('completed_at', sa.DateTime(), nullable=True),
+    sa.Column('error_message', sa.Text(), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    schema='contas'
+    )
+    op.create_index('ix_onboarding_workflows_queue', 'onboarding_workflows', ['status', 'next_attempt_at'], unique=False, schema='contas')
+
+
+def downgrade() -> None:
+    op.drop_index('ix_onboarding_workflows_queue', table_name='onboarding_workflows', schema='contas')
+    op.drop_table('onboarding_workflows', schema='contas')
@@ -0,0 +1,25 @@
+"""add_assignment_expiry_indexes
+
+Revision ID: e5c92f4a7d18
+Revises: b7e3a1c9d254
+Create Date: 2026-10-18 22:02:41.583920
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'e5c92f4a7d18'
+down_revision = 'b7e3a1c9d254'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(op.f('ix_contas_user_organization_roles_expires_at'), 'user_organization_roles', ['expires_at'], unique=False, schema='contas')
+    op.create_index(op.f('ix_contas_user_role_assignments_expires_at'), 'user_role_assignments', ['expires_at'], unique=False, schema='contas')
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_contas_user_role_assignments_expires_at'), table_name='user_role_assignments', schema='contas')
+    op.drop_index(op.f('ix_contas_user_organization_roles_expires_at'), table_name='user_organization_roles', schema='contas')
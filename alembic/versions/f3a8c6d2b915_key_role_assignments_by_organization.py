@@ -0,0 +1,38 @@
+"""key_role_assignments_by_organization
+
+Revision ID: f3a8c6d2b915
+Revises: e5c92f4a7d18
+Create Date: 2026-10-18 23:05:12.402716
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'f3a8c6d2b915'
+down_revision = 'e5c92f4a7d18'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Default roles are shared templates: (user_id, role_id) repeats across organizations
+    op.add_column('user_role_assignments', sa.Column('id', sa.UUID(), server_default=sa.text('gen_random_uuid()'), nullable=False), schema='contas')
+    op.drop_constraint('user_role_assignments_pkey', 'user_role_assignments', type_='primary', schema='contas')
+    op.create_primary_key('user_role_assignments_pkey', 'user_role_assignments', ['id'], schema='contas')
+    op.create_unique_constraint('uq_user_role_assignments_user_role_organization', 'user_role_assignments', ['user_id', 'role_id', 'organization_id'], schema='contas', postgresql_nulls_not_distinct=True)
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_user_role_assignments_user_role_organization', 'user_role_assignments', type_='unique', schema='contas')
+    # The old key allows one organization per (user_id, role_id): keep the oldest assignment
+    op.execute("""
+        DELETE FROM contas.user_role_assignments a
+        USING contas.user_role_assignments b
+        WHERE a.user_id = b.user_id
+          AND a.role_id = b.role_id
+          AND (a.assigned_at, a.id) > (b.assigned_at, b.id)
+    """)
+    op.drop_constraint('user_role_assignments_pkey', 'user_role_assignments', type_='primary', schema='contas')
+    op.create_primary_key('user_role_assignments_pkey', 'user_role_assignments', ['user_id', 'role_id'], schema='contas')
+    op.drop_column('user_role_assignments', 'id', schema='contas')
@@ -73,6 +73,35 @@ def test():
     subprocess.run(cmd, env=env)
 
 
+def benchmark():
+    """Executar benchmarks de autorização (SQLite em memória por padrão)"""
+    # Definir PYTHONPATH para incluir src/
+    env = os.environ.copy()
+    src_path = Path(__file__).parent.parent / "src"
+    env["PYTHONPATH"] = (
+        str(src_path) + ":" + str(src_path.parent) + ":" + env.get("PYTHONPATH", "")
+    )
+
+    cmd = [sys.executable, "-m", "tests.benchmarks.bench_authorization"]
+    cmd.extend(sys.argv[1:])
+    subprocess.run(cmd, env=env, cwd=src_path.parent)
+
+
+def load_test():
+    """Executar teste de carga HTTP (login, validação de token, uso de recursos)"""
+    # Definir PYTHONPATH para incluir src/
+    env = os.environ.copy()
+    src_path = Path(__file__).parent.parent / "src"
+    env["PYTHONPATH"] = (
+        str(src_path) + ":" + str(src_path.parent) + ":" + env.get("PYTHONPATH", "")
+    )
+
+    cmd = [sys.executable, "-m", "tests.load.runner"]
+    cmd.extend(sys.argv[1:])
+    result = subprocess.run(cmd, env=env, cwd=src_path.parent)
+    sys.exit(result.returncode)
+
+
 def format_code():
     """Formatar código com black e isort"""
     print("🎨 Formatando código...")
@@ -100,6 +129,248 @@ def lint():
         sys.exit(1)
 
 
+def usage_rollover():
+    """Abrir novos períodos de uso mensal em lotes (fora do ciclo de requisições)"""
+    import argparse
+    import logging
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--chunk-size", type=int, default=500, help="Registros por transação")
+    parser.add_argument("--pause", type=float, default=0.0, help="Pausa entre lotes (segundos)")
+    parser.add_argument("--max-chunks", type=int, default=None, help="Parar após N lotes")
+    args, unknown = parser.parse_known_args()
+
+    # Definir PYTHONPATH para incluir src/
+    src_path = Path(__file__).parent.parent / "src"
+    sys.path.insert(0, str(src_path))
+    sys.path.insert(0, str(src_path.parent))
+    logging.basicConfig(level=logging.INFO)
+
+    from shared.infrastructure.database.connection import SessionLocal
+    from plans.application.jobs.usage_rollover_job import UsageRolloverJob
+    from plans.infrastructure.plans_unit_of_work import PlansUnitOfWork
+
+    job = UsageRolloverJob(
+        lambda: PlansUnitOfWork(SessionLocal(), ["feature_usage", "job_checkpoint"]),
+        chunk_size=args.chunk_size,
+        pause_seconds=args.pause,
+        progress_callback=lambda cp: print(
+            f"⏳ {cp.processed} registros processados, {cp.affected} períodos abertos"
+        ),
+    )
+    result = job.run(max_chunks=args.max_chunks)
+
+    checkpoint = result["checkpoint"]
+    if checkpoint["is_completed"]:
+        print(f"✅ Rollover concluído: {checkpoint['affected']} períodos abertos")
+    else:
+        print(f"⏸️  Rollover pausado em {checkpoint['cursor']} - execute novamente para continuar")
+
+
+def subscription_lifecycle():
+    """Renovar e expirar assinaturas vencidas em lotes (fora do ciclo de requisições)"""
+    import argparse
+    import logging
+    import signal
+    import threading
+
+    # Definir PYTHONPATH para incluir src/
+    src_path = Path(__file__).parent.parent / "src"
+    sys.path.insert(0, str(src_path))
+    sys.path.insert(0, str(src_path.parent))
+    logging.basicConfig(level=logging.INFO)
+
+    from shared.infrastructure.config import settings
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--chunk-size", type=int, default=settings.subscription_lifecycle_chunk_size, help="Assinaturas por transação")
+    parser.add_argument("--pause", type=float, default=0.0, help="Pausa entre lotes (segundos)")
+    parser.add_argument("--max-chunks", type=int, default=None, help="Parar após N lotes")
+    parser.add_argument("--schedule", action="store_true", help="Continuar executando a cada intervalo")
+    parser.add_argument("--interval", type=float, default=settings.subscription_lifecycle_interval_seconds, help="Intervalo entre execuções (segundos)")
+    args, unknown = parser.parse_known_args()
+
+    from shared.infrastructure.database.connection import SessionLocal
+    from shared.infrastructure.scheduler import JobScheduler
+    from plans.application.jobs.subscription_lifecycle_job import SubscriptionLifecycleJob
+    from plans.infrastructure.plans_unit_of_work import PlansUnitOfWork
+
+    job = SubscriptionLifecycleJob(
+        lambda: PlansUnitOfWork(SessionLocal(), ["subscription", "job_checkpoint"]),
+        chunk_size=args.chunk_size,
+        pause_seconds=args.pause,
+        progress_callback=lambda cp: print(
+            f"⏳ {cp.processed} assinaturas processadas: {cp.details.get('renewed', 0)} renovadas, "
+            f"{cp.details.get('expired', 0)} expiradas, {cp.details.get('trials_expired', 0)} trials expirados"
+        ),
+    )
+
+    def run_once():
+        checkpoint = job.run(max_chunks=args.max_chunks)["checkpoint"]
+        if checkpoint["is_completed"]:
+            print(f"✅ Ciclo de vida concluído até {checkpoint['run_key']}")
+        else:
+            print(f"⏸️  Pausado em {checkpoint['details'].get('phase')} após {checkpoint['cursor']} - execute novamente para continuar")
+
+    if not args.schedule:
+        run_once()
+        return
+
+    scheduler = JobScheduler()
+    scheduler.register("subscription_lifecycle", run_once, args.interval)
+
+    stopped = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stopped.set())
+    scheduler.start()
+    print(f"📅 Agendador de assinaturas em execução a cada {args.interval:.0f}s (Ctrl+C para parar)")
+    try:
+        while not stopped.wait(1):
+            pass
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print("⏹️  Aguardando a execução atual terminar...")
+        scheduler.stop()
+
+
+def reap_expired():
+    """Excluir sessões e atribuições de papéis expiradas em lotes"""
+    import argparse
+    import logging
+    from datetime import timedelta
+
+    # Definir PYTHONPATH para incluir src/
+    src_path = Path(__file__).parent.parent / "src"
+    sys.path.insert(0, str(src_path))
+    sys.path.insert(0, str(src_path.parent))
+    logging.basicConfig(level=logging.INFO)
+
+    from shared.infrastructure.config import settings
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--session-retention-days", type=int, default=settings.session_retention_days, help="Manter sessões expiradas por N dias")
+    parser.add_argument("--assignment-retention-days", type=int, default=settings.role_assignment_retention_days, help="Manter atribuições expiradas por N dias")
+    parser.add_argument("--chunk-size", type=int, default=settings.reaper_chunk_size, help="Linhas excluídas por transação")
+    parser.add_argument("--pause", type=float, default=settings.reaper_pause_seconds, help="Pausa entre lotes (segundos)")
+    parser.add_argument("--max-chunks", type=int, default=None, help="Parar após N lotes")
+    args, unknown = parser.parse_known_args()
+
+    from src.shared.infrastructure.database.connection import SessionLocal
+    from src.iam.application.jobs.expired_records_reaper import ExpiredRecordsReaper
+    from src.iam.infrastructure.iam_unit_of_work import IAMUnitOfWork
+
+    reaper = ExpiredRecordsReaper(
+        lambda: IAMUnitOfWork(
+            SessionLocal(),
+            ["user_session", "user_organization_role", "role", "effective_user_permission"],
+        ),
+        session_retention=timedelta(days=args.session_retention_days),
+        assignment_retention=timedelta(days=args.assignment_retention_days),
+        chunk_size=args.chunk_size,
+        pause_seconds=args.pause,
+    )
+    result = reaper.run(max_chunks=args.max_chunks)
+
+    print(
+        f"🧹 {result['sessions_deleted']} sessões, {result['organization_roles_deleted']} papéis de organização "
+        f"e {result['role_assignments_deleted']} atribuições excluídos em {result['chunks_processed']} lotes"
+    )
+    if not result["is_completed"]:
+        print("⏸️  Limite de lotes atingido - execute novamente para continuar")
+
+
+def rebuild_permissions():
+    """Recalcular a tabela de permissões efetivas a partir dos papéis"""
+    import argparse
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--check", action="store_true", help="Apenas comparar, sem reconstruir")
+    args, unknown = parser.parse_known_args()
+
+    # Definir PYTHONPATH para incluir src/
+    src_path = Path(__file__).parent.parent / "src"
+    sys.path.insert(0, str(src_path))
+    sys.path.insert(0, str(src_path.parent))
+
+    from shared.infrastructure.database.connection import SessionLocal
+    from iam.infrastructure.iam_unit_of_work import IAMUnitOfWork
+
+    uow = IAMUnitOfWork(SessionLocal(), ["effective_user_permission"])
+    with uow:
+        repository = uow.get_repository("effective_user_permission")
+        drift = repository.compare_with_source()
+        print(
+            f"🔍 {drift['total']} permissões materializadas: "
+            f"{drift['missing']} faltando, {drift['stale']} obsoletas"
+        )
+
+        if args.check:
+            if drift["missing"] or drift["stale"]:
+                sys.exit(1)
+            return
+
+        written = repository.rebuild()
+        print(f"✅ Tabela reconstruída: {written} permissões efetivas")
+
+
+def onboarding_worker():
+    """Executar os workers de onboarding (processa a fila de onboarding_workflows)"""
+    import argparse
+    import logging
+    import signal
+    import threading
+
+    # Definir PYTHONPATH para incluir src/
+    src_path = Path(__file__).parent.parent / "src"
+    sys.path.insert(0, str(src_path))
+    sys.path.insert(0, str(src_path.parent))
+    logging.basicConfig(level=logging.INFO)
+
+    from shared.infrastructure.config import settings
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, default=settings.onboarding_workers, help="Threads de processamento")
+    parser.add_argument("--poll-interval", type=float, default=settings.onboarding_poll_interval_seconds, help="Espera quando a fila está vazia (segundos)")
+    parser.add_argument("--once", action="store_true", help="Processar a fila atual e sair")
+    args, unknown = parser.parse_known_args()
+
+    from src.shared.infrastructure.database.connection import SessionLocal
+    from src.orchestration.infrastructure.workers import OnboardingWorkerPool
+    from src.orchestration.presentation.dependencies import (
+        create_process_onboarding_use_case,
+    )
+
+    def process_next(worker_id: str) -> bool:
+        session = SessionLocal()
+        try:
+            use_case = create_process_onboarding_use_case(session)
+            return use_case.process_next(worker_id) is not None
+        finally:
+            session.close()
+
+    pool = OnboardingWorkerPool(
+        process_next, workers=args.workers, poll_interval_seconds=args.poll_interval
+    )
+
+    if args.once:
+        processed = pool.drain()
+        print(f"✅ {processed} onboardings processados")
+        return
+
+    stopped = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stopped.set())
+    pool.start()
+    print(f"👷 {args.workers} workers de onboarding em execução (Ctrl+C para parar)")
+    try:
+        while not stopped.wait(1):
+            pass
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print("⏹️  Aguardando os workers terminarem...")
+        pool.stop()
+
+
 def check_env():
     """Verificar ambiente e configurações"""
     print("🔍 Verificando ambiente...")
@@ -131,10 +402,10 @@ if __name__ == "__main__":
         else:
             print(f"Comando '{command}' não encontrado")
             print(
-                "Comandos disponíveis: dev, start, migrate, migration, test, format_code, lint, check_env"
+                "Comandos disponíveis: dev, start, migrate, migration, test, format_code, lint, check_env, usage_rollover, subscription_lifecycle, reap_expired, rebuild_permissions, onboarding_worker, benchmark, load_test"
             )
     else:
         print("Uso: python scripts/commands.py <comando>")
         print(
-            "Comandos: dev, start, migrate, migration, test, format_code, lint, check_env"
+            "Comandos: dev, start, migrate, migration, test, format_code, lint, check_env, usage_rollover, subscription_lifecycle, reap_expired, rebuild_permissions, onboarding_worker, benchmark, load_test"
         )
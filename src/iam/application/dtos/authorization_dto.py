@@ -21,6 +21,9 @@ class AuthorizationRequestDTO(BaseModel):
     environment_attributes: Dict[str, Any] = Field(
         default_factory=dict, description="Environment attributes"
     )
+    explain: bool = Field(
+        False, description="Include the full reason tree in the response"
+    )
 
 
 class AuthorizationResponseDTO(BaseModel):
@@ -35,6 +38,8 @@ class AuthorizationResponseDTO(BaseModel):
     abac_result: Optional[bool] = None
     applicable_roles: List[str] = Field(default_factory=list)
     applicable_policies: List[str] = Field(default_factory=list)
+    deciding_rule: Optional[str] = None
+    reasons: Optional[List[Dict[str, Any]]] = None
     evaluation_time_ms: float
     evaluated_at: datetime
 
@@ -0,0 +1,5 @@
+from .expired_records_reaper import ExpiredRecordsReaper
+
+__all__ = [
+    "ExpiredRecordsReaper",
+]
@@ -0,0 +1,146 @@
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Optional, Dict, Any
+
+from shared.domain.repositories.unit_of_work import UnitOfWork
+from ...domain.repositories.effective_user_permission_repository import (
+    EffectiveUserPermissionRepository,
+)
+from ...domain.repositories.role_repository import RoleRepository
+from ...domain.repositories.user_organization_role_repository import (
+    UserOrganizationRoleRepository,
+)
+from ...domain.repositories.user_session_repository import UserSessionRepository
+from ...domain.services.role_set_cache import get_role_set_cache
+
+logger = logging.getLogger(__name__)
+
+
+class ExpiredRecordsReaper:
+    """Deletes sessions and role assignments long past their expiry.
+
+    Rows are kept for a retention period after they expire (for support and
+    audit lookups), then deleted oldest first in chunks of ``chunk_size``,
+    each in its own short transaction with a pause between them, so the
+    tables and the session token index stay bounded without long locks.
+    Deleting role assignments refreshes the effective permissions of their
+    users in the same transaction.
+    """
+
+    job_name = "expired_records_reaper"
+
+    def __init__(
+        self,
+        uow_factory: Callable[[], UnitOfWork],
+        session_retention: timedelta = timedelta(days=7),
+        assignment_retention: timedelta = timedelta(days=30),
+        chunk_size: int = 1000,
+        pause_seconds: float = 0.0,
+        progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ):
+        self._uow_factory = uow_factory
+        self._session_retention = session_retention
+        self._assignment_retention = assignment_retention
+        self._chunk_size = chunk_size
+        self._pause_seconds = pause_seconds
+        self._progress_callback = progress_callback
+
+    def run(
+        self, now: Optional[datetime] = None, max_chunks: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Delete the rows that expired more than the retention period ago."""
+
+        now = now or datetime.now(timezone.utc)
+        report = {
+            "sessions_deleted": 0,
+            "organization_roles_deleted": 0,
+            "role_assignments_deleted": 0,
+            "chunks_processed": 0,
+            "is_completed": True,
+        }
+        steps = [
+            ("sessions_deleted", now - self._session_retention, self._delete_sessions),
+            (
+                "organization_roles_deleted",
+                now - self._assignment_retention,
+                self._delete_organization_roles,
+            ),
+            (
+                "role_assignments_deleted",
+                now - self._assignment_retention,
+                self._delete_role_assignments,
+            ),
+        ]
+
+        for counter, expired_before, delete_chunk in steps:
+            while True:
+                if max_chunks is not None and report["chunks_processed"] >= max_chunks:
+                    report["is_completed"] = False
+                    return self._result(report)
+
+                deleted = delete_chunk(expired_before)
+                report[counter] += deleted
+                report["chunks_processed"] += 1
+                self._report(report)
+
+                if deleted < self._chunk_size:
+                    break
+                if self._pause_seconds:
+                    time.sleep(self._pause_seconds)
+
+        return self._result(report)
+
+    def _delete_sessions(self, expired_before: datetime) -> int:
+        with self._uow_factory() as uow:
+            session_repository: UserSessionRepository = uow.get_repository(
+                "user_session"
+            )
+            return session_repository.delete_expired_chunk(
+                expired_before, self._chunk_size
+            )
+
+    def _delete_organization_roles(self, expired_before: datetime) -> int:
+        with self._uow_factory() as uow:
+            membership_repository: UserOrganizationRoleRepository = (
+                uow.get_repository("user_organization_role")
+            )
+            return membership_repository.delete_expired_chunk(
+                expired_before, self._chunk_size
+            )
+
+    def _delete_role_assignments(self, expired_before: datetime) -> int:
+        with self._uow_factory() as uow:
+            role_repository: RoleRepository = uow.get_repository("role")
+            user_ids = role_repository.delete_expired_assignments_chunk(
+                expired_before, self._chunk_size
+            )
+
+            if user_ids:
+                effective_permission_repository: EffectiveUserPermissionRepository = (
+                    uow.get_repository("effective_user_permission")
+                )
+                effective_permission_repository.refresh_users(user_ids)
+
+        if user_ids:
+            get_role_set_cache().reload_cache()
+        return len(user_ids)
+
+    def _report(self, report: Dict[str, Any]) -> None:
+        logger.info(
+            f"{self.job_name}: sessions={report['sessions_deleted']} "
+            f"organization_roles={report['organization_roles_deleted']} "
+            f"role_assignments={report['role_assignments_deleted']} "
+            f"chunks={report['chunks_processed']}"
+        )
+        if self._progress_callback:
+            self._progress_callback(dict(report))
+
+    def _result(self, report: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "success": True,
+            "operation": "expired_records_reaper",
+            "session_retention_days": self._session_retention.days,
+            "assignment_retention_days": self._assignment_retention.days,
+            **report,
+        }
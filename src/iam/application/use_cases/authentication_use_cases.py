@@ -1,8 +1,9 @@
 from typing import List, Optional
 from uuid import UUID
 
-from iam.domain.repositories.role_repository import RoleRepository
 from shared.domain.repositories.unit_of_work import UnitOfWork
+from shared.infrastructure.config import settings
+from ...domain.repositories.role_repository import RoleRepository
 from ...domain.repositories.user_repository import UserRepository
 from ...domain.repositories.user_session_repository import UserSessionRepository
 
@@ -16,7 +17,8 @@ from ..dtos.auth_dto import (
 from ..dtos.user_dto import UserResponseDTO
 from ..dtos.session_dto import SessionResponseDTO
 from ...domain.services.authentication_service import AuthenticationService
-from ...domain.services.jwt_service import JWTService
+from ...domain.services.jwt_service import JWTService, JWTTokenPayload
+from ...domain.services.role_set_cache import get_role_set_cache
 from ...domain.services.rbac_service import RBACService
 
 
@@ -39,6 +41,9 @@ class AuthenticationUseCase:
             role_repository=role_repository,
             permission_repository=permission_repository,
             role_permission_repository=role_permission_repository,
+            effective_permission_repository=uow.get_repository(
+                "effective_user_permission"
+            ),
         )
         self._uow = uow
 
@@ -57,17 +62,10 @@ class AuthenticationUseCase:
             # Get user's organization context
             organization_id = self._get_user_primary_organization(user.id)
 
-            # Get user permissions and roles for JWT token
-            permissions = self._get_user_permissions(user.id, organization_id)
-            roles = self._get_user_roles(user.id, organization_id)
-
             # Generate JWT access token with organization context and permissions
-            access_token = self._jwt_service.create_access_token(
-                user_id=str(user.id),
-                organization_id=str(organization_id) if organization_id else None,
-                email=user.email.value,
-                permissions=permissions,
-                roles=roles,
+            access_token = self._create_access_token(
+                user,
+                organization_id,
                 user_agent=dto.user_agent,
                 ip_address=dto.ip_address,
             )
@@ -174,18 +172,8 @@ class AuthenticationUseCase:
                 # Get user's organization context (same as login)
                 organization_id = self._get_user_primary_organization(user.id)
 
-                # Get fresh permissions and roles for the new token
-                permissions = self._get_user_permissions(user.id, organization_id)
-                roles = self._get_user_roles(user.id, organization_id)
-
-                # Create new JWT token
-                new_access_token = self._jwt_service.create_access_token(
-                    user_id=str(user.id),
-                    organization_id=str(organization_id) if organization_id else None,
-                    email=user.email.value,
-                    permissions=permissions,
-                    roles=roles,
-                )
+                # Create new JWT token with fresh permissions and roles
+                new_access_token = self._create_access_token(user, organization_id)
 
                 # Update session in database if it exists
                 with self._uow:
@@ -258,16 +246,7 @@ class AuthenticationUseCase:
 
             # Generate new JWT token instead of session token
             organization_id = self._get_user_primary_organization(user.id)
-            permissions = self._get_user_permissions(user.id, organization_id)
-            roles = self._get_user_roles(user.id, organization_id)
-
-            new_token = self._jwt_service.create_access_token(
-                user_id=str(user.id),
-                organization_id=str(organization_id) if organization_id else None,
-                email=user.email.value,
-                permissions=permissions,
-                roles=roles,
-            )
+            new_token = self._create_access_token(user, organization_id)
 
             # Create new session with same duration
             original_duration = int(
@@ -308,6 +287,24 @@ class AuthenticationUseCase:
             expires_in=int(original_duration * 3600),
         )
 
+    def resolve_token_claims(self, payload: JWTTokenPayload) -> JWTTokenPayload:
+        """Preenche papéis e permissões de um token compacto (no-op para tokens embutidos)."""
+        if self._jwt_service.resolve_cached_claims(payload):
+            return payload
+
+        return self.load_token_claims(payload)
+
+    def load_token_claims(self, payload: JWTTokenPayload) -> JWTTokenPayload:
+        """Carrega do banco os papéis e permissões de um token compacto (falta no cache)."""
+        user_id = UUID(payload.user_id)
+        organization_id = (
+            UUID(payload.organization_id) if payload.organization_id else None
+        )
+        role_set = self._load_role_set(user_id, organization_id)
+        payload.roles = list(role_set.roles)
+        payload.permissions = list(role_set.permissions)
+        return payload
+
     def request_password_reset(self, dto: PasswordResetRequestDTO) -> bool:
         """Solicita a redefinição de senha para o usuário."""
         from ...domain.value_objects.email import Email
@@ -382,6 +379,42 @@ class AuthenticationUseCase:
 
         return secrets.token_urlsafe(32)
 
+    def _create_access_token(
+        self,
+        user,
+        organization_id: Optional[UUID],
+        user_agent: Optional[str] = None,
+        ip_address: Optional[str] = None,
+    ) -> str:
+        """Gera o token JWT no modo de claims configurado (embedded ou compact)."""
+        if settings.jwt_claims_mode == "compact":
+            self._load_role_set(user.id, organization_id)
+            return self._jwt_service.create_access_token(
+                user_id=str(user.id),
+                organization_id=str(organization_id) if organization_id else None,
+                email=user.email.value,
+                compact=True,
+            )
+
+        return self._jwt_service.create_access_token(
+            user_id=str(user.id),
+            organization_id=str(organization_id) if organization_id else None,
+            email=user.email.value,
+            permissions=self._get_user_permissions(user.id, organization_id),
+            roles=self._get_user_roles(user.id, organization_id),
+            user_agent=user_agent,
+            ip_address=ip_address,
+        )
+
+    def _load_role_set(self, user_id: UUID, organization_id: Optional[UUID]):
+        """Resolve o conjunto de papéis do usuário e o guarda no cache do processo."""
+        return get_role_set_cache().put(
+            self._get_user_roles(user_id, organization_id),
+            self._get_user_permissions(user_id, organization_id),
+            str(user_id),
+            str(organization_id) if organization_id else None,
+        )
+
     def _get_user_primary_organization(self, user_id: UUID) -> Optional[UUID]:
         """
         Get the user's primary organization ID.
@@ -441,7 +474,7 @@ class AuthenticationUseCase:
             # Get user roles through the role repository
             role_repo: RoleRepository = self._uow.get_repository("role")
             user_roles = role_repo.get_user_roles(user_id, organization_id)
-            return [role.name for role in user_roles if role.is_active]
+            return [str(role.name) for role in user_roles if role.is_active]
         except Exception as e:
             # Log error and return empty roles for security
             print(f"Error getting user roles: {e}")
@@ -4,8 +4,12 @@ from uuid import UUID
 
 from ...domain.entities.authorization_context import AuthorizationContext
 from ...domain.services.authorization_service import AuthorizationService
+from ...domain.services.role_set_cache import get_role_set_cache
 from ...domain.repositories.role_repository import RoleRepository
 from ...domain.repositories.policy_repository import PolicyRepository
+from ...domain.repositories.effective_user_permission_repository import (
+    EffectiveUserPermissionRepository,
+)
 from ..dtos.authorization_dto import (
     AuthorizationRequestDTO,
     AuthorizationResponseDTO,
@@ -24,10 +28,12 @@ class AuthorizationUseCase:
         authorization_service: AuthorizationService,
         role_repository: RoleRepository,
         policy_repository: PolicyRepository,
+        effective_permission_repository: EffectiveUserPermissionRepository,
     ):
         self.authorization_service = authorization_service
         self.role_repository = role_repository
         self.policy_repository = policy_repository
+        self.effective_permission_repository = effective_permission_repository
 
     def check_authorization(
         self, request_dto: AuthorizationRequestDTO
@@ -47,8 +53,19 @@ class AuthorizationUseCase:
             environment_attributes=request_dto.environment_attributes,
         )
 
-        # Perform authorization check
-        is_authorized, decision_info = self.authorization_service.is_authorized(context)
+        # Perform authorization check; reasons are only built when requested
+        deciding_rule = None
+        reasons = None
+        if request_dto.explain:
+            decision = self.authorization_service.authorize(context)
+            is_authorized = decision.is_allowed()
+            decision_reason = decision.get_summary()
+            reasons = decision.to_dict()["reasons"]
+        else:
+            access = self.authorization_service.decide(context)
+            is_authorized = access.allowed
+            deciding_rule = access.rule
+            decision_reason = access.rule
 
         end_time = datetime.now(timezone.utc)
         evaluation_time_ms = (end_time - start_time).total_seconds() * 1000
@@ -58,11 +75,9 @@ class AuthorizationUseCase:
             resource_type=request_dto.resource_type,
             action=request_dto.action,
             is_authorized=is_authorized,
-            decision_reason=decision_info.get("reason", ""),
-            rbac_result=decision_info.get("rbac_result"),
-            abac_result=decision_info.get("abac_result"),
-            applicable_roles=decision_info.get("roles", []),
-            applicable_policies=decision_info.get("policies", []),
+            decision_reason=decision_reason,
+            deciding_rule=deciding_rule,
+            reasons=reasons,
             evaluation_time_ms=evaluation_time_ms,
             evaluated_at=end_time,
         )
@@ -168,16 +183,25 @@ class AuthorizationUseCase:
             expires_at=assignment_dto.expires_at,
         )
 
+        self.effective_permission_repository.refresh_users([assignment_dto.user_id])
+        get_role_set_cache().reload_cache()
+
         return True
 
     def remove_role_from_user(
         self, user_id: UUID, role_id: UUID, organization_id: Optional[UUID] = None
     ) -> bool:
         """Remove a role from a user."""
-        return self.role_repository.remove_role_from_user(
+        removed = self.role_repository.remove_role_from_user(
             user_id=user_id, role_id=role_id, organization_id=organization_id
         )
 
+        if removed:
+            self.effective_permission_repository.refresh_users([user_id])
+            get_role_set_cache().reload_cache()
+
+        return removed
+
     def get_user_roles(
         self, user_id: UUID, organization_id: Optional[UUID] = None
     ) -> List[Dict[str, Any]]:
@@ -213,8 +237,7 @@ class AuthorizationUseCase:
             action=permission_name,
         )
 
-        is_authorized, _ = self.authorization_service.authorize(context)
-        return is_authorized
+        return self.authorization_service.decide(context).allowed
 
     def get_resource_policies(
         self,
@@ -107,6 +107,24 @@ class OrganizationUseCase:
             settings=organization.settings.model_dump(),
         )
 
+    def get_organization_by_name(self, name: str) -> Optional[OrganizationResponseDTO]:
+        """Get organization by name."""
+        organization = self._organization_repository.get_by_name(
+            OrganizationName(value=name)
+        )
+
+        if not organization:
+            return None
+
+        user_count = self._role_repository.count_organization_users(organization.id)
+
+        return OrganizationResponseDTO(
+            **organization.model_dump(),
+            current_user_count=user_count,
+            max_users=organization.settings.max_users,
+            settings=organization.settings.model_dump(),
+        )
+
     def get_organization_detail(
         self, organization_id: UUID
     ) -> Optional[OrganizationDetailResponseDTO]:
@@ -5,7 +5,13 @@ from uuid import UUID
 from ...domain.entities.role import Role
 from ...domain.repositories.role_repository import RoleRepository
 from ...domain.repositories.permission_repository import PermissionRepository
+from ...domain.repositories.effective_user_permission_repository import (
+    EffectiveUserPermissionRepository,
+)
 from ...domain.services.role_inheritance_service import RoleInheritanceService
+from ...domain.services.role_set_cache import get_role_set_cache
+from ...domain.services.role_template_service import RoleTemplateService
+from ...domain.value_objects.role_hierarchy import RoleHierarchy
 from ..dtos.role_dto import (
     RoleCreateDTO,
     RoleUpdateDTO,
@@ -25,10 +31,15 @@ class RoleUseCase:
         self,
         role_repository: RoleRepository,
         permission_repository: PermissionRepository,
+        effective_permission_repository: EffectiveUserPermissionRepository,
     ):
         self.role_repository = role_repository
         self.permission_repository = permission_repository
+        self.effective_permission_repository = effective_permission_repository
         self.role_inheritance_service = RoleInheritanceService()
+        self.role_template_service = RoleTemplateService(
+            role_repository, effective_permission_repository
+        )
 
     def create_role(self, dto: RoleCreateDTO, created_by: UUID) -> RoleResponseDTO:
         """Create a new role."""
@@ -47,7 +58,8 @@ class RoleUseCase:
                 parent_role_id=dto.parent_role_id,
             )
 
-            all_roles = self.role_repository.get_role_hierarchy(dto.organization_id)
+            # A new role has no descendants, so only the parent's lineage matters
+            all_roles = self.role_repository.get_roles_with_ancestors([parent_role.id])
             can_inherit, reason = self.role_inheritance_service.can_role_inherit_from(
                 temp_role, parent_role, all_roles
             )
@@ -87,13 +99,31 @@ class RoleUseCase:
 
         return self._build_role_detail_response(role)
 
+    def get_role_by_name_and_organization(
+        self, name: str, organization_id: UUID
+    ) -> Optional[RoleResponseDTO]:
+        """Get an organization's role by name (default roles resolve to templates)."""
+        role = self.role_template_service.resolve_role(name, organization_id)
+        if not role:
+            return None
+
+        return self._build_role_response(role)
+
     def update_role(
-        self, role_id: UUID, dto: RoleUpdateDTO
+        self,
+        role_id: UUID,
+        dto: RoleUpdateDTO,
+        organization_id: UUID,
     ) -> Optional[RoleResponseDTO]:
-        """Update an existing role."""
-        role = self.role_repository.get_by_id(role_id)
+        """Update an organization's role.
+
+        A shared default-role template is copied into the organization first
+        and the copy is updated.
+        """
+        role = self._get_role_for_change(role_id, organization_id)
         if not role:
             return None
+        role_id = role.id
 
         # Update fields
         if dto.description is not None:
@@ -113,6 +143,7 @@ class RoleUseCase:
                     raise ValueError("One or more permissions not found")
 
             self.role_repository.replace_permissions(role_id, dto.permission_ids)
+            self._refresh_effective_permissions(role_id, organization_id)
 
         return self._build_role_response(updated_role)
 
@@ -135,6 +166,9 @@ class RoleUseCase:
         role.updated_at = datetime.now(timezone.utc)
         self.role_repository.save(role)
 
+        # Child roles stop inheriting from a deactivated parent
+        self._refresh_effective_permissions(role_id, role.organization_id)
+
         return True
 
     def list_roles(
@@ -169,12 +203,16 @@ class RoleUseCase:
         )
 
     def assign_permissions(
-        self, role_id: UUID, dto: RolePermissionAssignDTO
+        self,
+        role_id: UUID,
+        dto: RolePermissionAssignDTO,
+        organization_id: UUID,
     ) -> Optional[RoleDetailResponseDTO]:
-        """Assign permissions to a role."""
-        role = self.role_repository.get_by_id(role_id)
+        """Assign permissions to a role (copying a template into organization_id)."""
+        role = self._get_role_for_change(role_id, organization_id)
         if not role:
             return None
+        role_id = role.id
 
         # Validate permissions exist
         permissions = self.permission_repository.find_by_ids(dto.permission_ids)
@@ -182,24 +220,30 @@ class RoleUseCase:
             raise ValueError("One or more permissions not found")
 
         self.role_repository.assign_permissions(role_id, dto.permission_ids)
+        self._refresh_effective_permissions(role_id, organization_id)
 
         return self._build_role_detail_response(role)
 
     def remove_permissions(
-        self, role_id: UUID, dto: RolePermissionRemoveDTO
+        self,
+        role_id: UUID,
+        dto: RolePermissionRemoveDTO,
+        organization_id: UUID,
     ) -> Optional[RoleDetailResponseDTO]:
-        """Remove permissions from a role."""
-        role = self.role_repository.get_by_id(role_id)
+        """Remove permissions from a role (copying a template into organization_id)."""
+        role = self._get_role_for_change(role_id, organization_id)
         if not role:
             return None
+        role_id = role.id
 
         self.role_repository.remove_permissions(role_id, dto.permission_ids)
+        self._refresh_effective_permissions(role_id, organization_id)
 
         return self._build_role_detail_response(role)
 
     def get_roles_by_organization(self, organization_id: UUID) -> List[RoleResponseDTO]:
-        """Get all roles for an organization."""
-        roles = self.role_repository.get_organization_roles(organization_id)
+        """Get all roles for an organization, including the default-role templates it uses."""
+        roles = self.role_template_service.resolve_organization_roles(organization_id)
 
         role_responses = []
         for role in roles:
@@ -208,19 +252,20 @@ class RoleUseCase:
         return role_responses
 
     def set_role_parent(
-        self, role_id: UUID, parent_role_id: UUID
+        self, role_id: UUID, parent_role_id: UUID, organization_id: UUID
     ) -> Optional[RoleResponseDTO]:
-        """Set parent role for inheritance."""
-        role = self.role_repository.get_by_id(role_id)
-        if not role:
-            raise ValueError("Role not found")
-
+        """Set parent role for inheritance (copying a template into organization_id)."""
         parent_role = self.role_repository.get_by_id(parent_role_id)
         if not parent_role:
             raise ValueError("Parent role not found")
 
-        # Validate inheritance rules
-        all_roles = self.role_repository.get_role_hierarchy(role.organization_id)
+        role = self._get_role_for_change(role_id, organization_id)
+        if not role:
+            raise ValueError("Role not found")
+        role_id = role.id
+
+        # Validate inheritance rules: a cycle needs the parent among the descendants
+        all_roles = self.role_repository.get_roles_with_descendants([role.id])
         can_inherit, reason = self.role_inheritance_service.can_role_inherit_from(
             role, parent_role, all_roles
         )
@@ -231,18 +276,23 @@ class RoleUseCase:
         # Update role
         updated_role = role.set_parent_role(parent_role_id)
         saved_role = self.role_repository.save(updated_role)
+        self._refresh_effective_permissions(role_id, organization_id)
 
         return self._build_role_response(saved_role)
 
-    def remove_role_parent(self, role_id: UUID) -> Optional[RoleResponseDTO]:
-        """Remove parent role inheritance."""
-        role = self.role_repository.get_by_id(role_id)
+    def remove_role_parent(
+        self, role_id: UUID, organization_id: UUID
+    ) -> Optional[RoleResponseDTO]:
+        """Remove parent role inheritance (copying a template into organization_id)."""
+        role = self._get_role_for_change(role_id, organization_id)
         if not role:
             raise ValueError("Role not found")
+        role_id = role.id
 
         # Update role
         updated_role = role.remove_parent_role()
         saved_role = self.role_repository.save(updated_role)
+        self._refresh_effective_permissions(role_id, organization_id)
 
         return self._build_role_response(saved_role)
 
@@ -274,8 +324,8 @@ class RoleUseCase:
         if not role:
             raise ValueError("Role not found")
 
-        # Get all roles for hierarchy calculation
-        all_roles = self.role_repository.get_role_hierarchy(role.organization_id)
+        # Get the role's ancestors for hierarchy calculation
+        all_roles = self.role_repository.get_roles_with_ancestors([role.id])
 
         # Get role permissions mapping
         role_permissions = {}
@@ -333,6 +383,32 @@ class RoleUseCase:
 
         return response_tree
 
+    def _get_role_for_change(
+        self, role_id: UUID, organization_id: UUID
+    ) -> Optional[Role]:
+        """Get an organization's role to modify, materializing its copy of a template.
+
+        Templates are shared by every organization, so they are never
+        changed in place; other global roles and roles of other
+        organizations cannot be changed at all.
+        """
+        role = self.role_repository.get_by_id(role_id)
+        if not role:
+            return None
+
+        role = self.role_template_service.materialize(role, organization_id)
+        if role.organization_id != organization_id:
+            raise ValueError("Role does not belong to the specified organization")
+
+        return role
+
+    def _refresh_effective_permissions(
+        self, role_id: UUID, organization_id: Optional[UUID]
+    ) -> None:
+        """Recompute materialized permissions of users holding the role or a descendant."""
+        self.effective_permission_repository.refresh_roles([role_id], organization_id)
+        get_role_set_cache().reload_cache()
+
     def _build_role_response(self, role: Role) -> RoleResponseDTO:
         """Build role response DTO."""
         permission_count = self.role_repository.get_permission_count(role.id)
@@ -342,8 +418,10 @@ class RoleUseCase:
         # Calculate inheritance level
         inheritance_level = 0
         if role.has_parent():
-            all_roles = self.role_repository.get_role_hierarchy(role.organization_id)
-            hierarchy_path = role.get_role_hierarchy_path(all_roles)
+            hierarchy = RoleHierarchy(
+                self.role_repository.get_roles_with_ancestors([role.id])
+            )
+            hierarchy_path = role.get_role_hierarchy_path(hierarchy)
             inheritance_level = len(hierarchy_path) - 1
 
         return RoleResponseDTO(
@@ -31,16 +31,21 @@ class SessionUseCase:
         from ...domain.services.rbac_service import RBACService
         from ...domain.services.abac_service import ABACService
         from ...domain.services.policy_evaluation_service import PolicyEvaluationService
+        from ...domain.services.policy_index import get_policy_index
 
         rbac_service = RBACService(
             role_repository=uow.get_repository("role"),
             permission_repository=uow.get_repository("permission"),
             role_permission_repository=uow.get_repository("role_permission"),
+            effective_permission_repository=uow.get_repository(
+                "effective_user_permission"
+            ),
         )
         policy_evaluation_service = PolicyEvaluationService()
         abac_service = ABACService(
             policy_repository=uow.get_repository("policy"),
             policy_evaluation_service=policy_evaluation_service,
+            policy_index=get_policy_index(),
         )
         self._authorization_service = AuthorizationService(rbac_service, abac_service)
 
@@ -252,9 +257,8 @@ class SessionUseCase:
                 },
             )
 
-            # Check permission using authorization service
-            decision = self._authorization_service.authorize(context)
-            if not decision.is_allowed():
+            # Only the outcome is needed here, so skip building reasons
+            if not self._authorization_service.decide(context).is_allowed():
                 return False
 
         return True
@@ -136,6 +136,11 @@ class DefaultRoleConfigurations:
         """Get all default role names."""
         return list(cls.get_role_configs().keys())
 
+    @classmethod
+    def is_default_role(cls, role_name: str) -> bool:
+        """Check if a role name is one of the default organization roles."""
+        return role_name in cls.get_role_configs()
+
     @classmethod
     def reload_configurations(cls) -> None:
         """Reload configurations from JSON files."""
@@ -1,5 +1,6 @@
 from .authorization_context import AuthorizationContext
 from .authorization_subject import AuthorizationSubject
+from .evaluation_context import EvaluationContext
 from .organization import Organization
 from .permission import Permission
 from .policy import Policy
@@ -11,6 +12,7 @@ from .user_session import UserSession
 __all__ = [
     "AuthorizationContext",
     "AuthorizationSubject",
+    "EvaluationContext",
     "Organization",
     "Permission",
     "Policy",
@@ -0,0 +1,165 @@
+from datetime import datetime, timezone
+from uuid import UUID
+from typing import Optional, Dict, Any, List, Callable, Union
+
+from .authorization_context import AuthorizationContext
+
+
+class EvaluationContext:
+    """Lightweight authorization context for the evaluation hot path.
+
+    ``AuthorizationContext`` is validated at the API boundary; once inside the
+    authorization services a request is evaluated against this slotted,
+    unvalidated copy. Its flat attribute view (what policy conditions read) is
+    computed on first use and shared by every policy evaluated for the
+    request, instead of being rebuilt per policy.
+
+    The attribute dicts and the memoized views must be treated as read-only.
+    """
+
+    __slots__ = (
+        "user_id",
+        "organization_id",
+        "resource_type",
+        "resource_id",
+        "action",
+        "user_attributes",
+        "resource_attributes",
+        "environment_attributes",
+        "request_time",
+        "_flat_attributes",
+        "_evaluation_attributes",
+    )
+
+    def __init__(
+        self,
+        user_id: UUID,
+        resource_type: str,
+        action: str,
+        organization_id: Optional[UUID] = None,
+        resource_id: Optional[UUID] = None,
+        user_attributes: Optional[Dict[str, Any]] = None,
+        resource_attributes: Optional[Dict[str, Any]] = None,
+        environment_attributes: Optional[Dict[str, Any]] = None,
+        request_time: Optional[datetime] = None,
+    ):
+        self.user_id = user_id
+        self.organization_id = organization_id
+        self.resource_type = resource_type
+        self.resource_id = resource_id
+        self.action = action
+        self.user_attributes = user_attributes or {}
+        self.resource_attributes = resource_attributes or {}
+        self.environment_attributes = environment_attributes or {}
+        self.request_time = request_time or datetime.now(timezone.utc)
+        self._flat_attributes: Optional[Dict[str, Any]] = None
+        self._evaluation_attributes: Optional[Dict[str, Any]] = None
+
+    @classmethod
+    def create(
+        cls,
+        user_id: UUID,
+        resource_type: str,
+        action: str,
+        organization_id: Optional[UUID] = None,
+        resource_id: Optional[UUID] = None,
+        user_attributes: Optional[Dict[str, Any]] = None,
+        resource_attributes: Optional[Dict[str, Any]] = None,
+        environment_attributes: Optional[Dict[str, Any]] = None,
+    ) -> "EvaluationContext":
+        """Create a context without validation (for internal callers)."""
+        return cls(
+            user_id=user_id,
+            resource_type=resource_type,
+            action=action,
+            organization_id=organization_id,
+            resource_id=resource_id,
+            user_attributes=user_attributes,
+            resource_attributes=resource_attributes,
+            environment_attributes=environment_attributes,
+        )
+
+    @classmethod
+    def from_context(
+        cls, context: Union[AuthorizationContext, "EvaluationContext"]
+    ) -> "EvaluationContext":
+        """Get an evaluation context for a validated authorization context."""
+        if isinstance(context, EvaluationContext):
+            return context
+
+        return cls(
+            user_id=context.user_id,
+            resource_type=context.resource_type,
+            action=context.action,
+            organization_id=context.organization_id,
+            resource_id=context.resource_id,
+            user_attributes=context.user_attributes,
+            resource_attributes=context.resource_attributes,
+            environment_attributes=context.environment_attributes,
+            request_time=context.request_time,
+        )
+
+    def get_user_attribute(self, key: str, default: Any = None) -> Any:
+        """Get user attribute value."""
+        return self.user_attributes.get(key, default)
+
+    def get_resource_attribute(self, key: str, default: Any = None) -> Any:
+        """Get resource attribute value."""
+        return self.resource_attributes.get(key, default)
+
+    def get_environment_attribute(self, key: str, default: Any = None) -> Any:
+        """Get environment attribute value."""
+        return self.environment_attributes.get(key, default)
+
+    def get_flat_attributes(self) -> Dict[str, Any]:
+        """Get the memoized flat attribute view (same keys as to_dict())."""
+        if self._flat_attributes is None:
+            flat = {
+                "user_id": str(self.user_id),
+                "organization_id": str(self.organization_id)
+                if self.organization_id
+                else None,
+                "resource_type": self.resource_type,
+                "resource_id": str(self.resource_id) if self.resource_id else None,
+                "action": self.action,
+                "request_time": self.request_time.isoformat(),
+            }
+            flat.update(self.user_attributes)
+            for key, value in self.resource_attributes.items():
+                flat[f"resource_{key}"] = value
+            for key, value in self.environment_attributes.items():
+                flat[f"env_{key}"] = value
+            self._flat_attributes = flat
+
+        return self._flat_attributes
+
+    def get_evaluation_attributes(
+        self, computed: Callable[["EvaluationContext"], Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Get the flat view plus computed attributes, computed once per request."""
+        if self._evaluation_attributes is None:
+            attributes = dict(self.get_flat_attributes())
+            attributes.update(computed(self))
+            self._evaluation_attributes = attributes
+
+        return self._evaluation_attributes
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert context to dictionary for policy evaluation (a copy)."""
+        return dict(self.get_flat_attributes())
+
+    def is_same_organization(self, other_org_id: Optional[UUID]) -> bool:
+        """Check if context belongs to same organization."""
+        return self.organization_id == other_org_id
+
+    def is_resource_owner(self) -> bool:
+        """Check if user is the resource owner."""
+        return self.get_resource_attribute("owner_id") == str(self.user_id)
+
+    def get_user_roles(self) -> List[str]:
+        """Get user roles from context."""
+        return self.get_user_attribute("roles", [])
+
+    def has_role(self, role: str) -> bool:
+        """Check if user has specific role."""
+        return role in self.get_user_roles()
@@ -17,6 +17,17 @@ class PolicyCondition(BaseModel):
 
     model_config = {"frozen": True}
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "PolicyCondition":
+        """Create a condition from its stored representation."""
+        return cls(
+            attribute=data["attribute"], operator=data["operator"], value=data["value"]
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert condition to its stored representation."""
+        return {"attribute": self.attribute, "operator": self.operator, "value": self.value}
+
     def evaluate(self, context: Dict[str, Any]) -> bool:
         """Evaluate condition against context."""
         # Support nested attribute access with dot notation
@@ -1,10 +1,11 @@
 from datetime import datetime, timezone
 
 from uuid import UUID, uuid4
-from typing import Optional, List, Set
+from typing import Optional, List, Set, Union
 from pydantic import BaseModel
 
 from ..value_objects.role_name import RoleName
+from ..value_objects.role_hierarchy import RoleHierarchy
 
 
 class Role(BaseModel):
@@ -111,11 +112,16 @@ class Role(BaseModel):
             update={"parent_role_id": None, "updated_at": datetime.now(timezone.utc)}
         )
 
-    def is_descendant_of(self, role_hierarchy: List["Role"], ancestor_id: UUID) -> bool:
+    def is_descendant_of(
+        self, role_hierarchy: Union[List["Role"], RoleHierarchy], ancestor_id: UUID
+    ) -> bool:
         """Check if this role is a descendant of the given ancestor role."""
         if not self.has_parent():
             return False
 
+        if isinstance(role_hierarchy, RoleHierarchy):
+            return ancestor_id in role_hierarchy.get_path(self.parent_role_id)
+
         # Create lookup map for efficiency
         role_map = {role.id: role for role in role_hierarchy}
 
@@ -136,11 +142,17 @@ class Role(BaseModel):
 
         return False
 
-    def get_role_hierarchy_path(self, role_hierarchy: List["Role"]) -> List[UUID]:
+    def get_role_hierarchy_path(
+        self, role_hierarchy: Union[List["Role"], RoleHierarchy]
+    ) -> List[UUID]:
         """Get the complete inheritance path from root to this role."""
         if not self.has_parent():
             return [self.id]
 
+        if isinstance(role_hierarchy, RoleHierarchy):
+            path = role_hierarchy.get_path(self.parent_role_id)
+            return path + [self.id] if self.id not in path else path
+
         # Create lookup map
         role_map = {role.id: role for role in role_hierarchy}
 
@@ -1,4 +1,5 @@
 from .authorization_subject_repository import AuthorizationSubjectRepository
+from .effective_user_permission_repository import EffectiveUserPermissionRepository
 from .organization_repository import OrganizationRepository
 from .permission_repository import PermissionRepository
 from .policy_repository import PolicyRepository
@@ -10,6 +11,7 @@ from .user_session_repository import UserSessionRepository
 
 __all__ = [
     "AuthorizationSubjectRepository",
+    "EffectiveUserPermissionRepository",
     "OrganizationRepository",
     "PermissionRepository",
     "PolicyRepository",
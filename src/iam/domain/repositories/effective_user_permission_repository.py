@@ -0,0 +1,56 @@
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional
+from uuid import UUID
+
+
+class EffectiveUserPermissionRepository(ABC):
+    """Repository for the materialized user -> permission mapping.
+
+    Each row is a permission a user holds in an organization through an
+    assigned role or one of its ancestors, keyed as ``resource_type:action``.
+    Rows are derived data: writes to roles, role permissions and role
+    assignments refresh the affected users, and ``rebuild`` recomputes the
+    whole table from the source tables.
+    """
+
+    @abstractmethod
+    def find_matching_permission(
+        self,
+        user_id: UUID,
+        organization_id: Optional[UUID],
+        permission_keys: List[str],
+    ) -> Optional[str]:
+        """Return one of the given permission keys the user holds, if any."""
+        pass
+
+    @abstractmethod
+    def get_permission_keys(
+        self, user_id: UUID, organization_id: Optional[UUID] = None
+    ) -> List[str]:
+        """Get all permission keys of a user (in every organization if None)."""
+        pass
+
+    @abstractmethod
+    def refresh_users(self, user_ids: List[UUID]) -> int:
+        """Recompute the rows of the given users. Returns rows written."""
+        pass
+
+    @abstractmethod
+    def refresh_roles(
+        self, role_ids: List[UUID], organization_id: Optional[UUID] = None
+    ) -> int:
+        """Recompute the rows of every user holding the roles or a descendant.
+
+        With organization_id, only holders in that organization are refreshed.
+        """
+        pass
+
+    @abstractmethod
+    def compare_with_source(self) -> Dict[str, int]:
+        """Count rows missing from or stale in the table versus a recomputation."""
+        pass
+
+    @abstractmethod
+    def rebuild(self) -> int:
+        """Recompute the whole table from scratch. Returns rows written."""
+        pass
@@ -37,6 +37,33 @@ class RoleRepository(ABC):
         """Get all system roles."""
         pass
 
+    @abstractmethod
+    def get_role_templates(self, names: List[str]) -> List[Role]:
+        """Get the global (organization-less) system roles with the given names."""
+        pass
+
+    @abstractmethod
+    def reassign_organization_role(
+        self, organization_id: UUID, from_role_id: UUID, to_role_id: UUID
+    ) -> List[UUID]:
+        """Move an organization's assignments of a role to another role.
+
+        Returns the user id of each moved assignment, so their effective
+        permissions can be refreshed.
+        """
+        pass
+
+    @abstractmethod
+    def delete_expired_assignments_chunk(
+        self, expired_before: datetime, chunk_size: int = 1000
+    ) -> List[UUID]:
+        """Delete up to chunk_size role assignments that expired before expired_before.
+
+        Returns the user id of each deleted assignment, so their effective
+        permissions can be refreshed.
+        """
+        pass
+
     @abstractmethod
     def get_user_roles(
         self, user_id: UUID, organization_id: Optional[UUID] = None
@@ -83,6 +110,16 @@ class RoleRepository(ABC):
         """Get all roles in hierarchical order for an organization."""
         pass
 
+    @abstractmethod
+    def get_roles_with_ancestors(self, role_ids: List[UUID]) -> List[Role]:
+        """Get the given active roles and all their active ancestors."""
+        pass
+
+    @abstractmethod
+    def get_roles_with_descendants(self, role_ids: List[UUID]) -> List[Role]:
+        """Get the given active roles and all their active descendants."""
+        pass
+
     @abstractmethod
     def has_child_roles(self, role_id: UUID) -> bool:
         """Check if role has any child roles."""
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 from typing import Optional, List
 from uuid import UUID
 
@@ -66,6 +67,15 @@ class UserOrganizationRoleRepository(ABC):
         """Cleanup expired roles. Returns count of cleaned roles."""
         pass
 
+    @abstractmethod
+    def delete_expired_chunk(self, expired_before: datetime, chunk_size: int = 1000) -> int:
+        """Delete up to chunk_size assignments that expired before expired_before.
+
+        Returns the count of deleted assignments; fewer than chunk_size means
+        none are left.
+        """
+        pass
+
     @abstractmethod
     def assign_role_to_user(
         self, user_id: UUID, organization_id: UUID, role_id: UUID
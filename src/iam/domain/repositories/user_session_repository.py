@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 from typing import List, Optional
 from uuid import UUID
 
@@ -38,6 +39,15 @@ class UserSessionRepository(ABC):
         """Limpa sessões expiradas. Retorna a contagem de sessões limpas."""
         pass
 
+    @abstractmethod
+    def delete_expired_chunk(self, expired_before: datetime, chunk_size: int = 1000) -> int:
+        """Exclui até chunk_size sessões expiradas antes de expired_before.
+
+        Retorna a contagem de sessões excluídas; menos que chunk_size indica
+        que não restam sessões a excluir.
+        """
+        pass
+
     @abstractmethod
     def delete(self, session_id: UUID) -> bool:
         """Exclui uma sessão pelo ID."""
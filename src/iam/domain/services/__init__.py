@@ -7,8 +7,11 @@ from .membership_service import MembershipService
 from .organization_domain_service import OrganizationDomainService
 from .organization_role_setup_service import OrganizationRoleSetupService
 from .policy_evaluation_service import PolicyEvaluationService
+from .policy_index import PolicyIndex
 from .rbac_service import RBACService
+from .role_set_cache import RoleSetCache
 from .role_inheritance_service import RoleInheritanceService
+from .role_template_service import RoleTemplateService
 from .user_domain_service import UserDomainService
 
 __all__ = [
@@ -21,7 +24,10 @@ __all__ = [
     "OrganizationDomainService",
     "OrganizationRoleSetupService",
     "PolicyEvaluationService",
+    "PolicyIndex",
     "RBACService",
     "RoleInheritanceService",
+    "RoleSetCache",
+    "RoleTemplateService",
     "UserDomainService",
 ]
\ No newline at end of file
@@ -1,11 +1,17 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from uuid import UUID
 
 from ..entities.authorization_context import AuthorizationContext
+from ..entities.evaluation_context import EvaluationContext
 from ..entities.policy import Policy
 from ..repositories.policy_repository import PolicyRepository
-from ..value_objects.authorization_decision import AuthorizationDecision, DecisionReason
+from ..value_objects.authorization_decision import (
+    AccessDecision,
+    AuthorizationDecision,
+    DecisionReason,
+)
 from .policy_evaluation_service import PolicyEvaluationService
+from .policy_index import PolicyIndex
 
 
 class ABACService:
@@ -15,9 +21,11 @@ class ABACService:
         self,
         policy_repository: PolicyRepository,
         policy_evaluation_service: PolicyEvaluationService,
+        policy_index: Optional[PolicyIndex] = None,
     ):
         self._policy_repository = policy_repository
         self._policy_evaluation_service = policy_evaluation_service
+        self._policy_index = policy_index
 
     def evaluate_policies(self, context: AuthorizationContext) -> AuthorizationDecision:
         """Evaluate ABAC policies for the given context."""
@@ -26,12 +34,8 @@ class ABACService:
         # Enrich context with resource attributes if resource_id is provided
         enriched_context = self._enrich_context_with_resource_attributes(context)
 
-        # Get applicable policies
-        applicable_policies = self._policy_repository.get_applicable_policies(
-            enriched_context.resource_type,
-            enriched_context.action,
-            enriched_context.organization_id,
-        )
+        # Get applicable policies, highest priority first
+        applicable_policies = self._get_applicable_policies(enriched_context)
 
         if not applicable_policies:
             reason = DecisionReason(
@@ -44,14 +48,9 @@ class ABACService:
             )
             return AuthorizationDecision.not_applicable([reason])
 
-        # Sort policies by priority (highest first)
-        sorted_policies = sorted(
-            applicable_policies, key=lambda p: p.priority, reverse=True
-        )
-
         # Evaluate policies
         policy_results = []
-        for policy in sorted_policies:
+        for policy in applicable_policies:
             if not policy.is_active:
                 continue
 
@@ -94,13 +93,60 @@ class ABACService:
             )
             return AuthorizationDecision.not_applicable([reason])
 
+    def decide(self, context: AuthorizationContext) -> Optional[AccessDecision]:
+        """Evaluate policies without building reasons.
+
+        Returns None when no policy applies. Deny overrides allow, so the first
+        matching deny policy (by priority) decides immediately.
+        """
+        enriched_context = self._enrich_context_with_resource_attributes(context)
+
+        allowing_policy = None
+        for policy in self._get_applicable_policies(enriched_context):
+            if not policy.is_active:
+                continue
+
+            result = self._policy_evaluation_service.evaluate_policy(
+                policy, enriched_context
+            )
+            if result is None:
+                continue
+
+            if policy.effect.value == "deny":
+                return AccessDecision(False, f"policy:{policy.id}")
+            if allowing_policy is None and policy.effect.value == "allow":
+                allowing_policy = policy
+
+        if allowing_policy is not None:
+            return AccessDecision(True, f"policy:{allowing_policy.id}")
+
+        return None
+
+    def _get_applicable_policies(self, context: EvaluationContext) -> List[Policy]:
+        """Get policies for the context's resource and action, highest priority first."""
+        if self._policy_index is not None:
+            return self._policy_index.get_applicable_policies(
+                self._policy_repository,
+                context.resource_type,
+                context.action,
+                context.organization_id,
+            )
+
+        applicable_policies = self._policy_repository.get_applicable_policies(
+            context.resource_type,
+            context.action,
+            context.organization_id,
+        )
+        return sorted(applicable_policies, key=lambda p: p.priority, reverse=True)
+
     def _enrich_context_with_resource_attributes(
         self, context: AuthorizationContext
-    ) -> AuthorizationContext:
+    ) -> EvaluationContext:
         """Enrich authorization context with resource attributes."""
-        # For now, return context as-is since resource attributes should be provided
-        # by the calling context instead of being fetched from a resource repository
-        return context
+        # Resource attributes are provided by the calling context instead of being
+        # fetched from a resource repository; this only switches to the
+        # evaluation context so all policies share one attribute view.
+        return EvaluationContext.from_context(context)
 
     def _combine_policy_results(
         self, policy_results: List[tuple[Policy, bool]]
@@ -112,12 +158,13 @@ class ABACService:
         has_allow = False
         has_deny = False
 
+        # Every result here comes from a policy whose conditions matched; the
+        # boolean is the effect (False for deny policies), not the match.
         for policy, result in policy_results:
-            if result:  # Policy condition matched
-                if policy.effect.value == "deny":
-                    has_deny = True
-                elif policy.effect.value == "allow":
-                    has_allow = True
+            if policy.effect.value == "deny":
+                has_deny = True
+            elif policy.effect.value == "allow":
+                has_allow = True
 
         # Deny-overrides: if any policy denies, deny
         if has_deny:
@@ -166,10 +213,13 @@ class ABACService:
         """Evaluate policy conditions against context."""
         condition_results = []
         all_conditions_met = True
+        evaluation_attributes = EvaluationContext.from_context(
+            context
+        ).get_flat_attributes()
 
         for condition in policy.conditions:
             result = self._policy_evaluation_service.evaluate_condition(
-                condition, context.to_dict()
+                condition, evaluation_attributes
             )
             condition_results.append(
                 {"condition": condition.model_dump(), "result": result}
@@ -3,7 +3,9 @@ from typing import List
 from uuid import UUID
 
 from ..entities.authorization_context import AuthorizationContext
+from ..entities.evaluation_context import EvaluationContext
 from ..value_objects.authorization_decision import (
+    AccessDecision,
     AuthorizationDecision,
     DecisionReason,
 )
@@ -22,6 +24,7 @@ class AuthorizationService:
         """Main authorization method combining RBAC and ABAC."""
         start_time = time.time()
         reasons: List[DecisionReason] = []
+        context = EvaluationContext.from_context(context)
 
         try:
             # First try RBAC (faster)
@@ -84,6 +87,31 @@ class AuthorizationService:
             )
             return AuthorizationDecision.deny([error_reason], evaluation_time)
 
+    def decide(self, context: AuthorizationContext) -> AccessDecision:
+        """Lean authorization: same outcome as authorize(), without reasons.
+
+        Use authorize() when an explanation of the decision is needed.
+        """
+        try:
+            context = EvaluationContext.from_context(context)
+            rbac_decision = self._rbac_service.decide(context)
+            abac_decision = self._abac_service.decide(context)
+
+            if rbac_decision.allowed:
+                # RBAC allows unless an ABAC policy explicitly denies
+                if abac_decision is not None and not abac_decision.allowed:
+                    return abac_decision
+                return rbac_decision
+
+            # RBAC denies unless an ABAC policy explicitly allows
+            if abac_decision is not None and abac_decision.allowed:
+                return abac_decision
+            return rbac_decision
+
+        except Exception:
+            # Authorization failure should default to deny
+            return AccessDecision(False, "authorization_error")
+
     def can_user_access_resource(
         self,
         user_id: UUID,
@@ -93,7 +121,7 @@ class AuthorizationService:
         organization_id: UUID = None,
     ) -> bool:
         """Simplified method to check if user can access a resource."""
-        context = AuthorizationContext.create(
+        context = EvaluationContext.create(
             user_id=user_id,
             resource_type=resource_type,
             resource_id=resource_id,
@@ -101,8 +129,7 @@ class AuthorizationService:
             organization_id=organization_id,
         )
 
-        decision = self.authorize(context)
-        return decision.is_allowed()
+        return self.decide(context).allowed
 
     def get_user_permissions(
         self, user_id: UUID, organization_id: UUID = None
@@ -122,7 +149,7 @@ class AuthorizationService:
         results = {}
 
         for action in actions:
-            context = AuthorizationContext.create(
+            context = EvaluationContext.create(
                 user_id=user_id,
                 resource_type=resource_type,
                 action=action,
@@ -130,7 +157,6 @@ class AuthorizationService:
                 resource_id=resource_id,
             )
 
-            decision = self.authorize(context)
-            results[action] = decision.is_allowed()
+            results[action] = self.decide(context).allowed
 
         return results
@@ -6,6 +6,7 @@ from typing import Any, Dict, List, Optional
 from jose import JWTError, jwt
 
 from shared.infrastructure.config import settings
+from .role_set_cache import get_role_set_cache
 
 
 class JWTTokenPayload:
@@ -22,6 +23,7 @@ class JWTTokenPayload:
         ip_address: Optional[str] = None,
         exp: Optional[datetime] = None,
         iat: Optional[datetime] = None,
+        compact: bool = False,
     ):
         self.user_id = user_id
         self.organization_id = organization_id
@@ -32,6 +34,7 @@ class JWTTokenPayload:
         self.ip_address = ip_address
         self.exp = exp or (datetime.utcnow() + settings.jwt_expiration_delta)
         self.iat = iat or datetime.utcnow()
+        self.compact = compact
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert payload to dictionary for JWT encoding."""
@@ -59,6 +62,9 @@ class JWTTokenPayload:
         if self.ip_address:
             payload["ip_address"] = self.ip_address
         
+        if self.compact:
+            payload["compact"] = True
+        
         return payload
     
     @classmethod
@@ -74,6 +80,7 @@ class JWTTokenPayload:
             ip_address=payload.get("ip_address"),
             exp=datetime.fromtimestamp(payload["exp"]) if "exp" in payload else None,
             iat=datetime.fromtimestamp(payload["iat"]) if "iat" in payload else None,
+            compact=payload.get("compact", False),
         )
 
 
@@ -101,10 +108,15 @@ class JWTService:
         user_agent: Optional[str] = None,
         ip_address: Optional[str] = None,
         expires_delta: Optional[timedelta] = None,
+        compact: bool = False,
     ) -> str:
         """
         Create a new JWT access token.
         
+        A compact token only carries the user's identity: permissions, roles,
+        user agent and IP address are left out and resolved server-side from
+        the user's current role set.
+        
         Args:
             user_id: User identifier
             organization_id: Organization identifier (for multi-tenant context)
@@ -114,12 +126,16 @@ class JWTService:
             user_agent: Client user agent
             ip_address: Client IP address
             expires_delta: Custom expiration delta, defaults to settings value
+            compact: Leave roles and permissions out of the token
         
         Returns:
             Encoded JWT token string
         """
         expire = datetime.utcnow() + (expires_delta or settings.jwt_expiration_delta)
         
+        if compact:
+            permissions = roles = user_agent = ip_address = None
+        
         payload = JWTTokenPayload(
             user_id=user_id,
             organization_id=organization_id,
@@ -129,6 +145,7 @@ class JWTService:
             user_agent=user_agent,
             ip_address=ip_address,
             exp=expire,
+            compact=compact,
         )
         
         encoded_token: str = jwt.encode(
@@ -230,6 +247,7 @@ class JWTService:
             user_agent=payload.user_agent,
             ip_address=payload.ip_address,
             expires_delta=expires_delta,
+            compact=payload.compact,
         )
     
     def has_permission(self, token: str, required_permission: str) -> bool:
@@ -243,7 +261,7 @@ class JWTService:
         Returns:
             True if user has permission, False otherwise
         """
-        payload = self.decode_token(token)
+        payload = self._decode_with_claims(token)
         if not payload:
             return False
         
@@ -279,7 +297,7 @@ class JWTService:
         Returns:
             True if user has role, False otherwise
         """
-        payload = self.decode_token(token)
+        payload = self._decode_with_claims(token)
         if not payload:
             return False
         
@@ -295,7 +313,7 @@ class JWTService:
         Returns:
             List of permission strings if token is valid, empty list otherwise
         """
-        payload = self.decode_token(token)
+        payload = self._decode_with_claims(token)
         return payload.permissions if payload else []
     
     def get_token_roles(self, token: str) -> List[str]:
@@ -308,5 +326,33 @@ class JWTService:
         Returns:
             List of role strings if token is valid, empty list otherwise
         """
+        payload = self._decode_with_claims(token)
+        return payload.roles if payload else []
+    
+    def resolve_cached_claims(self, payload: JWTTokenPayload) -> bool:
+        """
+        Fill roles and permissions of a compact token from the role set cache.
+        
+        Args:
+            payload: Decoded token payload
+        
+        Returns:
+            True if the payload carries its claims, False on a cache miss
+        """
+        if not payload.compact:
+            return True
+        
+        role_set = get_role_set_cache().get(payload.user_id, payload.organization_id)
+        if role_set is None:
+            return False
+        
+        payload.roles = list(role_set.roles)
+        payload.permissions = list(role_set.permissions)
+        return True
+    
+    def _decode_with_claims(self, token: str) -> Optional[JWTTokenPayload]:
+        """Decode a token, resolving compact claims from the cache when possible."""
         payload = self.decode_token(token)
-        return payload.roles if payload else []
\ No newline at end of file
+        if payload:
+            self.resolve_cached_claims(payload)
+        return payload
\ No newline at end of file
@@ -9,19 +9,36 @@ from ..constants.default_roles import (
     DefaultOrganizationRoles,
 )
 from ..entities.role import Role
-from ..entities.permission import Permission
-from ..value_objects.role_name import RoleName
+from ..entities.permission import Permission, PermissionAction
 from ..value_objects.permission_name import PermissionName
 from ..repositories.role_repository import RoleRepository
 from ..repositories.permission_repository import PermissionRepository
-from ..repositories.role_permission_repository import RolePermissionRepository
 from ..repositories.user_organization_role_repository import (
     UserOrganizationRoleRepository,
 )
+from ..repositories.effective_user_permission_repository import (
+    EffectiveUserPermissionRepository,
+)
+from .role_set_cache import get_role_set_cache
+from .role_template_service import RoleTemplateService
+
+_STORED_ACTIONS = {
+    PermissionAction.CREATE.value,
+    PermissionAction.READ.value,
+    PermissionAction.UPDATE.value,
+    PermissionAction.DELETE.value,
+    PermissionAction.EXECUTE.value,
+    PermissionAction.MANAGE.value,
+}
 
 
 class OrganizationRoleSetupService:
-    """Service for setting up default roles and permissions for organizations."""
+    """Service for setting up default roles and permissions for organizations.
+
+    Organizations do not get their own copies of the default roles: they
+    reference shared templates (see RoleTemplateService), which are created
+    once, on first use.
+    """
 
     def __init__(self, uow: UnitOfWork):
         self._uow = uow
@@ -29,72 +46,77 @@ class OrganizationRoleSetupService:
         self._permission_repository: PermissionRepository = uow.get_repository(
             "permission"
         )
-        self._role_permission_repository: RolePermissionRepository = uow.get_repository(
-            "role_permission"
-        )
         self._user_org_role_repository: UserOrganizationRoleRepository = (
             uow.get_repository("user_organization_role")
         )
+        self._effective_permission_repository: EffectiveUserPermissionRepository = (
+            uow.get_repository("effective_user_permission")
+        )
+        self._role_template_service = RoleTemplateService(
+            self._role_repository, self._effective_permission_repository
+        )
 
     def setup_default_roles_for_organization(
         self, organization_id: UUID, owner_user_id: UUID
     ) -> List[Role]:
         """
-        Create default roles for a new organization and assign owner role to the creator.
+        Give a new organization the default roles and assign the owner role to the creator.
 
         Args:
             organization_id: ID of the organization
             owner_user_id: ID of the user who created the organization (becomes owner)
 
         Returns:
-            List of created roles
+            List of default roles (the shared templates) of the organization
         """
-        created_roles = []
-
         with self._uow:
-            # Create all default roles
-            for role_name in DefaultRoleConfigurations.get_all_default_roles():
-                role_config = DefaultRoleConfigurations.get_role_config(role_name)
+            templates = self.ensure_role_templates(created_by=owner_user_id)
 
-                # Create role
-                role = Role.create(
-                    name=RoleName(role_name),
-                    description=role_config["description"],
-                    organization_id=organization_id,
-                    is_system_role=role_config.get("is_system_role", False),
-                    can_be_deleted=role_config.get("can_be_deleted", True),
-                )
+            for template in templates:
+                if template.name.value == DefaultOrganizationRoles.OWNER.value:
+                    self._assign_role_to_user(
+                        owner_user_id, organization_id, template.id
+                    )
 
-                saved_role = self._role_repository.save(role)
-                created_roles.append(saved_role)
+        return templates
 
-                # Create and assign permissions to role
-                self._setup_role_permissions(saved_role, role_config["permissions"])
+    def ensure_role_templates(self, created_by: UUID) -> List[Role]:
+        """Get the default-role templates, creating the missing ones."""
+        templates = self._role_template_service.get_templates()
+        existing_names = {template.name.value for template in templates}
 
-                # If this is the owner role, assign it to the creator
-                if role_name == DefaultOrganizationRoles.OWNER.value:
-                    self._assign_role_to_user(
-                        owner_user_id, organization_id, saved_role.id
-                    )
+        for role_name in DefaultRoleConfigurations.get_all_default_roles():
+            if role_name in existing_names:
+                continue
 
-        return created_roles
+            role_config = DefaultRoleConfigurations.get_role_config(role_name)
+            template = self._role_repository.save(
+                Role.create(
+                    name=role_name,
+                    description=role_config["description"],
+                    created_by=created_by,
+                    is_system_role=True,
+                )
+            )
+            self._setup_role_permissions(template, role_config["permissions"])
+            templates.append(template)
+
+        return templates
 
     def _setup_role_permissions(self, role: Role, permission_names: List[str]) -> None:
         """Setup permissions for a role."""
-        for permission_name in permission_names:
-            # Get or create permission
-            permission = self._get_or_create_permission(permission_name)
+        permission_ids = [
+            self._get_or_create_permission(permission_name).id
+            for permission_name in dict.fromkeys(permission_names)
+        ]
 
-            # Assign permission to role
-            self._role_permission_repository.assign_permission_to_role(
-                role_id=role.id, permission_id=permission.id
-            )
+        self._role_repository.assign_permissions(role.id, permission_ids)
 
     def _get_or_create_permission(self, permission_name: str) -> Permission:
         """Get existing permission or create new one."""
         # Try to find existing permission
         existing_permission = self._permission_repository.find_by_name(
-            PermissionName(permission_name)
+            PermissionName(value=permission_name)
         )
 
         if existing_permission:
@@ -104,14 +126,24 @@ class OrganizationRoleSetupService:
         resource_type, action = self._parse_permission_name(permission_name)
 
         permission = Permission.create(
-            name=PermissionName(permission_name),
+            name=permission_name,
             description=f"Permission to {action} {resource_type}",
             resource_type=resource_type,
-            action=action,
+            action=self._stored_action(action),
         )
 
         return self._permission_repository.save(permission)
 
+    def _stored_action(self, action: str) -> PermissionAction:
+        """Get the action column value for a configured permission action.
+
+        Wildcards and document actions have no column value and are stored as
+        manage; the permission name keeps the exact action.
+        """
+        if action in _STORED_ACTIONS:
+            return PermissionAction(action)
+        return PermissionAction.MANAGE
+
     def _parse_permission_name(self, permission_name: str) -> tuple[str, str]:
         """Parse permission name into resource_type and action."""
         if ":" in permission_name:
@@ -125,26 +157,41 @@ class OrganizationRoleSetupService:
     def _assign_role_to_user(
         self, user_id: UUID, organization_id: UUID, role_id: UUID
     ) -> None:
-        """Assign a role to a user in an organization."""
+        """Assign a role to a user in an organization (no-op if already assigned).
+
+        Besides the membership, the role goes into the RBAC assignments and the
+        user's effective permissions are refreshed in the same unit of work, as
+        authorization only reads the materialized permissions.
+        """
+        if self._user_org_role_repository.user_has_role_in_organization(
+            user_id, organization_id, role_id
+        ):
+            return
+
         self._user_org_role_repository.assign_role_to_user(
             user_id=user_id, organization_id=organization_id, role_id=role_id
         )
+        self._role_repository.assign_role_to_user(
+            user_id=user_id,
+            role_id=role_id,
+            organization_id=organization_id,
+            assigned_by=user_id,
+        )
+
+        self._effective_permission_repository.refresh_users([user_id])
+        get_role_set_cache().reload_cache()
 
     def get_organization_roles(self, organization_id: UUID) -> List[Role]:
-        """Get all roles for an organization."""
-        return self._role_repository.get_organization_roles(organization_id)
+        """Get all roles for an organization, including the shared templates."""
+        return self._role_template_service.resolve_organization_roles(organization_id)
 
     def assign_default_member_role(self, user_id: UUID, organization_id: UUID) -> bool:
         """Assign default member role to a user."""
         try:
-            # Find member role for the organization
-            roles = self._role_repository.get_organization_roles(organization_id)
-            member_role = None
-
-            for role in roles:
-                if role.name.value == DefaultOrganizationRoles.MEMBER.value:
-                    member_role = role
-                    break
+            # Find member role for the organization (its own copy or the template)
+            member_role = self._role_template_service.resolve_role(
+                DefaultOrganizationRoles.MEMBER.value, organization_id
+            )
 
             if not member_role:
                 return False
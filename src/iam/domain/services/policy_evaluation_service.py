@@ -1,15 +1,18 @@
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Union
 from datetime import datetime, timezone
 
 from ..entities.policy import Policy, PolicyCondition
 from ..entities.authorization_context import AuthorizationContext
+from ..entities.evaluation_context import EvaluationContext
 
 
 class PolicyEvaluationService:
     """Service for evaluating ABAC policies against authorization contexts."""
 
     def evaluate_policy(
-        self, policy: Policy, context: AuthorizationContext
+        self,
+        policy: Policy,
+        context: Union[AuthorizationContext, EvaluationContext],
     ) -> Optional[bool]:
         """Evaluate a policy against an authorization context."""
         if not policy.is_active:
@@ -19,11 +22,8 @@ class PolicyEvaluationService:
         if not self._policy_applies_to_context(policy, context):
             return None
 
-        # Convert context to evaluation dictionary
-        evaluation_context = context.to_dict()
-
-        # Add computed attributes
-        evaluation_context.update(self._get_computed_attributes(context))
+        # Flat attributes plus computed ones, shared by all policies of a request
+        evaluation_context = self._get_evaluation_attributes(context)
 
         # Evaluate all conditions
         all_conditions_met = True
@@ -47,8 +47,8 @@ class PolicyEvaluationService:
         if policy.resource_type != context.resource_type:
             return False
 
-        # Check action
-        if policy.action != context.action:
+        # Check action (wildcard policies apply to every action)
+        if policy.action != context.action and policy.action != "*":
             return False
 
         # Check organization scope
@@ -57,6 +57,14 @@ class PolicyEvaluationService:
 
         return True
 
+    def _get_evaluation_attributes(
+        self, context: Union[AuthorizationContext, EvaluationContext]
+    ) -> Dict[str, Any]:
+        """Get the attributes conditions are evaluated against (memoized per context)."""
+        return EvaluationContext.from_context(context).get_evaluation_attributes(
+            self._get_computed_attributes
+        )
+
     def _evaluate_condition(
         self, condition: PolicyCondition, context: Dict[str, Any]
     ) -> bool:
@@ -178,8 +186,7 @@ class PolicyEvaluationService:
             explanation["reason"] = "Policy does not apply to this context"
             return explanation
 
-        evaluation_context = context.to_dict()
-        evaluation_context.update(self._get_computed_attributes(context))
+        evaluation_context = self._get_evaluation_attributes(context)
 
         all_conditions_met = True
         for i, condition in enumerate(policy.conditions):
@@ -0,0 +1,197 @@
+import threading
+import time
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from ..entities.policy import Policy
+from ..repositories.policy_repository import PolicyRepository
+
+# Policies with this action apply to every action of their resource type
+WILDCARD_ACTION = "*"
+
+_PolicyBuckets = Dict[Tuple[str, str], Tuple[Policy, ...]]
+
+
+class _PolicyScope:
+    """Active policies of one scope bucketed by (resource_type, action)."""
+
+    __slots__ = ("buckets", "expires_at")
+
+    def __init__(self, buckets: _PolicyBuckets, expires_at: float):
+        self.buckets = buckets
+        self.expires_at = expires_at
+
+
+class PolicyIndex:
+    """Per-process index of active ABAC policies.
+
+    The policies of an organization (plus the global ones) are loaded once and
+    bucketed by ``(resource_type, action)``. Each bucket already contains the
+    wildcard-action policies of its resource type and is sorted by priority,
+    highest first, so a lookup is a dict access with no query and no sort.
+
+    Policy writes through ``PolicyUseCase`` invalidate the affected scope;
+    the TTL bounds how long writes made by other processes go unnoticed.
+    A load that started before an invalidation is not kept, so it cannot
+    bring back old policies.
+    """
+
+    def __init__(self, ttl_seconds: float = 60.0):
+        self._ttl_seconds = ttl_seconds
+        self._scopes: Dict[Optional[UUID], _PolicyScope] = {}
+        self._version = 0
+        self._lock = threading.Lock()
+        self._enabled = True
+        self._hits = 0
+        self._misses = 0
+
+    def get_applicable_policies(
+        self,
+        policy_repository: PolicyRepository,
+        resource_type: str,
+        action: str,
+        organization_id: Optional[UUID] = None,
+    ) -> List[Policy]:
+        """Get active policies for a resource type and action, highest priority first.
+
+        Organization-specific and global policies are returned together,
+        including the wildcard-action policies of the resource type.
+        """
+        if not self._enabled:
+            return self._sorted(
+                policy
+                for policy in self._load_policies(policy_repository, organization_id)
+                if policy.resource_type == resource_type
+                and policy.action in (action, WILDCARD_ACTION)
+            )
+
+        buckets = self._get_buckets(policy_repository, organization_id)
+        policies = buckets.get((resource_type, action))
+        if policies is None:
+            policies = buckets.get((resource_type, WILDCARD_ACTION), ())
+
+        return list(policies)
+
+    def preload(
+        self,
+        policy_repository: PolicyRepository,
+        organization_id: Optional[UUID] = None,
+    ) -> None:
+        """Load the policies of a scope ahead of the first lookup (startup warm-up)."""
+        if self._enabled:
+            self._get_buckets(policy_repository, organization_id)
+
+    def invalidate(self, organization_id: Optional[UUID] = None) -> None:
+        """Drop the indexed policies of an organization.
+
+        Global policies are part of every organization's buckets, so
+        invalidating the global scope (None) clears the whole index.
+        """
+        with self._lock:
+            self._version += 1
+            if organization_id is None:
+                self._scopes.clear()
+            else:
+                self._scopes.pop(organization_id, None)
+
+    def reload_cache(self) -> None:
+        """Clear all indexed policies."""
+        with self._lock:
+            self._version += 1
+            self._scopes.clear()
+
+    def disable_cache(self) -> None:
+        """Disable the index (useful for testing)."""
+        self._enabled = False
+        self.reload_cache()
+
+    def enable_cache(self) -> None:
+        """Enable the index."""
+        self._enabled = True
+
+    def get_cache_info(self) -> Dict[str, Any]:
+        """Get information about the current cache state."""
+        return {
+            "cache_enabled": self._enabled,
+            "cache_size": len(self._scopes),
+            "hits": self._hits,
+            "misses": self._misses,
+            "ttl_seconds": self._ttl_seconds,
+        }
+
+    def _get_buckets(
+        self, policy_repository: PolicyRepository, organization_id: Optional[UUID]
+    ) -> _PolicyBuckets:
+        now = time.time()
+
+        with self._lock:
+            scope = self._scopes.get(organization_id)
+            if scope is not None and now < scope.expires_at:
+                self._hits += 1
+                return scope.buckets
+            self._misses += 1
+            version = self._version
+
+        # Load outside the lock; concurrent misses build the same buckets
+        buckets = self._build_buckets(
+            self._load_policies(policy_repository, organization_id)
+        )
+
+        with self._lock:
+            if version == self._version:
+                self._scopes[organization_id] = _PolicyScope(
+                    buckets, now + self._ttl_seconds
+                )
+
+        return buckets
+
+    def _load_policies(
+        self, policy_repository: PolicyRepository, organization_id: Optional[UUID]
+    ) -> List[Policy]:
+        policies = list(policy_repository.find_global_policies())
+        if organization_id:
+            policies.extend(policy_repository.find_by_organization(organization_id))
+
+        return [policy for policy in policies if policy.is_active]
+
+    def _build_buckets(self, policies: Iterable[Policy]) -> _PolicyBuckets:
+        grouped: Dict[Tuple[str, str], List[Policy]] = {}
+        for policy in policies:
+            grouped.setdefault((policy.resource_type, policy.action), []).append(
+                policy
+            )
+
+        # Fold each resource type's wildcard policies into its exact buckets
+        buckets: _PolicyBuckets = {}
+        for (resource_type, action), policies in grouped.items():
+            if action != WILDCARD_ACTION:
+                policies = policies + grouped.get(
+                    (resource_type, WILDCARD_ACTION), []
+                )
+            buckets[(resource_type, action)] = tuple(self._sorted(policies))
+
+        return buckets
+
+    @staticmethod
+    def _sorted(policies: Iterable[Policy]) -> List[Policy]:
+        return sorted(policies, key=lambda policy: policy.priority, reverse=True)
+
+
+# Global instance shared by all requests in this process
+_policy_index_instance: Optional[PolicyIndex] = None
+
+
+def get_policy_index() -> PolicyIndex:
+    """Get the global policy index instance."""
+    global _policy_index_instance
+
+    if _policy_index_instance is None:
+        _policy_index_instance = PolicyIndex()
+
+    return _policy_index_instance
+
+
+def set_policy_index(index: PolicyIndex) -> None:
+    """Set a custom policy index instance (useful for testing)."""
+    global _policy_index_instance
+    _policy_index_instance = index
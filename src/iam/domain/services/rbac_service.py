@@ -6,7 +6,15 @@ from ..entities.permission import Permission
 from ..repositories.role_repository import RoleRepository
 from ..repositories.permission_repository import PermissionRepository
 from ..repositories.role_permission_repository import RolePermissionRepository
-from ..value_objects.authorization_decision import AuthorizationDecision, DecisionReason
+from ..repositories.effective_user_permission_repository import (
+    EffectiveUserPermissionRepository,
+)
+from ..value_objects.authorization_decision import (
+    AccessDecision,
+    AuthorizationDecision,
+    DecisionReason,
+)
+from ..value_objects.role_hierarchy import RoleHierarchy
 from .role_inheritance_service import RoleInheritanceService
 
 
@@ -19,6 +27,9 @@ class RBACService:
         permission_repository: PermissionRepository,
         role_permission_repository: RolePermissionRepository,
         role_inheritance_service: Optional[RoleInheritanceService] = None,
+        effective_permission_repository: Optional[
+            EffectiveUserPermissionRepository
+        ] = None,
     ):
         self._role_repository = role_repository
         self._permission_repository = permission_repository
@@ -26,9 +37,13 @@ class RBACService:
         self._role_inheritance_service = (
             role_inheritance_service or RoleInheritanceService()
         )
+        self._effective_permission_repository = effective_permission_repository
 
     def authorize(self, context: AuthorizationContext) -> AuthorizationDecision:
         """Authorize request using RBAC."""
+        if self._effective_permission_repository is not None:
+            return self._authorize_from_effective_permissions(context)
+
         reasons: List[DecisionReason] = []
 
         # Get user roles
@@ -125,32 +140,99 @@ class RBACService:
         )
         return AuthorizationDecision.deny([reason])
 
+    def decide(self, context: AuthorizationContext) -> AccessDecision:
+        """Authorize without building reasons; the rule is the matched permission."""
+        candidates = (
+            f"{context.resource_type}:{context.action}",
+            f"{context.resource_type}:*",
+            f"*:{context.action}",
+            "*:*",
+        )
+
+        if self._effective_permission_repository is not None:
+            matched = self._effective_permission_repository.find_matching_permission(
+                context.user_id, context.organization_id, list(candidates)
+            )
+            if matched:
+                return AccessDecision(True, matched)
+            return AccessDecision(False, "rbac_deny")
+
+        user_permissions = set(
+            self.get_user_permissions(context.user_id, context.organization_id)
+        )
+        for candidate in candidates:
+            if candidate in user_permissions:
+                return AccessDecision(True, candidate)
+
+        return AccessDecision(False, "rbac_deny")
+
+    def _authorize_from_effective_permissions(
+        self, context: AuthorizationContext
+    ) -> AuthorizationDecision:
+        """Authorize with one indexed lookup in the materialized permissions."""
+        required_permission = f"{context.resource_type}:{context.action}"
+        candidates = [
+            required_permission,
+            f"{context.resource_type}:*",
+            f"*:{context.action}",
+            "*:*",
+        ]
+
+        matched = self._effective_permission_repository.find_matching_permission(
+            context.user_id, context.organization_id, candidates
+        )
+
+        if matched:
+            reason = DecisionReason(
+                type="rbac_allow",
+                message=f"User has required permission: {matched}",
+                details={"permission": matched},
+            )
+            return AuthorizationDecision.allow([reason])
+
+        reason = DecisionReason(
+            type="rbac_deny",
+            message=f"User lacks required permission: {required_permission}",
+            details={
+                "required_permission": required_permission,
+                "user_id": str(context.user_id),
+            },
+        )
+        return AuthorizationDecision.deny([reason])
+
     def get_user_permissions(
         self, user_id: UUID, organization_id: Optional[UUID] = None
     ) -> List[str]:
         """Get all permissions for a user through their roles (including inherited permissions)."""
+        if self._effective_permission_repository is not None:
+            return self._effective_permission_repository.get_permission_keys(
+                user_id, organization_id
+            )
+
         # Get user roles
         user_roles = self._role_repository.get_user_roles(user_id, organization_id)
 
         if not user_roles:
             return []
 
-        # Get all roles in the organization hierarchy
-        all_roles = self._role_repository.get_role_hierarchy(organization_id)
+        # Load only the user's roles and their ancestors in one query
+        user_role_ids = [role.id for role in user_roles if role.is_active]
+        hierarchy = RoleHierarchy(
+            self._role_repository.get_roles_with_ancestors(user_role_ids)
+        )
 
         # Build role permissions map
         role_permissions_map: Dict[UUID, List[Permission]] = {}
-        for role in all_roles:
+        for role in hierarchy:
             role_perms = self._permission_repository.get_role_permissions(role.id)
             # Only include active permissions
             active_perms = [p for p in role_perms if p.is_active]
             role_permissions_map[role.id] = active_perms
 
         # Get effective permissions for user roles (including inherited)
-        user_role_ids = [role.id for role in user_roles if role.is_active]
         effective_permissions = (
             self._role_inheritance_service.get_effective_permissions_for_user_roles(
-                user_role_ids, all_roles, role_permissions_map
+                user_role_ids, hierarchy, role_permissions_map
             )
         )
 
@@ -1,8 +1,9 @@
-from typing import List, Set, Dict, Optional
+from typing import List, Set, Dict, Optional, Union
 from uuid import UUID
 
 from ..entities.role import Role
 from ..entities.permission import Permission
+from ..value_objects.role_hierarchy import RoleHierarchy
 
 
 class RoleInheritanceService:
@@ -11,7 +12,7 @@ class RoleInheritanceService:
     def calculate_inherited_permissions(
         self,
         role: Role,
-        all_roles: List[Role],
+        all_roles: Union[List[Role], RoleHierarchy],
         role_permissions: Dict[UUID, List[Permission]],
     ) -> List[Permission]:
         """
@@ -19,7 +20,8 @@ class RoleInheritanceService:
 
         Args:
             role: The role to calculate permissions for
-            all_roles: All available roles in the system
+            all_roles: The role's ancestors (or all roles), as a list or a
+                prebuilt RoleHierarchy
             role_permissions: Map of role_id to direct permissions
 
         Returns:
@@ -28,19 +30,19 @@ class RoleInheritanceService:
         if not role.has_parent():
             return role_permissions.get(role.id, [])
 
+        hierarchy = self._as_hierarchy(all_roles)
+
         # Get role hierarchy path (from root to current role)
-        hierarchy_path = role.get_role_hierarchy_path(all_roles)
+        hierarchy_path = self._get_path(role, hierarchy)
 
         # Collect permissions from all roles in hierarchy
         all_permissions = []
         seen_permissions = set()  # Track to avoid duplicates
 
         # Start from root and work down to ensure proper inheritance order
-        role_map = {r.id: r for r in all_roles}
-
         for role_id in hierarchy_path:
             # Check if role is active - only inherit from active roles
-            role_in_hierarchy = role_map.get(role_id)
+            role_in_hierarchy = role if role_id == role.id else hierarchy.get(role_id)
             if not role_in_hierarchy or not role_in_hierarchy.is_active:
                 continue
 
@@ -56,7 +58,9 @@ class RoleInheritanceService:
 
         return all_permissions
 
-    def get_role_hierarchy(self, role: Role, all_roles: List[Role]) -> List[Role]:
+    def get_role_hierarchy(
+        self, role: Role, all_roles: Union[List[Role], RoleHierarchy]
+    ) -> List[Role]:
         """
         Get complete role hierarchy for a given role.
 
@@ -65,18 +69,12 @@ class RoleInheritanceService:
         if not role.has_parent():
             return [role]
 
-        role_map = {r.id: r for r in all_roles}
-        hierarchy = []
-
-        # Get hierarchy path
-        hierarchy_path = role.get_role_hierarchy_path(all_roles)
-
-        # Convert IDs to Role objects
-        for role_id in hierarchy_path:
-            if role_id in role_map:
-                hierarchy.append(role_map[role_id])
+        hierarchy = self._as_hierarchy(all_roles)
+        ancestors = [
+            hierarchy.get(role_id) for role_id in self._get_path(role, hierarchy)[:-1]
+        ]
 
-        return hierarchy
+        return [ancestor for ancestor in ancestors if ancestor] + [role]
 
     def get_child_roles(
         self, parent_role_id: UUID, all_roles: List[Role]
@@ -85,20 +83,10 @@ class RoleInheritanceService:
         return [role for role in all_roles if role.parent_role_id == parent_role_id]
 
     def get_descendant_roles(
-        self, ancestor_role_id: UUID, all_roles: List[Role]
+        self, ancestor_role_id: UUID, all_roles: Union[List[Role], RoleHierarchy]
     ) -> List[Role]:
         """Get all descendant roles (children, grandchildren, etc.) of a role."""
-        descendants = []
-
-        # Get direct children
-        children = self.get_child_roles(ancestor_role_id, all_roles)
-
-        for child in children:
-            descendants.append(child)
-            # Recursively get descendants of child
-            descendants.extend(self.get_descendant_roles(child.id, all_roles))
-
-        return descendants
+        return self._as_hierarchy(all_roles).get_descendants(ancestor_role_id)
 
     def validate_role_hierarchy(self, roles: List[Role]) -> List[str]:
         """
@@ -144,7 +132,7 @@ class RoleInheritanceService:
     def get_effective_permissions_for_user_roles(
         self,
         user_role_ids: List[UUID],
-        all_roles: List[Role],
+        all_roles: Union[List[Role], RoleHierarchy],
         role_permissions: Dict[UUID, List[Permission]],
     ) -> List[Permission]:
         """
@@ -154,15 +142,16 @@ class RoleInheritanceService:
         """
         all_permissions = []
         seen_permissions = set()
+        hierarchy = self._as_hierarchy(all_roles)
 
         for role_id in user_role_ids:
-            role = next((r for r in all_roles if r.id == role_id), None)
+            role = hierarchy.get(role_id)
             if not role or not role.is_active:
                 continue
 
             # Get permissions for this role (including inherited)
             role_perms = self.calculate_inherited_permissions(
-                role, all_roles, role_permissions
+                role, hierarchy, role_permissions
             )
 
             for permission in role_perms:
@@ -193,8 +182,8 @@ class RoleInheritanceService:
             return False, "Cannot inherit from inactive role"
 
         # Check for circular inheritance
-        temp_role = child_role.set_parent_role(potential_parent_role.id)
-        if temp_role.is_descendant_of(all_roles + [temp_role], child_role.id):
+        hierarchy = RoleHierarchy([*all_roles, child_role, potential_parent_role])
+        if hierarchy.would_create_cycle(child_role.id, potential_parent_role.id):
             return False, "Would create circular inheritance"
 
         # Check organization scope
@@ -205,3 +194,17 @@ class RoleInheritanceService:
             return False, "Global role cannot inherit from organization role"
 
         return True, "Inheritance is allowed"
+
+    def _as_hierarchy(
+        self, all_roles: Union[List[Role], RoleHierarchy]
+    ) -> RoleHierarchy:
+        """Reuse a prebuilt hierarchy or build one from a role list."""
+        if isinstance(all_roles, RoleHierarchy):
+            return all_roles
+        return RoleHierarchy(all_roles)
+
+    def _get_path(self, role: Role, hierarchy: RoleHierarchy) -> List[UUID]:
+        """Get the root-to-role path, also for a role missing from the hierarchy."""
+        if role.id in hierarchy:
+            return hierarchy.get_path(role.id)
+        return hierarchy.get_path(role.parent_role_id) + [role.id]
@@ -0,0 +1,129 @@
+import threading
+import time
+from typing import Dict, Any, Iterable, Optional, Tuple
+
+from shared.infrastructure.config import settings
+
+_UserKey = Tuple[str, Optional[str]]
+
+
+class RoleSet:
+    """Role names and effective permissions of a user in an organization."""
+
+    __slots__ = ("roles", "permissions", "expires_at")
+
+    def __init__(
+        self,
+        roles: Tuple[str, ...],
+        permissions: Tuple[str, ...],
+        expires_at: float,
+    ):
+        self.roles = roles
+        self.permissions = permissions
+        self.expires_at = expires_at
+
+
+class RoleSetCache:
+    """Per-process cache resolving compact JWT claims.
+
+    Compact tokens only carry the user's identity (user and organization),
+    not the permission and role lists. Their claims are always the user's
+    current role set, looked up by user and organization, so they follow role
+    changes instead of staying as they were when the token was issued.
+
+    Refreshing materialized permissions drops every entry of this process.
+    Nothing is shared between processes, so the TTL bounds how long changes
+    made by other processes go unnoticed.
+    """
+
+    def __init__(self, ttl_seconds: float = 300.0):
+        self._ttl_seconds = ttl_seconds
+        self._user_role_sets: Dict[_UserKey, RoleSet] = {}
+        self._lock = threading.Lock()
+        self._enabled = True
+        self._hits = 0
+        self._misses = 0
+
+    def get(
+        self, user_id: str, organization_id: Optional[str] = None
+    ) -> Optional[RoleSet]:
+        """Get the user's current role set, None on a miss."""
+        if not self._enabled:
+            return None
+
+        now = time.time()
+        with self._lock:
+            role_set = self._user_role_sets.get((user_id, organization_id))
+
+            if role_set is not None and now < role_set.expires_at:
+                self._hits += 1
+                return role_set
+
+            self._misses += 1
+            return None
+
+    def put(
+        self,
+        roles: Iterable[str],
+        permissions: Iterable[str],
+        user_id: str,
+        organization_id: Optional[str] = None,
+    ) -> RoleSet:
+        """Cache a role set resolved for a user."""
+        role_set = RoleSet(
+            tuple(roles),
+            tuple(permissions),
+            time.time() + self._ttl_seconds,
+        )
+
+        if self._enabled:
+            with self._lock:
+                self._user_role_sets[(user_id, organization_id)] = role_set
+
+        return role_set
+
+    def reload_cache(self) -> None:
+        """Clear all cached role sets."""
+        with self._lock:
+            self._user_role_sets.clear()
+
+    def disable_cache(self) -> None:
+        """Disable the cache (useful for testing)."""
+        self._enabled = False
+        self.reload_cache()
+
+    def enable_cache(self) -> None:
+        """Enable the cache."""
+        self._enabled = True
+
+    def get_cache_info(self) -> Dict[str, Any]:
+        """Get information about the current cache state."""
+        return {
+            "cache_enabled": self._enabled,
+            "cache_size": len(self._user_role_sets),
+            "hits": self._hits,
+            "misses": self._misses,
+            "ttl_seconds": self._ttl_seconds,
+        }
+
+
+# Global instance shared by all requests in this process
+_role_set_cache_instance: Optional[RoleSetCache] = None
+
+
+def get_role_set_cache() -> RoleSetCache:
+    """Get the global role set cache instance."""
+    global _role_set_cache_instance
+
+    if _role_set_cache_instance is None:
+        _role_set_cache_instance = RoleSetCache(
+            ttl_seconds=settings.role_set_cache_ttl_seconds
+        )
+
+    return _role_set_cache_instance
+
+
+def set_role_set_cache(cache: RoleSetCache) -> None:
+    """Set a custom role set cache instance (useful for testing)."""
+    global _role_set_cache_instance
+    _role_set_cache_instance = cache
@@ -0,0 +1,114 @@
+from typing import List, Optional
+from uuid import UUID
+
+from ..constants.default_roles import DefaultRoleConfigurations
+from ..entities.role import Role
+from ..repositories.role_repository import RoleRepository
+from ..repositories.effective_user_permission_repository import (
+    EffectiveUserPermissionRepository,
+)
+from ..value_objects.role_name import RoleName
+from .role_set_cache import get_role_set_cache
+
+
+class RoleTemplateService:
+    """Copy-on-write sharing of the default organization roles.
+
+    Default roles exist once, as global system roles (templates) that the
+    assignments of every organization point to. An organization gets its
+    own copy of a default role only when it customizes it: the copy takes
+    the template's permissions and the organization's assignments, so the
+    change stays local to that organization.
+    """
+
+    def __init__(
+        self,
+        role_repository: RoleRepository,
+        effective_permission_repository: EffectiveUserPermissionRepository,
+    ):
+        self._role_repository = role_repository
+        self._effective_permission_repository = effective_permission_repository
+
+    def is_template(self, role: Role) -> bool:
+        """Check if a role is a shared default-role template."""
+        return (
+            role.organization_id is None
+            and role.is_system_role
+            and DefaultRoleConfigurations.is_default_role(role.name.value)
+        )
+
+    def get_templates(self) -> List[Role]:
+        """Get the default-role templates that exist."""
+        return self._role_repository.get_role_templates(
+            DefaultRoleConfigurations.get_all_default_roles()
+        )
+
+    def resolve_organization_roles(self, organization_id: UUID) -> List[Role]:
+        """Get an organization's roles, with templates for the defaults it kept."""
+        roles = self._role_repository.get_organization_roles(organization_id)
+        own_names = {role.name.value for role in roles}
+
+        return roles + [
+            template
+            for template in self.get_templates()
+            if template.name.value not in own_names
+        ]
+
+    def resolve_role(self, name: str, organization_id: UUID) -> Optional[Role]:
+        """Get an organization's role by name, falling back to the template."""
+        role = self._role_repository.get_by_name(RoleName(value=name), organization_id)
+        if role:
+            return role
+
+        if not DefaultRoleConfigurations.is_default_role(name):
+            return None
+
+        return next(
+            (
+                template
+                for template in self._role_repository.get_role_templates([name])
+                if template.name.value == name
+            ),
+            None,
+        )
+
+    def materialize(self, role: Role, organization_id: UUID) -> Role:
+        """Get the organization's own copy of a template, creating it if needed.
+
+        Roles that are not templates are returned unchanged.
+        """
+        if not self.is_template(role):
+            return role
+
+        existing = self._role_repository.get_by_name(role.name, organization_id)
+        if existing:
+            return existing
+
+        copy = self._role_repository.save(
+            Role.create(
+                name=role.name.value,
+                description=role.description,
+                created_by=role.created_by,
+                organization_id=organization_id,
+                parent_role_id=role.parent_role_id,
+                # The copy exists to be customized, unlike the template
+                is_system_role=False,
+            )
+        )
+
+        permission_ids = [
+            permission.id
+            for permission in self._role_repository.get_role_permissions(role.id)
+        ]
+        if permission_ids:
+            self._role_repository.assign_permissions(copy.id, permission_ids)
+
+        moved_user_ids = self._role_repository.reassign_organization_role(
+            organization_id, role.id, copy.id
+        )
+
+        # The moved users now hold a different role id
+        self._effective_permission_repository.refresh_users(moved_user_ids)
+        get_role_set_cache().reload_cache()
+
+        return copy
@@ -4,4 +4,5 @@ from .organization_name import *
 from .organization_settings import *
 from .password import *
 from .permission_name import *
+from .role_hierarchy import *
 from .role_name import *
\ No newline at end of file
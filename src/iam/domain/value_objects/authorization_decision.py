@@ -18,6 +18,31 @@ class DecisionReason(BaseModel):
     model_config = {"frozen": True}
 
 
+class AccessDecision:
+    """Lean authorization outcome for callers that only need a boolean.
+
+    Carries whether access is allowed and the id of the deciding rule (a
+    permission key, a policy id or a default), without building reasons.
+    Use ``AuthorizationDecision`` when an explanation is requested.
+    """
+
+    __slots__ = ("allowed", "rule")
+
+    def __init__(self, allowed: bool, rule: str):
+        self.allowed = allowed
+        self.rule = rule
+
+    def __bool__(self) -> bool:
+        return self.allowed
+
+    def __repr__(self) -> str:
+        return f"AccessDecision(allowed={self.allowed}, rule={self.rule!r})"
+
+    def is_allowed(self) -> bool:
+        """Check if the decision allows access."""
+        return self.allowed
+
+
 class AuthorizationDecision(BaseModel):
     result: DecisionResult
     reasons: List[DecisionReason]
@@ -22,8 +22,9 @@ class PermissionName(BaseModel):
         if len(cleaned_name) > 100:
             raise ValueError("Permission name cannot exceed 100 characters")
 
-        # Allow letters, numbers, underscores, and colons
-        if not re.match(r"^[a-z0-9_:]+$", cleaned_name):
+        # Allow letters, numbers, underscores, and colons, plus a wildcard
+        # action (e.g. "user:*")
+        if not re.match(r"^[a-z0-9_:]+(:\*)?$", cleaned_name):
             raise ValueError(
                 "Permission name can only contain lowercase letters, numbers, underscores, and colons"
             )
@@ -0,0 +1,94 @@
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional
+from uuid import UUID
+
+if TYPE_CHECKING:
+    from ..entities.role import Role
+
+
+class RoleHierarchy:
+    """In-memory role hierarchy with parent and child adjacency.
+
+    Built once from a list of roles (for example the result of
+    ``RoleRepository.get_roles_with_ancestors``), it answers path, ancestor
+    and descendant queries in time linear in the size of the answer instead of
+    rescanning the whole role list. Walks are cycle-safe and stop at roles
+    that are not part of the hierarchy.
+    """
+
+    __slots__ = ("_roles", "_children")
+
+    def __init__(self, roles: Iterable["Role"]):
+        self._roles: Dict[UUID, "Role"] = {role.id: role for role in roles}
+        self._children: Dict[Optional[UUID], List[UUID]] = {}
+
+        for role in self._roles.values():
+            self._children.setdefault(role.parent_role_id, []).append(role.id)
+
+    def __contains__(self, role_id: UUID) -> bool:
+        return role_id in self._roles
+
+    def __iter__(self) -> Iterator["Role"]:
+        return iter(self._roles.values())
+
+    def __len__(self) -> int:
+        return len(self._roles)
+
+    def get(self, role_id: UUID) -> Optional["Role"]:
+        """Get a role of the hierarchy by ID."""
+        return self._roles.get(role_id)
+
+    def get_path(self, role_id: UUID) -> List[UUID]:
+        """Get the inheritance path from the root ancestor to the role."""
+        path = []
+        visited = set()
+        current = self._roles.get(role_id)
+
+        while current and current.id not in visited:
+            path.append(current.id)
+            visited.add(current.id)
+            if not current.parent_role_id:
+                break
+            current = self._roles.get(current.parent_role_id)
+
+        path.reverse()
+        return path
+
+    def get_ancestors(self, role_id: UUID) -> List["Role"]:
+        """Get the ancestors of a role, nearest parent first."""
+        path = self.get_path(role_id)
+        return [self._roles[ancestor_id] for ancestor_id in reversed(path[:-1])]
+
+    def get_children(self, role_id: Optional[UUID]) -> List["Role"]:
+        """Get the direct children of a role (root roles for None)."""
+        return [self._roles[child_id] for child_id in self._children.get(role_id, [])]
+
+    def get_descendants(self, role_id: UUID) -> List["Role"]:
+        """Get all descendants of a role, depth first, each subtree after its root."""
+        descendants = []
+        visited = {role_id}
+        stack = list(reversed(self._children.get(role_id, [])))
+
+        while stack:
+            child_id = stack.pop()
+            if child_id in visited:
+                continue
+
+            visited.add(child_id)
+            descendants.append(self._roles[child_id])
+            stack.extend(reversed(self._children.get(child_id, [])))
+
+        return descendants
+
+    def is_descendant_of(self, role_id: UUID, ancestor_id: UUID) -> bool:
+        """Check if a role inherits, directly or not, from the ancestor."""
+        return role_id != ancestor_id and ancestor_id in self.get_path(role_id)
+
+    def get_depth(self, role_id: UUID) -> int:
+        """Get the inheritance level of a role (0 for root roles)."""
+        return max(len(self.get_path(role_id)) - 1, 0)
+
+    def would_create_cycle(self, role_id: UUID, parent_role_id: UUID) -> bool:
+        """Check if making parent_role_id the parent of role_id would form a cycle."""
+        return parent_role_id == role_id or self.is_descendant_of(
+            parent_role_id, role_id
+        )
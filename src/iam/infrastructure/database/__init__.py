@@ -1,2 +1 @@
 from .models import *
-from .repositories import *
\ No newline at end of file
@@ -1,4 +1,5 @@
 from sqlalchemy import (
+    BigInteger,
     Column,
     DateTime,
     String,
@@ -10,13 +11,16 @@ from sqlalchemy import (
     Table,
     UniqueConstraint,
     Index,
+    Identity,
 )
 from sqlalchemy.dialects.postgresql import UUID, JSON
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
 import enum
+import uuid
 
 from src.shared.infrastructure.database.base import BaseModel
 from src.shared.infrastructure.database.connection import Base
+from src.shared.infrastructure.database.search import trigram_index
 from src.shared.domain.enums import ResourceTypeEnum
 
 
@@ -71,13 +75,21 @@ user_role_assignment = Table(
     "user_role_assignments",
     Base.metadata,
     Column(
-        "user_id", UUID(as_uuid=True), ForeignKey("contas.users.id"), primary_key=True
+        "id",
+        UUID(as_uuid=True),
+        primary_key=True,
+        # Python-side for SQLAlchemy inserts, so other dialects work too
+        default=uuid.uuid4,
+        server_default=text("gen_random_uuid()"),
+    ),
+    Column(
+        "user_id", UUID(as_uuid=True), ForeignKey("contas.users.id"), nullable=False
     ),
     Column(
         "role_id",
         UUID(as_uuid=True),
         ForeignKey("contas.authorization_roles.id"),
-        primary_key=True,
+        nullable=False,
     ),
     Column(
         "organization_id",
@@ -94,8 +106,17 @@ user_role_assignment = Table(
         server_default=func.now(),
         nullable=False,
     ),
-    Column("expires_at", DateTime(timezone=True), nullable=True),
+    Column("expires_at", DateTime(timezone=True), nullable=True, index=True),
     Column("is_active", Boolean, default=True, nullable=False),
+    # Default roles are shared templates, so a user can hold the same role
+    # in several organizations
+    UniqueConstraint(
+        "user_id",
+        "role_id",
+        "organization_id",
+        name="uq_user_role_assignments_user_role_organization",
+        postgresql_nulls_not_distinct=True,
+    ),
 )
 
 
@@ -115,6 +136,9 @@ class OrganizationModel(BaseModel):
     member_count = Column(Integer, default=1, nullable=False)
     max_members = Column(Integer, nullable=True)
 
+    # Trigram indexes for substring search
+    __table_args__ = (trigram_index("ix_organizations_name_trgm", "name"),)
+
 
 class UserOrganizationRoleModel(BaseModel):
     """SQLAlchemy model for UserOrganizationRole entity."""
@@ -140,7 +164,7 @@ class UserOrganizationRoleModel(BaseModel):
         UUID(as_uuid=True), ForeignKey("contas.users.id"), nullable=False
     )
     assigned_at = Column(DateTime(timezone=True), nullable=False)
-    expires_at = Column(DateTime(timezone=True), nullable=True)
+    expires_at = Column(DateTime(timezone=True), nullable=True, index=True)
     is_active = Column(Boolean, default=True, nullable=False)
     revoked_at = Column(DateTime(timezone=True), nullable=True)
     revoked_by = Column(
@@ -161,6 +185,12 @@ class UserModel(BaseModel):
     is_verified = Column(Boolean, default=False, nullable=False)
     last_login_at = Column(DateTime(timezone=True), nullable=True)
 
+    # Trigram indexes for substring search
+    __table_args__ = (
+        trigram_index("ix_users_email_trgm", "email"),
+        trigram_index("ix_users_name_trgm", "name"),
+    )
+
 
 class UserSessionModel(BaseModel):
     """SQLAlchemy model for UserSession entity."""
@@ -230,7 +260,11 @@ class PermissionModel(BaseModel):
     is_system_permission = Column(Boolean, default=False, nullable=False)
 
     # Ensure unique permission names within resource type
-    __table_args__ = (UniqueConstraint("name", "resource_type"),)
+    __table_args__ = (
+        UniqueConstraint("name", "resource_type"),
+        trigram_index("ix_authorization_permissions_name_trgm", "name"),
+        trigram_index("ix_authorization_permissions_description_trgm", "description"),
+    )
 
 
 class PolicyModel(BaseModel):
@@ -256,9 +290,13 @@ class PolicyModel(BaseModel):
     priority = Column(Integer, default=0, nullable=False)
     is_active = Column(Boolean, default=True, nullable=False)
 
-    # Index for efficient policy lookup
+    # Index for efficient policy lookup, trigram indexes for substring search
     __table_args__ = (
         Index("ix_policy_lookup", "resource_type", "action", "organization_id"),
+        trigram_index("ix_authorization_policies_name_trgm", "name"),
+        trigram_index("ix_authorization_policies_description_trgm", "description"),
+        trigram_index("ix_authorization_policies_resource_type_trgm", "resource_type"),
+        trigram_index("ix_authorization_policies_action_trgm", "action"),
     )
 
 
@@ -286,3 +324,30 @@ class AuthorizationSubjectModel(BaseModel):
         Index("ix_auth_subject_lookup", "subject_type", "subject_id"),
         Index("ix_auth_subject_org", "organization_id", "subject_type"),
     )
+
+
+class EffectiveUserPermissionModel(Base):
+    """Materialized permissions a user holds through roles and their ancestors.
+
+    Derived from user_role_assignments, authorization_roles and
+    role_permissions; maintained on write and never edited directly.
+    """
+
+    __tablename__ = "effective_user_permissions"
+
+    id = Column(
+        BigInteger().with_variant(Integer, "sqlite"), Identity(), primary_key=True
+    )
+    user_id = Column(UUID(as_uuid=True), nullable=False)
+    organization_id = Column(UUID(as_uuid=True), nullable=True)
+    permission_key = Column(String(150), nullable=False)  # resource_type:action
+
+    __table_args__ = (
+        Index(
+            "ix_effective_permission_lookup",
+            "user_id",
+            "organization_id",
+            "permission_key",
+            unique=True,
+        ),
+    )
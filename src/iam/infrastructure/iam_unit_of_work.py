@@ -13,6 +13,9 @@ from .repositories.sqlalchemy_policy_repository import SqlAlchemyPolicyRepositor
 from .repositories.sqlalchemy_organization_repository import SqlAlchemyOrganizationRepository
 from .repositories.sqlalchemy_user_organization_role_repository import SqlAlchemyUserOrganizationRoleRepository
 from .repositories.sqlalchemy_authorization_subject_repository import SqlAlchemyAuthorizationSubjectRepository
+from .repositories.sqlalchemy_effective_user_permission_repository import (
+    SqlAlchemyEffectiveUserPermissionRepository,
+)
 
 from sqlalchemy.orm import Session
 
@@ -20,9 +23,9 @@ from sqlalchemy.orm import Session
 class IAMUnitOfWork(SQLAlchemyUnitOfWork):
     """Implementação da Unidade de Trabalho para o contexto de IAM."""
 
-    _repositories = {}
-
     def __init__(self, session: Session, repositories: list[str]):
+        self._repositories = {}
+
         # User-related repositories
         if "user" in repositories:
             self._repositories.update({"user": SqlAlchemyUserRepository(session)})
@@ -52,6 +55,14 @@ class IAMUnitOfWork(SQLAlchemyUnitOfWork):
             self._repositories.update(
                 {"authorization_subject": SqlAlchemyAuthorizationSubjectRepository(session)}
             )
+        if "effective_user_permission" in repositories:
+            self._repositories.update(
+                {
+                    "effective_user_permission": SqlAlchemyEffectiveUserPermissionRepository(
+                        session
+                    )
+                }
+            )
 
         super().__init__(session)
 
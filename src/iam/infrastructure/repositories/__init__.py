@@ -1,4 +1,5 @@
 from .sqlalchemy_authorization_subject_repository import SqlAlchemyAuthorizationSubjectRepository
+from .sqlalchemy_effective_user_permission_repository import SqlAlchemyEffectiveUserPermissionRepository
 from .sqlalchemy_organization_repository import SqlAlchemyOrganizationRepository
 from .sqlalchemy_permission_repository import SqlAlchemyPermissionRepository
 from .sqlalchemy_policy_repository import SqlAlchemyPolicyRepository
@@ -9,6 +10,7 @@ from .sqlalchemy_user_session_repository import SqlAlchemyUserSessionRepository
 
 __all__ = [
     "SqlAlchemyAuthorizationSubjectRepository",
+    "SqlAlchemyEffectiveUserPermissionRepository",
     "SqlAlchemyOrganizationRepository",
     "SqlAlchemyPermissionRepository",
     "SqlAlchemyPolicyRepository",
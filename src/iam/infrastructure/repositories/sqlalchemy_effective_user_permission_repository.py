@@ -0,0 +1,235 @@
+from typing import Dict, List, Optional
+from uuid import UUID
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy import select, insert, delete, and_, case, func, cast, literal, String
+
+from ...domain.repositories.effective_user_permission_repository import (
+    EffectiveUserPermissionRepository,
+)
+from ...infrastructure.database.models import (
+    EffectiveUserPermissionModel,
+    RoleModel,
+    PermissionModel,
+    role_permission_association,
+    user_role_assignment,
+)
+
+# Guards the recursive walk against parent_role_id cycles
+MAX_HIERARCHY_DEPTH = 10
+
+
+class SqlAlchemyEffectiveUserPermissionRepository(EffectiveUserPermissionRepository):
+    """SQLAlchemy implementation of EffectiveUserPermissionRepository."""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def find_matching_permission(
+        self,
+        user_id: UUID,
+        organization_id: Optional[UUID],
+        permission_keys: List[str],
+    ) -> Optional[str]:
+        """Return one of the given permission keys the user holds, if any."""
+        query = (
+            select(EffectiveUserPermissionModel.permission_key)
+            .where(
+                and_(
+                    EffectiveUserPermissionModel.user_id == user_id,
+                    EffectiveUserPermissionModel.permission_key.in_(permission_keys),
+                )
+            )
+            .limit(1)
+        )
+
+        if organization_id:
+            query = query.where(
+                EffectiveUserPermissionModel.organization_id == organization_id
+            )
+
+        return self.session.execute(query).scalar_one_or_none()
+
+    def get_permission_keys(
+        self, user_id: UUID, organization_id: Optional[UUID] = None
+    ) -> List[str]:
+        """Get all permission keys of a user (in every organization if None)."""
+        query = (
+            select(EffectiveUserPermissionModel.permission_key)
+            .where(EffectiveUserPermissionModel.user_id == user_id)
+            .distinct()
+        )
+
+        if organization_id:
+            query = query.where(
+                EffectiveUserPermissionModel.organization_id == organization_id
+            )
+
+        return list(self.session.execute(query).scalars().all())
+
+    def refresh_users(self, user_ids: List[UUID]) -> int:
+        """Recompute the rows of the given users. Returns rows written."""
+        user_ids = list(set(user_ids))
+        if not user_ids:
+            return 0
+
+        self.session.execute(
+            delete(EffectiveUserPermissionModel).where(
+                EffectiveUserPermissionModel.user_id.in_(user_ids)
+            )
+        )
+        result = self.session.execute(
+            self._insert_effective_permissions(
+                user_role_assignment.c.user_id.in_(user_ids)
+            )
+        )
+        self.session.flush()
+
+        return result.rowcount
+
+    def refresh_roles(
+        self, role_ids: List[UUID], organization_id: Optional[UUID] = None
+    ) -> int:
+        """Recompute the rows of every user holding the roles or a descendant.
+
+        With organization_id, only holders in that organization are refreshed.
+        """
+        if not role_ids:
+            return 0
+
+        # Children inherit from their parents, so a change to a role affects
+        # the holders of every role below it.
+        descendants = (
+            select(RoleModel.id)
+            .where(RoleModel.id.in_(role_ids))
+            .cte("descendant_roles", recursive=True)
+        )
+        descendants = descendants.union(
+            select(RoleModel.id).where(RoleModel.parent_role_id == descendants.c.id)
+        )
+
+        query = (
+            select(user_role_assignment.c.user_id)
+            .where(user_role_assignment.c.role_id.in_(select(descendants.c.id)))
+            .distinct()
+        )
+        if organization_id:
+            query = query.where(
+                user_role_assignment.c.organization_id == organization_id
+            )
+
+        user_ids = self.session.execute(query).scalars().all()
+
+        return self.refresh_users(list(user_ids))
+
+    def compare_with_source(self) -> Dict[str, int]:
+        """Count rows missing from or stale in the table versus a recomputation."""
+        expected = self._effective_permissions_query().subquery("expected")
+        actual = select(
+            EffectiveUserPermissionModel.user_id,
+            EffectiveUserPermissionModel.organization_id,
+            EffectiveUserPermissionModel.permission_key,
+        ).subquery("actual")
+
+        def _matches(left, right):
+            return and_(
+                left.c.user_id == right.c.user_id,
+                left.c.organization_id.is_not_distinct_from(right.c.organization_id),
+                left.c.permission_key == right.c.permission_key,
+            )
+
+        missing = self.session.execute(
+            select(func.count()).select_from(expected).where(
+                ~select(literal(1)).where(_matches(actual, expected)).exists()
+            )
+        ).scalar()
+        stale = self.session.execute(
+            select(func.count()).select_from(actual).where(
+                ~select(literal(1)).where(_matches(expected, actual)).exists()
+            )
+        ).scalar()
+        total = self.session.execute(
+            select(func.count()).select_from(EffectiveUserPermissionModel)
+        ).scalar()
+
+        return {"missing": missing or 0, "stale": stale or 0, "total": total or 0}
+
+    def rebuild(self) -> int:
+        """Recompute the whole table from scratch. Returns rows written."""
+        self.session.execute(delete(EffectiveUserPermissionModel))
+        result = self.session.execute(self._insert_effective_permissions())
+        self.session.flush()
+
+        return result.rowcount
+
+    def _insert_effective_permissions(self, *assignment_filters):
+        """INSERT ... SELECT of the recomputed rows for matching assignments."""
+        return insert(EffectiveUserPermissionModel).from_select(
+            ["user_id", "organization_id", "permission_key"],
+            self._effective_permissions_query(*assignment_filters),
+        )
+
+    def _effective_permissions_query(self, *assignment_filters):
+        """Recursive CTE walking each active assignment up through parent roles."""
+        granted = (
+            select(
+                user_role_assignment.c.user_id,
+                user_role_assignment.c.organization_id,
+                user_role_assignment.c.role_id,
+                literal(0).label("depth"),
+            )
+            .join(RoleModel, RoleModel.id == user_role_assignment.c.role_id)
+            .where(
+                and_(
+                    user_role_assignment.c.is_active,
+                    RoleModel.is_active,
+                    *assignment_filters,
+                )
+            )
+            .cte("granted_roles", recursive=True)
+        )
+
+        child = aliased(RoleModel)
+        parent = aliased(RoleModel)
+        granted = granted.union(
+            select(
+                granted.c.user_id,
+                granted.c.organization_id,
+                parent.id,
+                granted.c.depth + 1,
+            )
+            .join(child, child.id == granted.c.role_id)
+            .join(parent, parent.id == child.parent_role_id)
+            .where(and_(parent.is_active, granted.c.depth < MAX_HIERARCHY_DEPTH))
+        )
+
+        # A "<resource_type>:<action>" name is the exact key: the action column
+        # cannot hold wildcards ("user:*") or document actions
+        permission_key = case(
+            (
+                PermissionModel.name.startswith(PermissionModel.resource_type + ":"),
+                PermissionModel.name,
+            ),
+            else_=(
+                PermissionModel.resource_type
+                + ":"
+                + func.lower(cast(PermissionModel.action, String))
+            ),
+        )
+
+        return (
+            select(
+                granted.c.user_id,
+                granted.c.organization_id,
+                permission_key.label("permission_key"),
+            )
+            .join(
+                role_permission_association,
+                role_permission_association.c.role_id == granted.c.role_id,
+            )
+            .join(
+                PermissionModel,
+                PermissionModel.id == role_permission_association.c.permission_id,
+            )
+            .where(PermissionModel.is_active)
+            .distinct()
+        )
@@ -3,6 +3,7 @@ from typing import List, Optional
 from uuid import UUID
 from sqlalchemy.orm import Session
 from sqlalchemy import select, update, delete
+from shared.infrastructure.database.search import TextSearch, count_capped
 
 from ...domain.entities.organization import Organization
 from ...domain.repositories.organization_repository import OrganizationRepository
@@ -104,28 +105,24 @@ class SqlAlchemyOrganizationRepository(OrganizationRepository):
     ) -> tuple[List[Organization], int]:
         """Find organizations with pagination and filters."""
         query = select(OrganizationModel)
-        count_query = select(OrganizationModel)
+        search = TextSearch(name_filter, OrganizationModel.name) if name_filter else None
 
         # Apply filters
-        if name_filter:
-            query = query.where(OrganizationModel.name.ilike(f"%{name_filter}%"))
-            count_query = count_query.where(
-                OrganizationModel.name.ilike(f"%{name_filter}%")
-            )
+        if search:
+            query = query.where(search.condition())
 
         if owner_id:
             query = query.where(OrganizationModel.owner_id == owner_id)
-            count_query = count_query.where(OrganizationModel.owner_id == owner_id)
 
         if is_active is not None:
             query = query.where(OrganizationModel.is_active == is_active)
-            count_query = count_query.where(OrganizationModel.is_active == is_active)
 
         # Get total count
-        total_result = self.session.execute(count_query)
-        total = len(total_result.scalars().all())
+        total = count_capped(self.session, query)
 
-        # Get paginated results
+        # Get paginated results, most relevant first
+        if search:
+            query = search.ranked(query, self.session)
         query = (
             query.offset(offset)
             .limit(limit)
@@ -4,9 +4,11 @@ from uuid import UUID
 from sqlalchemy import select, delete, and_, text, join
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
+from shared.infrastructure.database.search import TextSearch, count_capped
 
 from ...domain.entities.permission import Permission, PermissionAction
 from ...domain.repositories.permission_repository import PermissionRepository
+from ...domain.value_objects.permission_name import PermissionName
 from ...infrastructure.database.models import (
     PermissionModel,
     PermissionActionEnum,
@@ -67,6 +69,17 @@ class SqlAlchemyPermissionRepository(PermissionRepository):
             return self._to_domain_entity(permission_model)
         return None
 
+    def find_by_name(self, name: PermissionName) -> Optional[Permission]:
+        """Find a permission by name."""
+        result = self.session.execute(
+            select(PermissionModel).where(PermissionModel.name == name.value).limit(1)
+        )
+        permission_model = result.scalar_one_or_none()
+
+        if permission_model:
+            return self._to_domain_entity(permission_model)
+        return None
+
     def find_by_name_and_resource(
         self, name: str, resource_type: str
     ) -> Optional[Permission]:
@@ -197,40 +210,34 @@ class SqlAlchemyPermissionRepository(PermissionRepository):
     ) -> tuple[List[Permission], int]:
         """Search permissions with text query and filters."""
         db_query = select(PermissionModel)
-        count_query = select(PermissionModel)
+        search = (
+            TextSearch(query, PermissionModel.name, PermissionModel.description)
+            if query
+            else None
+        )
 
         # Apply text search
-        if query:
-            search_filter = PermissionModel.name.ilike(
-                f"%{query}%"
-            ) | PermissionModel.description.ilike(f"%{query}%")
-            db_query = db_query.where(search_filter)
-            count_query = count_query.where(search_filter)
+        if search:
+            db_query = db_query.where(search.condition())
 
         # Apply filters
         if resource_type:
             db_query = db_query.where(PermissionModel.resource_type == resource_type)
-            count_query = count_query.where(
-                PermissionModel.resource_type == resource_type
-            )
 
         if action:
             db_query = db_query.where(
                 PermissionModel.action == PermissionActionEnum(action)
             )
-            count_query = count_query.where(
-                PermissionModel.action == PermissionActionEnum(action)
-            )
 
         if is_active is not None:
             db_query = db_query.where(PermissionModel.is_active == is_active)
-            count_query = count_query.where(PermissionModel.is_active == is_active)
 
         # Get total count
-        total_result = self.session.execute(count_query)
-        total = len(total_result.scalars().all())
+        total = count_capped(self.session, db_query)
 
-        # Get paginated results
+        # Get paginated results, most relevant first
+        if search:
+            db_query = search.ranked(db_query, self.session)
         db_query = (
             db_query.offset(offset)
             .limit(limit)
@@ -388,7 +395,7 @@ class SqlAlchemyPermissionRepository(PermissionRepository):
         """Convert SQLAlchemy model to domain entity."""
         return Permission(
             id=permission_model.id,
-            name=permission_model.name,
+            name=PermissionName(value=permission_model.name),
             description=permission_model.description,
             action=permission_model.action.value,
             resource_type=permission_model.resource_type,
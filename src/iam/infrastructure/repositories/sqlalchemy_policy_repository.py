@@ -2,16 +2,33 @@ from datetime import datetime, timezone
 from typing import List, Optional
 from uuid import UUID
 from sqlalchemy.orm import Session
-from sqlalchemy import select, delete, and_
+from sqlalchemy import event, select, delete, and_
 from sqlalchemy.exc import IntegrityError
+from shared.infrastructure.database.search import TextSearch, count_capped
 
-from ...domain.entities.policy import Policy, PolicyCondition
+from ...domain.entities.policy import Policy, PolicyCondition, PolicyEffect
 from ...domain.repositories.policy_repository import PolicyRepository
+from ...domain.services.policy_index import get_policy_index
 from ...infrastructure.database.models import (
     PolicyModel,
     PolicyEffectEnum,
 )
 
+# Session.info set of the organizations whose policies were written in the
+# open transaction (None for global policies)
+_POLICY_WRITES_KEY = "policy_index_pending_writes"
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_policy_index_after_commit(session: Session) -> None:
+    for organization_id in session.info.pop(_POLICY_WRITES_KEY, ()):
+        get_policy_index().invalidate(organization_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_policy_writes_after_rollback(session: Session) -> None:
+    session.info.pop(_POLICY_WRITES_KEY, None)
+
 
 class SqlAlchemyPolicyRepository(PolicyRepository):
     """SQLAlchemy implementation of PolicyRepository."""
@@ -26,7 +43,8 @@ class SqlAlchemyPolicyRepository(PolicyRepository):
             existing = self.session.get(PolicyModel, policy.id)
 
             if existing:
-                # Update existing policy
+                # Update existing policy (a moved policy leaves its old scope)
+                self._track_write(existing.organization_id)
                 existing.name = policy.name
                 existing.description = policy.description
                 existing.effect = PolicyEffectEnum(policy.effect)
@@ -42,6 +60,7 @@ class SqlAlchemyPolicyRepository(PolicyRepository):
                 existing.updated_at = datetime.now(timezone.utc)
 
                 self.session.flush()
+                self._track_write(existing.organization_id)
                 return self._to_domain_entity(existing)
             else:
                 # Create new policy
@@ -65,6 +84,7 @@ class SqlAlchemyPolicyRepository(PolicyRepository):
 
                 self.session.add(policy_model)
                 self.session.flush()
+                self._track_write(policy_model.organization_id)
                 return self._to_domain_entity(policy_model)
 
         except IntegrityError as e:
@@ -128,6 +148,33 @@ class SqlAlchemyPolicyRepository(PolicyRepository):
 
         return [self._to_domain_entity(model) for model in policy_models]
 
+    def get_applicable_policies(
+        self, resource_type: str, action: str, organization_id: Optional[UUID] = None
+    ) -> List[Policy]:
+        """Get policies applicable to a resource type and action."""
+        query_conditions = [
+            PolicyModel.resource_type == resource_type,
+            PolicyModel.action.in_([action, "*"]),
+            PolicyModel.is_active,
+        ]
+
+        if organization_id:
+            query_conditions.append(
+                (PolicyModel.organization_id == organization_id)
+                | (PolicyModel.organization_id.is_(None))
+            )
+        else:
+            query_conditions.append(PolicyModel.organization_id.is_(None))
+
+        result = self.session.execute(
+            select(PolicyModel)
+            .where(and_(*query_conditions))
+            .order_by(PolicyModel.priority.desc())
+        )
+        policy_models = result.scalars().all()
+
+        return [self._to_domain_entity(model) for model in policy_models]
+
     def find_by_resource_type(
         self, resource_type: str, organization_id: Optional[UUID] = None
     ) -> List[Policy]:
@@ -181,6 +228,51 @@ class SqlAlchemyPolicyRepository(PolicyRepository):
 
         return [self._to_domain_entity(model) for model in policy_models]
 
+    def get_organization_policies(self, organization_id: UUID) -> List[Policy]:
+        """Get all policies for an organization."""
+        return self.find_by_organization(organization_id)
+
+    def get_global_policies(self) -> List[Policy]:
+        """Get all global policies."""
+        return self.find_global_policies()
+
+    def get_policies_by_effect(
+        self, effect: PolicyEffect, organization_id: Optional[UUID] = None
+    ) -> List[Policy]:
+        """Get policies by effect (allow/deny)."""
+        return self.find_by_effect(PolicyEffect(effect).value, organization_id)
+
+    def list_active_policies(
+        self, organization_id: Optional[UUID] = None, limit: int = 100, offset: int = 0
+    ) -> List[Policy]:
+        """List active policies with pagination."""
+        query = select(PolicyModel).where(PolicyModel.is_active)
+
+        if organization_id:
+            query = query.where(PolicyModel.organization_id == organization_id)
+
+        result = self.session.execute(
+            query.order_by(PolicyModel.priority.desc(), PolicyModel.name)
+            .offset(offset)
+            .limit(limit)
+        )
+        policy_models = result.scalars().all()
+
+        return [self._to_domain_entity(model) for model in policy_models]
+
+    def search_policies(
+        self, query: str, organization_id: Optional[UUID] = None, limit: int = 100
+    ) -> List[Policy]:
+        """Search policies by name or description."""
+        policies, _ = self.search(query, organization_id, offset=0, limit=limit)
+        return policies
+
+    def get_policies_by_priority(
+        self, resource_type: str, action: str, organization_id: Optional[UUID] = None
+    ) -> List[Policy]:
+        """Get policies ordered by priority (highest first)."""
+        return self.find_by_resource_and_action(resource_type, action, organization_id)
+
     def find_by_effect(
         self, effect: str, organization_id: Optional[UUID] = None
     ) -> List[Policy]:
@@ -264,9 +356,14 @@ class SqlAlchemyPolicyRepository(PolicyRepository):
     def delete(self, policy_id: UUID) -> bool:
         """Delete a policy (hard delete)."""
         result = self.session.execute(
-            delete(PolicyModel).where(PolicyModel.id == policy_id)
+            delete(PolicyModel)
+            .where(PolicyModel.id == policy_id)
+            .returning(PolicyModel.organization_id)
         )
-        return result.rowcount > 0
+        organization_ids = result.scalars().all()
+        for organization_id in organization_ids:
+            self._track_write(organization_id)
+        return bool(organization_ids)
 
     def search(
         self,
@@ -277,18 +374,21 @@ class SqlAlchemyPolicyRepository(PolicyRepository):
     ) -> tuple[List[Policy], int]:
         """Search policies with text query."""
         db_query = select(PolicyModel)
-        count_query = select(PolicyModel)
+        search = (
+            TextSearch(
+                query,
+                PolicyModel.name,
+                PolicyModel.description,
+                PolicyModel.resource_type,
+                PolicyModel.action,
+            )
+            if query
+            else None
+        )
 
         # Apply text search
-        if query:
-            search_filter = (
-                PolicyModel.name.ilike(f"%{query}%")
-                | PolicyModel.description.ilike(f"%{query}%")
-                | PolicyModel.resource_type.ilike(f"%{query}%")
-                | PolicyModel.action.ilike(f"%{query}%")
-            )
-            db_query = db_query.where(search_filter)
-            count_query = count_query.where(search_filter)
+        if search:
+            db_query = db_query.where(search.condition())
 
         # Apply organization filter
         if organization_id is not None:
@@ -296,13 +396,13 @@ class SqlAlchemyPolicyRepository(PolicyRepository):
                 PolicyModel.organization_id.is_(None)
             )
             db_query = db_query.where(org_condition)
-            count_query = count_query.where(org_condition)
 
         # Get total count
-        total_result = self.session.execute(count_query)
-        total = len(total_result.scalars().all())
+        total = count_capped(self.session, db_query)
 
-        # Get paginated results
+        # Get paginated results, most relevant first
+        if search:
+            db_query = search.ranked(db_query, self.session)
         db_query = (
             db_query.offset(offset)
             .limit(limit)
@@ -336,6 +436,10 @@ class SqlAlchemyPolicyRepository(PolicyRepository):
         )
         return len(result.scalars().all())
 
+    def _track_write(self, organization_id: Optional[UUID]) -> None:
+        """Drop the organization's indexed policies once the transaction commits."""
+        self.session.info.setdefault(_POLICY_WRITES_KEY, set()).add(organization_id)
+
     def _to_domain_entity(self, policy_model: PolicyModel) -> Policy:
         """Convert SQLAlchemy model to domain entity."""
         conditions = [
@@ -1,16 +1,19 @@
 from datetime import datetime, timezone
 from typing import List, Optional
 from uuid import UUID
-from sqlalchemy.orm import Session
-from sqlalchemy import select, delete, and_, text
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy import select, delete, update, and_, text
 from sqlalchemy.exc import IntegrityError
 
 from ...domain.entities.role import Role
 from ...domain.entities.permission import Permission
 from ...domain.repositories.role_repository import RoleRepository
+from ...domain.value_objects.permission_name import PermissionName
+from ...domain.value_objects.role_name import RoleName
 from ...infrastructure.database.models import (
     RoleModel,
     PermissionModel,
+    UserOrganizationRoleModel,
     role_permission_association,
     user_role_assignment,
 )
@@ -68,6 +71,10 @@ class SqlAlchemyRoleRepository(RoleRepository):
             return self._to_domain_entity(role_model)
         return None
 
+    def find_by_id(self, role_id: UUID) -> Optional[Role]:
+        """Find role by ID."""
+        return self.get_by_id(role_id)
+
     def get_by_name(
         self, name, organization_id: Optional[UUID] = None
     ) -> Optional[Role]:
@@ -109,13 +116,84 @@ class SqlAlchemyRoleRepository(RoleRepository):
 
         return [self._to_domain_entity(model) for model in role_models]
 
+    def get_role_templates(self, names: List[str]) -> List[Role]:
+        """Get the global (organization-less) system roles with the given names."""
+        if not names:
+            return []
+
+        result = self.session.execute(
+            select(RoleModel)
+            .where(
+                and_(
+                    RoleModel.organization_id.is_(None),
+                    RoleModel.is_system_role,
+                    RoleModel.is_active,
+                    RoleModel.name.in_(names),
+                )
+            )
+            .order_by(RoleModel.created_at)
+        )
+
+        # Global names are not unique in the database: the oldest one wins
+        templates = {}
+        for model in result.scalars().all():
+            templates.setdefault(model.name, model)
+
+        return [self._to_domain_entity(model) for model in templates.values()]
+
+    def reassign_organization_role(
+        self, organization_id: UUID, from_role_id: UUID, to_role_id: UUID
+    ) -> List[UUID]:
+        """Move an organization's assignments of a role to another role."""
+        result = self.session.execute(
+            update(user_role_assignment)
+            .where(
+                and_(
+                    user_role_assignment.c.organization_id == organization_id,
+                    user_role_assignment.c.role_id == from_role_id,
+                )
+            )
+            .values(role_id=to_role_id)
+            .returning(user_role_assignment.c.user_id)
+        )
+        moved_user_ids = list(result.scalars().all())
+        self.session.execute(
+            update(UserOrganizationRoleModel)
+            .where(
+                and_(
+                    UserOrganizationRoleModel.organization_id == organization_id,
+                    UserOrganizationRoleModel.role_id == from_role_id,
+                )
+            )
+            .values(role_id=to_role_id, updated_at=datetime.now(timezone.utc))
+        )
+        self.session.flush()
+        return moved_user_ids
+
+    def delete_expired_assignments_chunk(
+        self, expired_before: datetime, chunk_size: int = 1000
+    ) -> List[UUID]:
+        """Delete up to chunk_size role assignments that expired before expired_before."""
+        expired_ids = (
+            select(user_role_assignment.c.id)
+            .where(user_role_assignment.c.expires_at < expired_before)
+            .order_by(user_role_assignment.c.expires_at)
+            .limit(chunk_size)
+        )
+        result = self.session.execute(
+            delete(user_role_assignment)
+            .where(user_role_assignment.c.id.in_(expired_ids))
+            .returning(user_role_assignment.c.user_id)
+        )
+        return list(result.scalars().all())
+
     def get_user_roles(
         self, user_id: UUID, organization_id: Optional[UUID] = None
     ) -> List[Role]:
         """Get roles assigned to a user."""
         query = (
             select(RoleModel)
-            .select_from(RoleModel.join(user_role_assignment))
+            .join(user_role_assignment, user_role_assignment.c.role_id == RoleModel.id)
             .where(
                 and_(
                     user_role_assignment.c.user_id == user_id,
@@ -135,6 +213,12 @@ class SqlAlchemyRoleRepository(RoleRepository):
 
         return [self._to_domain_entity(model) for model in role_models]
 
+    def find_user_roles(
+        self, user_id: UUID, organization_id: Optional[UUID]
+    ) -> List[Role]:
+        """Find roles assigned to a user."""
+        return self.get_user_roles(user_id, organization_id)
+
     def exists_by_name(self, name, organization_id: Optional[UUID] = None) -> bool:
         """Check if role exists by name within organization scope."""
         result = self.session.execute(
@@ -365,6 +449,52 @@ class SqlAlchemyRoleRepository(RoleRepository):
         role_models = result.scalars().all()
         return [self._to_domain_entity(model) for model in role_models]
 
+    def get_roles_with_ancestors(self, role_ids: List[UUID]) -> List[Role]:
+        """Get the given active roles and all their active ancestors."""
+        if not role_ids:
+            return []
+
+        lineage = (
+            select(RoleModel.id, RoleModel.parent_role_id)
+            .where(and_(RoleModel.id.in_(role_ids), RoleModel.is_active))
+            .cte("role_lineage", recursive=True)
+        )
+        parent = aliased(RoleModel)
+        lineage = lineage.union(
+            select(parent.id, parent.parent_role_id)
+            .join(lineage, parent.id == lineage.c.parent_role_id)
+            .where(parent.is_active)
+        )
+
+        return self._get_roles_in(lineage)
+
+    def get_roles_with_descendants(self, role_ids: List[UUID]) -> List[Role]:
+        """Get the given active roles and all their active descendants."""
+        if not role_ids:
+            return []
+
+        lineage = (
+            select(RoleModel.id, RoleModel.parent_role_id)
+            .where(and_(RoleModel.id.in_(role_ids), RoleModel.is_active))
+            .cte("role_lineage", recursive=True)
+        )
+        child = aliased(RoleModel)
+        lineage = lineage.union(
+            select(child.id, child.parent_role_id)
+            .join(lineage, child.parent_role_id == lineage.c.id)
+            .where(child.is_active)
+        )
+
+        return self._get_roles_in(lineage)
+
+    def _get_roles_in(self, lineage) -> List[Role]:
+        """Load the roles selected by a recursive lineage CTE in one query."""
+        result = self.session.execute(
+            select(RoleModel).join(lineage, RoleModel.id == lineage.c.id)
+        )
+        role_models = result.scalars().all()
+        return [self._to_domain_entity(model) for model in role_models]
+
     def has_child_roles(self, role_id: UUID) -> bool:
         """Check if role has any child roles."""
         result = self.session.execute(
@@ -391,7 +521,7 @@ class SqlAlchemyRoleRepository(RoleRepository):
         """Convert SQLAlchemy model to domain entity."""
         return Role(
             id=role_model.id,
-            name=role_model.name,
+            name=RoleName(value=role_model.name),
             description=role_model.description,
             organization_id=role_model.organization_id,
             parent_role_id=role_model.parent_role_id,
@@ -408,9 +538,9 @@ class SqlAlchemyRoleRepository(RoleRepository):
         """Convert SQLAlchemy permission model to domain entity."""
         return Permission(
             id=permission_model.id,
-            name=permission_model.name,
+            name=PermissionName(value=permission_model.name),
             description=permission_model.description,
-            permission_type=permission_model.permission_type.value,
+            action=permission_model.action.value,
             resource_type=permission_model.resource_type,
             is_active=permission_model.is_active,
             is_system_permission=permission_model.is_system_permission,
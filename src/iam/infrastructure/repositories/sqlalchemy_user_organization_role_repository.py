@@ -194,6 +194,34 @@ class SqlAlchemyUserOrganizationRoleRepository(UserOrganizationRoleRepository):
         )
         return result.rowcount
 
+    def delete_expired_chunk(self, expired_before: datetime, chunk_size: int = 1000) -> int:
+        """Delete up to chunk_size assignments that expired before expired_before."""
+        expired_ids = (
+            select(UserOrganizationRoleModel.id)
+            .where(UserOrganizationRoleModel.expires_at < expired_before)
+            .order_by(UserOrganizationRoleModel.expires_at)
+            .limit(chunk_size)
+        )
+        result = self.session.execute(
+            delete(UserOrganizationRoleModel)
+            .where(UserOrganizationRoleModel.id.in_(expired_ids.scalar_subquery()))
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+
+    def assign_role_to_user(
+        self, user_id: UUID, organization_id: UUID, role_id: UUID
+    ) -> None:
+        """Assign a role to a user in an organization."""
+        self.save(
+            UserOrganizationRole.create(
+                user_id=user_id,
+                organization_id=organization_id,
+                role_id=role_id,
+                assigned_by=user_id,
+            )
+        )
+
     def _to_domain_entity(
         self, role_model: UserOrganizationRoleModel
     ) -> UserOrganizationRole:
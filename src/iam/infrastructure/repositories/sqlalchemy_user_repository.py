@@ -3,6 +3,7 @@ from typing import List, Optional
 from uuid import UUID
 from sqlalchemy import delete, update, select
 from sqlalchemy.orm import Session
+from shared.infrastructure.database.search import TextSearch, count_capped
 from ...domain.entities.user import User
 from ...domain.repositories.user_repository import UserRepository
 from ...domain.value_objects.email import Email
@@ -88,26 +89,27 @@ class SqlAlchemyUserRepository(UserRepository):
     ) -> tuple[List[User], int]:
         """Encontra usuários com paginação e filtros."""
         query = select(UserModel)
-        count_query = select(UserModel)
+        searches = []
 
         # Apply filters
         if email_filter:
-            query = query.where(UserModel.email.ilike(f"%{email_filter}%"))
-            count_query = count_query.where(UserModel.email.ilike(f"%{email_filter}%"))
+            searches.append(TextSearch(email_filter, UserModel.email))
 
         if name_filter:
-            query = query.where(UserModel.name.ilike(f"%{name_filter}%"))
-            count_query = count_query.where(UserModel.name.ilike(f"%{name_filter}%"))
+            searches.append(TextSearch(name_filter, UserModel.name))
+
+        for search in searches:
+            query = query.where(search.condition())
 
         if is_active is not None:
             query = query.where(UserModel.is_active == is_active)
-            count_query = count_query.where(UserModel.is_active == is_active)
 
         # Get total count
-        total_result = self.session.execute(count_query)
-        total = len(total_result.scalars().all())
+        total = count_capped(self.session, query)
 
-        # Get paginated results
+        # Get paginated results, most relevant first
+        for search in searches:
+            query = search.ranked(query, self.session)
         query = query.offset(offset).limit(limit).order_by(UserModel.created_at.desc())
         result = self.session.execute(query)
         user_models = result.scalars().all()
@@ -4,6 +4,7 @@ from typing import List, Optional
 from uuid import UUID
 
 from sqlalchemy import delete, update
+from sqlalchemy import select as sa_select
 from sqlalchemy.orm import Session
 from ...domain.entities.user_session import UserSession
 from ...domain.repositories.user_session_repository import UserSessionRepository
@@ -208,6 +209,22 @@ class SqlAlchemyUserSessionRepository(UserSessionRepository):
         )
         return result.rowcount
 
+    def delete_expired_chunk(self, expired_before: datetime, chunk_size: int = 1000) -> int:
+        """Exclui até chunk_size sessões expiradas antes de expired_before."""
+        # Os mais antigos primeiro, pelo índice de expires_at
+        expired_ids = (
+            sa_select(UserSessionModel.id)
+            .where(UserSessionModel.expires_at < expired_before)
+            .order_by(UserSessionModel.expires_at)
+            .limit(chunk_size)
+        )
+        result = self.session.execute(
+            delete(UserSessionModel)
+            .where(UserSessionModel.id.in_(expired_ids.scalar_subquery()))
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+
     def _to_domain_entity(self, session_model: UserSessionModel) -> UserSession:
         """Converte o modelo SQLAlchemy para a entidade de domínio."""
         return UserSession(
@@ -15,7 +15,16 @@ from ...infrastructure.iam_unit_of_work import IAMUnitOfWork
 def get_iam_uow(db: Session = Depends(get_db)) -> IAMUnitOfWork:
     """Get IAMUnitOfWork instance for JWT dependencies."""
     return IAMUnitOfWork(
-        db, ["user", "user_session", "role", "permission", "policy", "resource"]
+        db,
+        [
+            "user",
+            "user_session",
+            "role",
+            "permission",
+            "policy",
+            "resource",
+            "effective_user_permission",
+        ],
     )
 
 
@@ -161,12 +170,20 @@ def get_jwt_payload(
 
 def get_jwt_auth_context(
     jwt_payload: JWTTokenPayload = Depends(get_jwt_payload),
+    jwt_service: JWTService = Depends(get_jwt_service),
+    db: Session = Depends(get_db),
 ) -> JWTAuthenticationContext:
     """
     Get JWT authentication context from token payload.
     
+    Compact tokens have their roles and permissions resolved from the
+    role set cache. The authentication use case is only built to load them
+    from the database on a miss, never for embedded tokens.
+    
     Args:
         jwt_payload: JWT token payload
+        jwt_service: JWT service (resolves cached compact claims)
+        db: Database session, used only on a cache miss
     
     Returns:
         JWTAuthenticationContext with user and organization information
@@ -177,6 +194,9 @@ def get_jwt_auth_context(
     try:
         user_id = UUID(jwt_payload.user_id)
         organization_id = UUID(jwt_payload.organization_id) if jwt_payload.organization_id else None
+        if not jwt_service.resolve_cached_claims(jwt_payload):
+            auth_use_case = get_auth_use_case(get_iam_uow(db))
+            jwt_payload = auth_use_case.load_token_claims(jwt_payload)
         
         return JWTAuthenticationContext(
             user_id=user_id,
@@ -8,6 +8,9 @@ from ..infrastructure.repositories.sqlalchemy_role_repository import (
 from ..infrastructure.repositories.sqlalchemy_permission_repository import (
     SqlAlchemyPermissionRepository,
 )
+from ..infrastructure.repositories.sqlalchemy_effective_user_permission_repository import (
+    SqlAlchemyEffectiveUserPermissionRepository,
+)
 from ..application.use_cases.role_use_cases import RoleUseCase
 from ..application.use_cases.permission_use_cases import PermissionUseCase
 
@@ -24,14 +27,24 @@ def get_permission_repository(
     return SqlAlchemyPermissionRepository(db)
 
 
+def get_effective_permission_repository(
+    db: Session = Depends(get_db),
+) -> SqlAlchemyEffectiveUserPermissionRepository:
+    """Get effective user permission repository dependency."""
+    return SqlAlchemyEffectiveUserPermissionRepository(db)
+
+
 def get_role_use_case(
     role_repo: SqlAlchemyRoleRepository = Depends(get_role_repository),
     permission_repo: SqlAlchemyPermissionRepository = Depends(
         get_permission_repository
     ),
+    effective_permission_repo: SqlAlchemyEffectiveUserPermissionRepository = Depends(
+        get_effective_permission_repository
+    ),
 ) -> RoleUseCase:
     """Get role use case dependency."""
-    return RoleUseCase(role_repo, permission_repo)
+    return RoleUseCase(role_repo, permission_repo, effective_permission_repo)
 
 
 def get_permission_use_case(
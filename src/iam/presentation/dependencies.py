@@ -12,6 +12,11 @@ from ..application.use_cases.policy_use_cases import PolicyUseCase
 from ..application.use_cases.organization_use_cases import OrganizationUseCase
 from ..application.use_cases.membership_use_cases import MembershipUseCase
 from ..application.use_cases.authorization_subject_use_cases import AuthorizationSubjectUseCase
+from ..domain.services.abac_service import ABACService
+from ..domain.services.authorization_service import AuthorizationService
+from ..domain.services.policy_evaluation_service import PolicyEvaluationService
+from ..domain.services.policy_index import get_policy_index
+from ..domain.services.rbac_service import RBACService
 from ..infrastructure.iam_unit_of_work import IAMUnitOfWork
 
 
@@ -47,12 +52,13 @@ def get_full_iam_uow(db: Session = Depends(get_db)) -> IAMUnitOfWork:
             "permission",
             "policy",
             "authorization_subject",
+            "effective_user_permission",
         ],
     )
 
 
 def get_auth_use_case(
-    uow: IAMUnitOfWork = Depends(get_iam_uow),
+    uow: IAMUnitOfWork = Depends(get_full_iam_uow),
 ) -> AuthenticationUseCase:
     """Obtém AuthenticationUseCase com a dependência UnitOfWork apropriada."""
     return AuthenticationUseCase(uow)
@@ -63,21 +69,45 @@ def get_user_use_case(uow: IAMUnitOfWork = Depends(get_iam_uow)) -> UserUseCase:
     return UserUseCase(uow)
 
 
-def get_session_use_case(uow: IAMUnitOfWork = Depends(get_iam_uow)) -> SessionUseCase:
+def get_session_use_case(
+    uow: IAMUnitOfWork = Depends(get_full_iam_uow),
+) -> SessionUseCase:
     """Obtém SessionUseCase com a dependência UnitOfWork apropriada."""
     return SessionUseCase(uow)
 
 
 def get_authorization_use_case(
-    uow: IAMUnitOfWork = Depends(get_iam_uow),
+    uow: IAMUnitOfWork = Depends(get_full_iam_uow),
 ) -> AuthorizationUseCase:
     """Obtém AuthorizationUseCase com a dependência UnitOfWork apropriada."""
-    return AuthorizationUseCase(uow)
+    rbac_service = RBACService(
+        role_repository=uow.get_repository("role"),
+        permission_repository=uow.get_repository("permission"),
+        role_permission_repository=uow.get_repository("role_permission"),
+        effective_permission_repository=uow.get_repository("effective_user_permission"),
+    )
+    abac_service = ABACService(
+        policy_repository=uow.get_repository("policy"),
+        policy_evaluation_service=PolicyEvaluationService(),
+        policy_index=get_policy_index(),
+    )
 
+    # Atribuições de papéis atualizam effective_user_permissions na mesma transação
+    return AuthorizationUseCase(
+        AuthorizationService(rbac_service, abac_service),
+        uow.get_repository("role"),
+        uow.get_repository("policy"),
+        uow.get_repository("effective_user_permission"),
+    )
 
-def get_role_use_case(uow: IAMUnitOfWork = Depends(get_iam_uow)) -> RoleUseCase:
+
+def get_role_use_case(uow: IAMUnitOfWork = Depends(get_full_iam_uow)) -> RoleUseCase:
     """Obtém RoleUseCase com a dependência UnitOfWork apropriada."""
-    return RoleUseCase(uow)
+    return RoleUseCase(
+        uow.get_repository("role"),
+        uow.get_repository("permission"),
+        uow.get_repository("effective_user_permission"),
+    )
 
 
 def get_permission_use_case(
@@ -166,15 +166,15 @@ def validate_session(
         # Extract additional context from JWT token
         from ...domain.services.jwt_service import JWTService
         jwt_service = JWTService()
-        organization_id = jwt_service.get_token_organization_id(token)
-        permissions = jwt_service.get_token_permissions(token)
-        roles = jwt_service.get_token_roles(token)
+        payload = jwt_service.decode_token(token)
+        if payload:
+            payload = use_case.resolve_token_claims(payload)
 
         return {
             "user": user,
-            "organization_id": organization_id,
-            "permissions": permissions,
-            "roles": roles,
+            "organization_id": payload.organization_id if payload else None,
+            "permissions": payload.permissions if payload else [],
+            "roles": payload.roles if payload else [],
             "token_valid": True,
             "message": "Token is valid"
         }
@@ -2,7 +2,8 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from typing import Optional, List
 from uuid import UUID
 
-from ..dependencies import get_authorization_subject_use_case, get_current_user
+from ..auth_dependencies import get_current_user_from_jwt
+from ..dependencies import get_authorization_subject_use_case
 from ...application.use_cases.authorization_subject_use_cases import AuthorizationSubjectUseCase
 from ...application.dtos.authorization_subject_dto import (
     AuthorizationSubjectCreateDTO,
@@ -27,7 +28,7 @@ router = APIRouter(prefix="/authorization-subjects", tags=["Authorization Subjec
 def create_authorization_subject(
     dto: AuthorizationSubjectCreateDTO,
     use_case: AuthorizationSubjectUseCase = Depends(get_authorization_subject_use_case),
-    current_user = Depends(get_current_user),
+    current_user = Depends(get_current_user_from_jwt),
 ):
     """Create a new authorization subject."""
     try:
@@ -40,7 +41,7 @@ def create_authorization_subject(
 def get_authorization_subject(
     subject_id: UUID,
     use_case: AuthorizationSubjectUseCase = Depends(get_authorization_subject_use_case),
-    current_user = Depends(get_current_user),
+    current_user = Depends(get_current_user_from_jwt),
 ):
     """Get authorization subject by ID."""
     try:
@@ -60,7 +61,7 @@ def update_authorization_subject(
     subject_id: UUID,
     dto: AuthorizationSubjectUpdateDTO,
     use_case: AuthorizationSubjectUseCase = Depends(get_authorization_subject_use_case),
-    current_user = Depends(get_current_user),
+    current_user = Depends(get_current_user_from_jwt),
 ):
     """Update an authorization subject."""
     try:
@@ -74,7 +75,7 @@ def transfer_ownership(
     subject_id: UUID,
     dto: AuthorizationSubjectTransferOwnershipDTO,
     use_case: AuthorizationSubjectUseCase = Depends(get_authorization_subject_use_case),
-    current_user = Depends(get_current_user),
+    current_user = Depends(get_current_user_from_jwt),
 ):
     """Transfer ownership of an authorization subject."""
     try:
@@ -88,7 +89,7 @@ def move_to_organization(
     subject_id: UUID,
     dto: AuthorizationSubjectMoveOrganizationDTO,
     use_case: AuthorizationSubjectUseCase = Depends(get_authorization_subject_use_case),
-    current_user = Depends(get_current_user),
+    current_user = Depends(get_current_user_from_jwt),
 ):
     """Move authorization subject to different organization."""
     try:
@@ -101,7 +102,7 @@ def move_to_organization(
 def activate_subject(
     subject_id: UUID,
     use_case: AuthorizationSubjectUseCase = Depends(get_authorization_subject_use_case),
-    current_user = Depends(get_current_user),
+    current_user = Depends(get_current_user_from_jwt),
 ):
     """Activate an authorization subject."""
     try:
@@ -114,7 +115,7 @@ def activate_subject(
 def deactivate_subject(
     subject_id: UUID,
     use_case: AuthorizationSubjectUseCase = Depends(get_authorization_subject_use_case),
-    current_user = Depends(get_current_user),
+    current_user = Depends(get_current_user_from_jwt),
 ):
     """Deactivate an authorization subject."""
     try:
@@ -127,7 +128,7 @@ def deactivate_subject(
 def delete_authorization_subject(
     subject_id: UUID,
     use_case: AuthorizationSubjectUseCase = Depends(get_authorization_subject_use_case),
-    current_user = Depends(get_current_user),
+    current_user = Depends(get_current_user_from_jwt),
 ):
     """Delete an authorization subject."""
     try:
@@ -151,7 +152,7 @@ def list_authorization_subjects(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
     use_case: AuthorizationSubjectUseCase = Depends(get_authorization_subject_use_case),
-    current_user = Depends(get_current_user),
+    current_user = Depends(get_current_user_from_jwt),
 ):
     """List authorization subjects with pagination and filters."""
     try:
@@ -172,7 +173,7 @@ def list_authorization_subjects(
 def find_subject_by_reference(
     dto: AuthorizationSubjectSearchDTO,
     use_case: AuthorizationSubjectUseCase = Depends(get_authorization_subject_use_case),
-    current_user = Depends(get_current_user),
+    current_user = Depends(get_current_user_from_jwt),
 ):
     """Find authorization subject by external reference."""
     try:
@@ -192,7 +193,7 @@ def get_user_subjects(
     user_id: UUID,
     organization_id: Optional[UUID] = Query(None, description="Filter by organization ID"),
     use_case: AuthorizationSubjectUseCase = Depends(get_authorization_subject_use_case),
-    current_user = Depends(get_current_user),
+    current_user = Depends(get_current_user_from_jwt),
 ):
     """Get all subjects owned by a user."""
     try:
@@ -206,7 +207,7 @@ def get_organization_subjects(
     organization_id: UUID,
     subject_type: Optional[str] = Query(None, description="Filter by subject type"),
     use_case: AuthorizationSubjectUseCase = Depends(get_authorization_subject_use_case),
-    current_user = Depends(get_current_user),
+    current_user = Depends(get_current_user_from_jwt),
 ):
     """Get all subjects in an organization."""
     try:
@@ -219,7 +220,7 @@ def get_organization_subjects(
 def get_active_organization_subjects(
     organization_id: UUID,
     use_case: AuthorizationSubjectUseCase = Depends(get_authorization_subject_use_case),
-    current_user = Depends(get_current_user),
+    current_user = Depends(get_current_user_from_jwt),
 ):
     """Get all active subjects in an organization."""
     try:
@@ -232,7 +233,7 @@ def get_active_organization_subjects(
 def bulk_transfer_ownership(
     dto: BulkTransferOwnershipDTO,
     use_case: AuthorizationSubjectUseCase = Depends(get_authorization_subject_use_case),
-    current_user = Depends(get_current_user),
+    current_user = Depends(get_current_user_from_jwt),
 ):
     """Bulk transfer ownership of multiple subjects."""
     try:
@@ -245,7 +246,7 @@ def bulk_transfer_ownership(
 def bulk_move_to_organization(
     dto: BulkMoveOrganizationDTO,
     use_case: AuthorizationSubjectUseCase = Depends(get_authorization_subject_use_case),
-    current_user = Depends(get_current_user),
+    current_user = Depends(get_current_user_from_jwt),
 ):
     """Bulk move subjects to different organization."""
     try:
@@ -258,7 +259,7 @@ def bulk_move_to_organization(
 def bulk_activate_subjects(
     dto: BulkAuthorizationSubjectOperationDTO,
     use_case: AuthorizationSubjectUseCase = Depends(get_authorization_subject_use_case),
-    current_user = Depends(get_current_user),
+    current_user = Depends(get_current_user_from_jwt),
 ):
     """Bulk activate multiple subjects."""
     try:
@@ -271,7 +272,7 @@ def bulk_activate_subjects(
 def bulk_deactivate_subjects(
     dto: BulkAuthorizationSubjectOperationDTO,
     use_case: AuthorizationSubjectUseCase = Depends(get_authorization_subject_use_case),
-    current_user = Depends(get_current_user),
+    current_user = Depends(get_current_user_from_jwt),
 ):
     """Bulk deactivate multiple subjects."""
     try:
@@ -284,7 +285,7 @@ def bulk_deactivate_subjects(
 def get_subject_statistics(
     organization_id: Optional[UUID] = Query(None, description="Organization ID for scoped statistics"),
     use_case: AuthorizationSubjectUseCase = Depends(get_authorization_subject_use_case),
-    current_user = Depends(get_current_user),
+    current_user = Depends(get_current_user_from_jwt),
 ):
     """Get statistics about authorization subjects."""
     try:
@@ -56,11 +56,14 @@ def get_role(
 def update_role(
     role_id: UUID,
     role_data: RoleUpdateDTO,
+    organization_id: UUID = Query(
+        ..., description="Organization owning the role (default roles are copied on write)"
+    ),
     role_use_case: RoleUseCase = Depends(get_role_use_case),
 ):
     """Update an existing role."""
     try:
-        role = role_use_case.update_role(role_id, role_data)
+        role = role_use_case.update_role(role_id, role_data, organization_id)
         if not role:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Role not found"
@@ -120,11 +123,14 @@ def list_roles(
 def assign_permissions(
     role_id: UUID,
     permission_data: RolePermissionAssignDTO,
+    organization_id: UUID = Query(
+        ..., description="Organization owning the role (default roles are copied on write)"
+    ),
     role_use_case: RoleUseCase = Depends(get_role_use_case),
 ):
     """Assign permissions to a role."""
     try:
-        role = role_use_case.assign_permissions(role_id, permission_data)
+        role = role_use_case.assign_permissions(role_id, permission_data, organization_id)
         if not role:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Role not found"
@@ -142,11 +148,14 @@ def assign_permissions(
 def remove_permissions(
     role_id: UUID,
     permission_data: RolePermissionRemoveDTO,
+    organization_id: UUID = Query(
+        ..., description="Organization owning the role (default roles are copied on write)"
+    ),
     role_use_case: RoleUseCase = Depends(get_role_use_case),
 ):
     """Remove permissions from a role."""
     try:
-        role = role_use_case.remove_permissions(role_id, permission_data)
+        role = role_use_case.remove_permissions(role_id, permission_data, organization_id)
         if not role:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Role not found"
@@ -167,11 +176,16 @@ def remove_permissions(
 def set_role_parent(
     role_id: UUID,
     inheritance_data: RoleInheritanceDTO,
+    organization_id: UUID = Query(
+        ..., description="Organization owning the role (default roles are copied on write)"
+    ),
     role_use_case: RoleUseCase = Depends(get_role_use_case),
 ):
     """Set parent role for inheritance."""
     try:
-        role = role_use_case.set_role_parent(role_id, inheritance_data.parent_role_id)
+        role = role_use_case.set_role_parent(
+            role_id, inheritance_data.parent_role_id, organization_id
+        )
         if not role:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Role not found"
@@ -188,11 +202,14 @@ def set_role_parent(
 @router.delete("/{role_id}/parent", response_model=RoleResponseDTO)
 def remove_role_parent(
     role_id: UUID,
+    organization_id: UUID = Query(
+        ..., description="Organization owning the role (default roles are copied on write)"
+    ),
     role_use_case: RoleUseCase = Depends(get_role_use_case),
 ):
     """Remove parent role inheritance."""
     try:
-        role = role_use_case.remove_role_parent(role_id)
+        role = role_use_case.remove_role_parent(role_id, organization_id)
         if not role:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Role not found"
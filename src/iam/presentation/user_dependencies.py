@@ -11,7 +11,16 @@ from ..infrastructure.iam_unit_of_work import IAMUnitOfWork
 def get_iam_uow(db: Session = Depends(get_db)) -> IAMUnitOfWork:
     """Obtém uma instância de IAMUnitOfWork com repositórios IAM."""
     return IAMUnitOfWork(
-        db, ["user", "user_session", "role", "permission", "policy", "resource"]
+        db,
+        [
+            "user",
+            "user_session",
+            "role",
+            "permission",
+            "policy",
+            "resource",
+            "effective_user_permission",
+        ],
     )
 
 
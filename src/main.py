@@ -1,10 +1,37 @@
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+from sqlalchemy import text
+from datetime import timedelta
 import logging
 import time
 
-from shared.infrastructure.database.connection import engine, Base
+from shared.infrastructure.config import settings, get_configuration_loader
+from shared.infrastructure.database.connection import engine, Base, SessionLocal
+from shared.infrastructure.database.query_stats import track_queries
+from shared.infrastructure.database.schema_check import verify_schema_revision
+from shared.infrastructure.metrics import get_http_metrics, get_metrics_registry
+from shared.infrastructure.scheduler import get_job_scheduler, register_scheduled_job
+from shared.infrastructure.warmup import get_warmup_registry, register_warmup_hook
+from shared.presentation.serialization import (
+    ORJSON_AVAILABLE,
+    FastJSONResponse,
+    install_fast_serialization,
+)
+from src.iam.application.jobs.expired_records_reaper import ExpiredRecordsReaper
+from src.iam.domain.constants.default_roles import DefaultRoleConfigurations
+from src.iam.domain.services.policy_index import get_policy_index
+from src.iam.infrastructure.iam_unit_of_work import IAMUnitOfWork
+from src.iam.infrastructure.repositories.sqlalchemy_policy_repository import (
+    SqlAlchemyPolicyRepository,
+)
 from src.iam.presentation.routers import router as iam_router
+from plans.application.jobs.subscription_lifecycle_job import SubscriptionLifecycleJob
+from plans.infrastructure.plans_unit_of_work import PlansUnitOfWork
+from plans.presentation.routes.chat_widget_routes import router as chat_widget_router
+from plans.infrastructure.repositories.sqlalchemy_plan_repository import (
+    SqlAlchemyPlanRepository,
+)
 
 # Configurar logging
 logging.basicConfig(level=logging.INFO)
@@ -15,29 +42,178 @@ def create_tables():
     Base.metadata.create_all(bind=engine)
 
 
+def prepare_schema():
+    # "verify" só lê alembic_version, sem refletir todas as tabelas
+    if settings.startup_schema_mode == "create_all":
+        create_tables()
+    elif settings.startup_schema_mode == "verify":
+        heads = verify_schema_revision(engine)
+        logger.info(f"Database schema at revision {', '.join(sorted(heads))}")
+
+
+def warm_database_pool():
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+
+
+def warm_default_configs():
+    loader = get_configuration_loader()
+    loader.load_default_roles()
+    loader.load_application_types()
+    loader.load_plan_configurations()
+    loader.load_trial_settings()
+
+
+def warm_policy_index():
+    db = SessionLocal()
+    try:
+        get_policy_index().preload(SqlAlchemyPolicyRepository(db))
+    finally:
+        db.close()
+
+
+def warm_plan_catalog():
+    db = SessionLocal()
+    try:
+        SqlAlchemyPlanRepository(db).preload_catalog()
+    finally:
+        db.close()
+
+
+def register_warmup_hooks():
+    register_warmup_hook("database_pool", warm_database_pool)
+    register_warmup_hook("default_configs", warm_default_configs)
+    register_warmup_hook("default_roles", DefaultRoleConfigurations.get_role_configs)
+    register_warmup_hook("global_policies", warm_policy_index)
+    register_warmup_hook("plan_catalog", warm_plan_catalog)
+
+
+def run_subscription_lifecycle():
+    SubscriptionLifecycleJob(
+        lambda: PlansUnitOfWork(SessionLocal(), ["subscription", "job_checkpoint"]),
+        chunk_size=settings.subscription_lifecycle_chunk_size,
+    ).run()
+
+
+def run_expired_records_reaper():
+    ExpiredRecordsReaper(
+        lambda: IAMUnitOfWork(
+            SessionLocal(),
+            ["user_session", "user_organization_role", "role", "effective_user_permission"],
+        ),
+        session_retention=timedelta(days=settings.session_retention_days),
+        assignment_retention=timedelta(days=settings.role_assignment_retention_days),
+        chunk_size=settings.reaper_chunk_size,
+        pause_seconds=settings.reaper_pause_seconds,
+    ).run()
+
+
+def register_scheduled_jobs():
+    if settings.subscription_lifecycle_scheduler:
+        register_scheduled_job(
+            "subscription_lifecycle",
+            run_subscription_lifecycle,
+            settings.subscription_lifecycle_interval_seconds,
+        )
+    if settings.expired_records_reaper:
+        register_scheduled_job(
+            "expired_records_reaper",
+            run_expired_records_reaper,
+            settings.reaper_interval_seconds,
+        )
+
+
+# Prefixos de APIs de IA (tupla para um único startswith por requisição)
+AI_ENDPOINT_PREFIXES = ("/v1/models", "/v1/chat", "/v1/completions", "/models", "/chat")
+
+
+def get_db_pool_stats() -> dict:
+    pool = engine.pool
+    stats = {}
+    for field in ("size", "checkedin", "checkedout", "overflow"):
+        if hasattr(pool, field):
+            stats[field] = getattr(pool, field)()
+    return stats
+
+
+def register_metrics_collectors():
+    registry = get_metrics_registry()
+    registry.register_collector(
+        "db_pool_connections", "Database connection pool state.", get_db_pool_stats
+    )
+    registry.register_collector(
+        "app_cache_info",
+        "In-process cache state.",
+        lambda: get_policy_index().get_cache_info(),
+        labels={"cache": "policy_index"},
+    )
+    registry.register_collector(
+        "app_cache_info",
+        "In-process cache state.",
+        lambda: get_configuration_loader().get_cache_info(),
+        labels={"cache": "configuration_loader"},
+    )
+
+
 def create_app() -> FastAPI:
     app = FastAPI(
         title="DDD FastAPI Application",
         description="A FastAPI application following Domain Driven Design principles",
         version="1.0.0",
         redirect_slashes=False,  # Desabilita redirecionamento automático de trailing slash
+        default_response_class=(
+            FastJSONResponse if settings.fast_serialization else JSONResponse
+        ),
     )
 
+    http_metrics = get_http_metrics()
+    in_flight = http_metrics.in_flight
+
     @app.middleware("http")
     async def log_requests(request: Request, call_next):
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         # Logar requisições suspeitas para endpoints de IA
-        ai_endpoints = ["/v1/models", "/v1/chat", "/v1/completions", "/models", "/chat"]
-        if any(request.url.path.startswith(endpoint) for endpoint in ai_endpoints):
+        if request.url.path.startswith(AI_ENDPOINT_PREFIXES):
             logger.warning(
                 f"AI API request detected: {request.method} {request.url.path} "
                 f"from {request.client.host if request.client else 'unknown'} "
                 f"User-Agent: {request.headers.get('user-agent', 'unknown')}"
             )
 
-        response = await call_next(request)
-        process_time = time.time() - start_time
+        in_flight.inc()
+        try:
+            with track_queries() as query_stats:
+                response = await call_next(request)
+        except Exception:
+            http_metrics.get_route_metrics(
+                request.method, request.scope.get("route")
+            ).observe(time.perf_counter() - start_time, 500)
+            raise
+        finally:
+            in_flight.dec()
+        process_time = time.perf_counter() - start_time
+
+        # O roteamento grava a rota casada no scope (template, não o path real)
+        http_metrics.get_route_metrics(
+            request.method, request.scope.get("route")
+        ).observe(process_time, response.status_code)
+
+        if settings.query_stats_headers:
+            response.headers["X-DB-Query-Count"] = str(query_stats.count)
+            response.headers["X-DB-Time-Ms"] = f"{query_stats.duration_ms:.2f}"
+
+        # Logar possíveis N+1 (mesma query repetida na requisição)
+        repeated_statements = query_stats.get_repeated_statements(
+            settings.query_repeat_threshold
+        )
+        if repeated_statements:
+            logger.warning(
+                f"Repeated SQL statements: {request.method} {request.url.path} - "
+                f"Queries: {query_stats.count} - "
+                f"Top: {repeated_statements[0][1]}x {repeated_statements[0][0][:200]}",
+                extra=query_stats.to_dict(settings.query_repeat_threshold),
+            )
 
         # Logar requisições problemáticas e redirecionamentos
         if (
@@ -53,7 +229,12 @@ def create_app() -> FastAPI:
                 f"{request.method} {request.url.path} - "
                 f"Status: {response.status_code}{status_msg} - "
                 f"Time: {process_time:.4f}s - "
-                f"Client: {request.client.host if request.client else 'unknown'}"
+                f"Queries: {query_stats.count} ({query_stats.duration_ms:.1f}ms) - "
+                f"Client: {request.client.host if request.client else 'unknown'}",
+                extra={
+                    "db_query_count": query_stats.count,
+                    "db_time_ms": round(query_stats.duration_ms, 2),
+                },
             )
 
         return response
@@ -67,6 +248,36 @@ def create_app() -> FastAPI:
     )
 
     app.include_router(iam_router)
+    # Só o widget do chat: o restante de plans_api_router ainda não é montado
+    app.include_router(chat_widget_router, prefix="/api/v1/plans")
+
+    # Depois de incluir as rotas: DTOs vão direto para bytes JSON
+    if settings.fast_serialization:
+        installed = install_fast_serialization(app)
+        logger.info(f"Fast serialization enabled for {installed} routes")
+        if not ORJSON_AVAILABLE:
+            logger.warning(
+                "FAST_SERIALIZATION is on but orjson is not installed: "
+                "responses fall back to the json module (pip install orjson)"
+            )
+
+    register_metrics_collectors()
+    register_warmup_hooks()
+
+    @app.get("/internal/metrics", include_in_schema=False)
+    def metrics_endpoint(request: Request):
+        """Métricas no formato texto do Prometheus (uso interno)."""
+        # Fechado por padrão: exige o token, ou METRICS_ENABLED para expor sem token
+        if settings.metrics_token:
+            if request.headers.get("authorization") != f"Bearer {settings.metrics_token}":
+                return Response(status_code=403)
+        elif not settings.metrics_enabled:
+            return Response(status_code=404)
+
+        return Response(
+            get_metrics_registry().render(),
+            media_type="text/plain; version=0.0.4; charset=utf-8",
+        )
 
     return app
 
@@ -76,7 +287,22 @@ app = create_app()
 
 @app.on_event("startup")
 def startup_event():
-    create_tables()
+    prepare_schema()
+
+    # Readiness só passa depois do aquecimento dos caches
+    if settings.startup_warmup:
+        get_warmup_registry().run()
+    else:
+        get_warmup_registry().mark_ready()
+
+    register_scheduled_jobs()
+    if get_job_scheduler().get_status():
+        get_job_scheduler().start()
+
+
+@app.on_event("shutdown")
+def shutdown_event():
+    get_job_scheduler().stop(timeout=30)
 
 
 @app.get("/")
@@ -89,6 +315,15 @@ def health_check():
     return {"status": "healthy"}
 
 
+@app.get("/health/ready")
+def readiness_check():
+    registry = get_warmup_registry()
+    if not registry.is_ready:
+        return JSONResponse(status_code=503, content={"status": "starting"})
+
+    return {"status": "ready", "warmup": registry.get_results()}
+
+
 @app.get("/v1/models")
 def models_endpoint():
     """
@@ -1,7 +1,9 @@
 from .onboarding_request_dto import OnboardingRequestDto
 from .onboarding_response_dto import OnboardingResponseDto
+from .bulk_onboarding_request_dto import BulkOnboardingRequestDto
 
 __all__ = [
     "OnboardingRequestDto",
     "OnboardingResponseDto",
+    "BulkOnboardingRequestDto",
 ]
\ No newline at end of file
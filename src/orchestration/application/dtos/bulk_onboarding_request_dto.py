@@ -0,0 +1,9 @@
+from dataclasses import dataclass, field
+from typing import List
+
+from .onboarding_request_dto import OnboardingRequestDto
+
+
+@dataclass
+class BulkOnboardingRequestDto:
+    tenants: List[OnboardingRequestDto] = field(default_factory=list)
\ No newline at end of file
@@ -1,5 +1,5 @@
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import List, Optional
 from datetime import datetime
 
 from ...domain.entities import OnboardingStatus
@@ -15,4 +15,6 @@ class OnboardingResponseDto:
     created_at: datetime
     updated_at: datetime
     completed_at: Optional[datetime] = None
-    error_message: Optional[str] = None
\ No newline at end of file
+    error_message: Optional[str] = None
+    completed_steps: List[str] = field(default_factory=list)
+    attempts: int = 0
\ No newline at end of file
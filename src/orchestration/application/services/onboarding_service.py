@@ -1,5 +1,6 @@
 from ..use_cases import OnboardTenantUseCase
 from ..dtos import OnboardingRequestDto, OnboardingResponseDto
+from ...domain.entities import OnboardingWorkflow
 from ...domain.value_objects import TenantSetupRequest
 
 
@@ -8,6 +9,7 @@ class OnboardingService:
         self.onboard_tenant_use_case = onboard_tenant_use_case
     
     def onboard_tenant(self, request: OnboardingRequestDto) -> OnboardingResponseDto:
+        """Queue a tenant onboarding (workers run it; poll get_workflow_status)."""
         setup_request = TenantSetupRequest(
             user_id=request.user_id,
             plan_id=request.plan_id,
@@ -17,6 +19,14 @@ class OnboardingService:
         
         workflow = self.onboard_tenant_use_case.execute(setup_request)
         
+        return self._to_response(workflow)
+    
+    def get_workflow_status(self, workflow_id: str) -> OnboardingResponseDto:
+        workflow = self.onboard_tenant_use_case.get_workflow(workflow_id)
+        
+        return self._to_response(workflow)
+    
+    def _to_response(self, workflow: OnboardingWorkflow) -> OnboardingResponseDto:
         return OnboardingResponseDto(
             id=workflow.id,
             tenant_id=workflow.tenant_id,
@@ -27,4 +37,6 @@ class OnboardingService:
             updated_at=workflow.updated_at,
             completed_at=workflow.completed_at,
             error_message=workflow.error_message,
+            completed_steps=list(workflow.completed_steps),
+            attempts=workflow.attempts,
         )
\ No newline at end of file
@@ -1,5 +1,9 @@
 from .onboard_tenant import OnboardTenantUseCase
+from .process_onboarding import ProcessOnboardingUseCase
+from .bulk_onboard_tenants import BulkOnboardTenantsUseCase
 
 __all__ = [
     "OnboardTenantUseCase",
+    "ProcessOnboardingUseCase",
+    "BulkOnboardTenantsUseCase",
 ]
\ No newline at end of file
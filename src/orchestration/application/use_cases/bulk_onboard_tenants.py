@@ -0,0 +1,75 @@
+from typing import Dict, Iterable, Iterator, List, Optional, Protocol, Tuple
+
+from ...domain.value_objects import TenantSetupRequest, TenantProvisioningResult
+from .onboard_tenant import PlansService
+
+
+class BulkTenantProvisioner(Protocol):
+    def provision_batch(
+        self, batch: List[Tuple[int, TenantSetupRequest]]
+    ) -> List[TenantProvisioningResult]:
+        ...
+
+
+class BulkOnboardTenantsUseCase:
+    """Provisions a batch of tenants synchronously, a chunk at a time.
+
+    Plans are validated once per distinct plan id and duplicate names in
+    the batch are rejected up front; the remaining requests go to the
+    provisioner in chunks of ``batch_size``, each written set-based in one
+    transaction. Results are yielded per tenant as soon as their chunk is
+    done, so callers can stream them.
+    """
+
+    def __init__(
+        self,
+        plans_service: PlansService,
+        provisioner: BulkTenantProvisioner,
+        batch_size: int = 100,
+    ):
+        self.plans_service = plans_service
+        self.provisioner = provisioner
+        self.batch_size = batch_size
+
+    def execute(
+        self, requests: Iterable[TenantSetupRequest]
+    ) -> Iterator[TenantProvisioningResult]:
+        requests = list(requests)
+        plan_errors = self._validate_plans({request.plan_id for request in requests})
+
+        seen_names = set()
+        batch: List[Tuple[int, TenantSetupRequest]] = []
+
+        for index, request in enumerate(requests):
+            error = plan_errors.get(request.plan_id)
+            if error is None and request.tenant_name in seen_names:
+                error = f"Tenant name '{request.tenant_name}' is repeated in the batch"
+            seen_names.add(request.tenant_name)
+
+            if error:
+                yield TenantProvisioningResult(
+                    index=index,
+                    tenant_name=request.tenant_name,
+                    success=False,
+                    error_message=error,
+                )
+                continue
+
+            batch.append((index, request))
+            if len(batch) >= self.batch_size:
+                yield from self.provisioner.provision_batch(batch)
+                batch = []
+
+        if batch:
+            yield from self.provisioner.provision_batch(batch)
+
+    def _validate_plans(self, plan_ids: Iterable[str]) -> Dict[str, Optional[str]]:
+        """Map each invalid plan id to its error, checking every plan once."""
+        errors = {}
+        for plan_id in plan_ids:
+            try:
+                if not self.plans_service.get_plan(plan_id):
+                    errors[plan_id] = f"Plan {plan_id} not found"
+            except ValueError as e:
+                errors[plan_id] = str(e)
+        return errors
@@ -0,0 +1,95 @@
+import logging
+from datetime import datetime, timedelta
+from typing import Optional
+
+from ...domain.entities import OnboardingWorkflow, OnboardingStep
+from .onboard_tenant import IamService, PlansService, OnboardingRepository
+
+logger = logging.getLogger(__name__)
+
+
+class ProcessOnboardingUseCase:
+    """Runs the steps of queued onboarding workflows, outside request handling.
+
+    The workflow is saved after every step, so a retried or reclaimed
+    workflow resumes after its last finished step. Validation errors
+    (``ValueError``) fail the workflow; other errors are retried with
+    exponential backoff until the workflow runs out of attempts.
+    """
+
+    def __init__(
+        self,
+        iam_service: IamService,
+        plans_service: PlansService,
+        onboarding_repository: OnboardingRepository,
+        retry_backoff_seconds: float = 30.0,
+        lease_seconds: int = 300,
+    ):
+        self.iam_service = iam_service
+        self.plans_service = plans_service
+        self.onboarding_repository = onboarding_repository
+        self.retry_backoff_seconds = retry_backoff_seconds
+        self.lease_seconds = lease_seconds
+
+    def process_next(self, worker_id: str) -> Optional[OnboardingWorkflow]:
+        """Claim and run the next due workflow, None when there is none."""
+        workflow = self.onboarding_repository.claim_next(worker_id, self.lease_seconds)
+        if workflow is None:
+            return None
+
+        return self.execute(workflow)
+
+    def execute(self, workflow: OnboardingWorkflow) -> OnboardingWorkflow:
+        """Run the remaining steps of a claimed workflow."""
+        step = workflow.next_step()
+
+        try:
+            while step is not None:
+                self._run_step(workflow, step)
+                workflow.checkpoint(step)
+                self.onboarding_repository.save(workflow)
+                step = workflow.next_step()
+
+            workflow.complete()
+
+        except ValueError as e:
+            workflow.fail(str(e))
+
+        except Exception as e:
+            logger.warning(
+                f"Onboarding {workflow.id} failed at {step.value} "
+                f"(attempt {workflow.attempts}/{workflow.max_attempts}): {e}"
+            )
+            delay = self.retry_backoff_seconds * 2 ** max(workflow.attempts - 1, 0)
+            workflow.retry_later(str(e), datetime.utcnow() + timedelta(seconds=delay))
+
+        self.onboarding_repository.save(workflow)
+        return workflow
+
+    def _run_step(self, workflow: OnboardingWorkflow, step: OnboardingStep) -> None:
+        if step == OnboardingStep.VALIDATE_PLAN:
+            if not self.plans_service.get_plan(workflow.plan_id):
+                raise ValueError(f"Plan {workflow.plan_id} not found")
+
+        elif step == OnboardingStep.CREATE_TENANT:
+            if not workflow.tenant_id:
+                # A previous attempt may have created the tenant before saving its id
+                tenant_id = None
+                if workflow.attempts > 1:
+                    tenant_id = self.iam_service.find_tenant(
+                        workflow.tenant_name, workflow.user_id
+                    )
+                workflow.tenant_id = tenant_id or self.iam_service.create_tenant(
+                    workflow.tenant_name, workflow.user_id, workflow.tenant_domain
+                )
+
+        elif step == OnboardingStep.ASSIGN_USER:
+            self.iam_service.assign_user_to_tenant(workflow.user_id, workflow.tenant_id)
+
+        elif step == OnboardingStep.CREATE_ADMIN_ROLE:
+            self.iam_service.create_tenant_admin_role(workflow.tenant_id, workflow.user_id)
+
+        elif step == OnboardingStep.CREATE_SUBSCRIPTION:
+            self.plans_service.create_application_instance(
+                workflow.tenant_id, workflow.plan_id
+            )
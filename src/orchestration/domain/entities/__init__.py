@@ -1,6 +1,7 @@
-from .onboarding_workflow import OnboardingWorkflow, OnboardingStatus
+from .onboarding_workflow import OnboardingWorkflow, OnboardingStatus, OnboardingStep
 
 __all__ = [
     "OnboardingWorkflow",
     "OnboardingStatus",
+    "OnboardingStep",
 ]
\ No newline at end of file
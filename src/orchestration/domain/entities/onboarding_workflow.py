@@ -1,6 +1,6 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 
 
@@ -11,6 +11,16 @@ class OnboardingStatus(Enum):
     FAILED = "failed"
 
 
+class OnboardingStep(Enum):
+    """Onboarding steps, in the order a worker runs them."""
+
+    VALIDATE_PLAN = "validate_plan"
+    CREATE_TENANT = "create_tenant"
+    ASSIGN_USER = "assign_user"
+    CREATE_ADMIN_ROLE = "create_admin_role"
+    CREATE_SUBSCRIPTION = "create_subscription"
+
+
 @dataclass
 class OnboardingWorkflow:
     id: str
@@ -22,23 +32,70 @@ class OnboardingWorkflow:
     updated_at: datetime
     completed_at: Optional[datetime] = None
     error_message: Optional[str] = None
-    
-    def start(self) -> None:
+    tenant_name: str = ""
+    tenant_domain: Optional[str] = None
+    completed_steps: List[str] = field(default_factory=list)
+    attempts: int = 0
+    max_attempts: int = 5
+    next_attempt_at: Optional[datetime] = None
+    locked_by: Optional[str] = None
+    locked_until: Optional[datetime] = None
+
+    def start(
+        self, worker_id: Optional[str] = None, locked_until: Optional[datetime] = None
+    ) -> None:
         self.status = OnboardingStatus.IN_PROGRESS
+        self.attempts += 1
+        self.locked_by = worker_id
+        self.locked_until = locked_until
         self.updated_at = datetime.utcnow()
-    
+
     def complete(self) -> None:
         self.status = OnboardingStatus.COMPLETED
         self.completed_at = datetime.utcnow()
         self.updated_at = datetime.utcnow()
-    
+        self.error_message = None
+        self._release()
+
     def fail(self, error_message: str) -> None:
         self.status = OnboardingStatus.FAILED
         self.error_message = error_message
         self.updated_at = datetime.utcnow()
-    
+        self._release()
+
+    def retry_later(self, error_message: str, next_attempt_at: datetime) -> None:
+        """Queue the workflow again, or fail it once out of attempts."""
+        if self.attempts >= self.max_attempts:
+            self.fail(error_message)
+            return
+
+        self.status = OnboardingStatus.PENDING
+        self.error_message = error_message
+        self.next_attempt_at = next_attempt_at
+        self.updated_at = datetime.utcnow()
+        self._release()
+
+    def checkpoint(self, step: OnboardingStep) -> None:
+        """Record a finished step so later attempts skip it."""
+        if step.value not in self.completed_steps:
+            self.completed_steps.append(step.value)
+        self.updated_at = datetime.utcnow()
+
+    def is_step_completed(self, step: OnboardingStep) -> bool:
+        return step.value in self.completed_steps
+
+    def next_step(self) -> Optional[OnboardingStep]:
+        for step in OnboardingStep:
+            if not self.is_step_completed(step):
+                return step
+        return None
+
     def is_completed(self) -> bool:
         return self.status == OnboardingStatus.COMPLETED
-    
+
     def is_failed(self) -> bool:
-        return self.status == OnboardingStatus.FAILED
\ No newline at end of file
+        return self.status == OnboardingStatus.FAILED
+
+    def _release(self) -> None:
+        self.locked_by = None
+        self.locked_until = None
@@ -1,5 +1,7 @@
 from .tenant_setup_request import TenantSetupRequest
+from .tenant_provisioning_result import TenantProvisioningResult
 
 __all__ = [
     "TenantSetupRequest",
+    "TenantProvisioningResult",
 ]
\ No newline at end of file
@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class TenantProvisioningResult:
+    index: int
+    tenant_name: str
+    success: bool
+    tenant_id: Optional[str] = None
+    error_message: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        return {
+            "index": self.index,
+            "tenant_name": self.tenant_name,
+            "success": self.success,
+            "tenant_id": self.tenant_id,
+            "error_message": self.error_message,
+        }
@@ -1,3 +1,4 @@
 from .database import *
 from .repositories import *
-from .services import *
\ No newline at end of file
+from .services import *
+from .workers import *
\ No newline at end of file
@@ -1,21 +1,34 @@
-from sqlalchemy import Column, String, DateTime, Text, Enum as SqlEnum
-from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy import Column, String, DateTime, Text, Integer, Index
+from sqlalchemy.dialects.postgresql import JSON
 from datetime import datetime
 
-from ...domain.entities import OnboardingStatus
-
-Base = declarative_base()
+from src.shared.infrastructure.database.connection import Base
 
 
 class OnboardingWorkflowModel(Base):
+    """Durable onboarding job: one row per workflow, claimed by workers."""
+
     __tablename__ = "onboarding_workflows"
-    
+
     id = Column(String(36), primary_key=True)
     tenant_id = Column(String(36), nullable=False)
     user_id = Column(String(36), nullable=False)
     plan_id = Column(String(36), nullable=False)
-    status = Column(SqlEnum(OnboardingStatus), nullable=False)
+    tenant_name = Column(String(255), nullable=False)
+    tenant_domain = Column(String(255), nullable=True)
+    status = Column(String(20), nullable=False)
+    completed_steps = Column(JSON, nullable=False, default=[])
+    attempts = Column(Integer, default=0, nullable=False)
+    max_attempts = Column(Integer, default=5, nullable=False)
+    next_attempt_at = Column(DateTime, nullable=True)
+    locked_by = Column(String(100), nullable=True)
+    locked_until = Column(DateTime, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     completed_at = Column(DateTime, nullable=True)
-    error_message = Column(Text, nullable=True)
\ No newline at end of file
+    error_message = Column(Text, nullable=True)
+
+    # Workers poll for due pending workflows (and expired leases)
+    __table_args__ = (
+        Index("ix_onboarding_workflows_queue", "status", "next_attempt_at"),
+    )
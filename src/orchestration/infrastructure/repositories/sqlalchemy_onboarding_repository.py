@@ -1,20 +1,28 @@
+from datetime import datetime, timedelta
+from typing import Optional
+
 from sqlalchemy.orm import Session
-from sqlalchemy import select
+from sqlalchemy import select, and_, or_
 
-from ...domain.entities import OnboardingWorkflow
+from ...domain.entities import OnboardingWorkflow, OnboardingStatus
 from ..database.models import OnboardingWorkflowModel
 
 
 class SqlAlchemyOnboardingRepository:
     def __init__(self, session: Session):
         self.session = session
-    
+
     def save(self, workflow: OnboardingWorkflow) -> None:
         existing = self.session.get(OnboardingWorkflowModel, workflow.id)
-        
+
         if existing:
             existing.tenant_id = workflow.tenant_id
             existing.status = workflow.status.value
+            existing.completed_steps = list(workflow.completed_steps)
+            existing.attempts = workflow.attempts
+            existing.next_attempt_at = workflow.next_attempt_at
+            existing.locked_by = workflow.locked_by
+            existing.locked_until = workflow.locked_until
             existing.updated_at = workflow.updated_at
             existing.completed_at = workflow.completed_at
             existing.error_message = workflow.error_message
@@ -24,29 +32,89 @@ class SqlAlchemyOnboardingRepository:
                 tenant_id=workflow.tenant_id,
                 user_id=workflow.user_id,
                 plan_id=workflow.plan_id,
+                tenant_name=workflow.tenant_name,
+                tenant_domain=workflow.tenant_domain,
                 status=workflow.status.value,
+                completed_steps=list(workflow.completed_steps),
+                attempts=workflow.attempts,
+                max_attempts=workflow.max_attempts,
+                next_attempt_at=workflow.next_attempt_at,
+                locked_by=workflow.locked_by,
+                locked_until=workflow.locked_until,
                 created_at=workflow.created_at,
                 updated_at=workflow.updated_at,
                 completed_at=workflow.completed_at,
                 error_message=workflow.error_message,
             )
             self.session.add(model)
-        
+
         self.session.commit()
-    
+
     def get_by_id(self, workflow_id: str) -> OnboardingWorkflow:
         model = self.session.get(OnboardingWorkflowModel, workflow_id)
         if not model:
             raise ValueError(f"Onboarding workflow {workflow_id} not found")
-        
+
+        return self._to_domain_entity(model)
+
+    def claim_next(
+        self, worker_id: str, lease_seconds: int = 300
+    ) -> Optional[OnboardingWorkflow]:
+        """Claim the next due workflow for a worker, None when the queue is empty.
+
+        Due workflows are pending ones whose retry time has come and running
+        ones whose worker lease expired (the worker died). The row is locked
+        with SKIP LOCKED, so concurrent workers never claim the same one.
+        """
+        now = datetime.utcnow()
+        model = self.session.execute(
+            select(OnboardingWorkflowModel)
+            .where(
+                or_(
+                    and_(
+                        OnboardingWorkflowModel.status == OnboardingStatus.PENDING.value,
+                        or_(
+                            OnboardingWorkflowModel.next_attempt_at.is_(None),
+                            OnboardingWorkflowModel.next_attempt_at <= now,
+                        ),
+                    ),
+                    and_(
+                        OnboardingWorkflowModel.status == OnboardingStatus.IN_PROGRESS.value,
+                        OnboardingWorkflowModel.locked_until < now,
+                    ),
+                )
+            )
+            .order_by(OnboardingWorkflowModel.next_attempt_at)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+        ).scalar_one_or_none()
+
+        if not model:
+            self.session.rollback()
+            return None
+
+        workflow = self._to_domain_entity(model)
+        workflow.start(worker_id, now + timedelta(seconds=lease_seconds))
+        self.save(workflow)
+        return workflow
+
+    def _to_domain_entity(self, model: OnboardingWorkflowModel) -> OnboardingWorkflow:
         return OnboardingWorkflow(
             id=model.id,
             tenant_id=model.tenant_id,
             user_id=model.user_id,
             plan_id=model.plan_id,
-            status=model.status,
+            status=OnboardingStatus(model.status),
             created_at=model.created_at,
             updated_at=model.updated_at,
             completed_at=model.completed_at,
             error_message=model.error_message,
-        )
\ No newline at end of file
+            tenant_name=model.tenant_name,
+            tenant_domain=model.tenant_domain,
+            completed_steps=list(model.completed_steps or []),
+            attempts=model.attempts,
+            max_attempts=model.max_attempts,
+            next_attempt_at=model.next_attempt_at,
+            locked_by=model.locked_by,
+            locked_until=model.locked_until,
+        )
@@ -1,7 +1,9 @@
 from .iam_service_impl import IamServiceImpl
 from .plans_service_impl import PlansServiceImpl
+from .bulk_tenant_provisioner import SqlAlchemyBulkTenantProvisioner
 
 __all__ = [
     "IamServiceImpl",
     "PlansServiceImpl",
+    "SqlAlchemyBulkTenantProvisioner",
 ]
\ No newline at end of file
@@ -0,0 +1,330 @@
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Tuple
+from uuid import UUID, uuid4
+
+from sqlalchemy import and_, insert, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from ...domain.value_objects import TenantSetupRequest, TenantProvisioningResult
+from ....iam.domain.constants import DefaultOrganizationRoles, DefaultRoleConfigurations
+from ....iam.domain.entities.organization import Organization
+from ....iam.domain.services.role_set_cache import get_role_set_cache
+from ....iam.infrastructure.database.models import (
+    AuthorizationSubjectModel,
+    OrganizationModel,
+    PermissionActionEnum,
+    PermissionModel,
+    RoleModel,
+    UserOrganizationRoleModel,
+    role_permission_association,
+    user_role_assignment,
+)
+from ....iam.infrastructure.repositories.sqlalchemy_effective_user_permission_repository import (
+    SqlAlchemyEffectiveUserPermissionRepository,
+)
+from ....plans.infrastructure.database.models import (
+    BillingCycleEnum,
+    SubscriptionModel,
+    SubscriptionStatusEnum,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class SqlAlchemyBulkTenantProvisioner:
+    """Writes a chunk of tenant onboardings with set-based inserts.
+
+    Creates the same rows as the one-tenant path (organization, owner
+    assignment to the shared owner-role template, owner authorization
+    subject, trial subscription), but with one multi-row INSERT per table
+    for the whole chunk, in a single transaction that also refreshes the
+    owners' effective permissions. If the transaction fails, every tenant
+    of the chunk is reported as failed and nothing is written.
+    """
+
+    def __init__(self, session: Session, trial_days: int = 14):
+        self.session = session
+        self.trial_days = trial_days
+
+    def provision_batch(
+        self, batch: List[Tuple[int, TenantSetupRequest]]
+    ) -> List[TenantProvisioningResult]:
+        results: Dict[int, TenantProvisioningResult] = {}
+        organizations: List[Tuple[int, Organization, str]] = []
+
+        taken_names = self._existing_names(request.tenant_name for _, request in batch)
+        for index, request in batch:
+            try:
+                if request.tenant_name in taken_names:
+                    raise ValueError(
+                        f"Organization name '{request.tenant_name}' is already in use"
+                    )
+                organization = Organization.create(
+                    name=request.tenant_name, owner_id=UUID(request.user_id)
+                )
+            except ValueError as e:
+                results[index] = self._failed(index, request, str(e))
+                continue
+            organizations.append((index, organization, request.plan_id))
+
+        if organizations:
+            try:
+                self._insert_tenants(
+                    [(organization, plan_id) for _, organization, plan_id in organizations]
+                )
+                self.session.commit()
+            except Exception as e:
+                self.session.rollback()
+                logger.exception(f"Bulk provisioning of {len(organizations)} tenants failed")
+                for index, organization, _ in organizations:
+                    results[index] = TenantProvisioningResult(
+                        index=index,
+                        tenant_name=organization.name.value,
+                        success=False,
+                        error_message=str(e),
+                    )
+            else:
+                get_role_set_cache().reload_cache()
+                for index, organization, _ in organizations:
+                    results[index] = TenantProvisioningResult(
+                        index=index,
+                        tenant_name=organization.name.value,
+                        success=True,
+                        tenant_id=str(organization.id),
+                    )
+
+        return [results[index] for index, _ in batch]
+
+    def _insert_tenants(self, tenants: List[Tuple[Organization, str]]) -> None:
+        organizations = [organization for organization, _ in tenants]
+        now = datetime.now(timezone.utc)
+
+        owner_role_id = self._template_role_ids(organizations[0].owner_id, now).get(
+            DefaultOrganizationRoles.OWNER.value
+        )
+        assignment_rows = [
+            {
+                "id": uuid4(),
+                "user_id": organization.owner_id,
+                "organization_id": organization.id,
+                "role_id": owner_role_id,
+                "assigned_by": organization.owner_id,
+                "assigned_at": now,
+                "is_active": True,
+                "created_at": now,
+            }
+            for organization in organizations
+            if owner_role_id
+        ]
+        # RBAC authorizes from these, through the materialized permissions
+        rbac_assignment_rows = [
+            {
+                "id": uuid4(),
+                "user_id": organization.owner_id,
+                "role_id": owner_role_id,
+                "organization_id": organization.id,
+                "assigned_by": organization.owner_id,
+                "assigned_at": now,
+                "is_active": True,
+            }
+            for organization in organizations
+            if owner_role_id
+        ]
+        subject_rows = [
+            {
+                "id": uuid4(),
+                "subject_type": "user",
+                "subject_id": organization.owner_id,
+                "organization_id": organization.id,
+                "owner_id": organization.owner_id,
+                "is_active": True,
+                "created_at": now,
+            }
+            for organization in organizations
+        ]
+
+        trial_ends_at = now + timedelta(days=self.trial_days) if self.trial_days else None
+        subscription_rows = [
+            {
+                "id": uuid4(),
+                "organization_id": organization.id,
+                "plan_id": UUID(plan_id),
+                "status": SubscriptionStatusEnum.ACTIVE,
+                "billing_cycle": BillingCycleEnum.MONTHLY,
+                "starts_at": now,
+                "ends_at": now + timedelta(days=30),
+                "subscription_metadata": {
+                    "feature_overrides": {},
+                    "limit_overrides": {},
+                    "auto_renew": True,
+                    "suspended_at": None,
+                    "trial_ends_at": trial_ends_at.isoformat() if trial_ends_at else None,
+                },
+                "created_by": organization.owner_id,
+                "created_at": now,
+            }
+            for organization, plan_id in tenants
+        ]
+
+        self.session.execute(
+            insert(OrganizationModel),
+            [
+                {
+                    "id": organization.id,
+                    "name": organization.name.value,
+                    "description": organization.description,
+                    "owner_id": organization.owner_id,
+                    "is_active": organization.is_active,
+                    "settings": organization.settings.to_dict(),
+                    "member_count": organization.member_count,
+                    "max_members": organization.max_members,
+                    "created_at": now,
+                }
+                for organization in organizations
+            ],
+        )
+        if assignment_rows:
+            self.session.execute(insert(UserOrganizationRoleModel), assignment_rows)
+            self.session.execute(insert(user_role_assignment), rbac_assignment_rows)
+            SqlAlchemyEffectiveUserPermissionRepository(self.session).refresh_users(
+                [row["user_id"] for row in rbac_assignment_rows]
+            )
+        self.session.execute(insert(AuthorizationSubjectModel), subject_rows)
+        self.session.execute(insert(SubscriptionModel), subscription_rows)
+
+    def _template_role_ids(self, created_by: UUID, now: datetime) -> Dict[str, UUID]:
+        """Resolve the default-role templates, creating the missing ones once."""
+        role_configs = {
+            role_name: DefaultRoleConfigurations.get_role_config(role_name)
+            for role_name in DefaultRoleConfigurations.get_all_default_roles()
+        }
+        template_ids = self._load_template_ids(role_configs.keys())
+
+        missing = [name for name in role_configs if name not in template_ids]
+        if not missing:
+            return template_ids
+
+        permission_ids = self._permission_ids(
+            {name for role_name in missing for name in role_configs[role_name]["permissions"]}
+        )
+        role_rows, role_permission_rows = [], []
+        for role_name in missing:
+            config = role_configs[role_name]
+            role_id = uuid4()
+            role_rows.append(
+                {
+                    "id": role_id,
+                    "name": role_name,
+                    "description": config["description"],
+                    "organization_id": None,
+                    "created_by": created_by,
+                    "is_active": True,
+                    "is_system_role": True,
+                    "created_at": now,
+                }
+            )
+            role_permission_rows.extend(
+                {"role_id": role_id, "permission_id": permission_ids[name]}
+                for name in dict.fromkeys(config["permissions"])
+                if name in permission_ids
+            )
+
+        self.session.execute(insert(RoleModel), role_rows)
+        if role_permission_rows:
+            self.session.execute(insert(role_permission_association), role_permission_rows)
+
+        return self._load_template_ids(role_configs.keys())
+
+    def _load_template_ids(self, names: Iterable[str]) -> Dict[str, UUID]:
+        rows = self.session.execute(
+            select(RoleModel.name, RoleModel.id)
+            .where(
+                and_(
+                    RoleModel.organization_id.is_(None),
+                    RoleModel.is_system_role,
+                    RoleModel.is_active,
+                    RoleModel.name.in_(list(names)),
+                )
+            )
+            .order_by(RoleModel.created_at)
+        )
+        template_ids = {}
+        for name, role_id in rows:
+            template_ids.setdefault(name, role_id)
+        return template_ids
+
+    def _existing_names(self, names: Iterable[str]) -> set:
+        names = list(set(names))
+        if not names:
+            return set()
+        return set(
+            self.session.execute(
+                select(OrganizationModel.name).where(OrganizationModel.name.in_(names))
+            ).scalars()
+        )
+
+    def _permission_ids(self, names: set) -> Dict[str, UUID]:
+        """Resolve permission names to ids, creating the missing ones in one insert."""
+        permission_ids = self._load_permission_ids(names)
+
+        missing_rows = []
+        for name in sorted(names - permission_ids.keys()):
+            resource_type, action = self._parse_permission_name(name)
+            try:
+                action_enum = PermissionActionEnum(action)
+            except ValueError:
+                # Wildcards and document actions are stored as manage; the
+                # permission name keeps the exact action
+                action_enum = PermissionActionEnum.MANAGE
+            missing_rows.append(
+                {
+                    "id": uuid4(),
+                    "name": name,
+                    "description": f"Permission to {action} {resource_type}",
+                    "action": action_enum,
+                    "resource_type": resource_type,
+                    "is_active": True,
+                    "is_system_permission": False,
+                }
+            )
+
+        if missing_rows:
+            if self.session.get_bind().dialect.name == "postgresql":
+                # Another chunk may create the same permission concurrently
+                statement = postgresql.insert(PermissionModel).on_conflict_do_nothing()
+            else:
+                statement = insert(PermissionModel)
+            self.session.execute(statement, missing_rows)
+            permission_ids = self._load_permission_ids(names)
+
+        return permission_ids
+
+    def _load_permission_ids(self, names: set) -> Dict[str, UUID]:
+        if not names:
+            return {}
+        rows = self.session.execute(
+            select(PermissionModel.name, PermissionModel.id).where(
+                PermissionModel.name.in_(names)
+            )
+        )
+        return {name: permission_id for name, permission_id in rows}
+
+    @staticmethod
+    def _parse_permission_name(permission_name: str) -> Tuple[str, str]:
+        if ":" in permission_name:
+            resource_type, action = permission_name.split(":", 1)
+            return resource_type, action
+        return "general", permission_name
+
+    @staticmethod
+    def _failed(
+        index: int, request: TenantSetupRequest, error_message: str
+    ) -> TenantProvisioningResult:
+        return TenantProvisioningResult(
+            index=index,
+            tenant_name=request.tenant_name,
+            success=False,
+            error_message=error_message,
+        )
@@ -12,11 +12,10 @@ from ....iam.application.use_cases import (
 from ....iam.application.dtos import (
     OrganizationCreateDTO,
     UserOrganizationAssignmentDTO,
-    RoleAssignmentDTO,
     AuthorizationSubjectCreateDTO,
+    AuthorizationSubjectSearchDTO,
 )
 from ....iam.domain.services import OrganizationRoleSetupService
-from ....iam.domain.constants import DefaultRoles
 
 
 class IamServiceImpl(IamService):
@@ -36,25 +35,28 @@ class IamServiceImpl(IamService):
         self.authorization_subject_use_case = authorization_subject_use_case
         self.organization_role_setup_service = organization_role_setup_service
 
-    def create_tenant(self, tenant_name: str, domain: str = None) -> str:
-        """Create a new tenant organization."""
-        create_dto = OrganizationCreateDTO(
-            name=tenant_name,
-            domain=domain,
-            settings={"is_active": True, "created_via": "onboarding"},
-        )
-        
-        organization = self.organization_use_case.create_organization(create_dto)
-        
-        # Setup default roles and permissions for the organization
-        self.organization_role_setup_service.setup_default_roles_for_organization(
-            organization.id
+    def create_tenant(self, tenant_name: str, user_id: str, domain: str = None) -> str:
+        """Create a new tenant organization owned by the user."""
+        create_dto = OrganizationCreateDTO(name=tenant_name)
+
+        organization = self.organization_use_case.create_organization(
+            create_dto, owner_id=UUID(user_id)
         )
-        
+
         return str(organization.id)
 
+    def find_tenant(self, tenant_name: str, user_id: str) -> Optional[str]:
+        """Find the tenant organization the user owns by name."""
+        organization = self.organization_use_case.get_organization_by_name(tenant_name)
+        if organization and organization.owner_id == UUID(user_id):
+            return str(organization.id)
+        return None
+
     def assign_user_to_tenant(self, user_id: str, tenant_id: str) -> None:
-        """Assign user to tenant organization."""
+        """Assign user to tenant organization (no-op if already a member)."""
+        if self.membership_use_case.get_user_membership(UUID(user_id), UUID(tenant_id)):
+            return
+
         assignment_dto = UserOrganizationAssignmentDTO(
             user_id=UUID(user_id),
             organization_id=UUID(tenant_id),
@@ -63,30 +65,30 @@ class IamServiceImpl(IamService):
         self.membership_use_case.add_user_to_organization(assignment_dto)
 
     def create_tenant_admin_role(self, tenant_id: str, user_id: str) -> None:
-        """Assign admin/owner role to user in tenant organization."""
-        # Get the organization owner role
-        owner_role = self.role_use_case.get_role_by_name_and_organization(
-            DefaultRoles.ORGANIZATION_OWNER.value, UUID(tenant_id)
-        )
-        
-        if not owner_role:
-            raise ValueError(f"Owner role not found for organization {tenant_id}")
-        
-        # Assign the owner role to the user
-        role_assignment_dto = RoleAssignmentDTO(
-            user_id=UUID(user_id),
-            role_id=owner_role.id,
-            organization_id=UUID(tenant_id),
+        """Set up the tenant roles and make the user its owner (safe to retry)."""
+        # Assigns the owner role unless the user already holds it
+        self.organization_role_setup_service.setup_default_roles_for_organization(
+            UUID(tenant_id), UUID(user_id)
         )
-        
-        self.membership_use_case.assign_role_to_user(role_assignment_dto)
-        
+
         # Create authorization subject for the user in this organization
+        existing_subject = self.authorization_subject_use_case.find_subject_by_reference(
+            AuthorizationSubjectSearchDTO(
+                subject_type="user",
+                subject_id=UUID(user_id),
+                organization_id=UUID(tenant_id),
+            )
+        )
+        if existing_subject:
+            return
+
         auth_subject_dto = AuthorizationSubjectCreateDTO(
-            user_id=UUID(user_id),
-            organization_id=UUID(tenant_id),
             subject_type="user",
-            metadata={"created_via": "onboarding", "role": "owner"},
+            subject_id=UUID(user_id),
+            owner_id=UUID(user_id),
+            organization_id=UUID(tenant_id),
+        )
+
+        self.authorization_subject_use_case.create_subject(
+            auth_subject_dto, requester_id=UUID(user_id)
         )
-        
-        self.authorization_subject_use_case.create_authorization_subject(auth_subject_dto)
\ No newline at end of file
@@ -33,6 +33,9 @@ class PlansServiceImpl(PlansService):
                 UUID(tenant_id)
             )
             if existing_plan:
+                # Already subscribed by an earlier attempt of this onboarding
+                if existing_plan.plan_id == UUID(plan_id):
+                    return str(existing_plan.id)
                 raise ValueError(f"Organization {tenant_id} already has a plan subscription")
             
             # Create organization plan subscription with trial period
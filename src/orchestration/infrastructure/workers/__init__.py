@@ -0,0 +1,5 @@
+from .onboarding_worker_pool import OnboardingWorkerPool
+
+__all__ = [
+    "OnboardingWorkerPool",
+]
@@ -0,0 +1,69 @@
+import logging
+import os
+import socket
+import threading
+from typing import Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class OnboardingWorkerPool:
+    """Pool of threads draining the onboarding queue.
+
+    Each worker repeatedly calls ``process_next(worker_id)``, which claims
+    and runs one workflow and returns whether there was one; idle workers
+    wait ``poll_interval_seconds`` before polling again. ``process_next``
+    opens its own database session, so workers share nothing but the
+    queue table.
+    """
+
+    def __init__(
+        self,
+        process_next: Callable[[str], bool],
+        workers: int = 4,
+        poll_interval_seconds: float = 1.0,
+    ):
+        self._process_next = process_next
+        self._workers = workers
+        self._poll_interval_seconds = poll_interval_seconds
+        self._stop_event = threading.Event()
+        self._threads: List[threading.Thread] = []
+        self._worker_prefix = f"{socket.gethostname()}:{os.getpid()}"
+
+    def start(self) -> None:
+        """Start the worker threads."""
+        self._stop_event.clear()
+        for index in range(self._workers):
+            worker_id = f"{self._worker_prefix}:{index}"
+            thread = threading.Thread(
+                target=self._run, args=(worker_id,), name=f"onboarding-{index}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the workers once their current workflow finishes."""
+        self._stop_event.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def drain(self) -> int:
+        """Process due workflows in the calling thread until none is left."""
+        processed = 0
+        while self._process_once(f"{self._worker_prefix}:drain"):
+            processed += 1
+        return processed
+
+    def _run(self, worker_id: str) -> None:
+        while not self._stop_event.is_set():
+            if not self._process_once(worker_id):
+                self._stop_event.wait(self._poll_interval_seconds)
+
+    def _process_once(self, worker_id: str) -> bool:
+        try:
+            return bool(self._process_next(worker_id))
+        except Exception:
+            # Claiming failed (e.g. database unavailable): back off and retry
+            logger.exception(f"Onboarding worker {worker_id} failed to process the queue")
+            return False
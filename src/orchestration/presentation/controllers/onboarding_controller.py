@@ -9,7 +9,7 @@ from ..dependencies.onboarding_dependencies import get_onboarding_service
 router = APIRouter(prefix="/onboarding", tags=["tenant-onboarding"])
 
 
-@router.post("/tenant", response_model=Dict[str, Any], status_code=status.HTTP_201_CREATED)
+@router.post("/tenant", response_model=Dict[str, Any], status_code=status.HTTP_202_ACCEPTED)
 async def onboard_tenant(
     request: OnboardingRequestDto,
     onboarding_service: OnboardingService = Depends(get_onboarding_service),
@@ -17,7 +17,8 @@ async def onboard_tenant(
     """
     Onboard a new tenant with complete setup.
     
-    This endpoint handles the complete tenant onboarding process:
+    The onboarding is queued and this returns at once; workers then run
+    the steps below and clients poll GET /onboarding/tenant/{workflow_id}:
     1. Creates an organization in IAM
     2. Assigns the user to the organization as owner
     3. Sets up default roles and permissions  
@@ -40,7 +41,7 @@ async def onboard_tenant(
                 "completed_at": response.completed_at.isoformat() if response.completed_at else None,
                 "error_message": response.error_message,
             },
-            "message": "Tenant onboarding completed successfully" if response.status.value == "completed" else "Tenant onboarding in progress",
+            "message": "Tenant onboarding queued",
         }
     
     except ValueError as e:
@@ -4,6 +4,8 @@ from .onboarding_dependencies import (
     get_plans_service,
     get_onboard_tenant_use_case,
     get_onboarding_repository,
+    create_process_onboarding_use_case,
+    create_bulk_onboard_tenants_use_case,
 )
 
 __all__ = [
@@ -12,4 +14,6 @@ __all__ = [
     "get_plans_service",
     "get_onboard_tenant_use_case",
     "get_onboarding_repository",
+    "create_process_onboarding_use_case",
+    "create_bulk_onboard_tenants_use_case",
 ]
\ No newline at end of file
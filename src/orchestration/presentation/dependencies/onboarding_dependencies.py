@@ -3,8 +3,11 @@ from sqlalchemy.orm import Session
 
 from ...application.services.onboarding_service import OnboardingService
 from ...application.use_cases.onboard_tenant import OnboardTenantUseCase
+from ...application.use_cases.process_onboarding import ProcessOnboardingUseCase
+from ...application.use_cases.bulk_onboard_tenants import BulkOnboardTenantsUseCase
 from ...infrastructure.services.iam_service_impl import IamServiceImpl
 from ...infrastructure.services.plans_service_impl import PlansServiceImpl
+from ...infrastructure.services.bulk_tenant_provisioner import SqlAlchemyBulkTenantProvisioner
 from ...infrastructure.repositories.sqlalchemy_onboarding_repository import SqlAlchemyOnboardingRepository
 
 # Import IAM dependencies
@@ -23,17 +26,29 @@ from ....plans.application.use_cases.plan_use_cases import PlanUseCase
 from ....plans.infrastructure.plans_unit_of_work import PlansUnitOfWork
 
 # Import shared dependencies
-from ....shared.infrastructure.database.session import get_session
+from ....shared.infrastructure.config import settings
+from ....shared.infrastructure.database.connection import get_db as get_session
 
 
 def get_iam_unit_of_work(session: Session = Depends(get_session)) -> IAMUnitOfWork:
     """Get IAM unit of work."""
-    return IAMUnitOfWork(session)
+    return IAMUnitOfWork(
+        session,
+        [
+            "user",
+            "organization",
+            "user_organization_role",
+            "role",
+            "permission",
+            "authorization_subject",
+            "effective_user_permission",
+        ],
+    )
 
 
 def get_plans_unit_of_work(session: Session = Depends(get_session)) -> PlansUnitOfWork:
     """Get Plans unit of work."""
-    return PlansUnitOfWork(session)
+    return PlansUnitOfWork(session, ["plan", "subscription", "organization_plan"])
 
 
 def get_organization_use_case(iam_uow: IAMUnitOfWork = Depends(get_iam_unit_of_work)) -> OrganizationUseCase:
@@ -53,7 +68,11 @@ def get_membership_use_case(iam_uow: IAMUnitOfWork = Depends(get_iam_unit_of_wor
 
 def get_role_use_case(iam_uow: IAMUnitOfWork = Depends(get_iam_unit_of_work)) -> RoleUseCase:
     """Get role use case."""
-    return RoleUseCase(iam_uow)
+    return RoleUseCase(
+        iam_uow.get_repository("role"),
+        iam_uow.get_repository("permission"),
+        iam_uow.get_repository("effective_user_permission"),
+    )
 
 
 def get_authorization_subject_use_case(iam_uow: IAMUnitOfWork = Depends(get_iam_unit_of_work)) -> AuthorizationSubjectUseCase:
@@ -107,15 +126,58 @@ def get_onboarding_repository(session: Session = Depends(get_session)) -> SqlAlc
 
 
 def get_onboard_tenant_use_case(
-    iam_service: IamServiceImpl = Depends(get_iam_service),
-    plans_service: PlansServiceImpl = Depends(get_plans_service),
     onboarding_repository: SqlAlchemyOnboardingRepository = Depends(get_onboarding_repository),
 ) -> OnboardTenantUseCase:
-    """Get onboard tenant use case."""
+    """Get onboard tenant use case (only queues the workflow)."""
     return OnboardTenantUseCase(
+        onboarding_repository=onboarding_repository,
+        max_attempts=settings.onboarding_max_attempts,
+    )
+
+
+def create_process_onboarding_use_case(session: Session) -> ProcessOnboardingUseCase:
+    """Build the onboarding step processor for a worker, outside any request."""
+    iam_uow = get_iam_unit_of_work(session)
+    plans_uow = get_plans_unit_of_work(session)
+
+    iam_service = get_iam_service(
+        organization_use_case=get_organization_use_case(iam_uow),
+        user_use_case=get_user_use_case(iam_uow),
+        membership_use_case=get_membership_use_case(iam_uow),
+        role_use_case=get_role_use_case(iam_uow),
+        authorization_subject_use_case=get_authorization_subject_use_case(iam_uow),
+        organization_role_setup_service=get_organization_role_setup_service(iam_uow),
+    )
+    plans_service = get_plans_service(
+        plan_use_case=get_plan_use_case(plans_uow),
+        plans_uow=plans_uow,
+    )
+
+    return ProcessOnboardingUseCase(
         iam_service=iam_service,
         plans_service=plans_service,
-        onboarding_repository=onboarding_repository,
+        onboarding_repository=SqlAlchemyOnboardingRepository(session),
+        retry_backoff_seconds=settings.onboarding_retry_backoff_seconds,
+        lease_seconds=settings.onboarding_lease_seconds,
+    )
+
+
+def create_bulk_onboard_tenants_use_case(session: Session) -> BulkOnboardTenantsUseCase:
+    """Build the bulk onboarding use case on a session owned by the caller.
+
+    Bulk results are streamed after the request dependencies have exited,
+    so the stream opens (and closes) its own session instead of get_session.
+    """
+    plans_uow = get_plans_unit_of_work(session)
+    plans_service = get_plans_service(
+        plan_use_case=get_plan_use_case(plans_uow),
+        plans_uow=plans_uow,
+    )
+
+    return BulkOnboardTenantsUseCase(
+        plans_service=plans_service,
+        provisioner=SqlAlchemyBulkTenantProvisioner(session),
+        batch_size=settings.onboarding_bulk_batch_size,
     )
 
 
@@ -1,15 +1,24 @@
+import json
 from fastapi import APIRouter, Depends, HTTPException, status
-from typing import Dict, Any
+from fastapi.responses import StreamingResponse
+from typing import Dict, Any, Iterator, List
 
 from ...application.services.onboarding_service import OnboardingService
 from ...application.dtos.onboarding_request_dto import OnboardingRequestDto
 from ...application.dtos.onboarding_response_dto import OnboardingResponseDto
-from ..dependencies.onboarding_dependencies import get_onboarding_service
+from ...application.dtos.bulk_onboarding_request_dto import BulkOnboardingRequestDto
+from ...domain.value_objects import TenantSetupRequest
+from ..dependencies.onboarding_dependencies import (
+    get_onboarding_service,
+    create_bulk_onboard_tenants_use_case,
+)
+from ....shared.infrastructure.config import settings
+from ....shared.infrastructure.database.connection import SessionLocal
 
 router = APIRouter(prefix="/onboarding", tags=["tenant-onboarding"])
 
 
-@router.post("/tenant", response_model=Dict[str, Any], status_code=status.HTTP_201_CREATED)
+@router.post("/tenant", response_model=Dict[str, Any], status_code=status.HTTP_202_ACCEPTED)
 async def onboard_tenant(
     request: OnboardingRequestDto,
     onboarding_service: OnboardingService = Depends(get_onboarding_service),
@@ -17,7 +26,8 @@ async def onboard_tenant(
     """
     Onboard a new tenant.
     
-    This endpoint handles the complete tenant onboarding process:
+    The onboarding is queued and this returns at once; workers then run
+    the steps below and clients poll GET /onboarding/tenant/{workflow_id}:
     1. Creates an organization in IAM
     2. Assigns the user to the organization as owner
     3. Sets up default roles and permissions
@@ -28,7 +38,7 @@ async def onboard_tenant(
         request: Onboarding request with user_id, plan_id, tenant_name, and optional domain
         
     Returns:
-        Onboarding response with workflow details and status
+        Queued workflow details (status "pending")
     """
     try:
         response = onboarding_service.onboard_tenant(request)
@@ -46,7 +56,7 @@ async def onboard_tenant(
                 "completed_at": response.completed_at.isoformat() if response.completed_at else None,
                 "error_message": response.error_message,
             },
-            "message": "Tenant onboarding completed successfully" if response.status.value == "completed" else "Tenant onboarding in progress",
+            "message": "Tenant onboarding queued",
         }
     
     except ValueError as e:
@@ -84,15 +94,24 @@ async def get_onboarding_status(
         Current status and details of the onboarding workflow
     """
     try:
-        # This would require adding a get_workflow_status method to OnboardingService
-        # For now, return a simple response
+        response = onboarding_service.get_workflow_status(workflow_id)
+        
         return {
             "success": True,
             "data": {
-                "workflow_id": workflow_id,
-                "status": "completed",  # This should come from the service
-                "message": "Onboarding workflow status retrieved successfully",
-            }
+                "workflow_id": response.id,
+                "tenant_id": response.tenant_id,
+                "user_id": response.user_id,
+                "plan_id": response.plan_id,
+                "status": response.status.value,
+                "completed_steps": response.completed_steps,
+                "attempts": response.attempts,
+                "created_at": response.created_at.isoformat(),
+                "updated_at": response.updated_at.isoformat(),
+                "completed_at": response.completed_at.isoformat() if response.completed_at else None,
+                "error_message": response.error_message,
+            },
+            "message": "Onboarding workflow status retrieved successfully",
         }
     
     except ValueError as e:
@@ -115,7 +134,7 @@ async def get_onboarding_status(
         )
 
 
-@router.post("/tenant/trial", response_model=Dict[str, Any], status_code=status.HTTP_201_CREATED)
+@router.post("/tenant/trial", response_model=Dict[str, Any], status_code=status.HTTP_202_ACCEPTED)
 async def onboard_tenant_with_trial(
     user_id: str,
     tenant_name: str,
@@ -168,7 +187,7 @@ async def onboard_tenant_with_trial(
                 "completed_at": response.completed_at.isoformat() if response.completed_at else None,
                 "error_message": response.error_message,
             },
-            "message": "Tenant trial onboarding completed successfully" if response.status.value == "completed" else "Tenant trial onboarding in progress",
+            "message": "Tenant trial onboarding queued",
         }
     
     except ValueError as e:
@@ -188,4 +207,77 @@ async def onboard_tenant_with_trial(
                 "error": "Internal Server Error",
                 "message": "An unexpected error occurred during trial tenant onboarding",
             }
-        )
\ No newline at end of file
+        )
+
+
+def _stream_bulk_onboarding(requests: List[TenantSetupRequest]) -> Iterator[str]:
+    """Yield one NDJSON line per tenant as each insert batch finishes."""
+    session = SessionLocal()
+    try:
+        use_case = create_bulk_onboard_tenants_use_case(session)
+        for result in use_case.execute(requests):
+            yield json.dumps(result.to_dict()) + "\n"
+    finally:
+        session.close()
+
+
+@router.post("/tenants/bulk")
+async def bulk_onboard_tenants(request: BulkOnboardingRequestDto) -> StreamingResponse:
+    """
+    Onboard a batch of tenants synchronously.
+    
+    Plans are validated once per distinct plan, then tenants are written in
+    batches (organization, default roles and permissions, owner role and
+    trial subscription) with one insert per table per batch. Results are
+    streamed as NDJSON, one line per tenant with its index in the request,
+    as soon as the tenant's batch is committed.
+    
+    Args:
+        request: The tenants to onboard (same fields as POST /onboarding/tenant)
+        
+    Returns:
+        NDJSON stream of {index, tenant_name, success, tenant_id, error_message}
+    """
+    if not request.tenants:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "success": False,
+                "error": "Validation Error",
+                "message": "At least one tenant is required",
+            }
+        )
+    if len(request.tenants) > settings.onboarding_bulk_max_tenants:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "success": False,
+                "error": "Validation Error",
+                "message": f"At most {settings.onboarding_bulk_max_tenants} tenants per request",
+            }
+        )
+
+    setup_requests = []
+    for index, tenant in enumerate(request.tenants):
+        try:
+            setup_requests.append(
+                TenantSetupRequest(
+                    user_id=tenant.user_id,
+                    plan_id=tenant.plan_id,
+                    tenant_name=tenant.tenant_name,
+                    tenant_domain=tenant.tenant_domain,
+                )
+            )
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail={
+                    "success": False,
+                    "error": "Validation Error",
+                    "message": f"Tenant {index}: {e}",
+                }
+            )
+
+    return StreamingResponse(
+        _stream_bulk_onboarding(setup_requests), media_type="application/x-ndjson"
+    )
@@ -15,17 +15,8 @@ from .dtos import (
     SubscriptionUpgradeDTO,
     SubscriptionDowngradeDTO,
     SubscriptionCancellationDTO,
-    # Plan Resource DTOs
-    PlanResourceCreateDTO,
-    PlanResourceUpdateDTO,
-    PlanResourceResponseDTO,
-    PlanResourceListResponseDTO,
-    PlanResourceTestDTO,
-    PlanResourceTestResponseDTO,
-    PlanResourceUsageDTO,
-    PlanResourceUsageResponseDTO,
 )
-from .use_cases import PlanUseCase, SubscriptionUseCase, PlanResourceUseCase
+from .use_cases import PlanUseCase, SubscriptionUseCase
 
 __all__ = [
     # DTOs
@@ -43,16 +34,7 @@ __all__ = [
     "SubscriptionUpgradeDTO",
     "SubscriptionDowngradeDTO",
     "SubscriptionCancellationDTO",
-    "PlanResourceCreateDTO",
-    "PlanResourceUpdateDTO",
-    "PlanResourceResponseDTO",
-    "PlanResourceListResponseDTO",
-    "PlanResourceTestDTO",
-    "PlanResourceTestResponseDTO",
-    "PlanResourceUsageDTO",
-    "PlanResourceUsageResponseDTO",
     # Use Cases
     "PlanUseCase",
     "SubscriptionUseCase",
-    "PlanResourceUseCase",
 ]
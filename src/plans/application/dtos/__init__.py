@@ -16,16 +16,6 @@ from .subscription_dto import (
     SubscriptionDowngradeDTO,
     SubscriptionCancellationDTO,
 )
-from .plan_resource_dto import (
-    PlanResourceCreateDTO,
-    PlanResourceUpdateDTO,
-    PlanResourceResponseDTO,
-    PlanResourceListResponseDTO,
-    PlanResourceTestDTO,
-    PlanResourceTestResponseDTO,
-    PlanResourceUsageDTO,
-    PlanResourceUsageResponseDTO,
-)
 
 __all__ = [
     # Plan DTOs
@@ -44,13 +34,4 @@ __all__ = [
     "SubscriptionUpgradeDTO",
     "SubscriptionDowngradeDTO",
     "SubscriptionCancellationDTO",
-    # Plan Resource DTOs
-    "PlanResourceCreateDTO",
-    "PlanResourceUpdateDTO",
-    "PlanResourceResponseDTO",
-    "PlanResourceListResponseDTO",
-    "PlanResourceTestDTO",
-    "PlanResourceTestResponseDTO",
-    "PlanResourceUsageDTO",
-    "PlanResourceUsageResponseDTO",
 ]
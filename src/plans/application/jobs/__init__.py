@@ -0,0 +1,7 @@
+from .usage_rollover_job import UsageRolloverJob
+from .subscription_lifecycle_job import SubscriptionLifecycleJob
+
+__all__ = [
+    "UsageRolloverJob",
+    "SubscriptionLifecycleJob",
+]
@@ -0,0 +1,159 @@
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Callable, Optional, Dict, Any, List, Tuple
+from uuid import UUID
+
+from shared.domain.entities.job_checkpoint import JobCheckpoint
+from shared.domain.repositories.job_checkpoint_repository import (
+    JobCheckpointRepository,
+)
+from shared.domain.repositories.unit_of_work import UnitOfWork
+from ...domain.entities.subscription import SubscriptionStatus
+from ...domain.repositories.subscription_repository import SubscriptionRepository
+
+logger = logging.getLogger(__name__)
+
+# (phase, counter in the checkpoint details), in processing order. Renewals
+# run first so the expiration phase only sees subscriptions that do not renew.
+PHASES: List[Tuple[str, str]] = [
+    ("renewals", "renewed"),
+    ("expirations", "expired"),
+    ("trial_expirations", "trials_expired"),
+]
+
+
+class SubscriptionLifecycleJob:
+    """Renews and expires due subscriptions in key-ordered chunks.
+
+    A run handles the subscriptions that ended by the start of the current
+    hour (the run key), phase by phase. Each chunk is one set-based UPDATE
+    in its own short transaction that also stores the checkpoint, so an
+    interrupted run resumes after the last committed chunk of its phase.
+    """
+
+    job_name = "subscription_lifecycle"
+
+    def __init__(
+        self,
+        uow_factory: Callable[[], UnitOfWork],
+        chunk_size: int = 500,
+        pause_seconds: float = 0.0,
+        progress_callback: Optional[Callable[[JobCheckpoint], None]] = None,
+    ):
+        self._uow_factory = uow_factory
+        self._chunk_size = chunk_size
+        self._pause_seconds = pause_seconds
+        self._progress_callback = progress_callback
+
+    def run(
+        self, now: Optional[datetime] = None, max_chunks: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Apply the renewals and expirations due by the start of this hour."""
+
+        now = now or datetime.now(timezone.utc)
+        cutoff = now.replace(minute=0, second=0, microsecond=0)
+        run_key = cutoff.isoformat()
+
+        checkpoint = self._load_checkpoint(run_key)
+        chunks = 0
+
+        while not checkpoint.is_completed:
+            if max_chunks is not None and chunks >= max_chunks:
+                break
+
+            checkpoint = self._process_chunk(checkpoint, cutoff)
+            chunks += 1
+            self._report(checkpoint)
+
+            if not checkpoint.is_completed and self._pause_seconds:
+                time.sleep(self._pause_seconds)
+
+        return {
+            "success": True,
+            "operation": "subscription_lifecycle",
+            "cutoff": run_key,
+            "chunks_processed": chunks,
+            "checkpoint": checkpoint.to_dict(),
+        }
+
+    def get_status(self) -> Optional[Dict[str, Any]]:
+        """Get the latest checkpoint of this job."""
+
+        with self._uow_factory() as uow:
+            checkpoint = self._checkpoints(uow).get(self.job_name)
+
+        return checkpoint.to_dict() if checkpoint else None
+
+    def _load_checkpoint(self, run_key: str) -> JobCheckpoint:
+        with self._uow_factory() as uow:
+            checkpoint = self._checkpoints(uow).get(self.job_name)
+
+        if checkpoint and checkpoint.is_for_run(run_key):
+            if not checkpoint.is_completed:
+                logger.info(
+                    f"Resuming {self.job_name} for {run_key} in "
+                    f"{checkpoint.details.get('phase')} after {checkpoint.cursor}"
+                )
+            return checkpoint
+
+        return JobCheckpoint.start(self.job_name, run_key).advance(
+            None, 0, details={"phase": PHASES[0][0]}
+        )
+
+    def _process_chunk(
+        self, checkpoint: JobCheckpoint, cutoff: datetime
+    ) -> JobCheckpoint:
+        phase = checkpoint.details.get("phase", PHASES[0][0])
+        phase_names = [name for name, _ in PHASES]
+        counter = dict(PHASES)[phase]
+
+        with self._uow_factory() as uow:
+            subscription_repository: SubscriptionRepository = uow.get_repository(
+                "subscription"
+            )
+            after_id = UUID(checkpoint.cursor) if checkpoint.cursor else None
+
+            if phase == "renewals":
+                scanned, affected, last_id = subscription_repository.renew_due_chunk(
+                    cutoff, after_id=after_id, chunk_size=self._chunk_size
+                )
+            else:
+                status = (
+                    SubscriptionStatus.TRIAL
+                    if phase == "trial_expirations"
+                    else SubscriptionStatus.ACTIVE
+                )
+                scanned, affected, last_id = subscription_repository.expire_due_chunk(
+                    status, cutoff, after_id=after_id, chunk_size=self._chunk_size
+                )
+
+            if scanned:
+                checkpoint = checkpoint.advance(
+                    str(last_id),
+                    scanned,
+                    affected,
+                    details={counter: checkpoint.details.get(counter, 0) + affected},
+                )
+            elif phase != phase_names[-1]:
+                next_phase = phase_names[phase_names.index(phase) + 1]
+                checkpoint = checkpoint.advance(None, 0, details={"phase": next_phase})
+            else:
+                checkpoint = checkpoint.complete({"phase": None})
+
+            return self._checkpoints(uow).save(checkpoint)
+
+    def _report(self, checkpoint: JobCheckpoint) -> None:
+        counts = " ".join(
+            f"{counter}={checkpoint.details.get(counter, 0)}" for _, counter in PHASES
+        )
+        logger.info(
+            f"{self.job_name} {checkpoint.run_key}: processed={checkpoint.processed} "
+            f"{counts} completed={checkpoint.is_completed}"
+        )
+        if self._progress_callback:
+            self._progress_callback(checkpoint)
+
+    @staticmethod
+    def _checkpoints(uow: UnitOfWork) -> JobCheckpointRepository:
+        return uow.get_repository("job_checkpoint")
@@ -0,0 +1,128 @@
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Callable, Optional, Dict, Any
+from uuid import UUID
+
+from shared.domain.entities.job_checkpoint import JobCheckpoint
+from shared.domain.repositories.job_checkpoint_repository import (
+    JobCheckpointRepository,
+)
+from shared.domain.repositories.unit_of_work import UnitOfWork
+from ...domain.entities.feature_usage import FeatureUsage, UsagePeriod
+from ...domain.repositories.feature_usage_repository import FeatureUsageRepository
+
+logger = logging.getLogger(__name__)
+
+
+class UsageRolloverJob:
+    """Opens new usage periods in key-ordered chunks, outside request handling.
+
+    Each chunk runs in its own short transaction that also stores the job
+    checkpoint, so an interrupted run resumes after the last committed chunk
+    and live usage tracking is never blocked behind one large update.
+    """
+
+    def __init__(
+        self,
+        uow_factory: Callable[[], UnitOfWork],
+        period: UsagePeriod = UsagePeriod.MONTHLY,
+        chunk_size: int = 500,
+        pause_seconds: float = 0.0,
+        progress_callback: Optional[Callable[[JobCheckpoint], None]] = None,
+    ):
+        self._uow_factory = uow_factory
+        self._period = period
+        self._chunk_size = chunk_size
+        self._pause_seconds = pause_seconds
+        self._progress_callback = progress_callback
+
+    @property
+    def job_name(self) -> str:
+        return f"feature_usage_{self._period.value}_rollover"
+
+    def run(
+        self, now: Optional[datetime] = None, max_chunks: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Roll over expired usage records into the period containing now."""
+
+        now = now or datetime.now(timezone.utc)
+        period_start, _ = FeatureUsage._calculate_period_boundaries(now, self._period)
+        run_key = period_start.isoformat()
+
+        checkpoint = self._load_checkpoint(run_key)
+        chunks = 0
+
+        while not checkpoint.is_completed:
+            if max_chunks is not None and chunks >= max_chunks:
+                break
+
+            checkpoint = self._process_chunk(checkpoint, period_start)
+            chunks += 1
+            self._report(checkpoint)
+
+            if not checkpoint.is_completed and self._pause_seconds:
+                time.sleep(self._pause_seconds)
+
+        return {
+            "success": True,
+            "operation": "usage_period_rollover",
+            "period": self._period.value,
+            "chunks_processed": chunks,
+            "checkpoint": checkpoint.to_dict(),
+        }
+
+    def get_status(self) -> Optional[Dict[str, Any]]:
+        """Get the latest checkpoint of this job."""
+
+        with self._uow_factory() as uow:
+            checkpoint = self._checkpoints(uow).get(self.job_name)
+
+        return checkpoint.to_dict() if checkpoint else None
+
+    def _load_checkpoint(self, run_key: str) -> JobCheckpoint:
+        with self._uow_factory() as uow:
+            checkpoint = self._checkpoints(uow).get(self.job_name)
+
+        if checkpoint and checkpoint.is_for_run(run_key):
+            if not checkpoint.is_completed:
+                logger.info(
+                    f"Resuming {self.job_name} for {run_key} after {checkpoint.cursor} "
+                    f"({checkpoint.processed} records processed)"
+                )
+            return checkpoint
+
+        return JobCheckpoint.start(self.job_name, run_key)
+
+    def _process_chunk(
+        self, checkpoint: JobCheckpoint, period_start: datetime
+    ) -> JobCheckpoint:
+        with self._uow_factory() as uow:
+            usage_repository: FeatureUsageRepository = uow.get_repository(
+                "feature_usage"
+            )
+            scanned, inserted, last_id = usage_repository.open_next_period_chunk(
+                self._period,
+                period_start,
+                after_id=UUID(checkpoint.cursor) if checkpoint.cursor else None,
+                chunk_size=self._chunk_size,
+            )
+
+            if scanned:
+                checkpoint = checkpoint.advance(str(last_id), scanned, inserted)
+            else:
+                checkpoint = checkpoint.complete()
+
+            return self._checkpoints(uow).save(checkpoint)
+
+    def _report(self, checkpoint: JobCheckpoint) -> None:
+        logger.info(
+            f"{self.job_name} {checkpoint.run_key}: processed={checkpoint.processed} "
+            f"opened={checkpoint.affected} completed={checkpoint.is_completed}"
+        )
+        if self._progress_callback:
+            self._progress_callback(checkpoint)
+
+    @staticmethod
+    def _checkpoints(uow: UnitOfWork) -> JobCheckpointRepository:
+        return uow.get_repository("job_checkpoint")
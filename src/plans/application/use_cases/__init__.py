@@ -1,19 +1,19 @@
 from .plan_use_cases import PlanUseCase
 from .subscription_use_cases import SubscriptionUseCase
-from .plan_resource_use_cases import PlanResourceUseCase
 from .feature_usage_use_cases import FeatureUsageUseCase
 from .application_instance_use_cases import ApplicationInstanceUseCase
 from .usage_tracking_use_cases import UsageTrackingUseCase
 from .plan_resource_feature_use_cases import PlanResourceFeatureUseCase
 from .plan_resource_limit_use_cases import PlanResourceLimitUseCase
+from .chat_widget_use_cases import ChatWidgetUseCase
 
 __all__ = [
     "PlanUseCase",
     "SubscriptionUseCase", 
-    "PlanResourceUseCase",
     "FeatureUsageUseCase",
     "ApplicationInstanceUseCase",
     "UsageTrackingUseCase",
     "PlanResourceFeatureUseCase",
     "PlanResourceLimitUseCase",
+    "ChatWidgetUseCase",
 ]
@@ -1,10 +1,16 @@
+from datetime import datetime
 from typing import List, Optional, Dict, Any
 from uuid import UUID
 
 from shared.domain.repositories.unit_of_work import UnitOfWork
+from shared.infrastructure.config import settings
+from ...domain.entities.api_key import ApiKeyPrincipal
 from ...domain.entities.application_instance import ApplicationInstance
 from ...domain.entities.organization_plan import OrganizationPlan
+from ...domain.services.api_key_cache import get_api_key_cache
+from ...domain.services.api_key_service import ApiKeyService
 from ...domain.services.application_instance_service import ApplicationInstanceService
+from ...domain.repositories.api_key_repository import ApiKeyRepository
 from ...domain.repositories.organization_plan_repository import OrganizationPlanRepository
 
 
@@ -14,7 +20,19 @@ class ApplicationInstanceUseCase:
     def __init__(self, uow: UnitOfWork):
         self._uow = uow
         self._org_plan_repository: OrganizationPlanRepository = uow.get_repository("organization_plan")
+        self._api_key_repository: ApiKeyRepository = uow.get_repository("api_key")
         self._application_instance_service = ApplicationInstanceService()
+        self._api_key_service: Optional[ApiKeyService] = None
+
+    def _get_api_key_service(self) -> ApiKeyService:
+        """Get the API key service, built on first use.
+
+        Raises ApiKeySecretMissingError when API_KEY_SECRET is not set, so only
+        the operations issuing or verifying keys fail.
+        """
+        if self._api_key_service is None:
+            self._api_key_service = ApiKeyService(settings.api_key_secret)
+        return self._api_key_service
 
     def provision_instance(
         self,
@@ -107,30 +125,42 @@ class ApplicationInstanceUseCase:
         }
 
     def generate_api_keys(
-        self, instance_id: UUID, key_types: List[str]
+        self,
+        instance_id: UUID,
+        key_types: List[str],
+        created_by: Optional[UUID] = None,
+        expires_at: Optional[datetime] = None,
     ) -> Dict[str, Any]:
-        """Generate API keys for an instance."""
-        
-        # This would typically load the actual instance
-        # For now, simulate the process
-        
-        temp_instance = ApplicationInstance.create(
-            plan_resource_id=UUID("00000000-0000-0000-0000-000000000000"),
-            organization_id=UUID("00000000-0000-0000-0000-000000000000"),
-            instance_name="Temp Instance",
-            owner_id=UUID("00000000-0000-0000-0000-000000000000"),
-        )
+        """Generate API keys for an instance.
+
+        The plaintext keys are only returned here; just their prefix and
+        digest are stored.
+        """
+        api_key_service = self._get_api_key_service()
         
         try:
-            updated_instance = self._application_instance_service.generate_api_keys(
-                temp_instance, key_types
-            )
+            api_keys = {}
+            with self._uow:
+                for key_type in key_types:
+                    raw_key, api_key = api_key_service.generate_api_key(
+                        application_instance_id=instance_id,
+                        key_type=key_type,
+                        created_by=created_by,
+                        expires_at=expires_at,
+                    )
+                    self._api_key_repository.save(api_key)
+                    api_keys[key_type] = {
+                        "key_id": str(api_key.id),
+                        "key_prefix": api_key.key_prefix,
+                        "api_key": raw_key,
+                        "expires_at": api_key.expires_at.isoformat() if api_key.expires_at else None,
+                    }
             
             return {
                 "success": True,
                 "instance_id": str(instance_id),
                 "generated_keys": key_types,
-                "api_key_names": updated_instance.get_api_key_names(),
+                "api_keys": api_keys,
                 "message": f"Generated {len(key_types)} API keys successfully",
             }
             
@@ -141,6 +171,81 @@ class ApplicationInstanceUseCase:
                 "message": f"Failed to generate API keys: {str(e)}",
             }
 
+    def list_api_keys(
+        self, instance_id: UUID, active_only: bool = True
+    ) -> Dict[str, Any]:
+        """List the API keys of an instance (without their secrets)."""
+        
+        api_keys = self._api_key_repository.find_by_instance(instance_id, active_only)
+        
+        return {
+            "instance_id": str(instance_id),
+            "api_keys": [
+                {
+                    "key_id": str(api_key.id),
+                    "key_type": api_key.key_type,
+                    "key_prefix": api_key.key_prefix,
+                    "is_active": api_key.is_active,
+                    "expires_at": api_key.expires_at.isoformat() if api_key.expires_at else None,
+                    "revoked_at": api_key.revoked_at.isoformat() if api_key.revoked_at else None,
+                    "created_at": api_key.created_at.isoformat(),
+                }
+                for api_key in api_keys
+            ],
+            "total": len(api_keys),
+        }
+
+    def get_instance_organization_id(self, instance_id: UUID) -> Optional[UUID]:
+        """Get the organization owning an instance, None if the instance does not exist."""
+        return self._api_key_repository.get_instance_organization_id(instance_id)
+
+    def get_api_key_instance_id(self, key_id: UUID) -> Optional[UUID]:
+        """Get the instance an API key belongs to, None if the key does not exist."""
+        api_key = self._api_key_repository.get_by_id(key_id)
+        return api_key.application_instance_id if api_key else None
+
+    def revoke_api_key(self, key_id: UUID) -> Dict[str, Any]:
+        """Revoke an API key."""
+        
+        with self._uow:
+            api_key = self._api_key_repository.get_by_id(key_id)
+            if not api_key:
+                raise ValueError("API key not found")
+            
+            revoked_key = self._api_key_repository.save(api_key.revoke())
+        
+        get_api_key_cache().revoke(revoked_key.key_prefix)
+        
+        return {
+            "success": True,
+            "key_id": str(key_id),
+            "key_prefix": revoked_key.key_prefix,
+            "message": "API key revoked successfully",
+        }
+
+    def revoke_instance_api_keys(self, instance_id: UUID) -> Dict[str, Any]:
+        """Revoke every active API key of an instance."""
+        
+        with self._uow:
+            revoked_prefixes = self._api_key_repository.revoke_instance_keys(instance_id)
+        
+        cache = get_api_key_cache()
+        for key_prefix in revoked_prefixes:
+            cache.revoke(key_prefix)
+        
+        return {
+            "success": True,
+            "instance_id": str(instance_id),
+            "revoked_keys": len(revoked_prefixes),
+            "message": f"Revoked {len(revoked_prefixes)} API keys successfully",
+        }
+
+    def authenticate_api_key(self, raw_key: str) -> Optional[ApiKeyPrincipal]:
+        """Resolve a presented API key to its principal, None if it does not authenticate."""
+        return self._get_api_key_service().authenticate(
+            raw_key, self._api_key_repository, get_api_key_cache()
+        )
+
     def analyze_instance_health(
         self, instance_id: UUID, usage_metrics: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
@@ -234,6 +339,7 @@ class ApplicationInstanceUseCase:
         
         try:
             # This would typically load and update the actual instance
+            get_api_key_cache().invalidate_instance(instance_id)
             return {
                 "success": True,
                 "instance_id": str(instance_id),
@@ -255,6 +361,7 @@ class ApplicationInstanceUseCase:
         
         try:
             # This would typically load and update the actual instance
+            get_api_key_cache().invalidate_instance(instance_id)
             return {
                 "success": True,
                 "instance_id": str(instance_id),
@@ -319,6 +426,7 @@ class ApplicationInstanceUseCase:
         
         try:
             # This would typically load and update the actual instance
+            get_api_key_cache().invalidate_instance(instance_id)
             return {
                 "success": True,
                 "instance_id": str(instance_id),
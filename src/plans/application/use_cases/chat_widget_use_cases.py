@@ -0,0 +1,27 @@
+from typing import Optional
+from uuid import UUID
+
+from shared.domain.repositories.unit_of_work import UnitOfWork
+from shared.infrastructure.config import settings
+from ...domain.repositories.organization_plan_repository import OrganizationPlanRepository
+from ...domain.repositories.plan_repository import PlanRepository
+from ...domain.services.feature_access_service import FeatureAccessService
+from ...domain.value_objects.chat_widget_render import ChatWidgetRender
+
+
+class ChatWidgetUseCase:
+    """Use case for the public chat widget bootstrap."""
+
+    def __init__(self, uow: UnitOfWork):
+        self._uow = uow
+        self._org_plan_repository: OrganizationPlanRepository = uow.get_repository("organization_plan")
+        self._plan_repository: PlanRepository = uow.get_repository("plan")
+        self._feature_access_service = FeatureAccessService(
+            self._org_plan_repository, self._plan_repository
+        )
+
+    def get_widget(self, organization_id: UUID) -> Optional[ChatWidgetRender]:
+        """Get the organization's rendered widget, or None if the iframe chat is off."""
+        return self._feature_access_service.get_chat_widget(
+            organization_id, settings.chat_widget_url
+        )
@@ -1,4 +1,4 @@
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import List, Optional, Dict, Any
 from uuid import UUID
 
@@ -7,7 +7,9 @@ from ...domain.entities.feature_usage import FeatureUsage, UsagePeriod
 from ...domain.repositories.feature_usage_repository import FeatureUsageRepository
 from ...domain.repositories.organization_plan_repository import OrganizationPlanRepository
 from ...domain.repositories.plan_repository import PlanRepository
+from ...domain.repositories.usage_event_repository import UsageEventRepository
 from ...domain.services.usage_tracking_service import UsageTrackingService
+from ...domain.services.usage_budget_cache import get_usage_budget_cache
 
 
 class FeatureUsageUseCase:
@@ -18,10 +20,14 @@ class FeatureUsageUseCase:
         self._feature_usage_repository: FeatureUsageRepository = uow.get_repository("feature_usage")
         self._org_plan_repository: OrganizationPlanRepository = uow.get_repository("organization_plan")
         self._plan_repository: PlanRepository = uow.get_repository("plan")
+        self._usage_event_repository: UsageEventRepository = uow.get_repository("usage_event")
+        self._budget_cache = get_usage_budget_cache()
         self._usage_tracking_service = UsageTrackingService(
             self._feature_usage_repository,
             self._org_plan_repository,
             self._plan_repository,
+            self._usage_event_repository,
+            self._budget_cache,
         )
 
     def track_feature_usage(
@@ -121,6 +127,33 @@ class FeatureUsageUseCase:
             organization_id, feature_name, periods
         )
 
+    def get_usage_buckets(
+        self,
+        organization_id: UUID,
+        feature_name: str,
+        granularity: UsagePeriod = UsagePeriod.DAILY,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> Dict[str, Any]:
+        """Get pre-aggregated usage buckets for a feature."""
+        
+        end = end or datetime.now(timezone.utc)
+        start = start or end - timedelta(days=30)
+        
+        buckets = self._usage_tracking_service.get_usage_buckets(
+            organization_id, feature_name, granularity, start, end
+        )
+        
+        return {
+            "organization_id": str(organization_id),
+            "feature_name": feature_name,
+            "granularity": granularity.value,
+            "start": start.isoformat(),
+            "end": end.isoformat(),
+            "total_usage": sum(bucket.total_usage for bucket in buckets),
+            "buckets": [bucket.to_trend_point() for bucket in buckets],
+        }
+
     def get_feature_usage_history(
         self,
         organization_id: UUID,
@@ -164,6 +197,7 @@ class FeatureUsageUseCase:
                 success = self._feature_usage_repository.reset_usage_for_period(
                     organization_id, feature_name, period
                 )
+                self._budget_cache.invalidate(organization_id, feature_name)
                 
                 return {
                     "success": success,
@@ -213,6 +247,7 @@ class FeatureUsageUseCase:
                 )
                 
                 saved_usage = self._feature_usage_repository.save(usage)
+                self._budget_cache.invalidate(organization_id, feature_name)
                 
                 return {
                     "success": True,
@@ -252,6 +287,7 @@ class FeatureUsageUseCase:
             with self._uow:
                 updated_usage = current_usage.update_limit(new_limit)
                 saved_usage = self._feature_usage_repository.save(updated_usage)
+                self._budget_cache.invalidate(organization_id, feature_name)
                 
                 return {
                     "success": True,
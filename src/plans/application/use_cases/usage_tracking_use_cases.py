@@ -7,7 +7,9 @@ from ...domain.entities.feature_usage import UsagePeriod
 from ...domain.repositories.feature_usage_repository import FeatureUsageRepository
 from ...domain.repositories.organization_plan_repository import OrganizationPlanRepository
 from ...domain.repositories.plan_repository import PlanRepository
+from ...domain.repositories.usage_event_repository import UsageEventRepository
 from ...domain.services.usage_tracking_service import UsageTrackingService
+from ...domain.services.usage_budget_cache import get_usage_budget_cache
 
 
 class UsageTrackingUseCase:
@@ -18,10 +20,13 @@ class UsageTrackingUseCase:
         self._feature_usage_repository: FeatureUsageRepository = uow.get_repository("feature_usage")
         self._org_plan_repository: OrganizationPlanRepository = uow.get_repository("organization_plan")
         self._plan_repository: PlanRepository = uow.get_repository("plan")
+        self._usage_event_repository: UsageEventRepository = uow.get_repository("usage_event")
         self._usage_tracking_service = UsageTrackingService(
             self._feature_usage_repository,
             self._org_plan_repository,
             self._plan_repository,
+            self._usage_event_repository,
+            get_usage_budget_cache(),
         )
 
     def get_organization_analytics_dashboard(self, organization_id: UUID) -> Dict[str, Any]:
@@ -226,29 +231,6 @@ class UsageTrackingUseCase:
             "generated_at": datetime.utcnow().isoformat(),
         }
 
-    def reset_monthly_usage_bulk(self) -> Dict[str, Any]:
-        """Reset monthly usage for all organizations (scheduled operation)."""
-        
-        try:
-            with self._uow:
-                reset_count = self._feature_usage_repository.bulk_reset_monthly_usage()
-                
-                return {
-                    "success": True,
-                    "reset_records": reset_count,
-                    "operation": "bulk_monthly_reset",
-                    "executed_at": datetime.utcnow().isoformat(),
-                    "message": f"Successfully reset {reset_count} monthly usage records",
-                }
-                
-        except Exception as e:
-            return {
-                "success": False,
-                "operation": "bulk_monthly_reset",
-                "error": str(e),
-                "executed_at": datetime.utcnow().isoformat(),
-            }
-
     def get_limit_utilization_analysis(
         self, organization_id: UUID
     ) -> Dict[str, Any]:
@@ -1,10 +1,7 @@
 from .entities import (
     Plan,
     PlanType,
-    PlanFeature,
     PlanResource,
-    PlanResourceType,
-    PlanConfiguration,
     OrganizationPlan,
     FeatureUsage,
 )
@@ -16,11 +13,8 @@ from .value_objects import (
 )
 from .repositories import (
     PlanRepository,
-    PlanResourceRepository,
-    PlanConfigurationRepository,
     OrganizationPlanRepository,
     FeatureUsageRepository,
-    PlanFeatureRepository,
 )
 from .services import (
     PlanManagementService,
@@ -34,10 +28,7 @@ __all__ = [
     # Entities
     "Plan",
     "PlanType",
-    "PlanFeature",
     "PlanResource",
-    "PlanResourceType",
-    "PlanConfiguration",
     "OrganizationPlan",
     "FeatureUsage",
     # Value Objects
@@ -47,11 +38,8 @@ __all__ = [
     "ChatIframeConfiguration",
     # Repositories
     "PlanRepository",
-    "PlanResourceRepository",
-    "PlanConfigurationRepository",
     "OrganizationPlanRepository",
     "FeatureUsageRepository",
-    "PlanFeatureRepository",
     # Services
     "PlanManagementService",
     "SubscriptionService",
@@ -1,17 +1,21 @@
 from .plan import Plan, PlanType
 from .organization_plan import OrganizationPlan
-from .feature_usage import FeatureUsage
+from .feature_usage import FeatureUsage, UsagePeriod
+from .usage_bucket import UsageBucket
 from .subscription import Subscription, SubscriptionStatus, BillingCycle
 from .plan_resource import PlanResource, ResourceCategory
 from .plan_resource_feature import PlanResourceFeature
 from .plan_resource_limit import PlanResourceLimit, LimitType, LimitUnit
 from .application_instance import ApplicationInstance
+from .api_key import ApiKey, ApiKeyPrincipal
 
 __all__ = [
     "Plan",
     "PlanType",
     "OrganizationPlan",
     "FeatureUsage",
+    "UsagePeriod",
+    "UsageBucket",
     "Subscription",
     "SubscriptionStatus", 
     "BillingCycle",
@@ -22,4 +26,6 @@ __all__ = [
     "LimitType",
     "LimitUnit",
     "ApplicationInstance",
+    "ApiKey",
+    "ApiKeyPrincipal",
 ]
@@ -0,0 +1,96 @@
+from datetime import datetime, timezone
+from uuid import UUID, uuid4
+from typing import Optional, Dict
+from pydantic import BaseModel, Field
+
+
+def _is_past(moment: datetime) -> bool:
+    """Compare with the current time, whether the moment is naive UTC or aware."""
+    now = datetime.now(timezone.utc) if moment.tzinfo else datetime.utcnow()
+    return now >= moment
+
+
+class ApiKey(BaseModel):
+    """API key of an application instance.
+
+    Only the public prefix (used to look the key up) and a keyed digest of
+    the full key are stored; the key itself is shown once, at creation.
+    """
+
+    id: UUID
+    application_instance_id: UUID
+    key_type: str = Field(..., min_length=1, max_length=50)
+    key_prefix: str = Field(..., min_length=1, max_length=32)
+    key_digest: str = Field(..., min_length=1, max_length=64)
+    is_active: bool = True
+    expires_at: Optional[datetime] = None
+    revoked_at: Optional[datetime] = None
+    created_by: Optional[UUID] = None
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+    model_config = {"frozen": True}
+
+    @classmethod
+    def create(
+        cls,
+        application_instance_id: UUID,
+        key_type: str,
+        key_prefix: str,
+        key_digest: str,
+        created_by: Optional[UUID] = None,
+        expires_at: Optional[datetime] = None,
+    ) -> "ApiKey":
+        """Create a new API key."""
+        return cls(
+            id=uuid4(),
+            application_instance_id=application_instance_id,
+            key_type=key_type,
+            key_prefix=key_prefix,
+            key_digest=key_digest,
+            is_active=True,
+            expires_at=expires_at,
+            created_by=created_by,
+            created_at=datetime.utcnow(),
+        )
+
+    def revoke(self) -> "ApiKey":
+        """Revoke the API key."""
+        now = datetime.utcnow()
+        return self.model_copy(
+            update={"is_active": False, "revoked_at": now, "updated_at": now}
+        )
+
+    def is_expired(self) -> bool:
+        """Check if the API key is expired."""
+        return self.expires_at is not None and _is_past(self.expires_at)
+
+    def is_valid(self) -> bool:
+        """Check if the API key can authenticate."""
+        return self.is_active and not self.is_expired()
+
+
+class ApiKeyPrincipal(BaseModel):
+    """What an API key authenticates as: its instance, organization and limits."""
+
+    key_id: UUID
+    key_type: str
+    key_prefix: str
+    key_digest: str
+    application_instance_id: UUID
+    organization_id: UUID
+    is_active: bool
+    expires_at: Optional[datetime] = None
+    effective_limits: Dict[str, int] = Field(default_factory=dict)
+
+    model_config = {"frozen": True}
+
+    def is_valid(self) -> bool:
+        """Check if the key and its instance can authenticate."""
+        return self.is_active and (
+            self.expires_at is None or not _is_past(self.expires_at)
+        )
+
+    def get_limit(self, limit_key: str, default: Optional[int] = None) -> Optional[int]:
+        """Get an effective limit of the instance (-1 for unlimited)."""
+        return self.effective_limits.get(limit_key, default)
@@ -6,6 +6,7 @@ from enum import Enum
 
 
 class UsagePeriod(str, Enum):
+    HOURLY = "hourly"
     DAILY = "daily"
     WEEKLY = "weekly"
     MONTHLY = "monthly"
@@ -58,7 +59,11 @@ class FeatureUsage(BaseModel):
         date: datetime, period: UsagePeriod
     ) -> tuple[datetime, datetime]:
         """Calculate period start and end dates."""
-        if period == UsagePeriod.DAILY:
+        if period == UsagePeriod.HOURLY:
+            start = date.replace(minute=0, second=0, microsecond=0)
+            end = start + timedelta(hours=1) - timedelta(microseconds=1)
+
+        elif period == UsagePeriod.DAILY:
             start = date.replace(hour=0, minute=0, second=0, microsecond=0)
             end = start + timedelta(days=1) - timedelta(microseconds=1)
 
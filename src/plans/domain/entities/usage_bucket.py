@@ -0,0 +1,53 @@
+from datetime import datetime
+from uuid import UUID
+from typing import Dict, Any
+from pydantic import BaseModel
+
+from .feature_usage import FeatureUsage, UsagePeriod
+
+
+class UsageBucket(BaseModel):
+    """Pre-aggregated usage total for one organization/feature time bucket."""
+
+    organization_id: UUID
+    feature_name: str
+    granularity: UsagePeriod
+    bucket_start: datetime
+    bucket_end: datetime
+    total_usage: int
+    event_count: int
+
+    model_config = {"frozen": True}
+
+    @classmethod
+    def for_moment(
+        cls,
+        organization_id: UUID,
+        feature_name: str,
+        granularity: UsagePeriod,
+        moment: datetime,
+        total_usage: int = 0,
+        event_count: int = 0,
+    ) -> "UsageBucket":
+        bucket_start, bucket_end = FeatureUsage._calculate_period_boundaries(
+            moment, granularity
+        )
+
+        return cls(
+            organization_id=organization_id,
+            feature_name=feature_name,
+            granularity=granularity,
+            bucket_start=bucket_start,
+            bucket_end=bucket_end,
+            total_usage=total_usage,
+            event_count=event_count,
+        )
+
+    def to_trend_point(self) -> Dict[str, Any]:
+        """Serialize bucket in the shape used by usage trend responses."""
+        return {
+            "period_start": self.bucket_start.isoformat(),
+            "period_end": self.bucket_end.isoformat(),
+            "usage": self.total_usage,
+            "event_count": self.event_count,
+        }
@@ -2,10 +2,14 @@ from .plan_repository import PlanRepository
 from .organization_plan_repository import OrganizationPlanRepository
 from .feature_usage_repository import FeatureUsageRepository
 from .subscription_repository import SubscriptionRepository
+from .usage_event_repository import UsageEventRepository
+from .api_key_repository import ApiKeyRepository
 
 __all__ = [
     "PlanRepository",
     "OrganizationPlanRepository",
     "FeatureUsageRepository",
     "SubscriptionRepository",
+    "UsageEventRepository",
+    "ApiKeyRepository",
 ]
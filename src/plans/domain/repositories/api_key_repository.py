@@ -0,0 +1,48 @@
+from abc import ABC, abstractmethod
+from typing import Optional, List
+from uuid import UUID
+
+from ..entities.api_key import ApiKey, ApiKeyPrincipal
+
+
+class ApiKeyRepository(ABC):
+    """Repository interface for application instance API keys."""
+
+    @abstractmethod
+    def save(self, api_key: ApiKey) -> ApiKey:
+        """Save an API key."""
+        pass
+
+    @abstractmethod
+    def get_by_id(self, key_id: UUID) -> Optional[ApiKey]:
+        """Get an API key by ID."""
+        pass
+
+    @abstractmethod
+    def find_by_instance(
+        self, application_instance_id: UUID, active_only: bool = True
+    ) -> List[ApiKey]:
+        """Find the API keys of an application instance."""
+        pass
+
+    @abstractmethod
+    def get_instance_organization_id(
+        self, application_instance_id: UUID
+    ) -> Optional[UUID]:
+        """Get the organization owning an application instance, None if unknown."""
+        pass
+
+    @abstractmethod
+    def resolve_principal(self, key_prefix: str) -> Optional[ApiKeyPrincipal]:
+        """Resolve a key prefix to its instance, organization and effective limits.
+
+        A single statement over the indexed prefix. The principal is returned
+        even for revoked keys and inactive instances; callers verify the
+        digest and validity.
+        """
+        pass
+
+    @abstractmethod
+    def revoke_instance_keys(self, application_instance_id: UUID) -> List[str]:
+        """Revoke every active key of an instance, returning their prefixes."""
+        pass
@@ -60,8 +60,9 @@ class FeatureUsageRepository(ABC):
         feature_name: str,
         amount: int = 1,
         metadata: Optional[Dict[str, Any]] = None,
+        period: UsagePeriod = UsagePeriod.MONTHLY,
     ) -> FeatureUsage:
-        """Increment usage for organization and feature."""
+        """Increment the current period's usage for organization and feature."""
         pass
 
     @abstractmethod
@@ -96,6 +97,18 @@ class FeatureUsageRepository(ABC):
         pass
 
     @abstractmethod
-    def bulk_reset_monthly_usage(self) -> int:
-        """Reset monthly usage for all organizations at month end."""
+    def open_next_period_chunk(
+        self,
+        period: UsagePeriod,
+        period_start: datetime,
+        after_id: Optional[UUID] = None,
+        chunk_size: int = 500,
+    ) -> tuple[int, int, Optional[UUID]]:
+        """Open the period starting at period_start for a chunk of records.
+
+        Scans records of the preceding period in id order after ``after_id``
+        and inserts a zeroed record for the new period where one does not
+        exist yet. Old records are kept as history, so re-running a chunk is
+        harmless. Returns (scanned, inserted, last scanned id).
+        """
         pass
@@ -3,7 +3,7 @@ from datetime import datetime
 from typing import List, Optional, Tuple
 from uuid import UUID
 
-from ..entities.subscription import Subscription
+from ..entities.subscription import Subscription, SubscriptionStatus
 
 
 class SubscriptionRepository(ABC):
@@ -149,3 +149,34 @@ class SubscriptionRepository(ABC):
             Dictionary with revenue metrics for the period
         """
         pass
+
+    @abstractmethod
+    def renew_due_chunk(
+        self,
+        cutoff: datetime,
+        after_id: Optional[UUID] = None,
+        chunk_size: int = 500,
+    ) -> Tuple[int, int, Optional[UUID]]:
+        """Renew a chunk of active auto-renewing subscriptions ended by cutoff.
+
+        Scans due subscriptions in id order after ``after_id`` and moves
+        ``ends_at`` one billing cycle ahead, with ``next_billing_date`` set to
+        the new end, in a single UPDATE. Returns (scanned, renewed, last
+        scanned id).
+        """
+        pass
+
+    @abstractmethod
+    def expire_due_chunk(
+        self,
+        status: SubscriptionStatus,
+        cutoff: datetime,
+        after_id: Optional[UUID] = None,
+        chunk_size: int = 500,
+    ) -> Tuple[int, int, Optional[UUID]]:
+        """Expire a chunk of subscriptions in status that ended by cutoff.
+
+        Active subscriptions that renew automatically are left to
+        ``renew_due_chunk``. Returns (scanned, expired, last scanned id).
+        """
+        pass
@@ -0,0 +1,54 @@
+from abc import ABC, abstractmethod
+from typing import Optional, List
+from uuid import UUID
+from datetime import datetime
+
+from ..entities.feature_usage import UsagePeriod
+from ..entities.usage_bucket import UsageBucket
+
+
+class UsageEventRepository(ABC):
+    """Append-only usage event log with hourly and daily rollups."""
+
+    @abstractmethod
+    def record_event(
+        self,
+        organization_id: UUID,
+        feature_name: str,
+        amount: int = 1,
+        occurred_at: Optional[datetime] = None,
+    ) -> None:
+        """Append a usage event and add it to its hourly and daily buckets."""
+        pass
+
+    @abstractmethod
+    def get_buckets(
+        self,
+        organization_id: UUID,
+        feature_name: str,
+        granularity: UsagePeriod,
+        start: datetime,
+        end: datetime,
+    ) -> List[UsageBucket]:
+        """Get usage buckets within [start, end), newest first.
+
+        Hourly and daily buckets are read directly from their rollup tables;
+        weekly, monthly and yearly buckets are aggregated from daily rollups.
+        """
+        pass
+
+    @abstractmethod
+    def get_total_usage(
+        self,
+        organization_id: UUID,
+        feature_name: str,
+        start: datetime,
+        end: datetime,
+    ) -> int:
+        """Get total usage within [start, end) from daily rollups."""
+        pass
+
+    @abstractmethod
+    def delete_events_before(self, cutoff: datetime) -> int:
+        """Delete raw events older than cutoff. Rollups are kept."""
+        pass
@@ -1,5 +1,20 @@
 from .subscription_service import SubscriptionService
 from .usage_tracking_service import UsageTrackingService
+from .usage_budget_cache import (
+    UsageBudgetCache,
+    get_usage_budget_cache,
+    set_usage_budget_cache,
+)
+from .feature_configuration_cache import (
+    FeatureConfigurationCache,
+    get_feature_configuration_cache,
+    set_feature_configuration_cache,
+)
+from .chat_widget_render_cache import (
+    ChatWidgetRenderCache,
+    get_chat_widget_render_cache,
+    set_chat_widget_render_cache,
+)
 from .feature_access_service import FeatureAccessService
 from .plan_authorization_service import PlanAuthorizationService
 from .plan_management_service import PlanManagementService
@@ -7,10 +22,27 @@ from .plan_resource_service import PlanResourceService
 from .plan_resource_feature_service import PlanResourceFeatureService
 from .plan_resource_limit_service import PlanResourceLimitService
 from .application_instance_service import ApplicationInstanceService
+from .api_key_cache import ApiKeyCache, get_api_key_cache, set_api_key_cache
+from .api_key_service import ApiKeySecretMissingError, ApiKeyService
+from .plan_catalog_cache import (
+    PlanCatalog,
+    PlanCatalogCache,
+    get_plan_catalog_cache,
+    set_plan_catalog_cache,
+)
 
 __all__ = [
     "SubscriptionService",
     "UsageTrackingService",
+    "UsageBudgetCache",
+    "get_usage_budget_cache",
+    "set_usage_budget_cache",
+    "FeatureConfigurationCache",
+    "get_feature_configuration_cache",
+    "set_feature_configuration_cache",
+    "ChatWidgetRenderCache",
+    "get_chat_widget_render_cache",
+    "set_chat_widget_render_cache",
     "FeatureAccessService",
     "PlanAuthorizationService",
     "PlanManagementService",
@@ -18,4 +50,13 @@ __all__ = [
     "PlanResourceFeatureService",
     "PlanResourceLimitService",
     "ApplicationInstanceService",
+    "ApiKeyCache",
+    "get_api_key_cache",
+    "set_api_key_cache",
+    "ApiKeySecretMissingError",
+    "ApiKeyService",
+    "PlanCatalog",
+    "PlanCatalogCache",
+    "get_plan_catalog_cache",
+    "set_plan_catalog_cache",
 ]
@@ -0,0 +1,128 @@
+import threading
+import time
+from typing import Callable, Dict, Any, Optional, Tuple
+from uuid import UUID
+
+from ..entities.api_key import ApiKeyPrincipal
+
+
+class ApiKeyCache:
+    """Per-process cache of API key principals, keyed by key prefix.
+
+    Known prefixes are cached with their principal (digest included, so the
+    full key is still verified on every request) and unknown prefixes are
+    cached as negative entries, so repeated bad keys do not reach the
+    database either. Revocations made in this process drop the entry right
+    away; the TTLs bound how long revocations made by other processes go
+    unnoticed.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 60.0,
+        negative_ttl_seconds: float = 10.0,
+        max_entries: int = 10000,
+    ):
+        self._ttl_seconds = ttl_seconds
+        self._negative_ttl_seconds = negative_ttl_seconds
+        self._max_entries = max_entries
+        self._entries: Dict[str, Tuple[Optional[ApiKeyPrincipal], float]] = {}
+        self._lock = threading.Lock()
+        self._enabled = True
+        self._hits = 0
+        self._negative_hits = 0
+        self._misses = 0
+
+    def resolve(
+        self,
+        key_prefix: str,
+        loader: Callable[[str], Optional[ApiKeyPrincipal]],
+    ) -> Optional[ApiKeyPrincipal]:
+        """Get the principal of a key prefix, loading it on a miss."""
+        if not self._enabled:
+            return loader(key_prefix)
+
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key_prefix)
+            if entry is not None and now < entry[1]:
+                if entry[0] is None:
+                    self._negative_hits += 1
+                else:
+                    self._hits += 1
+                return entry[0]
+            self._misses += 1
+
+        principal = loader(key_prefix)
+        ttl = self._ttl_seconds if principal is not None else self._negative_ttl_seconds
+
+        with self._lock:
+            self._entries.pop(key_prefix, None)
+            if len(self._entries) >= self._max_entries:
+                # Entries are kept in insertion order: drop the oldest
+                del self._entries[next(iter(self._entries))]
+            self._entries[key_prefix] = (principal, now + ttl)
+
+        return principal
+
+    def revoke(self, key_prefix: str) -> None:
+        """Drop a revoked key so the next request re-reads it."""
+        with self._lock:
+            self._entries.pop(key_prefix, None)
+
+    def invalidate_instance(self, application_instance_id: UUID) -> None:
+        """Drop the keys of an application instance (deactivation, limit changes)."""
+        with self._lock:
+            for key_prefix in [
+                key_prefix
+                for key_prefix, (principal, _) in self._entries.items()
+                if principal is not None
+                and principal.application_instance_id == application_instance_id
+            ]:
+                del self._entries[key_prefix]
+
+    def reload_cache(self) -> None:
+        """Clear all cached principals."""
+        with self._lock:
+            self._entries.clear()
+
+    def disable_cache(self) -> None:
+        """Disable the cache (useful for testing)."""
+        self._enabled = False
+        self.reload_cache()
+
+    def enable_cache(self) -> None:
+        """Enable the cache."""
+        self._enabled = True
+
+    def get_cache_info(self) -> Dict[str, Any]:
+        """Get information about the current cache state."""
+        return {
+            "cache_enabled": self._enabled,
+            "cache_size": len(self._entries),
+            "hits": self._hits,
+            "negative_hits": self._negative_hits,
+            "misses": self._misses,
+            "ttl_seconds": self._ttl_seconds,
+            "negative_ttl_seconds": self._negative_ttl_seconds,
+        }
+
+
+# Global instance shared by all requests in this process
+_api_key_cache_instance: Optional[ApiKeyCache] = None
+
+
+def get_api_key_cache() -> ApiKeyCache:
+    """Get the global API key cache instance."""
+    global _api_key_cache_instance
+
+    if _api_key_cache_instance is None:
+        _api_key_cache_instance = ApiKeyCache()
+
+    return _api_key_cache_instance
+
+
+def set_api_key_cache(cache: ApiKeyCache) -> None:
+    """Set a custom API key cache instance (useful for testing)."""
+    global _api_key_cache_instance
+    _api_key_cache_instance = cache
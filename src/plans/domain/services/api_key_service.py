@@ -0,0 +1,95 @@
+import hashlib
+import hmac
+import re
+import secrets
+from datetime import datetime
+from typing import Optional, Tuple
+from uuid import UUID
+
+from ..entities.api_key import ApiKey, ApiKeyPrincipal
+from ..repositories.api_key_repository import ApiKeyRepository
+from .api_key_cache import ApiKeyCache
+
+
+class ApiKeySecretMissingError(RuntimeError):
+    """Raised when API keys are used without API_KEY_SECRET configured."""
+
+
+class ApiKeyService:
+    """Domain service for issuing and verifying application instance API keys.
+
+    Keys look like ``WHA_3f9a0c1b2d4e5f60_<secret>``: the part before the
+    second underscore is the public prefix, stored as is and indexed; the
+    full key is only stored as an HMAC-SHA256 digest under a server secret.
+    Keys are random, so a keyed digest is as safe as a slow password hash
+    while verifying in microseconds.
+    """
+
+    PREFIX_ID_BYTES = 8
+    SECRET_BYTES = 32
+
+    def __init__(self, secret: str):
+        if not secret:
+            raise ApiKeySecretMissingError(
+                "API_KEY_SECRET must be set to issue or verify API keys"
+            )
+        self._secret = secret.encode()
+
+    def generate_api_key(
+        self,
+        application_instance_id: UUID,
+        key_type: str,
+        created_by: Optional[UUID] = None,
+        expires_at: Optional[datetime] = None,
+    ) -> Tuple[str, ApiKey]:
+        """Generate a key, returning the plaintext (shown once) and the entity to store."""
+        type_code = re.sub(r"[^A-Za-z0-9]", "", key_type)[:3].upper() or "KEY"
+        key_prefix = f"{type_code}_{secrets.token_hex(self.PREFIX_ID_BYTES)}"
+        raw_key = f"{key_prefix}_{secrets.token_urlsafe(self.SECRET_BYTES)}"
+
+        api_key = ApiKey.create(
+            application_instance_id=application_instance_id,
+            key_type=key_type,
+            key_prefix=key_prefix,
+            key_digest=self.digest(raw_key),
+            created_by=created_by,
+            expires_at=expires_at,
+        )
+        return raw_key, api_key
+
+    def digest(self, raw_key: str) -> str:
+        """Get the keyed digest of a full key."""
+        return hmac.new(self._secret, raw_key.encode(), hashlib.sha256).hexdigest()
+
+    @staticmethod
+    def parse_prefix(raw_key: str) -> Optional[str]:
+        """Get the public prefix of a key, None if it is malformed."""
+        parts = raw_key.split("_", 2)
+        if len(parts) != 3 or not all(parts):
+            return None
+
+        key_prefix = f"{parts[0]}_{parts[1]}"
+        return key_prefix if len(key_prefix) <= 32 else None
+
+    def authenticate(
+        self,
+        raw_key: str,
+        repository: ApiKeyRepository,
+        cache: Optional[ApiKeyCache] = None,
+    ) -> Optional[ApiKeyPrincipal]:
+        """Resolve a presented key to its principal, None if it does not authenticate."""
+        key_prefix = self.parse_prefix(raw_key)
+        if key_prefix is None:
+            return None
+
+        if cache is not None:
+            principal = cache.resolve(key_prefix, repository.resolve_principal)
+        else:
+            principal = repository.resolve_principal(key_prefix)
+
+        if principal is None or not hmac.compare_digest(
+            principal.key_digest, self.digest(raw_key)
+        ):
+            return None
+
+        return principal if principal.is_valid() else None
@@ -0,0 +1,130 @@
+import threading
+import time
+from typing import Callable, Dict, Any, Optional, Tuple
+from uuid import UUID
+
+from shared.infrastructure.config import settings
+
+from ..value_objects.chat_widget_render import ChatWidgetRender
+
+
+class ChatWidgetRenderCache:
+    """Per-process cache of rendered chat widget bootstraps.
+
+    A fresh entry is served without touching the database. Once the TTL
+    passes, the caller re-reads the configuration version; if it did not
+    change, the existing render is kept and only its TTL is renewed, so
+    strings are rendered once per version. Changes saved in this process
+    invalidate the organization right away; the TTL bounds how long changes
+    made by other processes go unnoticed.
+    """
+
+    def __init__(self, ttl_seconds: float = 30.0, max_entries: int = 10000):
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._entries: Dict[Tuple[UUID, str], Tuple[ChatWidgetRender, float]] = {}
+        self._lock = threading.Lock()
+        self._enabled = True
+        self._hits = 0
+        self._revalidations = 0
+        self._misses = 0
+
+    def get_fresh(
+        self, organization_id: UUID, chat_endpoint: str
+    ) -> Optional[ChatWidgetRender]:
+        """Get a render whose TTL has not passed yet."""
+        if not self._enabled:
+            return None
+
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get((organization_id, chat_endpoint))
+            if entry is not None and now < entry[1]:
+                self._hits += 1
+                return entry[0]
+
+        return None
+
+    def store(
+        self,
+        organization_id: UUID,
+        chat_endpoint: str,
+        version: str,
+        renderer: Callable[[], ChatWidgetRender],
+    ) -> ChatWidgetRender:
+        """Get the render of a version, rendering it only if the version changed."""
+        if not self._enabled:
+            return renderer()
+
+        key = (organization_id, chat_endpoint)
+        with self._lock:
+            entry = self._entries.get(key)
+            current = entry[0] if entry is not None and entry[0].version == version else None
+            if current is not None:
+                self._revalidations += 1
+            else:
+                self._misses += 1
+
+        render = current or renderer()
+
+        with self._lock:
+            self._entries.pop(key, None)
+            if len(self._entries) >= self._max_entries:
+                # Entries are kept in insertion order: drop the oldest
+                del self._entries[next(iter(self._entries))]
+            self._entries[key] = (render, time.time() + self._ttl_seconds)
+
+        return render
+
+    def invalidate(self, organization_id: UUID) -> None:
+        """Drop an organization's renders after its configuration changed."""
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == organization_id]:
+                del self._entries[key]
+
+    def reload_cache(self) -> None:
+        """Clear all cached renders."""
+        with self._lock:
+            self._entries.clear()
+
+    def disable_cache(self) -> None:
+        """Disable the cache (useful for testing)."""
+        self._enabled = False
+        self.reload_cache()
+
+    def enable_cache(self) -> None:
+        """Enable the cache."""
+        self._enabled = True
+
+    def get_cache_info(self) -> Dict[str, Any]:
+        """Get information about the current cache state."""
+        return {
+            "cache_enabled": self._enabled,
+            "cache_size": len(self._entries),
+            "hits": self._hits,
+            "revalidations": self._revalidations,
+            "misses": self._misses,
+            "ttl_seconds": self._ttl_seconds,
+        }
+
+
+# Global instance shared by all requests in this process
+_chat_widget_render_cache_instance: Optional[ChatWidgetRenderCache] = None
+
+
+def get_chat_widget_render_cache() -> ChatWidgetRenderCache:
+    """Get the global chat widget render cache instance."""
+    global _chat_widget_render_cache_instance
+
+    if _chat_widget_render_cache_instance is None:
+        _chat_widget_render_cache_instance = ChatWidgetRenderCache(
+            ttl_seconds=settings.chat_widget_cache_ttl_seconds
+        )
+
+    return _chat_widget_render_cache_instance
+
+
+def set_chat_widget_render_cache(cache: ChatWidgetRenderCache) -> None:
+    """Set a custom chat widget render cache instance (useful for testing)."""
+    global _chat_widget_render_cache_instance
+    _chat_widget_render_cache_instance = cache
@@ -1,4 +1,4 @@
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from uuid import UUID
 
 from ..entities.organization_plan import OrganizationPlan
@@ -8,6 +8,9 @@ from ..value_objects.chat_configuration import (
     ChatWhatsAppConfiguration,
     ChatIframeConfiguration,
 )
+from ..value_objects.chat_widget_render import ChatWidgetRender
+from .chat_widget_render_cache import get_chat_widget_render_cache
+from .feature_configuration_cache import get_feature_configuration_cache
 
 
 class FeatureAccessService:
@@ -99,17 +102,38 @@ class FeatureAccessService:
     ) -> Optional[ChatIframeConfiguration]:
         """Get iframe chat configuration for organization."""
 
+        config, _ = self._load_chat_iframe_config(organization_id)
+        return config
+
+    def _load_chat_iframe_config(
+        self, organization_id: UUID
+    ) -> Tuple[Optional[ChatIframeConfiguration], Optional[str]]:
+        """Get the iframe configuration and the subscription version it came from."""
+
         has_access, _ = self.has_feature_access(organization_id, "chat_iframe")
         if not has_access:
-            return None
+            return None, None
 
         subscription = self._org_plan_repository.get_by_organization_id(organization_id)
         if not subscription:
-            return None
-
-        # Get configuration from feature overrides or default
-        config_data = subscription.feature_overrides.get("chat_iframe")
+            return None, None
+
+        version = f"{subscription.id}:{subscription.updated_at}"
+
+        # Parsed once per subscription version, with its compiled domain matcher
+        config = get_feature_configuration_cache().get_or_load(
+            organization_id,
+            "chat_iframe",
+            version,
+            lambda: self._parse_chat_iframe_config(
+                subscription.feature_overrides.get("chat_iframe")
+            ),
+        )
+        return config, version
 
+    @staticmethod
+    def _parse_chat_iframe_config(config_data: Any) -> ChatIframeConfiguration:
+        """Get configuration from feature overrides or default."""
         if isinstance(config_data, dict):
             try:
                 return ChatIframeConfiguration(**config_data)
@@ -137,7 +161,10 @@ class FeatureAccessService:
             "chat_iframe", config.model_dump()
         )
 
-        return self._org_plan_repository.save(updated_subscription)
+        saved = self._org_plan_repository.save(updated_subscription)
+        get_feature_configuration_cache().invalidate(organization_id, "chat_iframe")
+        get_chat_widget_render_cache().invalidate(organization_id)
+        return saved
 
     def get_feature_configurations(self, organization_id: UUID) -> Dict[str, Any]:
         """Get all feature configurations for organization."""
@@ -245,11 +272,32 @@ class FeatureAccessService:
     ) -> Optional[str]:
         """Generate iframe embed code for organization."""
 
-        config = self.get_chat_iframe_config(organization_id)
+        widget = self.get_chat_widget(organization_id, chat_endpoint)
+        return widget.embed_html if widget else None
+
+    def get_chat_widget(
+        self, organization_id: UUID, chat_endpoint: str
+    ) -> Optional[ChatWidgetRender]:
+        """Get the rendered widget bootstrap (client config and embed code)."""
+
+        cache = get_chat_widget_render_cache()
+        widget = cache.get_fresh(organization_id, chat_endpoint)
+        if widget:
+            return widget
+
+        config, version = self._load_chat_iframe_config(organization_id)
         if not config or not config.enabled:
+            cache.invalidate(organization_id)
             return None
 
-        return config.get_embed_code(str(organization_id), chat_endpoint)
+        return cache.store(
+            organization_id,
+            chat_endpoint,
+            version,
+            lambda: ChatWidgetRender.render(
+                config, str(organization_id), chat_endpoint, version
+            ),
+        )
 
     def is_domain_allowed_for_iframe(self, organization_id: UUID, domain: str) -> bool:
         """Check if domain is allowed to embed iframe chat."""
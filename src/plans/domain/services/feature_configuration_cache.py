@@ -0,0 +1,115 @@
+import threading
+import time
+from typing import Callable, Dict, Any, Hashable, Optional, Tuple
+from uuid import UUID
+
+from shared.infrastructure.config import settings
+
+
+class FeatureConfigurationCache:
+    """Per-process cache of parsed per-organization feature configurations.
+
+    Entries are keyed by (organization, feature) and carry the version of
+    the subscription they were parsed from (its id and last update time), so
+    a saved change is picked up by the next lookup, in any process, without
+    an explicit invalidation. Parsed configurations are frozen and shared;
+    whatever they compile lazily (e.g. the iframe domain matcher) is built
+    once per version. The TTL only bounds memory held for idle tenants.
+    """
+
+    def __init__(self, ttl_seconds: float = 300.0, max_entries: int = 10000):
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._entries: Dict[Tuple[UUID, str], Tuple[Hashable, Any, float]] = {}
+        self._lock = threading.Lock()
+        self._enabled = True
+        self._hits = 0
+        self._misses = 0
+
+    def get_or_load(
+        self,
+        organization_id: UUID,
+        feature_name: str,
+        version: Hashable,
+        loader: Callable[[], Any],
+    ) -> Any:
+        """Get the configuration of a version, parsing it on a miss."""
+        if not self._enabled:
+            return loader()
+
+        key = (organization_id, feature_name)
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == version and now < entry[2]:
+                self._hits += 1
+                return entry[1]
+            self._misses += 1
+
+        configuration = loader()
+
+        with self._lock:
+            self._entries.pop(key, None)
+            if len(self._entries) >= self._max_entries:
+                # Entries are kept in insertion order: drop the oldest
+                del self._entries[next(iter(self._entries))]
+            self._entries[key] = (version, configuration, now + self._ttl_seconds)
+
+        return configuration
+
+    def invalidate(self, organization_id: UUID, feature_name: Optional[str] = None) -> None:
+        """Drop an organization's configurations (or one feature's) after a change."""
+        with self._lock:
+            for key in [
+                key
+                for key in self._entries
+                if key[0] == organization_id
+                and (feature_name is None or key[1] == feature_name)
+            ]:
+                del self._entries[key]
+
+    def reload_cache(self) -> None:
+        """Clear all cached configurations."""
+        with self._lock:
+            self._entries.clear()
+
+    def disable_cache(self) -> None:
+        """Disable the cache (useful for testing)."""
+        self._enabled = False
+        self.reload_cache()
+
+    def enable_cache(self) -> None:
+        """Enable the cache."""
+        self._enabled = True
+
+    def get_cache_info(self) -> Dict[str, Any]:
+        """Get information about the current cache state."""
+        return {
+            "cache_enabled": self._enabled,
+            "cache_size": len(self._entries),
+            "hits": self._hits,
+            "misses": self._misses,
+            "ttl_seconds": self._ttl_seconds,
+        }
+
+
+# Global instance shared by all requests in this process
+_feature_configuration_cache_instance: Optional[FeatureConfigurationCache] = None
+
+
+def get_feature_configuration_cache() -> FeatureConfigurationCache:
+    """Get the global feature configuration cache instance."""
+    global _feature_configuration_cache_instance
+
+    if _feature_configuration_cache_instance is None:
+        _feature_configuration_cache_instance = FeatureConfigurationCache(
+            ttl_seconds=settings.feature_config_cache_ttl_seconds
+        )
+
+    return _feature_configuration_cache_instance
+
+
+def set_feature_configuration_cache(cache: FeatureConfigurationCache) -> None:
+    """Set a custom feature configuration cache instance (useful for testing)."""
+    global _feature_configuration_cache_instance
+    _feature_configuration_cache_instance = cache
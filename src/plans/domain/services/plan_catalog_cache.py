@@ -0,0 +1,152 @@
+import threading
+import time
+from typing import Callable, Dict, Any, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from shared.infrastructure.config import settings
+
+from ..entities.plan import Plan
+
+
+def _plan_type_key(plan_type: Any) -> str:
+    return getattr(plan_type, "value", plan_type)
+
+
+class PlanCatalog:
+    """Immutable snapshot of all plans, indexed by id, name and type.
+
+    Plans are kept newest first, the order the repository lists them in.
+    The Plan entities are frozen, so the snapshot is shared by all readers.
+    """
+
+    def __init__(self, plans: Iterable[Plan]):
+        self._plans: Tuple[Plan, ...] = tuple(
+            sorted(plans, key=lambda plan: plan.created_at, reverse=True)
+        )
+        self._by_id: Dict[UUID, Plan] = {plan.id: plan for plan in self._plans}
+        self._by_name: Dict[str, Plan] = {plan.name.value: plan for plan in self._plans}
+        self._by_type: Dict[str, Tuple[Plan, ...]] = {}
+        for plan in self._plans:
+            key = _plan_type_key(plan.plan_type)
+            self._by_type[key] = self._by_type.get(key, ()) + (plan,)
+
+    def __len__(self) -> int:
+        return len(self._plans)
+
+    def get(self, plan_id: UUID) -> Optional[Plan]:
+        return self._by_id.get(plan_id)
+
+    def get_by_name(self, name: str) -> Optional[Plan]:
+        return self._by_name.get(name)
+
+    def filter(
+        self, plan_type: Optional[str] = None, is_active: Optional[bool] = None
+    ) -> List[Plan]:
+        """Get the plans of a type and/or activity state, newest first."""
+        plans = self._by_type.get(_plan_type_key(plan_type), ()) if plan_type else self._plans
+        if is_active is None:
+            return list(plans)
+        return [plan for plan in plans if plan.is_active == is_active]
+
+
+class PlanCatalogCache:
+    """Per-process read-through cache of the plan catalog.
+
+    Plans change rarely and are read on every feature check and
+    subscription lookup, so the whole catalog is loaded at once and served
+    from memory. Writes invalidate it (PlanManagementService, and the
+    repository after a commit that wrote plans); the TTL bounds how long
+    writes made by other processes go unnoticed. A load that started
+    before an invalidation is not kept, so it cannot bring back old plans.
+    """
+
+    def __init__(self, ttl_seconds: float = 300.0):
+        self._ttl_seconds = ttl_seconds
+        self._catalog: Optional[PlanCatalog] = None
+        self._expires_at = 0.0
+        self._version = 0
+        self._lock = threading.Lock()
+        self._enabled = True
+        self._hits = 0
+        self._misses = 0
+
+    def get_catalog(
+        self, loader: Callable[[], List[Plan]]
+    ) -> Optional[PlanCatalog]:
+        """Get the catalog, loading it on a miss; None when the cache is disabled."""
+        if not self._enabled:
+            return None
+
+        now = time.time()
+        with self._lock:
+            if self._catalog is not None and now < self._expires_at:
+                self._hits += 1
+                return self._catalog
+            self._misses += 1
+            version = self._version
+
+        catalog = PlanCatalog(loader())
+
+        with self._lock:
+            if version == self._version:
+                self._catalog = catalog
+                self._expires_at = now + self._ttl_seconds
+
+        return catalog
+
+    def preload(self, loader: Callable[[], List[Plan]]) -> None:
+        """Load the catalog ahead of the first lookup (startup warm-up)."""
+        self.invalidate()
+        self.get_catalog(loader)
+
+    def invalidate(self) -> None:
+        """Drop the catalog after plans changed."""
+        with self._lock:
+            self._version += 1
+            self._catalog = None
+
+    def reload_cache(self) -> None:
+        """Clear the cached catalog."""
+        self.invalidate()
+
+    def disable_cache(self) -> None:
+        """Disable the cache (useful for testing)."""
+        self._enabled = False
+        self.reload_cache()
+
+    def enable_cache(self) -> None:
+        """Enable the cache."""
+        self._enabled = True
+
+    def get_cache_info(self) -> Dict[str, Any]:
+        """Get information about the current cache state."""
+        catalog = self._catalog
+        return {
+            "cache_enabled": self._enabled,
+            "cached_plans": len(catalog) if catalog is not None else 0,
+            "hits": self._hits,
+            "misses": self._misses,
+            "ttl_seconds": self._ttl_seconds,
+        }
+
+
+# Global instance shared by all requests in this process
+_plan_catalog_cache_instance: Optional[PlanCatalogCache] = None
+
+
+def get_plan_catalog_cache() -> PlanCatalogCache:
+    """Get the global plan catalog cache instance."""
+    global _plan_catalog_cache_instance
+
+    if _plan_catalog_cache_instance is None:
+        _plan_catalog_cache_instance = PlanCatalogCache(
+            ttl_seconds=settings.plan_catalog_cache_ttl_seconds
+        )
+
+    return _plan_catalog_cache_instance
+
+
+def set_plan_catalog_cache(cache: PlanCatalogCache) -> None:
+    """Set a custom plan catalog cache instance (useful for testing)."""
+    global _plan_catalog_cache_instance
+    _plan_catalog_cache_instance = cache
@@ -6,6 +6,7 @@ from ..value_objects.plan_name import PlanName
 from ..value_objects.pricing import Pricing
 from ..repositories.plan_repository import PlanRepository
 from ..repositories.organization_plan_repository import OrganizationPlanRepository
+from .plan_catalog_cache import get_plan_catalog_cache
 
 
 class PlanManagementService:
@@ -54,7 +55,7 @@ class PlanManagementService:
             is_public=is_public,
         )
         
-        return self._plan_repository.save(plan)
+        return self._save_plan(plan)
 
     def update_plan(
         self,
@@ -88,7 +89,7 @@ class PlanManagementService:
             for resource_type, config in updates["resources"].items():
                 updated_plan = updated_plan.update_resource(resource_type, config)
         
-        return self._plan_repository.save(updated_plan)
+        return self._save_plan(updated_plan)
 
     def archive_plan(self, plan_id: UUID, force: bool = False) -> Plan:
         """Archive a plan (soft delete)."""
@@ -108,7 +109,7 @@ class PlanManagementService:
         
         # Archive the plan
         archived_plan = plan.deprecate()
-        return self._plan_repository.save(archived_plan)
+        return self._save_plan(archived_plan)
 
     def validate_plan_rules(self, plan: Plan) -> tuple[bool, List[str]]:
         """Validate plan against business rules."""
@@ -284,6 +285,12 @@ class PlanManagementService:
         if plan_type == PlanType.ENTERPRISE and pricing.monthly_price < 100:
             raise ValueError("Enterprise plans should be at least $100/month")
 
+    def _save_plan(self, plan: Plan) -> Plan:
+        """Save a plan and drop the cached plan catalog."""
+        saved_plan = self._plan_repository.save(plan)
+        get_plan_catalog_cache().invalidate()
+        return saved_plan
+
     def _can_modify_plan(self, plan: Plan) -> bool:
         """Check if plan can be safely modified."""
         
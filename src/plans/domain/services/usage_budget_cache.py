@@ -0,0 +1,172 @@
+import math
+import threading
+import time
+from datetime import timezone
+from typing import Dict, Any, Optional, Tuple
+from uuid import UUID
+
+from ..entities.feature_usage import FeatureUsage
+
+
+class _UsageBudget:
+    """Remaining budget of one (organization, feature) as of the last exact read."""
+
+    __slots__ = ("limit_value", "remaining", "consumed", "period_end", "expires_at")
+
+    def __init__(
+        self, limit_value: int, remaining: int, period_end: float, expires_at: float
+    ):
+        self.limit_value = limit_value
+        self.remaining = remaining
+        self.consumed = 0
+        self.period_end = period_end
+        self.expires_at = expires_at
+
+
+class UsageBudgetCache:
+    """Per-process admission fast path for feature usage limits.
+
+    After an exact, database-backed check the remaining budget of an
+    organization's feature is remembered for a short time. While that budget
+    is clearly sufficient - unlimited, or more than a safety margin left after
+    what this process has admitted since - checks are answered without reading
+    the database. Near the limit, after the TTL, or at the end of the period
+    callers fall back to the exact check, which refreshes the entry.
+
+    Other processes consume the same budget concurrently; the margin and the
+    TTL bound how far that can overshoot a limit.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 30.0,
+        margin_ratio: float = 0.1,
+        min_margin: int = 10,
+    ):
+        self._ttl_seconds = ttl_seconds
+        self._margin_ratio = margin_ratio
+        self._min_margin = min_margin
+        self._budgets: Dict[Tuple[UUID, str], _UsageBudget] = {}
+        self._lock = threading.Lock()
+        self._enabled = True
+        self._hits = 0
+        self._misses = 0
+
+    def admit(
+        self,
+        organization_id: UUID,
+        feature_name: str,
+        amount: int = 1,
+        consume: bool = False,
+    ) -> Optional[int]:
+        """Admit usage without a database read if the budget clearly allows it.
+
+        Returns the estimated remaining usage (-1 for unlimited) when admitted,
+        or None when the caller must perform the exact check. With ``consume``
+        the admitted amount is deducted from the local budget.
+        """
+        key = (organization_id, feature_name)
+        now = time.time()
+
+        with self._lock:
+            budget = self._budgets.get(key) if self._enabled else None
+            if (
+                budget is None
+                or now >= budget.expires_at
+                or now > budget.period_end
+            ):
+                self._misses += 1
+                return None
+
+            if budget.limit_value == -1:
+                self._hits += 1
+                return -1
+
+            available = budget.remaining - budget.consumed - self._margin(budget)
+            if amount > available:
+                self._misses += 1
+                return None
+
+            if consume:
+                budget.consumed += amount
+            self._hits += 1
+            return budget.remaining - budget.consumed
+
+    def remember(self, usage: FeatureUsage) -> None:
+        """Store the exact budget read from a usage record."""
+        if not self._enabled:
+            return
+
+        period_end = usage.period_end
+        if period_end.tzinfo is None:
+            period_end = period_end.replace(tzinfo=timezone.utc)
+
+        budget = _UsageBudget(
+            limit_value=usage.limit_value,
+            remaining=usage.get_remaining_usage(),
+            period_end=period_end.timestamp(),
+            expires_at=time.time() + self._ttl_seconds,
+        )
+
+        with self._lock:
+            self._budgets[(usage.organization_id, usage.feature_name)] = budget
+
+    def invalidate(
+        self, organization_id: UUID, feature_name: Optional[str] = None
+    ) -> None:
+        """Drop cached budgets for an organization, or one of its features."""
+        with self._lock:
+            if feature_name is not None:
+                self._budgets.pop((organization_id, feature_name), None)
+                return
+
+            for key in [key for key in self._budgets if key[0] == organization_id]:
+                del self._budgets[key]
+
+    def reload_cache(self) -> None:
+        """Clear all cached budgets."""
+        with self._lock:
+            self._budgets.clear()
+
+    def disable_cache(self) -> None:
+        """Disable the fast path (useful for testing)."""
+        self._enabled = False
+        self.reload_cache()
+
+    def enable_cache(self) -> None:
+        """Enable the fast path."""
+        self._enabled = True
+
+    def get_cache_info(self) -> Dict[str, Any]:
+        """Get information about the current cache state."""
+        return {
+            "cache_enabled": self._enabled,
+            "cache_size": len(self._budgets),
+            "hits": self._hits,
+            "misses": self._misses,
+            "ttl_seconds": self._ttl_seconds,
+            "margin_ratio": self._margin_ratio,
+        }
+
+    def _margin(self, budget: _UsageBudget) -> int:
+        return max(self._min_margin, math.ceil(budget.limit_value * self._margin_ratio))
+
+
+# Global instance shared by all requests in this process
+_usage_budget_cache_instance: Optional[UsageBudgetCache] = None
+
+
+def get_usage_budget_cache() -> UsageBudgetCache:
+    """Get the global usage budget cache instance."""
+    global _usage_budget_cache_instance
+
+    if _usage_budget_cache_instance is None:
+        _usage_budget_cache_instance = UsageBudgetCache()
+
+    return _usage_budget_cache_instance
+
+
+def set_usage_budget_cache(cache: UsageBudgetCache) -> None:
+    """Set a custom usage budget cache instance (useful for testing)."""
+    global _usage_budget_cache_instance
+    _usage_budget_cache_instance = cache
@@ -1,10 +1,14 @@
+from datetime import datetime, timedelta, timezone
 from typing import Dict, Any, List, Optional
 from uuid import UUID
 
 from ..entities.feature_usage import FeatureUsage, UsagePeriod
+from ..entities.usage_bucket import UsageBucket
 from ..repositories.feature_usage_repository import FeatureUsageRepository
 from ..repositories.organization_plan_repository import OrganizationPlanRepository
 from ..repositories.plan_repository import PlanRepository
+from ..repositories.usage_event_repository import UsageEventRepository
+from .usage_budget_cache import UsageBudgetCache
 
 
 class UsageTrackingService:
@@ -15,10 +19,14 @@ class UsageTrackingService:
         usage_repository: FeatureUsageRepository,
         org_plan_repository: OrganizationPlanRepository,
         plan_repository: PlanRepository,
+        usage_event_repository: Optional[UsageEventRepository] = None,
+        budget_cache: Optional[UsageBudgetCache] = None,
     ):
         self._usage_repository = usage_repository
         self._org_plan_repository = org_plan_repository
         self._plan_repository = plan_repository
+        self._usage_event_repository = usage_event_repository
+        self._budget_cache = budget_cache
 
     def track_feature_usage(
         self,
@@ -29,6 +37,20 @@ class UsageTrackingService:
     ) -> tuple[bool, str, Optional[FeatureUsage]]:
         """Track feature usage and validate against limits."""
 
+        # Fast path: budget is known to be clearly sufficient, skip the reads
+        if self._budget_cache and self._budget_cache.admit(
+            organization_id, feature_name, amount, consume=True
+        ) is not None:
+            try:
+                updated_usage = self._usage_repository.increment_usage(
+                    organization_id, feature_name, amount, metadata, UsagePeriod.MONTHLY
+                )
+            except ValueError:
+                self._budget_cache.invalidate(organization_id, feature_name)
+            else:
+                self._record_usage_event(organization_id, feature_name, amount)
+                return True, "Usage tracked successfully", updated_usage
+
         # Get organization subscription and plan
         subscription = self._org_plan_repository.get_by_organization_id(organization_id)
         if not subscription or not subscription.is_active():
@@ -72,11 +94,23 @@ class UsageTrackingService:
 
         # Increment usage
         updated_usage = self._usage_repository.increment_usage(
-            organization_id, feature_name, amount, metadata
+            organization_id, feature_name, amount, metadata, UsagePeriod.MONTHLY
         )
+        self._record_usage_event(organization_id, feature_name, amount)
+
+        if self._budget_cache:
+            self._budget_cache.remember(updated_usage)
 
         return True, "Usage tracked successfully", updated_usage
 
+    def _record_usage_event(
+        self, organization_id: UUID, feature_name: str, amount: int
+    ) -> None:
+        if self._usage_event_repository:
+            self._usage_event_repository.record_event(
+                organization_id, feature_name, amount
+            )
+
     def get_organization_usage_summary(self, organization_id: UUID) -> Dict[str, Any]:
         """Get comprehensive usage summary for organization."""
 
@@ -124,6 +158,13 @@ class UsageTrackingService:
     ) -> tuple[bool, str, Dict[str, Any]]:
         """Check if organization can use a feature."""
 
+        if self._budget_cache:
+            remaining = self._budget_cache.admit(
+                organization_id, feature_name, requested_amount
+            )
+            if remaining is not None:
+                return True, "Feature access granted", {"remaining_usage": remaining}
+
         subscription = self._org_plan_repository.get_by_organization_id(organization_id)
         if not subscription or not subscription.is_active():
             return False, "No active subscription", {}
@@ -165,6 +206,9 @@ class UsageTrackingService:
                     },
                 )
 
+            if self._budget_cache:
+                self._budget_cache.remember(current_usage)
+
         return (
             True,
             "Feature access granted",
@@ -178,16 +222,21 @@ class UsageTrackingService:
     def get_usage_analytics(
         self, organization_id: UUID, feature_name: str, periods: int = 12
     ) -> Dict[str, Any]:
-        """Get usage analytics and trends."""
-
-        trends = self._usage_repository.get_usage_trends(
-            organization_id, feature_name, periods
-        )
+        """Get usage analytics and trends (newest period first)."""
 
         current_usage = self._usage_repository.get_current_usage(
             organization_id, feature_name, UsagePeriod.MONTHLY
         )
 
+        if self._usage_event_repository:
+            trends = self._get_bucketed_trends(
+                organization_id, feature_name, periods, current_usage
+            )
+        else:
+            trends = self._usage_repository.get_usage_trends(
+                organization_id, feature_name, periods
+            )
+
         analytics = {
             "feature_name": feature_name,
             "trends": trends,
@@ -199,8 +248,8 @@ class UsageTrackingService:
 
         # Generate insights
         if trends and len(trends) > 1:
-            # Calculate growth trend
-            recent_usage = [t["usage"] for t in trends[-3:]]
+            # Calculate growth trend, oldest to newest
+            recent_usage = [t["usage"] for t in reversed(trends[:3])]
             if len(recent_usage) >= 2:
                 growth_rate = (
                     (recent_usage[-1] - recent_usage[0]) / max(recent_usage[0], 1) * 100
@@ -232,6 +281,86 @@ class UsageTrackingService:
 
         return analytics
 
+    def get_usage_buckets(
+        self,
+        organization_id: UUID,
+        feature_name: str,
+        granularity: UsagePeriod,
+        start: datetime,
+        end: datetime,
+    ) -> List[UsageBucket]:
+        """Get pre-aggregated usage buckets for a feature."""
+
+        if not self._usage_event_repository:
+            return []
+
+        return self._usage_event_repository.get_buckets(
+            organization_id, feature_name, granularity, start, end
+        )
+
+    def _get_bucketed_trends(
+        self,
+        organization_id: UUID,
+        feature_name: str,
+        periods: int,
+        current_usage: Optional[FeatureUsage],
+    ) -> List[Dict[str, Any]]:
+        """Build calendar-month trends from daily rollups.
+
+        Months recorded before the rollups existed fall back to their monthly
+        counter row; months without either are reported as zero usage.
+        """
+
+        now = datetime.now(timezone.utc)
+        month_starts = [now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)]
+        for _ in range(max(periods, 1) - 1):
+            month_starts.append((month_starts[-1] - timedelta(days=1)).replace(day=1))
+        start = month_starts[-1]
+
+        buckets = {
+            (bucket.bucket_start.year, bucket.bucket_start.month): bucket
+            for bucket in self._usage_event_repository.get_buckets(
+                organization_id, feature_name, UsagePeriod.MONTHLY, start, now
+            )
+        }
+
+        # Limits live on the per-period counter rows, not in the rollups
+        counters = {
+            (usage.period_start.year, usage.period_start.month): usage
+            for usage in self._usage_repository.get_organization_usage(
+                organization_id, period_start=start
+            )
+            if usage.feature_name == feature_name
+            and usage.usage_period == UsagePeriod.MONTHLY
+        }
+        default_limit = current_usage.limit_value if current_usage else -1
+
+        trends = []
+        for month_start in month_starts:
+            month = (month_start.year, month_start.month)
+            counter = counters.get(month)
+            bucket = buckets.get(month) or UsageBucket.for_moment(
+                organization_id=organization_id,
+                feature_name=feature_name,
+                granularity=UsagePeriod.MONTHLY,
+                moment=month_start,
+                total_usage=counter.current_usage if counter else 0,
+            )
+            limit_value = counter.limit_value if counter else default_limit
+            trend = bucket.to_trend_point()
+            trend.update(
+                {
+                    "limit": limit_value,
+                    "usage_percentage": (bucket.total_usage / limit_value * 100)
+                    if limit_value > 0
+                    else 0,
+                    "is_unlimited": limit_value == -1,
+                }
+            )
+            trends.append(trend)
+
+        return trends
+
     def reset_monthly_usage(self, organization_id: UUID) -> Dict[str, int]:
         """Reset monthly usage for organization (typically called by scheduler)."""
 
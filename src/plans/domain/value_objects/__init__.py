@@ -1,10 +1,14 @@
 from .plan_name import PlanName
 from .pricing import Pricing
 from .chat_configuration import ChatWhatsAppConfiguration, ChatIframeConfiguration
+from .domain_matcher import DomainMatcher
+from .chat_widget_render import ChatWidgetRender
 
 __all__ = [
     "PlanName",
     "Pricing",
     "ChatWhatsAppConfiguration",
     "ChatIframeConfiguration",
+    "DomainMatcher",
+    "ChatWidgetRender",
 ]
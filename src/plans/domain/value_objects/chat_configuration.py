@@ -1,7 +1,9 @@
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, PrivateAttr, field_validator
 from typing import Optional, List, Dict, Any
 import re
 
+from .domain_matcher import DomainMatcher
+
 
 class BusinessHours(BaseModel):
     enabled: bool = False
@@ -172,6 +174,10 @@ class ChatIframeConfiguration(BaseModel):
     enable_file_upload: bool = False
     enable_emoji: bool = True
 
+    # Matcher compiled from allowed_domains, and the list it was compiled from
+    _domain_matcher: Optional[DomainMatcher] = PrivateAttr(default=None)
+    _matcher_domains: Optional[List[str]] = PrivateAttr(default=None)
+
     model_config = {"frozen": True, "arbitrary_types_allowed": True}
 
     @field_validator("position")
@@ -195,9 +201,9 @@ class ChatIframeConfiguration(BaseModel):
         validated_domains = []
 
         for domain in v:
-            # Basic domain validation
+            # Basic domain validation; "*.example.com" allows every subdomain
             if not re.match(
-                r"^[a-zA-Z0-9]([a-zA-Z0-9\-]*[a-zA-Z0-9])?(\.[a-zA-Z0-9]([a-zA-Z0-9\-]*[a-zA-Z0-9])?)*$",
+                r"^(\*\.)?[a-zA-Z0-9]([a-zA-Z0-9\-]*[a-zA-Z0-9])?(\.[a-zA-Z0-9]([a-zA-Z0-9\-]*[a-zA-Z0-9])?)*$",
                 domain,
             ):
                 raise ValueError(f"Invalid domain format: {domain}")
@@ -246,12 +252,24 @@ class ChatIframeConfiguration(BaseModel):
 
         return self.model_copy(update=updates)
 
+    @property
+    def domain_matcher(self) -> DomainMatcher:
+        """Matcher for allowed_domains, compiled on first use.
+
+        Copies share the matcher until allowed_domains is replaced, so a
+        configuration kept in a cache compiles it once.
+        """
+        if self._domain_matcher is None or self._matcher_domains is not self.allowed_domains:
+            self._domain_matcher = DomainMatcher.compile(self.allowed_domains)
+            self._matcher_domains = self.allowed_domains
+        return self._domain_matcher
+
     def is_domain_allowed(self, domain: str) -> bool:
         """Check if a domain is allowed to embed the chat."""
         if not self.allowed_domains:  # Empty list means all domains allowed
             return True
 
-        return domain.lower() in [d.lower() for d in self.allowed_domains]
+        return self.domain_matcher.matches(domain)
 
     def get_embed_code(self, organization_id: str, chat_endpoint: str) -> str:
         """Generate iframe embed code."""
@@ -0,0 +1,63 @@
+import hashlib
+import json
+from typing import Optional
+
+from pydantic import BaseModel
+
+from .chat_configuration import ChatIframeConfiguration
+
+
+class ChatWidgetRender(BaseModel):
+    """Serialized chat widget bootstrap of one configuration version.
+
+    Holds the client configuration JSON and the embed HTML exactly as they
+    are sent, with an ETag derived from their content, so identical
+    configurations get the same ETag in every process.
+    """
+
+    version: str
+    etag: str
+    client_config_json: str
+    embed_html: str
+
+    model_config = {"frozen": True}
+
+    @classmethod
+    def render(
+        cls,
+        config: ChatIframeConfiguration,
+        organization_id: str,
+        chat_endpoint: str,
+        version: str,
+    ) -> "ChatWidgetRender":
+        client_config_json = json.dumps(
+            config.to_client_config(), separators=(",", ":"), sort_keys=True
+        )
+        embed_html = config.get_embed_code(organization_id, chat_endpoint)
+
+        digest = hashlib.sha256(
+            f"{client_config_json}\n{embed_html}".encode("utf-8")
+        ).hexdigest()
+
+        return cls(
+            version=version,
+            etag=f'"{digest[:32]}"',
+            client_config_json=client_config_json,
+            embed_html=embed_html,
+        )
+
+    def matches_etag(self, if_none_match: Optional[str]) -> bool:
+        """Check an If-None-Match header against this render (weak comparison)."""
+        if not if_none_match:
+            return False
+
+        for candidate in if_none_match.split(","):
+            candidate = candidate.strip()
+            if candidate == "*":
+                return True
+            if candidate.startswith("W/"):
+                candidate = candidate[2:]
+            if candidate == self.etag:
+                return True
+
+        return False
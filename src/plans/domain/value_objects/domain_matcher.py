@@ -0,0 +1,69 @@
+from typing import Dict, FrozenSet, Iterable, Optional
+
+# Marks a trie node where a "*.<suffix>" entry ends
+_WILDCARD_END = ""
+
+
+class DomainMatcher:
+    """Compiled allow-list of hosts, matched in time independent of its size.
+
+    Exact entries (``example.com``) go into a frozenset. Wildcard entries
+    (``*.example.com``) go into a trie keyed by reversed labels (``com`` ->
+    ``example``), which matches any subdomain of the suffix but not the bare
+    suffix itself. A lookup costs one set probe plus one step per label of
+    the host.
+    """
+
+    __slots__ = ("_exact", "_suffixes", "_is_empty")
+
+    def __init__(self, exact: FrozenSet[str], suffixes: Dict[str, dict]):
+        self._exact = exact
+        self._suffixes = suffixes
+        self._is_empty = not exact and not suffixes
+
+    @classmethod
+    def compile(cls, domains: Iterable[str]) -> "DomainMatcher":
+        exact = set()
+        suffixes: Dict[str, dict] = {}
+
+        for domain in domains:
+            domain = cls.normalize(domain)
+            if domain.startswith("*."):
+                node = suffixes
+                for label in reversed(domain[2:].split(".")):
+                    node = node.setdefault(label, {})
+                node[_WILDCARD_END] = {}
+            elif domain:
+                exact.add(domain)
+
+        return cls(frozenset(exact), suffixes)
+
+    @staticmethod
+    def normalize(host: str) -> str:
+        """Lowercase a host and drop a trailing dot and port."""
+        host = host.strip().lower().rstrip(".")
+        if host.count(":") == 1:
+            host = host.split(":", 1)[0]
+        return host
+
+    @property
+    def is_empty(self) -> bool:
+        return self._is_empty
+
+    def matches(self, host: str) -> bool:
+        """Check if a host is listed, exactly or under a wildcard suffix."""
+        host = self.normalize(host)
+        if host in self._exact:
+            return True
+
+        labels = host.split(".")
+        node: Optional[dict] = self._suffixes
+        # Walk from the top-level label; a wildcard matches while labels remain
+        for depth in range(len(labels) - 1, 0, -1):
+            node = node.get(labels[depth])
+            if node is None:
+                return False
+            if _WILDCARD_END in node:
+                return True
+
+        return False
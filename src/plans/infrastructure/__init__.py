@@ -1,11 +1,9 @@
 from .repositories import (
     SqlAlchemyPlanRepository,
-    SqlAlchemyPlanResourceRepository,
     SqlAlchemySubscriptionRepository,
 )
 
 __all__ = [
     "SqlAlchemyPlanRepository",
-    "SqlAlchemyPlanResourceRepository",
     "SqlAlchemySubscriptionRepository",
 ]
@@ -10,11 +10,16 @@ from sqlalchemy import (
     DateTime,
     UniqueConstraint,
     Index,
+    BigInteger,
+    Identity,
 )
 from sqlalchemy.dialects.postgresql import UUID, JSON
+from sqlalchemy.sql import func
 import enum
 
 from src.shared.infrastructure.database.base import BaseModel
+from src.shared.infrastructure.database.connection import Base
+from src.shared.infrastructure.database.search import trigram_index
 
 
 class PlanTypeEnum(str, enum.Enum):
@@ -55,6 +60,12 @@ class PlanModel(BaseModel):
         UUID(as_uuid=True), ForeignKey("users.id"), nullable=False
     )
 
+    # Trigram indexes for substring search
+    __table_args__ = (
+        trigram_index("ix_plans_name_trgm", "name"),
+        trigram_index("ix_plans_description_trgm", "description"),
+    )
+
 
 class SubscriptionModel(BaseModel):
     """SQLAlchemy model for Subscription entity."""
@@ -91,6 +102,8 @@ class SubscriptionModel(BaseModel):
     # Ensure one active subscription per organization
     __table_args__ = (
         Index("ix_active_subscription_per_org", "organization_id", postgresql_where="status = 'active'"),
+        # Lifecycle job: subscriptions of a status that ended by a cutoff
+        Index("ix_subscriptions_status_ends_at", "status", "ends_at"),
     )
 
 
@@ -255,10 +268,10 @@ class ApplicationInstanceModel(BaseModel):
     )
 
 
-class FeatureUsageModel(BaseModel):
-    """SQLAlchemy model for FeatureUsage entity."""
+class ApiKeyModel(BaseModel):
+    """SQLAlchemy model for application instance API keys (prefix + keyed digest)."""
 
-    __tablename__ = "feature_usage"
+    __tablename__ = "application_api_keys"
 
     application_instance_id = Column(
         UUID(as_uuid=True),
@@ -266,22 +279,102 @@ class FeatureUsageModel(BaseModel):
         nullable=False,
         index=True,
     )
-    feature_id = Column(
+    key_type = Column(String(50), nullable=False)
+    key_prefix = Column(String(32), nullable=False)
+    key_digest = Column(String(64), nullable=False)
+    is_active = Column(Boolean, default=True, nullable=False)
+    expires_at = Column(DateTime(timezone=True), nullable=True)
+    revoked_at = Column(DateTime(timezone=True), nullable=True)
+    created_by = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
+
+    # Authentication resolves a key by its prefix
+    __table_args__ = (
+        Index("ix_application_api_keys_prefix", "key_prefix", unique=True),
+    )
+
+
+class FeatureUsageModel(BaseModel):
+    """SQLAlchemy model for FeatureUsage entity (one counter per period)."""
+
+    __tablename__ = "feature_usage"
+
+    organization_id = Column(
         UUID(as_uuid=True),
-        ForeignKey("plan_resource_features.id"),
+        ForeignKey("organizations.id"),
         nullable=False,
         index=True,
     )
-    usage_count = Column(Integer, default=0, nullable=False)
-    usage_date = Column(DateTime(timezone=True), nullable=False, index=True)
-    usage_details = Column(
-        JSON, nullable=False, default={}
-    )  # Detailed usage information
-    cost = Column(Numeric(10, 4), nullable=True)  # Cost associated with usage
+    feature_name = Column(String(100), nullable=False, index=True)
+    usage_period = Column(String(20), nullable=False)
+    period_start = Column(DateTime(timezone=True), nullable=False)
+    period_end = Column(DateTime(timezone=True), nullable=False)
+    current_usage = Column(Integer, default=0, nullable=False)
+    limit_value = Column(Integer, default=-1, nullable=False)  # -1 for unlimited
+    # "metadata" is reserved on declarative models
+    usage_metadata = Column("metadata", JSON, nullable=False, default={})
 
     # Indexes for efficient usage queries
     __table_args__ = (
-        Index("ix_usage_lookup", "application_instance_id", "feature_id", "usage_date"),
-        Index("ix_usage_by_date", "usage_date"),
-        Index("ix_usage_by_instance", "application_instance_id", "usage_date"),
+        # One counter per organization, feature and period
+        Index(
+            "ix_feature_usage_counter",
+            "organization_id",
+            "feature_name",
+            "usage_period",
+            "period_start",
+            unique=True,
+        ),
+        # Keyset scans of one period by the rollover job
+        Index("ix_feature_usage_period_id", "usage_period", "period_start", "id"),
     )
+
+
+class FeatureUsageEventModel(Base):
+    """SQLAlchemy model for the append-only feature usage event log.
+
+    Rows are kept deliberately narrow and carry no foreign keys so inserts stay
+    cheap. ``occurred_at`` is part of the primary key so the table can be range
+    partitioned by time without changing its keys.
+    """
+
+    __tablename__ = "feature_usage_events"
+
+    id = Column(BigInteger, Identity(), primary_key=True)
+    occurred_at = Column(DateTime(timezone=True), primary_key=True, nullable=False)
+    organization_id = Column(UUID(as_uuid=True), nullable=False)
+    feature_name = Column(String(100), nullable=False)
+    amount = Column(Integer, nullable=False)
+
+    __table_args__ = (
+        Index(
+            "ix_usage_event_org_feature_time",
+            "organization_id",
+            "feature_name",
+            "occurred_at",
+        ),
+    )
+
+
+class UsageRollupMixin:
+    """Columns shared by the usage rollup tables, keyed by bucket start."""
+
+    organization_id = Column(UUID(as_uuid=True), primary_key=True)
+    feature_name = Column(String(100), primary_key=True)
+    bucket_start = Column(DateTime(timezone=True), primary_key=True)
+    total_usage = Column(BigInteger, default=0, nullable=False)
+    event_count = Column(Integer, default=0, nullable=False)
+    updated_at = Column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+
+class FeatureUsageHourlyModel(UsageRollupMixin, Base):
+    """SQLAlchemy model for hourly usage rollups."""
+
+    __tablename__ = "feature_usage_hourly"
+
+
+class FeatureUsageDailyModel(UsageRollupMixin, Base):
+    """SQLAlchemy model for daily usage rollups."""
+
+    __tablename__ = "feature_usage_daily"
@@ -5,27 +5,56 @@ from sqlalchemy.orm import Session
 from plans.infrastructure.repositories.sqlalchemy_plan_repository import (
     SqlAlchemyPlanRepository,
 )
-from plans.infrastructure.repositories.sqlalchemy_plan_resource_repository import (
-    SqlAlchemyPlanResourceRepository,
-)
 from plans.infrastructure.repositories.sqlalchemy_subscription_repository import (
     SqlAlchemySubscriptionRepository,
 )
+from plans.infrastructure.repositories.sqlalchemy_usage_event_repository import (
+    SqlAlchemyUsageEventRepository,
+)
+from plans.infrastructure.repositories.sqlalchemy_feature_usage_repository import (
+    SqlAlchemyFeatureUsageRepository,
+)
+from plans.infrastructure.repositories.sqlalchemy_organization_plan_repository import (
+    SqlAlchemyOrganizationPlanRepository,
+)
+from plans.infrastructure.repositories.sqlalchemy_api_key_repository import (
+    SqlAlchemyApiKeyRepository,
+)
+from shared.infrastructure.repositories.sqlalchemy_job_checkpoint_repository import (
+    SqlAlchemyJobCheckpointRepository,
+)
 
 
 class PlansUnitOfWork(SQLAlchemyUnitOfWork):
-    _repositories = {}
-
     def __init__(self, session: Session, repositories: list[str]):
+        self._repositories = {}
+
         if "plan" in repositories:
             self._repositories.update({"plan": SqlAlchemyPlanRepository(session)})
-        if "plan_resource" in repositories:
-            self._repositories.update(
-                {"plan_resource": SqlAlchemyPlanResourceRepository(session)}
-            )
         if "subscription" in repositories:
             self._repositories.update(
                 {"subscription": SqlAlchemySubscriptionRepository(session)}
             )
+        if "feature_usage" in repositories:
+            self._repositories.update(
+                {"feature_usage": SqlAlchemyFeatureUsageRepository(session)}
+            )
+        if "usage_event" in repositories:
+            self._repositories.update(
+                {"usage_event": SqlAlchemyUsageEventRepository(session)}
+            )
+        if "organization_plan" in repositories:
+            self._repositories.update(
+                {"organization_plan": SqlAlchemyOrganizationPlanRepository(session)}
+            )
+        if "api_key" in repositories:
+            self._repositories.update({"api_key": SqlAlchemyApiKeyRepository(session)})
+        if "job_checkpoint" in repositories:
+            self._repositories.update(
+                {"job_checkpoint": SqlAlchemyJobCheckpointRepository(session)}
+            )
 
         super().__init__(session)
+
+    def get_repository(self, name):
+        return self._repositories.get(name)
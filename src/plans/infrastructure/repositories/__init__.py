@@ -2,10 +2,14 @@ from .sqlalchemy_plan_repository import SqlAlchemyPlanRepository
 from .sqlalchemy_subscription_repository import SqlAlchemySubscriptionRepository
 from .sqlalchemy_feature_usage_repository import SqlAlchemyFeatureUsageRepository
 from .sqlalchemy_organization_plan_repository import SqlAlchemyOrganizationPlanRepository
+from .sqlalchemy_usage_event_repository import SqlAlchemyUsageEventRepository
+from .sqlalchemy_api_key_repository import SqlAlchemyApiKeyRepository
 
 __all__ = [
     "SqlAlchemyPlanRepository",
     "SqlAlchemySubscriptionRepository",
     "SqlAlchemyFeatureUsageRepository",
     "SqlAlchemyOrganizationPlanRepository",
+    "SqlAlchemyUsageEventRepository",
+    "SqlAlchemyApiKeyRepository",
 ]
@@ -0,0 +1,200 @@
+from datetime import datetime, timezone
+from typing import List, Optional
+from uuid import UUID
+from sqlalchemy.orm import Session
+from sqlalchemy import select, update
+
+from ...domain.entities.api_key import ApiKey, ApiKeyPrincipal
+from ...domain.repositories.api_key_repository import ApiKeyRepository
+from ..database.models import (
+    ApiKeyModel,
+    ApplicationInstanceModel,
+    PlanResourceAssociationModel,
+    PlanResourceLimitConfigModel,
+    PlanResourceLimitModel,
+    SubscriptionModel,
+    SubscriptionStatusEnum,
+)
+
+# Subscriptions whose plan limits apply to the organization's instances
+_LIMIT_SUBSCRIPTION_STATUSES = [
+    SubscriptionStatusEnum.ACTIVE,
+    SubscriptionStatusEnum.TRIAL,
+]
+
+
+class SqlAlchemyApiKeyRepository(ApiKeyRepository):
+    """SQLAlchemy implementation of ApiKeyRepository."""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def save(self, api_key: ApiKey) -> ApiKey:
+        """Save an API key."""
+        existing = self.session.get(ApiKeyModel, api_key.id)
+
+        if existing:
+            existing.is_active = api_key.is_active
+            existing.expires_at = api_key.expires_at
+            existing.revoked_at = api_key.revoked_at
+            existing.updated_at = datetime.now(timezone.utc)
+            self.session.flush()
+            return self._to_domain_entity(existing)
+
+        model = ApiKeyModel(
+            id=api_key.id,
+            application_instance_id=api_key.application_instance_id,
+            key_type=api_key.key_type,
+            key_prefix=api_key.key_prefix,
+            key_digest=api_key.key_digest,
+            is_active=api_key.is_active,
+            expires_at=api_key.expires_at,
+            revoked_at=api_key.revoked_at,
+            created_by=api_key.created_by,
+            created_at=api_key.created_at,
+        )
+        self.session.add(model)
+        self.session.flush()
+        return self._to_domain_entity(model)
+
+    def get_by_id(self, key_id: UUID) -> Optional[ApiKey]:
+        """Get an API key by ID."""
+        model = self.session.get(ApiKeyModel, key_id)
+        return self._to_domain_entity(model) if model else None
+
+    def find_by_instance(
+        self, application_instance_id: UUID, active_only: bool = True
+    ) -> List[ApiKey]:
+        """Find the API keys of an application instance."""
+        stmt = select(ApiKeyModel).where(
+            ApiKeyModel.application_instance_id == application_instance_id
+        )
+        if active_only:
+            stmt = stmt.where(ApiKeyModel.is_active.is_(True))
+
+        models = self.session.execute(
+            stmt.order_by(ApiKeyModel.created_at.desc())
+        ).scalars()
+        return [self._to_domain_entity(model) for model in models]
+
+    def get_instance_organization_id(
+        self, application_instance_id: UUID
+    ) -> Optional[UUID]:
+        """Get the organization owning an application instance, None if unknown."""
+        return self.session.execute(
+            select(ApplicationInstanceModel.organization_id).where(
+                ApplicationInstanceModel.id == application_instance_id
+            )
+        ).scalar_one_or_none()
+
+    def resolve_principal(self, key_prefix: str) -> Optional[ApiKeyPrincipal]:
+        """Resolve a key prefix to its instance, organization and effective limits."""
+        # Limit configured by the organization's current plan for this resource
+        plan_limit_value = (
+            select(PlanResourceLimitConfigModel.limit_value)
+            .join(
+                PlanResourceAssociationModel,
+                PlanResourceAssociationModel.id
+                == PlanResourceLimitConfigModel.plan_resource_association_id,
+            )
+            .join(
+                SubscriptionModel,
+                SubscriptionModel.plan_id == PlanResourceAssociationModel.plan_id,
+            )
+            .where(
+                PlanResourceLimitConfigModel.limit_id == PlanResourceLimitModel.id,
+                PlanResourceAssociationModel.resource_id
+                == ApplicationInstanceModel.plan_resource_id,
+                SubscriptionModel.organization_id
+                == ApplicationInstanceModel.organization_id,
+                SubscriptionModel.status.in_(_LIMIT_SUBSCRIPTION_STATUSES),
+            )
+            .order_by(SubscriptionModel.starts_at.desc())
+            .limit(1)
+            .correlate(PlanResourceLimitModel, ApplicationInstanceModel)
+            .scalar_subquery()
+        )
+
+        # One row per resource limit (a single row when the resource has none)
+        rows = self.session.execute(
+            select(
+                ApiKeyModel,
+                ApplicationInstanceModel.organization_id,
+                ApplicationInstanceModel.is_active,
+                ApplicationInstanceModel.limits_override,
+                PlanResourceLimitModel.limit_key,
+                PlanResourceLimitModel.default_value,
+                plan_limit_value.label("plan_limit_value"),
+            )
+            .join(
+                ApplicationInstanceModel,
+                ApplicationInstanceModel.id == ApiKeyModel.application_instance_id,
+            )
+            .outerjoin(
+                PlanResourceLimitModel,
+                PlanResourceLimitModel.resource_id
+                == ApplicationInstanceModel.plan_resource_id,
+            )
+            .where(ApiKeyModel.key_prefix == key_prefix)
+        ).all()
+
+        if not rows:
+            return None
+
+        key, organization_id, instance_active, limits_override = rows[0][:4]
+
+        # Instance overrides win over the plan's value, which wins over the default
+        effective_limits = {}
+        for row in rows:
+            if row.limit_key is None:
+                continue
+            value = (
+                row.plan_limit_value
+                if row.plan_limit_value is not None
+                else row.default_value
+            )
+            if value is not None:
+                effective_limits[row.limit_key] = value
+        effective_limits.update(limits_override or {})
+
+        return ApiKeyPrincipal(
+            key_id=key.id,
+            key_type=key.key_type,
+            key_prefix=key.key_prefix,
+            key_digest=key.key_digest,
+            application_instance_id=key.application_instance_id,
+            organization_id=organization_id,
+            is_active=key.is_active and instance_active,
+            expires_at=key.expires_at,
+            effective_limits=effective_limits,
+        )
+
+    def revoke_instance_keys(self, application_instance_id: UUID) -> List[str]:
+        """Revoke every active key of an instance, returning their prefixes."""
+        now = datetime.now(timezone.utc)
+        result = self.session.execute(
+            update(ApiKeyModel)
+            .where(
+                ApiKeyModel.application_instance_id == application_instance_id,
+                ApiKeyModel.is_active.is_(True),
+            )
+            .values(is_active=False, revoked_at=now, updated_at=now)
+            .returning(ApiKeyModel.key_prefix)
+        )
+        return list(result.scalars())
+
+    def _to_domain_entity(self, model: ApiKeyModel) -> ApiKey:
+        """Convert SQLAlchemy model to domain entity."""
+        return ApiKey(
+            id=model.id,
+            application_instance_id=model.application_instance_id,
+            key_type=model.key_type,
+            key_prefix=model.key_prefix,
+            key_digest=model.key_digest,
+            is_active=model.is_active,
+            expires_at=model.expires_at,
+            revoked_at=model.revoked_at,
+            created_by=model.created_by,
+            created_at=model.created_at,
+            updated_at=model.updated_at,
+        )
@@ -2,7 +2,16 @@ from datetime import datetime, timedelta, timezone
 from typing import List, Optional, Dict, Any
 from uuid import UUID
 from sqlalchemy.orm import Session
-from sqlalchemy import select, update, delete, and_, func
+from sqlalchemy import (
+    select,
+    update,
+    delete,
+    and_,
+    func,
+    literal,
+    DateTime,
+)
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.exc import IntegrityError
 
 from ...domain.entities.feature_usage import FeatureUsage, UsagePeriod
@@ -24,7 +33,7 @@ class SqlAlchemyFeatureUsageRepository(FeatureUsageRepository):
             if existing:
                 existing.current_usage = feature_usage.current_usage
                 existing.limit_value = feature_usage.limit_value
-                existing.metadata = feature_usage.metadata
+                existing.usage_metadata = feature_usage.metadata
                 existing.updated_at = feature_usage.updated_at or datetime.now(timezone.utc)
                 self.session.flush()
                 return self._to_domain_entity(existing)
@@ -38,7 +47,7 @@ class SqlAlchemyFeatureUsageRepository(FeatureUsageRepository):
                     period_end=feature_usage.period_end,
                     current_usage=feature_usage.current_usage,
                     limit_value=feature_usage.limit_value,
-                    metadata=feature_usage.metadata,
+                    usage_metadata=feature_usage.metadata,
                     created_at=feature_usage.created_at,
                     updated_at=feature_usage.updated_at,
                 )
@@ -58,21 +67,27 @@ class SqlAlchemyFeatureUsageRepository(FeatureUsageRepository):
         self, organization_id: UUID, feature_name: str, period: UsagePeriod
     ) -> Optional[FeatureUsage]:
         """Get current usage for organization and feature."""
-        now = datetime.now(timezone.utc)
-        
-        result = self.session.execute(
+        usage_model = self._get_current_counter(organization_id, feature_name, period)
+        return self._to_domain_entity(usage_model) if usage_model else None
+
+    def _get_current_counter(
+        self, organization_id: UUID, feature_name: str, period: UsagePeriod
+    ) -> Optional[FeatureUsageModel]:
+        """Get the counter of the current period (at most one, by its unique key)."""
+        period_start, _ = FeatureUsage._calculate_period_boundaries(
+            datetime.now(timezone.utc), period
+        )
+
+        return self.session.execute(
             select(FeatureUsageModel).where(
                 and_(
                     FeatureUsageModel.organization_id == organization_id,
                     FeatureUsageModel.feature_name == feature_name,
                     FeatureUsageModel.usage_period == period.value,
-                    FeatureUsageModel.period_start <= now,
-                    FeatureUsageModel.period_end >= now,
+                    FeatureUsageModel.period_start == period_start,
                 )
             )
-        )
-        usage_model = result.scalar_one_or_none()
-        return self._to_domain_entity(usage_model) if usage_model else None
+        ).scalar_one_or_none()
 
     def get_organization_usage(
         self,
@@ -143,27 +158,19 @@ class SqlAlchemyFeatureUsageRepository(FeatureUsageRepository):
         feature_name: str,
         amount: int = 1,
         metadata: Optional[Dict[str, Any]] = None,
+        period: UsagePeriod = UsagePeriod.MONTHLY,
     ) -> FeatureUsage:
-        """Increment usage for organization and feature."""
+        """Increment the current period's usage for organization and feature."""
         now = datetime.now(timezone.utc)
         
         # Try to find existing current usage record
-        existing = self.session.execute(
-            select(FeatureUsageModel).where(
-                and_(
-                    FeatureUsageModel.organization_id == organization_id,
-                    FeatureUsageModel.feature_name == feature_name,
-                    FeatureUsageModel.period_start <= now,
-                    FeatureUsageModel.period_end >= now,
-                )
-            )
-        ).scalar_one_or_none()
+        existing = self._get_current_counter(organization_id, feature_name, period)
 
         if existing:
             # Update existing record
             existing.current_usage += amount
             if metadata:
-                existing.metadata.update(metadata)
+                existing.usage_metadata = {**existing.usage_metadata, **metadata}
             existing.updated_at = now
             self.session.flush()
             return self._to_domain_entity(existing)
@@ -174,9 +181,9 @@ class SqlAlchemyFeatureUsageRepository(FeatureUsageRepository):
     def reset_usage_for_period(
         self, organization_id: UUID, feature_name: str, period: UsagePeriod
     ) -> bool:
-        """Reset usage for new billing period."""
+        """Reset the current period's usage; past periods are kept as history."""
         now = datetime.now(timezone.utc)
-        period_start, period_end = FeatureUsage._calculate_period_boundaries(now, period)
+        period_start, _ = FeatureUsage._calculate_period_boundaries(now, period)
         
         result = self.session.execute(
             update(FeatureUsageModel)
@@ -185,15 +192,10 @@ class SqlAlchemyFeatureUsageRepository(FeatureUsageRepository):
                     FeatureUsageModel.organization_id == organization_id,
                     FeatureUsageModel.feature_name == feature_name,
                     FeatureUsageModel.usage_period == period.value,
+                    FeatureUsageModel.period_start == period_start,
                 )
             )
-            .values(
-                current_usage=0,
-                period_start=period_start,
-                period_end=period_end,
-                metadata={},
-                updated_at=now,
-            )
+            .values(current_usage=0, usage_metadata={}, updated_at=now)
         )
         
         return result.rowcount > 0
@@ -295,31 +297,74 @@ class SqlAlchemyFeatureUsageRepository(FeatureUsageRepository):
         
         return trends
 
-    def bulk_reset_monthly_usage(self) -> int:
-        """Reset monthly usage for all organizations at month end."""
-        now = datetime.now(timezone.utc)
-        
-        # Calculate new monthly period
-        period_start, period_end = FeatureUsage._calculate_period_boundaries(now, UsagePeriod.MONTHLY)
-        
+    def open_next_period_chunk(
+        self,
+        period: UsagePeriod,
+        period_start: datetime,
+        after_id: Optional[UUID] = None,
+        chunk_size: int = 500,
+    ) -> tuple[int, int, Optional[UUID]]:
+        """Open the period starting at period_start for a chunk of records."""
+        new_start, new_end = FeatureUsage._calculate_period_boundaries(period_start, period)
+        previous_start, _ = FeatureUsage._calculate_period_boundaries(
+            new_start - timedelta(microseconds=1), period
+        )
+
+        chunk_query = select(FeatureUsageModel.id).where(
+            and_(
+                FeatureUsageModel.usage_period == period.value,
+                FeatureUsageModel.period_start >= previous_start,
+                FeatureUsageModel.period_start < new_start,
+            )
+        )
+        if after_id:
+            chunk_query = chunk_query.where(FeatureUsageModel.id > after_id)
+
+        chunk_ids = self.session.execute(
+            chunk_query.order_by(FeatureUsageModel.id).limit(chunk_size)
+        ).scalars().all()
+
+        if not chunk_ids:
+            return 0, 0, None
+
+        source = select(
+            func.gen_random_uuid(),
+            FeatureUsageModel.organization_id,
+            FeatureUsageModel.feature_name,
+            FeatureUsageModel.usage_period,
+            literal(new_start, DateTime(timezone=True)),
+            literal(new_end, DateTime(timezone=True)),
+            literal(0),
+            FeatureUsageModel.limit_value,
+        ).where(FeatureUsageModel.id.in_(chunk_ids))
+
+        # Counters already opened (by a rerun or a first write) are left alone
         result = self.session.execute(
-            update(FeatureUsageModel)
-            .where(
-                and_(
-                    FeatureUsageModel.usage_period == UsagePeriod.MONTHLY.value,
-                    FeatureUsageModel.period_end < now,  # Only reset expired periods
-                )
+            postgresql.insert(FeatureUsageModel)
+            .from_select(
+                [
+                    "id",
+                    "organization_id",
+                    "feature_name",
+                    "usage_period",
+                    "period_start",
+                    "period_end",
+                    "current_usage",
+                    "limit_value",
+                ],
+                source,
             )
-            .values(
-                current_usage=0,
-                period_start=period_start,
-                period_end=period_end,
-                metadata={},
-                updated_at=now,
+            .on_conflict_do_nothing(
+                index_elements=[
+                    "organization_id",
+                    "feature_name",
+                    "usage_period",
+                    "period_start",
+                ]
             )
         )
-        
-        return result.rowcount
+
+        return len(chunk_ids), result.rowcount, chunk_ids[-1]
 
     def _to_domain_entity(self, usage_model: FeatureUsageModel) -> FeatureUsage:
         """Convert SQLAlchemy model to domain entity."""
@@ -332,7 +377,7 @@ class SqlAlchemyFeatureUsageRepository(FeatureUsageRepository):
             period_end=usage_model.period_end,
             current_usage=usage_model.current_usage,
             limit_value=usage_model.limit_value,
-            metadata=usage_model.metadata or {},
+            metadata=usage_model.usage_metadata or {},
             created_at=usage_model.created_at,
             updated_at=usage_model.updated_at,
         )
\ No newline at end of file
@@ -2,23 +2,46 @@ from datetime import datetime, timezone
 from typing import List, Optional
 from uuid import UUID
 from sqlalchemy.orm import Session
-from sqlalchemy import select, update, delete, and_, text
+from sqlalchemy import event, select, update, delete, and_, text
 from sqlalchemy.exc import IntegrityError
+from shared.infrastructure.database.search import TextSearch, count_capped
 
 from ...domain.entities.plan import Plan
 from ...domain.repositories.plan_repository import PlanRepository
+from ...domain.services.plan_catalog_cache import PlanCatalog, get_plan_catalog_cache
 from ...domain.value_objects.plan_name import PlanName
 from ...infrastructure.database.models import PlanModel, PlanTypeEnum
 
+# Session.info flag set by sessions that wrote plans in the open transaction
+_PLAN_WRITES_KEY = "plan_catalog_pending_writes"
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_plan_catalog_after_commit(session: Session) -> None:
+    if session.info.pop(_PLAN_WRITES_KEY, False):
+        get_plan_catalog_cache().invalidate()
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_plan_writes_after_rollback(session: Session) -> None:
+    session.info.pop(_PLAN_WRITES_KEY, None)
+
 
 class SqlAlchemyPlanRepository(PlanRepository):
-    """SQLAlchemy implementation of PlanRepository."""
+    """SQLAlchemy implementation of PlanRepository.
+
+    Lookups by id, name and type and plan listings are served from the
+    process-wide plan catalog cache. Once this repository wrote plans, its
+    reads go to the database until the transaction commits, so they see
+    the uncommitted changes.
+    """
 
     def __init__(self, session: Session):
         self.session = session
 
     def save(self, plan: Plan) -> Plan:
         """Save a plan entity."""
+        self._track_write()
         try:
             # Check if plan exists
             existing = self.session.get(PlanModel, plan.id)
@@ -66,6 +89,10 @@ class SqlAlchemyPlanRepository(PlanRepository):
 
     def find_by_id(self, plan_id: UUID) -> Optional[Plan]:
         """Find a plan by ID."""
+        catalog = self._catalog()
+        if catalog is not None:
+            return catalog.get(plan_id)
+
         result = self.session.execute(select(PlanModel).where(PlanModel.id == plan_id))
         plan_model = result.scalar_one_or_none()
 
@@ -75,6 +102,10 @@ class SqlAlchemyPlanRepository(PlanRepository):
 
     def find_by_name(self, name: PlanName) -> Optional[Plan]:
         """Find a plan by name."""
+        catalog = self._catalog()
+        if catalog is not None:
+            return catalog.get_by_name(name.value)
+
         result = self.session.execute(
             select(PlanModel).where(PlanModel.name == name.value)
         )
@@ -86,6 +117,10 @@ class SqlAlchemyPlanRepository(PlanRepository):
 
     def find_by_type(self, plan_type: str) -> List[Plan]:
         """Find plans by type."""
+        catalog = self._catalog()
+        if catalog is not None:
+            return catalog.filter(plan_type=plan_type, is_active=True)
+
         result = self.session.execute(
             select(PlanModel).where(
                 and_(
@@ -100,6 +135,10 @@ class SqlAlchemyPlanRepository(PlanRepository):
 
     def find_active_plans(self) -> List[Plan]:
         """Find all active plans."""
+        catalog = self._catalog()
+        if catalog is not None:
+            return catalog.filter(is_active=True)
+
         result = self.session.execute(select(PlanModel).where(PlanModel.is_active))
         plan_models = result.scalars().all()
 
@@ -113,23 +152,22 @@ class SqlAlchemyPlanRepository(PlanRepository):
         limit: int = 20,
     ) -> tuple[List[Plan], int]:
         """Find plans with pagination and filters."""
+        catalog = self._catalog()
+        if catalog is not None:
+            plans = catalog.filter(plan_type=plan_type, is_active=is_active)
+            return plans[offset : offset + limit], len(plans)
+
         query = select(PlanModel)
-        count_query = select(PlanModel)
 
         # Apply filters
         if plan_type:
             query = query.where(PlanModel.plan_type == PlanTypeEnum(plan_type))
-            count_query = count_query.where(
-                PlanModel.plan_type == PlanTypeEnum(plan_type)
-            )
 
         if is_active is not None:
             query = query.where(PlanModel.is_active == is_active)
-            count_query = count_query.where(PlanModel.is_active == is_active)
 
         # Get total count
-        total_result = self.session.execute(count_query)
-        total = len(total_result.scalars().all())
+        total = count_capped(self.session, query)
 
         # Get paginated results
         query = query.offset(offset).limit(limit).order_by(PlanModel.created_at.desc())
@@ -141,6 +179,7 @@ class SqlAlchemyPlanRepository(PlanRepository):
 
     def delete(self, plan_id: UUID) -> bool:
         """Delete a plan (hard delete)."""
+        self._track_write()
         result = self.session.execute(delete(PlanModel).where(PlanModel.id == plan_id))
         return result.rowcount > 0
 
@@ -175,6 +214,7 @@ class SqlAlchemyPlanRepository(PlanRepository):
         price_yearly: Optional[float] = None,
     ) -> bool:
         """Update plan pricing."""
+        self._track_write()
         update_values = {"updated_at": datetime.now(timezone.utc)}
 
         if price_monthly is not None:
@@ -198,15 +238,13 @@ class SqlAlchemyPlanRepository(PlanRepository):
     ) -> tuple[List[Plan], int]:
         """Search plans with filters."""
         db_query = select(PlanModel)
-        count_query = select(PlanModel)
+        search = (
+            TextSearch(query, PlanModel.name, PlanModel.description) if query else None
+        )
 
         # Apply text search
-        if query:
-            search_filter = PlanModel.name.ilike(
-                f"%{query}%"
-            ) | PlanModel.description.ilike(f"%{query}%")
-            db_query = db_query.where(search_filter)
-            count_query = count_query.where(search_filter)
+        if search:
+            db_query = db_query.where(search.condition())
 
         # Apply price filters
         if min_price is not None:
@@ -214,20 +252,19 @@ class SqlAlchemyPlanRepository(PlanRepository):
                 PlanModel.price_yearly >= min_price * 10
             )
             db_query = db_query.where(price_filter)
-            count_query = count_query.where(price_filter)
 
         if max_price is not None:
             price_filter = (PlanModel.price_monthly <= max_price) | (
                 PlanModel.price_yearly <= max_price * 10
             )
             db_query = db_query.where(price_filter)
-            count_query = count_query.where(price_filter)
 
         # Get total count
-        total_result = self.session.execute(count_query)
-        total = len(total_result.scalars().all())
+        total = count_capped(self.session, db_query)
 
-        # Get paginated results
+        # Get paginated results, most relevant first
+        if search:
+            db_query = search.ranked(db_query, self.session)
         db_query = (
             db_query.offset(offset).limit(limit).order_by(PlanModel.created_at.desc())
         )
@@ -237,6 +274,23 @@ class SqlAlchemyPlanRepository(PlanRepository):
         plans = [self._to_domain_entity(model) for model in plan_models]
         return plans, total
 
+    def preload_catalog(self) -> None:
+        """Load the plan catalog cache (startup warm-up)."""
+        get_plan_catalog_cache().preload(self._load_all_plans)
+
+    def _catalog(self) -> Optional[PlanCatalog]:
+        if self.session.info.get(_PLAN_WRITES_KEY):
+            return None
+        return get_plan_catalog_cache().get_catalog(self._load_all_plans)
+
+    def _load_all_plans(self) -> List[Plan]:
+        result = self.session.execute(select(PlanModel))
+        return [self._to_domain_entity(model) for model in result.scalars().all()]
+
+    def _track_write(self) -> None:
+        """Bypass the catalog until commit, then drop it for every reader."""
+        self.session.info[_PLAN_WRITES_KEY] = True
+
     def _to_domain_entity(self, plan_model: PlanModel) -> Plan:
         """Convert SQLAlchemy model to domain entity."""
         return Plan(
@@ -1,8 +1,8 @@
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import List, Optional
 from uuid import UUID
 from sqlalchemy.orm import Session
-from sqlalchemy import select, update, delete, and_
+from sqlalchemy import select, update, delete, and_, case, func, not_, true
 from sqlalchemy.exc import IntegrityError
 
 from ...domain.entities.subscription import (
@@ -18,6 +18,15 @@ from ...infrastructure.database.models import (
 )
 
 
+# Length of one renewal per billing cycle (matches OrganizationPlan.renew)
+BILLING_CYCLE_PERIODS = {
+    BillingCycleEnum.WEEKLY: timedelta(days=7),
+    BillingCycleEnum.MONTHLY: timedelta(days=30),
+    BillingCycleEnum.QUARTERLY: timedelta(days=90),
+    BillingCycleEnum.YEARLY: timedelta(days=365),
+}
+
+
 class SqlAlchemySubscriptionRepository(SubscriptionRepository):
     """SQLAlchemy implementation of SubscriptionRepository."""
 
@@ -326,6 +335,113 @@ class SqlAlchemySubscriptionRepository(SubscriptionRepository):
             "period_end": end_date,
         }
 
+    def renew_due_chunk(
+        self,
+        cutoff: datetime,
+        after_id: Optional[UUID] = None,
+        chunk_size: int = 500,
+    ) -> tuple[int, int, Optional[UUID]]:
+        """Renew a chunk of active auto-renewing subscriptions ended by cutoff."""
+        renews = self._renews_automatically()
+        chunk_ids = self._due_chunk_ids(
+            SubscriptionStatusEnum.ACTIVE, cutoff, renews, after_id, chunk_size
+        )
+        if not chunk_ids:
+            return 0, 0, None
+
+        new_ends_at = SubscriptionModel.ends_at + case(
+            BILLING_CYCLE_PERIODS,
+            value=SubscriptionModel.billing_cycle,
+            else_=BILLING_CYCLE_PERIODS[BillingCycleEnum.MONTHLY],
+        )
+        # The due conditions are checked again: a concurrent run that renewed
+        # the same rows first leaves them with ends_at past the cutoff
+        result = self.session.execute(
+            update(SubscriptionModel)
+            .where(
+                and_(
+                    SubscriptionModel.id.in_(chunk_ids),
+                    SubscriptionModel.status == SubscriptionStatusEnum.ACTIVE,
+                    SubscriptionModel.ends_at <= cutoff,
+                    renews,
+                )
+            )
+            .values(ends_at=new_ends_at, next_billing_date=new_ends_at)
+            .execution_options(synchronize_session=False)
+        )
+
+        return len(chunk_ids), result.rowcount, chunk_ids[-1]
+
+    def expire_due_chunk(
+        self,
+        status: SubscriptionStatus,
+        cutoff: datetime,
+        after_id: Optional[UUID] = None,
+        chunk_size: int = 500,
+    ) -> tuple[int, int, Optional[UUID]]:
+        """Expire a chunk of subscriptions in status that ended by cutoff."""
+        status_enum = SubscriptionStatusEnum(status.value)
+        condition = (
+            not_(self._renews_automatically())
+            if status_enum == SubscriptionStatusEnum.ACTIVE
+            else true()
+        )
+        chunk_ids = self._due_chunk_ids(
+            status_enum, cutoff, condition, after_id, chunk_size
+        )
+        if not chunk_ids:
+            return 0, 0, None
+
+        result = self.session.execute(
+            update(SubscriptionModel)
+            .where(
+                and_(
+                    SubscriptionModel.id.in_(chunk_ids),
+                    SubscriptionModel.status == status_enum,
+                    SubscriptionModel.ends_at <= cutoff,
+                    condition,
+                )
+            )
+            .values(status=SubscriptionStatusEnum.EXPIRED, next_billing_date=None)
+            .execution_options(synchronize_session=False)
+        )
+
+        return len(chunk_ids), result.rowcount, chunk_ids[-1]
+
+    def _due_chunk_ids(
+        self,
+        status: SubscriptionStatusEnum,
+        cutoff: datetime,
+        condition,
+        after_id: Optional[UUID],
+        chunk_size: int,
+    ) -> List[UUID]:
+        """Get the next ids, in id order, of subscriptions in status ended by cutoff."""
+        chunk_query = select(SubscriptionModel.id).where(
+            and_(
+                SubscriptionModel.status == status,
+                SubscriptionModel.ends_at <= cutoff,
+                condition,
+            )
+        )
+        if after_id:
+            chunk_query = chunk_query.where(SubscriptionModel.id > after_id)
+
+        return self.session.execute(
+            chunk_query.order_by(SubscriptionModel.id).limit(chunk_size)
+        ).scalars().all()
+
+    @staticmethod
+    def _renews_automatically():
+        """Not cancelled and auto_renew not switched off (it defaults to on)."""
+        return and_(
+            SubscriptionModel.cancelled_at.is_(None),
+            func.coalesce(
+                SubscriptionModel.subscription_metadata["auto_renew"].as_boolean(),
+                true(),
+            ),
+        )
+
     def _to_domain_entity(self, subscription_model: SubscriptionModel) -> Subscription:
         """Convert SQLAlchemy model to domain entity."""
         return Subscription(
@@ -0,0 +1,155 @@
+from datetime import datetime, timezone
+from typing import List, Optional
+from uuid import UUID
+from sqlalchemy.orm import Session
+from sqlalchemy import select, insert, delete, and_, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from ...domain.entities.feature_usage import FeatureUsage, UsagePeriod
+from ...domain.entities.usage_bucket import UsageBucket
+from ...domain.repositories.usage_event_repository import UsageEventRepository
+from ..database.models import (
+    FeatureUsageEventModel,
+    FeatureUsageHourlyModel,
+    FeatureUsageDailyModel,
+)
+
+
+class SqlAlchemyUsageEventRepository(UsageEventRepository):
+    """SQLAlchemy implementation of UsageEventRepository."""
+
+    _ROLLUP_MODELS = {
+        UsagePeriod.HOURLY: FeatureUsageHourlyModel,
+        UsagePeriod.DAILY: FeatureUsageDailyModel,
+    }
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def record_event(
+        self,
+        organization_id: UUID,
+        feature_name: str,
+        amount: int = 1,
+        occurred_at: Optional[datetime] = None,
+    ) -> None:
+        """Append a usage event and add it to its hourly and daily buckets."""
+        occurred_at = occurred_at or datetime.now(timezone.utc)
+
+        self.session.execute(
+            insert(FeatureUsageEventModel).values(
+                occurred_at=occurred_at,
+                organization_id=organization_id,
+                feature_name=feature_name,
+                amount=amount,
+            )
+        )
+
+        for granularity, model in self._ROLLUP_MODELS.items():
+            bucket_start, _ = FeatureUsage._calculate_period_boundaries(
+                occurred_at, granularity
+            )
+            stmt = pg_insert(model).values(
+                organization_id=organization_id,
+                feature_name=feature_name,
+                bucket_start=bucket_start,
+                total_usage=amount,
+                event_count=1,
+                updated_at=occurred_at,
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[
+                    model.organization_id,
+                    model.feature_name,
+                    model.bucket_start,
+                ],
+                set_={
+                    "total_usage": model.total_usage + stmt.excluded.total_usage,
+                    "event_count": model.event_count + 1,
+                    "updated_at": stmt.excluded.updated_at,
+                },
+            )
+            self.session.execute(stmt)
+
+        self.session.flush()
+
+    def get_buckets(
+        self,
+        organization_id: UUID,
+        feature_name: str,
+        granularity: UsagePeriod,
+        start: datetime,
+        end: datetime,
+    ) -> List[UsageBucket]:
+        """Get usage buckets within [start, end), newest first."""
+        model = self._ROLLUP_MODELS.get(granularity, FeatureUsageDailyModel)
+
+        result = self.session.execute(
+            select(model.bucket_start, model.total_usage, model.event_count)
+            .where(
+                and_(
+                    model.organization_id == organization_id,
+                    model.feature_name == feature_name,
+                    model.bucket_start >= start,
+                    model.bucket_start < end,
+                )
+            )
+            .order_by(model.bucket_start.desc())
+        )
+
+        # Coarser periods are folded from daily rows, which arrive newest
+        # first, so consecutive rows of the same period are adjacent.
+        buckets: List[UsageBucket] = []
+        for row in result.fetchall():
+            if buckets and buckets[-1].bucket_start <= row.bucket_start:
+                last = buckets[-1]
+                buckets[-1] = last.model_copy(
+                    update={
+                        "total_usage": last.total_usage + row.total_usage,
+                        "event_count": last.event_count + row.event_count,
+                    }
+                )
+            else:
+                buckets.append(
+                    UsageBucket.for_moment(
+                        organization_id=organization_id,
+                        feature_name=feature_name,
+                        granularity=granularity,
+                        moment=row.bucket_start,
+                        total_usage=row.total_usage,
+                        event_count=row.event_count,
+                    )
+                )
+
+        return buckets
+
+    def get_total_usage(
+        self,
+        organization_id: UUID,
+        feature_name: str,
+        start: datetime,
+        end: datetime,
+    ) -> int:
+        """Get total usage within [start, end) from daily rollups."""
+        total = self.session.execute(
+            select(func.coalesce(func.sum(FeatureUsageDailyModel.total_usage), 0)).where(
+                and_(
+                    FeatureUsageDailyModel.organization_id == organization_id,
+                    FeatureUsageDailyModel.feature_name == feature_name,
+                    FeatureUsageDailyModel.bucket_start >= start,
+                    FeatureUsageDailyModel.bucket_start < end,
+                )
+            )
+        ).scalar()
+
+        return int(total or 0)
+
+    def delete_events_before(self, cutoff: datetime) -> int:
+        """Delete raw events older than cutoff. Rollups are kept."""
+        result = self.session.execute(
+            delete(FeatureUsageEventModel).where(
+                FeatureUsageEventModel.occurred_at < cutoff
+            )
+        )
+
+        return result.rowcount
@@ -1,29 +1,34 @@
-from fastapi import Depends
+from fastapi import Depends, Header, HTTPException, status
 from sqlalchemy.orm import Session
 
-from shared.infrastructure.database.dependencies import get_db_session
+from shared.infrastructure.database.connection import get_db
 from plans.application.use_cases.plan_use_cases import PlanUseCase
 from plans.application.use_cases.subscription_use_cases import SubscriptionUseCase
-from plans.application.use_cases.plan_resource_use_cases import PlanResourceUseCase
 from plans.application.use_cases.feature_usage_use_cases import FeatureUsageUseCase
 from plans.application.use_cases.application_instance_use_cases import ApplicationInstanceUseCase
 from plans.application.use_cases.usage_tracking_use_cases import UsageTrackingUseCase
 from plans.application.use_cases.plan_resource_feature_use_cases import PlanResourceFeatureUseCase
 from plans.application.use_cases.plan_resource_limit_use_cases import PlanResourceLimitUseCase
+from plans.application.use_cases.chat_widget_use_cases import ChatWidgetUseCase
+from plans.application.jobs.usage_rollover_job import UsageRolloverJob
+from plans.domain.entities.api_key import ApiKeyPrincipal
+from plans.domain.services.api_key_service import ApiKeySecretMissingError
 from plans.infrastructure.plans_unit_of_work import PlansUnitOfWork
+from shared.infrastructure.database.connection import SessionLocal
 
 
-def get_plans_uow(db: Session = Depends(get_db_session)) -> PlansUnitOfWork:
+def get_plans_uow(db: Session = Depends(get_db)) -> PlansUnitOfWork:
     """Get a PlansUnitOfWork instance with all plan repositories."""
     return PlansUnitOfWork(db, [
         "plan", 
         "subscription", 
-        "plan_resource",
         "feature_usage",
+        "usage_event",
         "organization_plan",
         "application_instance",
         "plan_resource_feature",
-        "plan_resource_limit"
+        "plan_resource_limit",
+        "api_key"
     ])
 
 
@@ -39,13 +44,6 @@ def get_subscription_use_case(
     return SubscriptionUseCase(uow)
 
 
-def get_plan_resource_use_case(
-    uow: PlansUnitOfWork = Depends(get_plans_uow),
-) -> PlanResourceUseCase:
-    """Get PlanResourceUseCase with proper UnitOfWork dependency."""
-    return PlanResourceUseCase(uow)
-
-
 def get_feature_usage_use_case(
     uow: PlansUnitOfWork = Depends(get_plans_uow),
 ) -> FeatureUsageUseCase:
@@ -60,6 +58,25 @@ def get_application_instance_use_case(
     return ApplicationInstanceUseCase(uow)
 
 
+def require_api_key(
+    x_api_key: str = Header(..., alias="X-API-Key"),
+    use_case: ApplicationInstanceUseCase = Depends(get_application_instance_use_case),
+) -> ApiKeyPrincipal:
+    """Authenticate a machine caller by its application instance API key."""
+    try:
+        principal = use_case.authenticate_api_key(x_api_key)
+    except ApiKeySecretMissingError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e)
+        )
+    if principal is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or revoked API key",
+        )
+    return principal
+
+
 def get_usage_tracking_use_case(
     uow: PlansUnitOfWork = Depends(get_plans_uow),
 ) -> UsageTrackingUseCase:
@@ -79,3 +96,17 @@ def get_plan_resource_limit_use_case(
 ) -> PlanResourceLimitUseCase:
     """Get PlanResourceLimitUseCase with proper UnitOfWork dependency."""
     return PlanResourceLimitUseCase(uow)
+
+
+def get_chat_widget_use_case(
+    uow: PlansUnitOfWork = Depends(get_plans_uow),
+) -> ChatWidgetUseCase:
+    """Get ChatWidgetUseCase with proper UnitOfWork dependency."""
+    return ChatWidgetUseCase(uow)
+
+
+def get_usage_rollover_job() -> UsageRolloverJob:
+    """Get UsageRolloverJob; every chunk runs in its own session and transaction."""
+    return UsageRolloverJob(
+        lambda: PlansUnitOfWork(SessionLocal(), ["feature_usage", "job_checkpoint"])
+    )
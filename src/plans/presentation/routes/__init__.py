@@ -1,19 +1,19 @@
 from .plan_routes import router as plan_router
 from .subscription_routes import router as subscription_router
-from .plan_resource_routes import router as plan_resource_router
 from .feature_usage_routes import router as feature_usage_router
 from .application_instance_routes import router as application_instance_router
 from .usage_tracking_routes import router as usage_tracking_router
 from .plan_resource_feature_routes import router as plan_resource_feature_router
 from .plan_resource_limit_routes import router as plan_resource_limit_router
+from .chat_widget_routes import router as chat_widget_router
 
 __all__ = [
     "plan_router",
     "subscription_router", 
-    "plan_resource_router",
     "feature_usage_router",
     "application_instance_router",
     "usage_tracking_router",
     "plan_resource_feature_router",
     "plan_resource_limit_router",
+    "chat_widget_router",
 ]
@@ -2,12 +2,34 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from typing import Optional, Dict, Any, List
 from uuid import UUID
 
-from ..dependencies import get_application_instance_use_case
+from src.iam.presentation.auth_dependencies import JWTAuthenticationContext, get_jwt_auth_context
+from ..dependencies import get_application_instance_use_case, require_api_key
+from ...domain.entities.api_key import ApiKeyPrincipal
+from ...domain.services.api_key_service import ApiKeySecretMissingError
 from ...application.use_cases.application_instance_use_cases import ApplicationInstanceUseCase
 
 router = APIRouter(prefix="/application-instances", tags=["Application Instances"])
 
 
+def _require_instance_access(
+    instance_id: UUID,
+    auth_context: JWTAuthenticationContext,
+    use_case: ApplicationInstanceUseCase,
+) -> None:
+    """Only members of the organization owning an instance manage its API keys."""
+    organization_id = use_case.get_instance_organization_id(instance_id)
+    if organization_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Application instance not found",
+        )
+    if organization_id != auth_context.organization_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied to this application instance",
+        )
+
+
 @router.post("/provision", status_code=status.HTTP_201_CREATED)
 def provision_instance(
     plan_resource_id: UUID,
@@ -71,13 +93,72 @@ def generate_api_keys(
     instance_id: UUID,
     key_types: List[str],
     use_case: ApplicationInstanceUseCase = Depends(get_application_instance_use_case),
+    auth_context: JWTAuthenticationContext = Depends(get_jwt_auth_context),
 ):
     """Generate API keys for an instance."""
+    _require_instance_access(instance_id, auth_context, use_case)
     try:
         return use_case.generate_api_keys(
             instance_id=instance_id,
             key_types=key_types,
+            created_by=auth_context.user_id,
         )
+    except ApiKeySecretMissingError as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.get("/{instance_id}/api-keys")
+def list_api_keys(
+    instance_id: UUID,
+    active_only: bool = Query(True, description="Only list active keys"),
+    use_case: ApplicationInstanceUseCase = Depends(get_application_instance_use_case),
+    auth_context: JWTAuthenticationContext = Depends(get_jwt_auth_context),
+):
+    """List the API keys of an instance (without their secrets)."""
+    _require_instance_access(instance_id, auth_context, use_case)
+    try:
+        return use_case.list_api_keys(instance_id=instance_id, active_only=active_only)
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.delete("/{instance_id}/api-keys")
+def revoke_instance_api_keys(
+    instance_id: UUID,
+    use_case: ApplicationInstanceUseCase = Depends(get_application_instance_use_case),
+    auth_context: JWTAuthenticationContext = Depends(get_jwt_auth_context),
+):
+    """Revoke every active API key of an instance."""
+    _require_instance_access(instance_id, auth_context, use_case)
+    try:
+        return use_case.revoke_instance_api_keys(instance_id)
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.get("/api-keys/verify")
+def verify_api_key(principal: ApiKeyPrincipal = Depends(require_api_key)):
+    """Verify the presented API key and return what it authenticates as."""
+    return principal.model_dump(mode="json", exclude={"key_digest"})
+
+
+@router.delete("/api-keys/{key_id}")
+def revoke_api_key(
+    key_id: UUID,
+    use_case: ApplicationInstanceUseCase = Depends(get_application_instance_use_case),
+    auth_context: JWTAuthenticationContext = Depends(get_jwt_auth_context),
+):
+    """Revoke an API key."""
+    instance_id = use_case.get_api_key_instance_id(key_id)
+    if instance_id is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="API key not found")
+    _require_instance_access(instance_id, auth_context, use_case)
+    try:
+        return use_case.revoke_api_key(key_id)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
@@ -0,0 +1,61 @@
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
+from typing import Optional
+from uuid import UUID
+
+from shared.infrastructure.config import settings
+from ..dependencies import get_chat_widget_use_case
+from ...application.use_cases.chat_widget_use_cases import ChatWidgetUseCase
+from ...domain.value_objects.chat_widget_render import ChatWidgetRender
+
+router = APIRouter(prefix="/chat-widget", tags=["Chat Widget"])
+
+
+def _get_widget(use_case: ChatWidgetUseCase, organization_id: UUID) -> ChatWidgetRender:
+    widget = use_case.get_widget(organization_id)
+    if not widget:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Chat widget not available for this organization",
+        )
+    return widget
+
+
+def _widget_response(
+    widget: ChatWidgetRender,
+    content: str,
+    media_type: str,
+    if_none_match: Optional[str],
+) -> Response:
+    # Browsers and CDNs revalidate with If-None-Match once max-age passes
+    headers = {
+        "ETag": widget.etag,
+        "Cache-Control": f"public, max-age={settings.chat_widget_max_age_seconds}",
+    }
+    if widget.matches_etag(if_none_match):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return Response(content=content, media_type=media_type, headers=headers)
+
+
+@router.get("/{organization_id}/config")
+def get_chat_widget_config(
+    organization_id: UUID,
+    if_none_match: Optional[str] = Header(None, alias="If-None-Match"),
+    use_case: ChatWidgetUseCase = Depends(get_chat_widget_use_case),
+):
+    """Get the client-side configuration of an organization's chat widget."""
+    widget = _get_widget(use_case, organization_id)
+    return _widget_response(
+        widget, widget.client_config_json, "application/json", if_none_match
+    )
+
+
+@router.get("/{organization_id}/embed")
+def get_chat_widget_embed(
+    organization_id: UUID,
+    if_none_match: Optional[str] = Header(None, alias="If-None-Match"),
+    use_case: ChatWidgetUseCase = Depends(get_chat_widget_use_case),
+):
+    """Get the iframe embed code of an organization's chat widget."""
+    widget = _get_widget(use_case, organization_id)
+    return _widget_response(widget, widget.embed_html, "text/html", if_none_match)
@@ -104,6 +104,31 @@ def get_usage_analytics(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
+@router.get("/organizations/{organization_id}/buckets/{feature_name}")
+def get_usage_buckets(
+    organization_id: UUID,
+    feature_name: str,
+    granularity: str = Query("daily", description="Bucket size: hourly, daily, weekly, monthly, yearly"),
+    start_date: Optional[datetime] = Query(None, description="Start of the range (defaults to 30 days ago)"),
+    end_date: Optional[datetime] = Query(None, description="End of the range (defaults to now)"),
+    use_case: FeatureUsageUseCase = Depends(get_feature_usage_use_case),
+):
+    """Get pre-aggregated usage buckets for a feature."""
+    try:
+        from ...domain.entities.feature_usage import UsagePeriod
+        granularity_enum = UsagePeriod(granularity.lower())
+
+        return use_case.get_usage_buckets(
+            organization_id=organization_id,
+            feature_name=feature_name,
+            granularity=granularity_enum,
+            start=start_date,
+            end=end_date,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
 @router.get("/organizations/{organization_id}/history")
 def get_feature_usage_history(
     organization_id: UUID,
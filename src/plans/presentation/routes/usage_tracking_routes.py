@@ -1,9 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
 from typing import Optional, Dict, Any
 from uuid import UUID
 from datetime import datetime
 
-from ..dependencies import get_usage_tracking_use_case
+from ..dependencies import get_usage_tracking_use_case, get_usage_rollover_job
+from ...application.jobs.usage_rollover_job import UsageRolloverJob
 from ...application.use_cases.usage_tracking_use_cases import UsageTrackingUseCase
 
 router = APIRouter(prefix="/usage-tracking", tags=["Usage Tracking"])
@@ -78,13 +79,31 @@ def generate_usage_report(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
-@router.post("/monthly-reset/bulk")
+@router.post("/monthly-reset/bulk", status_code=status.HTTP_202_ACCEPTED)
 def reset_monthly_usage_bulk(
-    use_case: UsageTrackingUseCase = Depends(get_usage_tracking_use_case),
+    background_tasks: BackgroundTasks,
+    job: UsageRolloverJob = Depends(get_usage_rollover_job),
+):
+    """Start the chunked monthly usage rollover (scheduled operation).
+
+    The rollover runs after the response is sent; poll the status endpoint
+    for progress. Prefer the ``usage-rollover`` command for scheduled runs.
+    """
+    background_tasks.add_task(job.run)
+    return {
+        "accepted": True,
+        "operation": "usage_period_rollover",
+        "checkpoint": job.get_status(),
+    }
+
+
+@router.get("/monthly-reset/status")
+def get_monthly_reset_status(
+    job: UsageRolloverJob = Depends(get_usage_rollover_job),
 ):
-    """Reset monthly usage for all organizations (scheduled operation)."""
+    """Get progress of the latest monthly usage rollover."""
     try:
-        return use_case.reset_monthly_usage_bulk()
+        return {"checkpoint": job.get_status()}
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
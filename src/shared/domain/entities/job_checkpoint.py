@@ -0,0 +1,78 @@
+from datetime import datetime
+from typing import Optional, Dict, Any
+from pydantic import BaseModel
+
+
+class JobCheckpoint(BaseModel):
+    """Progress marker for a resumable background job run.
+
+    ``run_key`` identifies the unit of work being processed (for example the
+    billing period being rolled over) and ``cursor`` is the last key processed
+    within it, so an interrupted run resumes after that key.
+    """
+
+    job_name: str
+    run_key: str
+    cursor: Optional[str] = None
+    processed: int = 0
+    affected: int = 0
+    is_completed: bool = False
+    details: Dict[str, Any] = {}
+    started_at: datetime
+    updated_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+
+    model_config = {"frozen": True}
+
+    @classmethod
+    def start(cls, job_name: str, run_key: str) -> "JobCheckpoint":
+        return cls(job_name=job_name, run_key=run_key, started_at=datetime.utcnow())
+
+    def advance(
+        self,
+        cursor: Optional[str],
+        processed: int,
+        affected: int = 0,
+        details: Optional[Dict[str, Any]] = None,
+    ) -> "JobCheckpoint":
+        """Record a processed chunk."""
+        return self.model_copy(
+            update={
+                "cursor": cursor,
+                "processed": self.processed + processed,
+                "affected": self.affected + affected,
+                "details": {**self.details, **(details or {})},
+                "updated_at": datetime.utcnow(),
+            }
+        )
+
+    def complete(self, details: Optional[Dict[str, Any]] = None) -> "JobCheckpoint":
+        """Mark the run as finished."""
+        now = datetime.utcnow()
+        return self.model_copy(
+            update={
+                "is_completed": True,
+                "details": {**self.details, **(details or {})},
+                "updated_at": now,
+                "completed_at": now,
+            }
+        )
+
+    def is_for_run(self, run_key: str) -> bool:
+        return self.run_key == run_key
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "job_name": self.job_name,
+            "run_key": self.run_key,
+            "cursor": self.cursor,
+            "processed": self.processed,
+            "affected": self.affected,
+            "is_completed": self.is_completed,
+            "details": self.details,
+            "started_at": self.started_at.isoformat(),
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+            "completed_at": self.completed_at.isoformat()
+            if self.completed_at
+            else None,
+        }
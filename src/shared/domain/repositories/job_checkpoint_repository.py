@@ -0,0 +1,18 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from shared.domain.entities.job_checkpoint import JobCheckpoint
+
+
+class JobCheckpointRepository(ABC):
+    """Stores the latest checkpoint of each background job."""
+
+    @abstractmethod
+    def get(self, job_name: str) -> Optional[JobCheckpoint]:
+        """Get the latest checkpoint for a job."""
+        pass
+
+    @abstractmethod
+    def save(self, checkpoint: JobCheckpoint) -> JobCheckpoint:
+        """Create or replace the checkpoint for a job."""
+        pass
@@ -3,7 +3,8 @@ from typing import Any
 
 
 class UnitOfWork(ABC):
-    _repositories: dict[str, Any] = {}
+    # Per instance: repositories are bound to the instance's session
+    _repositories: dict[str, Any]
 
     @abstractmethod
     def __enter__(self) -> "UnitOfWork":
@@ -31,11 +31,68 @@ class Settings(BaseSettings):
     jwt_algorithm: str = Field(default="RS256", env="JWT_ALGORITHM")
     jwt_expiration_minutes: int = Field(default=15, env="JWT_EXPIRATION_MINUTES")
     jwt_refresh_expiration_hours: int = Field(default=24, env="JWT_REFRESH_EXPIRATION_HOURS")
+    # "embedded" puts permissions and roles in the token, "compact" only the user's identity
+    jwt_claims_mode: str = Field(default="embedded", env="JWT_CLAIMS_MODE")
+    # Compact claims are cached per process: bounds how long other processes' changes go unseen
+    role_set_cache_ttl_seconds: int = Field(default=300, env="ROLE_SET_CACHE_TTL_SECONDS")
+    plan_catalog_cache_ttl_seconds: int = Field(default=300, env="PLAN_CATALOG_CACHE_TTL_SECONDS")
+    feature_config_cache_ttl_seconds: int = Field(default=300, env="FEATURE_CONFIG_CACHE_TTL_SECONDS")
+    
+    # Chat widget bootstrap settings (rendered once per config version, revalidated by ETag)
+    chat_widget_url: str = Field(default="/chat/widget", env="CHAT_WIDGET_URL")
+    chat_widget_cache_ttl_seconds: int = Field(default=30, env="CHAT_WIDGET_CACHE_TTL_SECONDS")
+    chat_widget_max_age_seconds: int = Field(default=60, env="CHAT_WIDGET_MAX_AGE_SECONDS")
     
     # Session settings (for backward compatibility with existing sessions)
     session_expiration_hours: int = Field(default=24, env="SESSION_EXPIRATION_HOURS")
     session_remember_me_hours: int = Field(default=720, env="SESSION_REMEMBER_ME_HOURS")  # 30 days
     
+    # Startup settings: "create_all" creates missing tables, "verify" only checks
+    # the database is at the alembic head revision, "skip" does neither
+    startup_schema_mode: str = Field(default="create_all", env="STARTUP_SCHEMA_MODE")
+    startup_warmup: bool = Field(default=False, env="STARTUP_WARMUP")
+    
+    # Response serialization: dump DTOs straight to JSON bytes (orjson for dicts)
+    fast_serialization: bool = Field(default=False, env="FAST_SERIALIZATION")
+    
+    # API key settings (required: digests are keyed with API_KEY_SECRET, never the JWT secret)
+    api_key_secret: Optional[str] = Field(default=None, env="API_KEY_SECRET")
+    
+    # Onboarding worker settings (workflows are queued and run by workers)
+    onboarding_workers: int = Field(default=4, env="ONBOARDING_WORKERS")
+    onboarding_poll_interval_seconds: float = Field(default=1.0, env="ONBOARDING_POLL_INTERVAL_SECONDS")
+    onboarding_max_attempts: int = Field(default=5, env="ONBOARDING_MAX_ATTEMPTS")
+    onboarding_retry_backoff_seconds: float = Field(default=30.0, env="ONBOARDING_RETRY_BACKOFF_SECONDS")
+    onboarding_lease_seconds: int = Field(default=300, env="ONBOARDING_LEASE_SECONDS")
+    # Bulk onboarding: tenants written per set-based insert transaction
+    onboarding_bulk_batch_size: int = Field(default=100, env="ONBOARDING_BULK_BATCH_SIZE")
+    onboarding_bulk_max_tenants: int = Field(default=1000, env="ONBOARDING_BULK_MAX_TENANTS")
+    
+    # Subscription lifecycle settings (renewals and expirations run off the request path)
+    subscription_lifecycle_scheduler: bool = Field(default=False, env="SUBSCRIPTION_LIFECYCLE_SCHEDULER")
+    subscription_lifecycle_interval_seconds: int = Field(default=3600, env="SUBSCRIPTION_LIFECYCLE_INTERVAL_SECONDS")
+    subscription_lifecycle_chunk_size: int = Field(default=500, env="SUBSCRIPTION_LIFECYCLE_CHUNK_SIZE")
+    
+    # Expired records reaper (deletes expired sessions and role assignments after retention)
+    expired_records_reaper: bool = Field(default=False, env="EXPIRED_RECORDS_REAPER")
+    reaper_interval_seconds: int = Field(default=3600, env="REAPER_INTERVAL_SECONDS")
+    session_retention_days: int = Field(default=7, env="SESSION_RETENTION_DAYS")
+    role_assignment_retention_days: int = Field(default=30, env="ROLE_ASSIGNMENT_RETENTION_DAYS")
+    reaper_chunk_size: int = Field(default=1000, env="REAPER_CHUNK_SIZE")
+    reaper_pause_seconds: float = Field(default=0.1, env="REAPER_PAUSE_SECONDS")
+    
+    # Search settings (totals stop counting at this many matches, 0 for exact)
+    search_count_cap: int = Field(default=10000, env="SEARCH_COUNT_CAP")
+    
+    # Query instrumentation settings
+    query_stats_headers: bool = Field(default=False, env="QUERY_STATS_HEADERS")
+    query_repeat_threshold: int = Field(default=5, env="QUERY_REPEAT_THRESHOLD")
+    
+    # Metrics settings (/internal/metrics requires this bearer token when set,
+    # and without a token it is only served when explicitly enabled)
+    metrics_token: Optional[str] = Field(default=None, env="METRICS_TOKEN")
+    metrics_enabled: bool = Field(default=False, env="METRICS_ENABLED")
+    
     @validator("jwt_secret_key")
     def validate_jwt_secret_key(cls, v: str) -> str:
         """Validate JWT secret key is set for production."""
@@ -54,6 +111,22 @@ class Settings(BaseSettings):
             raise ValueError(f"JWT algorithm must be one of: {supported_algorithms}")
         return v
     
+    @validator("jwt_claims_mode")
+    def validate_jwt_claims_mode(cls, v: str) -> str:
+        """Validate JWT claims mode is supported."""
+        supported_modes = ["embedded", "compact"]
+        if v not in supported_modes:
+            raise ValueError(f"JWT claims mode must be one of: {supported_modes}")
+        return v
+    
+    @validator("startup_schema_mode")
+    def validate_startup_schema_mode(cls, v: str) -> str:
+        """Validate startup schema mode is supported."""
+        supported_modes = ["create_all", "verify", "skip"]
+        if v not in supported_modes:
+            raise ValueError(f"Startup schema mode must be one of: {supported_modes}")
+        return v
+    
     @property
     def jwt_expiration_delta(self) -> timedelta:
         """Get JWT expiration as timedelta (short-lived for security)."""
@@ -1,9 +1,11 @@
 import os
-from sqlalchemy import create_engine, MetaData
+from sqlalchemy import DDL, create_engine, event, MetaData
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from dotenv import load_dotenv
 
+from .query_stats import instrument_engine
+
 load_dotenv()
 
 DATABASE_URL = os.getenv(
@@ -13,11 +15,19 @@ DATABASE_URL = os.getenv(
 SCHEMA_NAME = "contas"
 
 engine = create_engine(DATABASE_URL)
+instrument_engine(engine)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 # Create Base with schema support
 Base = declarative_base(metadata=MetaData(schema=SCHEMA_NAME))
 
+# Trigram search indexes (see search.py) need the extension on PostgreSQL
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
+
 
 def get_db():
     """Legacy dependency - use get_unit_of_work instead for new code."""
@@ -0,0 +1,20 @@
+from sqlalchemy import Column, String, Integer, Boolean, DateTime
+from sqlalchemy.dialects.postgresql import JSON
+
+from src.shared.infrastructure.database.base import BaseModel
+
+
+class JobCheckpointModel(BaseModel):
+    """SQLAlchemy model for JobCheckpoint - one row per background job."""
+
+    __tablename__ = "job_checkpoints"
+
+    job_name = Column(String(100), nullable=False, unique=True, index=True)
+    run_key = Column(String(100), nullable=False)
+    cursor = Column(String(255), nullable=True)
+    processed = Column(Integer, default=0, nullable=False)
+    affected = Column(Integer, default=0, nullable=False)
+    is_completed = Column(Boolean, default=False, nullable=False)
+    details = Column(JSON, nullable=False, default={})
+    started_at = Column(DateTime(timezone=True), nullable=False)
+    completed_at = Column(DateTime(timezone=True), nullable=True)
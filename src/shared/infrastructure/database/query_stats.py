@@ -0,0 +1,142 @@
+"""Per-request SQL statement counting built on SQLAlchemy cursor events."""
+
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Statements repeated at least this many times in one scope look like N+1
+DEFAULT_REPEAT_THRESHOLD = 5
+
+_WHITESPACE = re.compile(r"\s+")
+# IN lists and multi-row VALUES differ only in their number of placeholders
+_PLACEHOLDER_LIST = re.compile(
+    r"\(\s*(?:\?|%\([^)]+\)s|%s|:\w+)(?:\s*,\s*(?:\?|%\([^)]+\)s|%s|:\w+))+\s*\)"
+)
+_NUMBERED_PARAM = re.compile(r"(%\(\w+?)_\d+(\)s)")
+
+_current_stats: ContextVar[Optional["QueryStats"]] = ContextVar(
+    "query_stats", default=None
+)
+_instrumented_engines = set()
+
+
+class QueryBudgetExceededError(AssertionError):
+    """Raised when a tracked scope issues more statements than its budget."""
+
+
+class QueryStats:
+    """Statements issued within one tracked scope (usually one request)."""
+
+    __slots__ = ("count", "duration", "_fingerprints")
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self._fingerprints: Counter = Counter()
+
+    @property
+    def duration_ms(self) -> float:
+        return self.duration * 1000
+
+    def record(self, statement: str, duration: float) -> None:
+        self.count += 1
+        self.duration += duration
+        self._fingerprints[fingerprint(statement)] += 1
+
+    def get_repeated_statements(
+        self, threshold: int = DEFAULT_REPEAT_THRESHOLD
+    ) -> List[Tuple[str, int]]:
+        """Get statement fingerprints issued at least ``threshold`` times."""
+        return [
+            (statement, count)
+            for statement, count in self._fingerprints.most_common()
+            if count >= threshold
+        ]
+
+    def to_dict(self, threshold: int = DEFAULT_REPEAT_THRESHOLD) -> Dict[str, Any]:
+        return {
+            "db_query_count": self.count,
+            "db_time_ms": round(self.duration_ms, 2),
+            "db_repeated_statements": [
+                {"statement": statement, "count": count}
+                for statement, count in self.get_repeated_statements(threshold)
+            ],
+        }
+
+
+def fingerprint(statement: str) -> str:
+    """Normalize a statement so calls differing only in parameters group together."""
+    statement = _WHITESPACE.sub(" ", statement).strip()
+    statement = _NUMBERED_PARAM.sub(r"\1\2", statement)
+    return _PLACEHOLDER_LIST.sub("(?)", statement)
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Record the statements of an engine into the active QueryStats, if any.
+
+    Safe to call more than once. With no tracked scope active the listeners
+    only read a context variable.
+    """
+    if engine in _instrumented_engines:
+        return
+
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    _instrumented_engines.add(engine)
+
+
+def get_current_query_stats() -> Optional[QueryStats]:
+    """Get the stats of the active tracked scope."""
+    return _current_stats.get()
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Track the statements issued within the block.
+
+    The stats object is shared with tasks and threadpool workers started
+    inside the block, which inherit the context.
+    """
+    stats = QueryStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+@contextmanager
+def assert_max_queries(budget: int) -> Iterator[QueryStats]:
+    """Fail with QueryBudgetExceededError if the block issues over ``budget`` statements."""
+    with track_queries() as stats:
+        yield stats
+
+    if stats.count > budget:
+        repeated = ", ".join(
+            f"{count}x {statement[:120]}"
+            for statement, count in stats.get_repeated_statements(threshold=2)
+        )
+        raise QueryBudgetExceededError(
+            f"Expected at most {budget} queries, got {stats.count}"
+            + (f" (repeated: {repeated})" if repeated else "")
+        )
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current_stats.get() is not None:
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current_stats.get()
+    start_times = conn.info.get("query_start_time")
+    if stats is None or not start_times:
+        return
+
+    stats.record(statement, time.perf_counter() - start_times.pop())
@@ -0,0 +1,66 @@
+"""Startup check that the database is at the alembic head revision."""
+
+import os
+from typing import Optional, Set
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import DBAPIError
+
+from .connection import SCHEMA_NAME
+
+# Repository root (holds alembic.ini and the alembic/ scripts)
+PROJECT_ROOT = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "..", "..", "..")
+)
+
+
+class SchemaRevisionError(RuntimeError):
+    """Raised when the database is not at the alembic head revision."""
+
+
+def get_head_revisions(script_location: Optional[str] = None) -> Set[str]:
+    """Get the head revisions of the migration scripts (no database access)."""
+    from alembic.config import Config
+    from alembic.script import ScriptDirectory
+
+    config = Config()
+    config.set_main_option(
+        "script_location", script_location or os.path.join(PROJECT_ROOT, "alembic")
+    )
+    return set(ScriptDirectory.from_config(config).get_heads())
+
+
+def get_current_revisions(engine: Engine, schema: str = SCHEMA_NAME) -> Set[str]:
+    """Get the revisions stamped in the database's alembic_version table."""
+    try:
+        with engine.connect() as connection:
+            rows = connection.execute(
+                text(f"SELECT version_num FROM {schema}.alembic_version")
+            )
+            return {row[0] for row in rows}
+    except DBAPIError as exc:
+        # A missing version table reads as an unmigrated database
+        if "alembic_version" in str(exc.orig):
+            return set()
+        raise
+
+
+def verify_schema_revision(
+    engine: Engine, script_location: Optional[str] = None
+) -> Set[str]:
+    """Check that the database is at the head revision, without reflecting tables.
+
+    Returns the head revisions; raises SchemaRevisionError when the database
+    is behind, ahead or was never migrated.
+    """
+    heads = get_head_revisions(script_location)
+    current = get_current_revisions(engine)
+
+    if current != heads:
+        raise SchemaRevisionError(
+            f"Database revision {sorted(current) or 'none'} does not match "
+            f"migration head {sorted(heads)}; run 'alembic upgrade head'"
+        )
+
+    return heads
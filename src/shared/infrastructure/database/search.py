@@ -0,0 +1,102 @@
+"""Text search over indexed columns, with relevance ordering and capped counts.
+
+On PostgreSQL the searched columns carry ``pg_trgm`` GIN indexes (see
+``trigram_index``), which serve ``ILIKE '%term%'`` without a sequential
+scan and rank matches by trigram similarity. Other dialects (SQLite in
+tests) get plain indexes and a simpler exact/prefix ranking.
+"""
+
+from typing import Optional
+
+from sqlalchemy import Column, Index, case, func, literal_column, select
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import ColumnElement, Select
+
+from shared.infrastructure.config import settings
+
+LIKE_ESCAPE = "\\"
+
+
+def escape_like(term: str) -> str:
+    """Escape LIKE wildcards so the term is matched literally."""
+    return (
+        term.replace(LIKE_ESCAPE, LIKE_ESCAPE * 2)
+        .replace("%", f"{LIKE_ESCAPE}%")
+        .replace("_", f"{LIKE_ESCAPE}_")
+    )
+
+
+def trigram_index(name: str, column: str) -> Index:
+    """Index a text column for substring search.
+
+    A GIN ``gin_trgm_ops`` index on PostgreSQL; other dialects ignore the
+    PostgreSQL options and create a plain index.
+    """
+    return Index(
+        name,
+        column,
+        postgresql_using="gin",
+        postgresql_ops={column: "gin_trgm_ops"},
+    )
+
+
+class TextSearch:
+    """Case-insensitive substring search of one term over some columns."""
+
+    def __init__(self, term: str, *columns: Column):
+        self.term = term.strip()
+        self.columns = columns
+        self._escaped = escape_like(self.term)
+
+    def condition(self) -> ColumnElement:
+        """Rows where any of the columns contains the term."""
+        pattern = f"%{self._escaped}%"
+        conditions = [column.ilike(pattern, escape=LIKE_ESCAPE) for column in self.columns]
+        condition = conditions[0]
+        for other in conditions[1:]:
+            condition = condition | other
+        return condition
+
+    def relevance(self, dialect_name: str) -> ColumnElement:
+        """Score of a row for the term, higher is more relevant."""
+        if dialect_name == "postgresql":
+            return func.greatest(
+                *[func.similarity(column, self.term) for column in self.columns]
+            )
+
+        prefix = f"{self._escaped}%"
+        return case(
+            *[
+                (func.lower(column) == self.term.lower(), 2)
+                for column in self.columns
+            ],
+            *[
+                (column.ilike(prefix, escape=LIKE_ESCAPE), 1)
+                for column in self.columns
+            ],
+            else_=0,
+        )
+
+    def ranked(self, stmt: Select, session: Session) -> Select:
+        """Order a statement by relevance (before any other ordering)."""
+        dialect_name = session.get_bind().dialect.name
+        return stmt.order_by(self.relevance(dialect_name).desc())
+
+
+def count_capped(session: Session, stmt: Select, cap: Optional[int] = None) -> int:
+    """Count the rows of a statement, stopping at ``cap``.
+
+    Counting stops once ``cap`` rows matched (``settings.search_count_cap``
+    by default, 0 for an exact count), so broad searches over large
+    tables do not scan every match just to report a total.
+    """
+    if cap is None:
+        cap = settings.search_count_cap
+
+    rows = stmt.order_by(None).with_only_columns(
+        literal_column("1"), maintain_column_froms=True
+    )
+    if cap:
+        rows = rows.limit(cap)
+
+    return session.execute(select(func.count()).select_from(rows.subquery())).scalar_one()
@@ -0,0 +1,23 @@
+"""Metrics module."""
+
+from .registry import (
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+    get_metrics_registry,
+    set_metrics_registry,
+)
+from .http_metrics import HttpMetrics, get_http_metrics, set_http_metrics
+
+__all__ = [
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "MetricsRegistry",
+    "get_metrics_registry",
+    "set_metrics_registry",
+    "HttpMetrics",
+    "get_http_metrics",
+    "set_http_metrics",
+]
@@ -0,0 +1,80 @@
+"""Per-route HTTP request metrics."""
+
+from typing import Any, Dict, Optional, Tuple
+
+from .registry import MetricsRegistry, get_metrics_registry
+
+# Label for requests that matched no route, so unknown paths stay one series
+UNMATCHED_ROUTE = "unmatched"
+
+
+class RouteMetrics:
+    """Metric children of one (method, route template), bound once."""
+
+    __slots__ = ("_latency", "_requests", "_method", "_route", "_by_status")
+
+    def __init__(self, http_metrics: "HttpMetrics", method: str, route: str):
+        self._latency = http_metrics.latency.labels(method, route)
+        self._requests = http_metrics.requests
+        self._method = method
+        self._route = route
+        self._by_status: Dict[int, Any] = {}
+
+    def observe(self, duration: float, status_code: int) -> None:
+        self._latency.observe(duration)
+
+        counter = self._by_status.get(status_code)
+        if counter is None:
+            counter = self._requests.labels(self._method, self._route, status_code)
+            self._by_status[status_code] = counter
+        counter.inc()
+
+
+class HttpMetrics:
+    """Latency histograms, status counters and in-flight requests per route."""
+
+    def __init__(self, registry: MetricsRegistry):
+        self.latency = registry.histogram(
+            "http_request_duration_seconds",
+            "HTTP request latency by route template.",
+            ("method", "route"),
+        )
+        self.requests = registry.counter(
+            "http_requests_total",
+            "HTTP requests by route template and status code.",
+            ("method", "route", "status"),
+        )
+        self.in_flight = registry.gauge(
+            "http_requests_in_flight", "HTTP requests being processed."
+        ).labels()
+        self._routes: Dict[Tuple[str, str], RouteMetrics] = {}
+
+    def get_route_metrics(self, method: str, route: Optional[Any]) -> RouteMetrics:
+        """Get the bound metrics of a matched route (the Starlette route object)."""
+        # Starlette routes are unhashable; their path is the route template
+        key = (method, getattr(route, "path", None) or UNMATCHED_ROUTE)
+        route_metrics = self._routes.get(key)
+        if route_metrics is None:
+            route_metrics = RouteMetrics(self, *key)
+            self._routes[key] = route_metrics
+        return route_metrics
+
+
+# Global instance shared by all requests in this process
+_http_metrics_instance: Optional[HttpMetrics] = None
+
+
+def get_http_metrics() -> HttpMetrics:
+    """Get the global HTTP metrics instance."""
+    global _http_metrics_instance
+
+    if _http_metrics_instance is None:
+        _http_metrics_instance = HttpMetrics(get_metrics_registry())
+
+    return _http_metrics_instance
+
+
+def set_http_metrics(http_metrics: HttpMetrics) -> None:
+    """Set a custom HTTP metrics instance (useful for testing)."""
+    global _http_metrics_instance
+    _http_metrics_instance = http_metrics
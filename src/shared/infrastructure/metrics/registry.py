@@ -0,0 +1,264 @@
+"""Dependency-free metrics registry rendered in the Prometheus text format."""
+
+import math
+import threading
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+# Prometheus client defaults, in seconds
+DEFAULT_LATENCY_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 7.5, 10.0,
+)
+
+
+def _format_labels(label_names: Sequence[str], label_values: Sequence[str]) -> str:
+    if not label_names:
+        return ""
+
+    pairs = ",".join(
+        '{}="{}"'.format(
+            name,
+            str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"'),
+        )
+        for name, value in zip(label_names, label_values)
+    )
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric(ABC):
+    """Base metric with label children created once and then reused."""
+
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._children: Dict[Tuple[str, ...], Any] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *label_values: str):
+        """Get the child for the label values; callers should keep it bound."""
+        key = tuple(str(value) for value in label_values)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    @abstractmethod
+    def _new_child(self):
+        """Create the child holding one label combination's value."""
+
+    def render(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+        for label_values, child in list(self._children.items()):
+            lines.extend(self._render_child(label_values, child))
+        return lines
+
+    def _render_child(self, label_values, child) -> List[str]:
+        labels = _format_labels(self.label_names, label_values)
+        return [f"{self.name}{labels} {_format_value(child.value)}"]
+
+
+class _CounterChild:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+
+class _GaugeChild(_CounterChild):
+    __slots__ = ()
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.value -= amount
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+
+class _HistogramChild:
+    __slots__ = ("_upper_bounds", "bucket_counts", "sum", "count")
+
+    def __init__(self, upper_bounds: Tuple[float, ...]):
+        self._upper_bounds = upper_bounds
+        self.bucket_counts = [0] * len(upper_bounds)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        # Buckets are stored non-cumulative and summed up when rendered
+        self.bucket_counts[bisect_left(self._upper_bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class Counter(_Metric):
+    """Monotonically increasing value."""
+
+    type_name = "counter"
+
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild()
+
+
+class Gauge(_Metric):
+    """Value that can go up and down."""
+
+    type_name = "gauge"
+
+    def _new_child(self) -> _GaugeChild:
+        return _GaugeChild()
+
+
+class Histogram(_Metric):
+    """Distribution of observed values over fixed buckets."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ):
+        super().__init__(name, documentation, label_names)
+        self._upper_bounds = tuple(sorted(buckets)) + (math.inf,)
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self._upper_bounds)
+
+    def _render_child(self, label_values, child: _HistogramChild) -> List[str]:
+        bucket_label_names = self.label_names + ("le",)
+        lines = []
+        cumulative = 0
+        for upper_bound, bucket_count in zip(self._upper_bounds, child.bucket_counts):
+            cumulative += bucket_count
+            labels = _format_labels(
+                bucket_label_names, label_values + (_format_value(upper_bound),)
+            )
+            lines.append(f"{self.name}_bucket{labels} {cumulative}")
+
+        labels = _format_labels(self.label_names, label_values)
+        lines.append(f"{self.name}_sum{labels} {_format_value(child.sum)}")
+        lines.append(f"{self.name}_count{labels} {child.count}")
+        return lines
+
+
+class MetricsRegistry:
+    """Metrics of this process plus stats collected when rendered.
+
+    Collectors return a dict of stats (for example a cache's
+    ``get_cache_info()``); numeric and boolean fields are rendered as gauges
+    labeled with the field name.
+    """
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: Dict[
+            str, List[Tuple[str, Dict[str, str], Callable[[], Dict[str, Any]]]]
+        ] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, documentation: str, label_names=()) -> Counter:
+        return self._register(Counter(name, documentation, label_names))
+
+    def gauge(self, name: str, documentation: str, label_names=()) -> Gauge:
+        return self._register(Gauge(name, documentation, label_names))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        label_names=(),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, label_names, buckets))
+
+    def register_collector(
+        self,
+        name: str,
+        documentation: str,
+        collect: Callable[[], Dict[str, Any]],
+        labels: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """Register stats collected at render time under a gauge family."""
+        with self._lock:
+            self._collectors.setdefault(name, []).append(
+                (documentation, labels or {}, collect)
+            )
+
+    def get_metric(self, name: str) -> Optional[_Metric]:
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """Render every metric and collector in the Prometheus text format."""
+        lines: List[str] = []
+        for metric in list(self._metrics.values()):
+            lines.extend(metric.render())
+
+        for name, collectors in list(self._collectors.items()):
+            lines.append(f"# HELP {name} {collectors[0][0]}")
+            lines.append(f"# TYPE {name} gauge")
+            for _, labels, collect in collectors:
+                try:
+                    stats = collect()
+                except Exception:
+                    continue
+
+                for field, value in stats.items():
+                    if not isinstance(value, (int, float)):
+                        continue
+                    label_names = tuple(labels) + ("field",)
+                    label_values = tuple(labels.values()) + (field,)
+                    lines.append(
+                        f"{name}{_format_labels(label_names, label_values)} "
+                        f"{_format_value(value)}"
+                    )
+
+        return "\n".join(lines) + "\n"
+
+    def _register(self, metric: _Metric):
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+
+# Global instance shared by all requests in this process
+_metrics_registry_instance: Optional[MetricsRegistry] = None
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """Get the global metrics registry instance."""
+    global _metrics_registry_instance
+
+    if _metrics_registry_instance is None:
+        _metrics_registry_instance = MetricsRegistry()
+
+    return _metrics_registry_instance
+
+
+def set_metrics_registry(registry: MetricsRegistry) -> None:
+    """Set a custom metrics registry instance (useful for testing)."""
+    global _metrics_registry_instance
+    _metrics_registry_instance = registry
@@ -0,0 +1,63 @@
+from typing import Optional
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from shared.domain.entities.job_checkpoint import JobCheckpoint
+from shared.domain.repositories.job_checkpoint_repository import (
+    JobCheckpointRepository,
+)
+from shared.infrastructure.database.models import JobCheckpointModel
+
+
+class SqlAlchemyJobCheckpointRepository(JobCheckpointRepository):
+    """SQLAlchemy implementation of JobCheckpointRepository."""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def get(self, job_name: str) -> Optional[JobCheckpoint]:
+        """Get the latest checkpoint for a job."""
+        model = self.session.execute(
+            select(JobCheckpointModel).where(JobCheckpointModel.job_name == job_name)
+        ).scalar_one_or_none()
+        return self._to_domain_entity(model) if model else None
+
+    def save(self, checkpoint: JobCheckpoint) -> JobCheckpoint:
+        """Create or replace the checkpoint for a job."""
+        model = self.session.execute(
+            select(JobCheckpointModel).where(
+                JobCheckpointModel.job_name == checkpoint.job_name
+            )
+        ).scalar_one_or_none()
+
+        if not model:
+            model = JobCheckpointModel(job_name=checkpoint.job_name)
+            self.session.add(model)
+
+        model.run_key = checkpoint.run_key
+        model.cursor = checkpoint.cursor
+        model.processed = checkpoint.processed
+        model.affected = checkpoint.affected
+        model.is_completed = checkpoint.is_completed
+        model.details = checkpoint.details
+        model.started_at = checkpoint.started_at
+        model.updated_at = checkpoint.updated_at
+        model.completed_at = checkpoint.completed_at
+
+        self.session.flush()
+        return self._to_domain_entity(model)
+
+    def _to_domain_entity(self, model: JobCheckpointModel) -> JobCheckpoint:
+        """Convert SQLAlchemy model to domain entity."""
+        return JobCheckpoint(
+            job_name=model.job_name,
+            run_key=model.run_key,
+            cursor=model.cursor,
+            processed=model.processed,
+            affected=model.affected,
+            is_completed=model.is_completed,
+            details=model.details or {},
+            started_at=model.started_at,
+            updated_at=model.updated_at,
+            completed_at=model.completed_at,
+        )
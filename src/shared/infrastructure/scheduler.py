@@ -0,0 +1,137 @@
+"""In-process scheduler running background jobs at fixed intervals."""
+
+import logging
+import threading
+import time
+from typing import Callable, Dict, Any, List, Optional
+
+logger = logging.getLogger(__name__)
+
+ScheduledJob = Callable[[], Any]
+
+
+class JobScheduler:
+    """Named jobs run every ``interval_seconds`` on one background thread.
+
+    Jobs run one at a time, so a slow run delays the others instead of
+    overlapping with itself. A failing run is logged and retried at the next
+    interval; jobs keep their own progress (e.g. checkpoints), so the retry
+    resumes where the failed run stopped.
+    """
+
+    def __init__(self, tick_seconds: float = 1.0):
+        self._tick_seconds = tick_seconds
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def register(
+        self, name: str, job: ScheduledJob, interval_seconds: float, run_at_start: bool = True
+    ) -> None:
+        """Register a job; a job with the same name is replaced."""
+        with self._lock:
+            self._jobs[name] = {
+                "job": job,
+                "interval_seconds": interval_seconds,
+                "next_run_at": time.monotonic()
+                if run_at_start
+                else time.monotonic() + interval_seconds,
+                "last_status": None,
+                "last_duration_ms": None,
+                "runs": 0,
+            }
+
+    def start(self) -> None:
+        """Start the scheduler thread."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="job-scheduler", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the scheduler once the running job finishes."""
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout)
+        self._thread = None
+
+    def run_pending(self) -> List[str]:
+        """Run the jobs that are due; returns their names."""
+        now = time.monotonic()
+        with self._lock:
+            due = [name for name, entry in self._jobs.items() if entry["next_run_at"] <= now]
+
+        for name in due:
+            self.run_job(name)
+        return due
+
+    def run_job(self, name: str) -> str:
+        """Run a job now and schedule its next run; returns ok or failed."""
+        entry = self._jobs[name]
+        start = time.perf_counter()
+        try:
+            entry["job"]()
+            status = "ok"
+        except Exception:
+            logger.exception("Scheduled job %s failed", name)
+            status = "failed"
+
+        duration_ms = round((time.perf_counter() - start) * 1000, 2)
+        with self._lock:
+            entry["next_run_at"] = time.monotonic() + entry["interval_seconds"]
+            entry["last_status"] = status
+            entry["last_duration_ms"] = duration_ms
+            entry["runs"] += 1
+        logger.info("Scheduled job %s: %s in %.2fms", name, status, duration_ms)
+        return status
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def get_status(self) -> Dict[str, Dict[str, Any]]:
+        """Get the interval and last outcome of every job."""
+        with self._lock:
+            return {
+                name: {
+                    "interval_seconds": entry["interval_seconds"],
+                    "last_status": entry["last_status"],
+                    "last_duration_ms": entry["last_duration_ms"],
+                    "runs": entry["runs"],
+                }
+                for name, entry in self._jobs.items()
+            }
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            self.run_pending()
+            self._stop_event.wait(self._tick_seconds)
+
+
+# Global instance shared by the application in this process
+_job_scheduler_instance: Optional[JobScheduler] = None
+
+
+def get_job_scheduler() -> JobScheduler:
+    """Get the global job scheduler instance."""
+    global _job_scheduler_instance
+
+    if _job_scheduler_instance is None:
+        _job_scheduler_instance = JobScheduler()
+
+    return _job_scheduler_instance
+
+
+def set_job_scheduler(scheduler: JobScheduler) -> None:
+    """Set a custom job scheduler instance (useful for testing)."""
+    global _job_scheduler_instance
+    _job_scheduler_instance = scheduler
+
+
+def register_scheduled_job(
+    name: str, job: ScheduledJob, interval_seconds: float, run_at_start: bool = True
+) -> None:
+    """Register a job in the global job scheduler."""
+    get_job_scheduler().register(name, job, interval_seconds, run_at_start)
@@ -0,0 +1,83 @@
+"""Warm-up hooks run at startup to preload per-process caches."""
+
+import logging
+import threading
+import time
+from typing import Callable, Dict, Any, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+WarmupHook = Callable[[], Any]
+
+
+class WarmupRegistry:
+    """Named warm-up hooks, run in registration order.
+
+    A failing hook is logged and skipped: a cold cache only costs latency on
+    the first requests, so it must not keep the application from starting.
+    """
+
+    def __init__(self):
+        self._hooks: List[Tuple[str, WarmupHook]] = []
+        self._results: Dict[str, Dict[str, Any]] = {}
+        self._ready = threading.Event()
+
+    def register(self, name: str, hook: WarmupHook) -> None:
+        """Register a hook; a hook with the same name is replaced."""
+        self._hooks = [(n, h) for n, h in self._hooks if n != name]
+        self._hooks.append((name, hook))
+
+    def run(self) -> Dict[str, Dict[str, Any]]:
+        """Run every hook and mark the process ready."""
+        for name, hook in self._hooks:
+            start = time.perf_counter()
+            try:
+                hook()
+                status = "ok"
+            except Exception:
+                logger.exception("Warm-up hook %s failed", name)
+                status = "failed"
+
+            duration_ms = round((time.perf_counter() - start) * 1000, 2)
+            self._results[name] = {"status": status, "duration_ms": duration_ms}
+            logger.info("Warm-up hook %s: %s in %.2fms", name, status, duration_ms)
+
+        self.mark_ready()
+        return dict(self._results)
+
+    def mark_ready(self) -> None:
+        """Mark startup as complete (readiness passes from now on)."""
+        self._ready.set()
+
+    @property
+    def is_ready(self) -> bool:
+        return self._ready.is_set()
+
+    def get_results(self) -> Dict[str, Dict[str, Any]]:
+        """Get the status and duration of the hooks that ran."""
+        return dict(self._results)
+
+
+# Global instance shared by the application in this process
+_warmup_registry_instance: Optional[WarmupRegistry] = None
+
+
+def get_warmup_registry() -> WarmupRegistry:
+    """Get the global warm-up registry instance."""
+    global _warmup_registry_instance
+
+    if _warmup_registry_instance is None:
+        _warmup_registry_instance = WarmupRegistry()
+
+    return _warmup_registry_instance
+
+
+def set_warmup_registry(registry: WarmupRegistry) -> None:
+    """Set a custom warm-up registry instance (useful for testing)."""
+    global _warmup_registry_instance
+    _warmup_registry_instance = registry
+
+
+def register_warmup_hook(name: str, hook: WarmupHook) -> None:
+    """Register a hook in the global warm-up registry."""
+    get_warmup_registry().register(name, hook)
@@ -0,0 +1,228 @@
+"""Fast JSON serialization for API responses."""
+
+import asyncio
+import dataclasses
+import functools
+import json
+import typing
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Callable, Optional, Tuple, Type
+from uuid import UUID
+
+from fastapi import FastAPI
+from fastapi.dependencies.models import Dependant
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute, request_response
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import PydanticSerializationError
+from starlette.responses import Response
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+# orjson is not a declared dependency: without it dicts go through the json module
+ORJSON_AVAILABLE = orjson is not None
+
+# Status codes whose responses must not carry a body
+_NO_BODY_STATUS_CODES = {204, 304}
+
+
+def _default(value: Any) -> Any:
+    """Encode the types orjson/json do not handle natively, as jsonable_encoder does."""
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json", by_alias=True)
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, Decimal):
+        return int(value) if value.as_tuple().exponent >= 0 else float(value)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    if isinstance(value, bytes):
+        return value.decode()
+    if dataclasses.is_dataclass(value):
+        return dataclasses.asdict(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    """Serialize content to JSON bytes, with native UUID and datetime handling."""
+    if orjson is not None:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+    return json.dumps(
+        content,
+        default=_default,
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered with orjson (falls back to the json module)."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def _uses_response_param(dependant: Dependant) -> bool:
+    """Whether the endpoint or a dependency sets headers through a Response parameter."""
+    if dependant.response_param_name:
+        return True
+    return any(_uses_response_param(dep) for dep in dependant.dependencies)
+
+
+def _model_types(response_model: Any) -> Optional[Tuple[Type[BaseModel], bool]]:
+    """Get (model, is_list) for ``Model`` and ``List[Model]`` response models."""
+    if isinstance(response_model, type) and issubclass(response_model, BaseModel):
+        return response_model, False
+
+    if typing.get_origin(response_model) is list:
+        (item,) = typing.get_args(response_model) or (None,)
+        if isinstance(item, type) and issubclass(item, BaseModel):
+            return item, True
+
+    return None
+
+
+def _is_free_form(response_model: Any) -> bool:
+    """Whether the response model does not constrain the payload (dict, Dict[str, Any])."""
+    if response_model is dict or response_model is Any:
+        return True
+    if typing.get_origin(response_model) is dict:
+        return typing.get_args(response_model)[1:] == (Any,)
+    return False
+
+
+def _build_serializer(route: APIRoute) -> Optional[Callable[[Any], Optional[bytes]]]:
+    """Get a serializer for the route's results, None if the route is not eligible.
+
+    The serializer returns None for results it cannot take, which then go
+    through FastAPI's regular validation and encoding. Output matches what
+    FastAPI would send: pydantic's JSON mode for typed routes, and
+    ``jsonable_encoder`` conventions for routes without a response model.
+    """
+    if route.response_model is None:
+
+        def serialize_untyped(result: Any) -> Optional[bytes]:
+            if not isinstance(result, (dict, list)):
+                return None
+            try:
+                return dumps(result)
+            except TypeError:
+                # e.g. non-string keys without orjson: leave it to jsonable_encoder
+                return None
+
+        return serialize_untyped
+
+    model_types = _model_types(route.response_model)
+    free_form = _is_free_form(route.response_model)
+    if model_types is None and not free_form:
+        return None
+
+    adapter = TypeAdapter(route.response_model)
+    options = {
+        "include": route.response_model_include,
+        "exclude": route.response_model_exclude,
+        "by_alias": route.response_model_by_alias,
+        "exclude_unset": route.response_model_exclude_unset,
+        "exclude_defaults": route.response_model_exclude_defaults,
+        "exclude_none": route.response_model_exclude_none,
+    }
+
+    def accepts(result: Any) -> bool:
+        if free_form:
+            return isinstance(result, dict)
+
+        # Exact types only: FastAPI filters subclass instances down to the
+        # declared model, which this path would not do
+        model, is_list = model_types
+        if is_list:
+            return isinstance(result, list) and all(
+                type(item) is model for item in result
+            )
+        return type(result) is model
+
+    def serialize_typed(result: Any) -> Optional[bytes]:
+        if not accepts(result):
+            return None
+        try:
+            return adapter.dump_json(result, **options)
+        except PydanticSerializationError:
+            return None
+
+    return serialize_typed
+
+
+def _wrap_endpoint(call: Callable, serializer: Callable, status_code: int) -> Callable:
+    def to_response(result: Any) -> Any:
+        if isinstance(result, Response):
+            return result
+        body = serializer(result)
+        if body is None:
+            return result
+        return Response(body, status_code=status_code, media_type="application/json")
+
+    if asyncio.iscoroutinefunction(call):
+
+        @functools.wraps(call)
+        async def async_endpoint(**values: Any) -> Any:
+            return to_response(await call(**values))
+
+        return async_endpoint
+
+    @functools.wraps(call)
+    def endpoint(**values: Any) -> Any:
+        return to_response(call(**values))
+
+    return endpoint
+
+
+def install_fast_serialization(app: FastAPI) -> int:
+    """Serialize route results directly to JSON bytes, skipping re-validation.
+
+    Must run after every router is included. A route returning an instance
+    of its ``response_model`` (or a list of them, or a dict for free-form
+    models) is dumped by pydantic's JSON serializer without being validated
+    and encoded again; routes without a response model have their dicts and
+    lists dumped with orjson instead of going through ``jsonable_encoder``.
+
+    Routes with a Response parameter, a non-JSON response class or a
+    bodiless status code are left untouched. Returns the number of routes
+    installed.
+    """
+    installed = 0
+
+    for route in app.routes:
+        if not isinstance(route, APIRoute) or getattr(route, "_fast_serialization", False):
+            continue
+
+        response_class = getattr(route.response_class, "value", route.response_class)
+        status_code = route.status_code or 200
+        if (
+            not issubclass(response_class, JSONResponse)
+            or status_code in _NO_BODY_STATUS_CODES
+            or _uses_response_param(route.dependant)
+        ):
+            continue
+
+        serializer = _build_serializer(route)
+        if serializer is None:
+            continue
+
+        route.dependant.call = _wrap_endpoint(
+            route.dependant.call, serializer, status_code
+        )
+        route.app = request_response(route.get_route_handler())
+        route._fast_serialization = True
+        installed += 1
+
+    return installed
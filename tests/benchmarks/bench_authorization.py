@@ -0,0 +1,254 @@
+"""Authorization engine benchmarks over synthetic multi-tenant datasets.
+
+Run from the project root (no network needed, SQLite in memory by default):
+
+    python -m tests.benchmarks.bench_authorization --scales small medium \\
+        --output benchmark-results.json
+
+Results are JSON (one entry per benchmark and scale) tagged with the current
+commit, so runs from different commits can be diffed.
+"""
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy.orm import Session
+
+from src.iam.domain.entities.evaluation_context import EvaluationContext
+from src.iam.domain.services.abac_service import ABACService
+from src.iam.domain.services.authorization_service import AuthorizationService
+from src.iam.domain.services.policy_evaluation_service import PolicyEvaluationService
+from src.iam.domain.services.policy_index import PolicyIndex
+from src.iam.domain.services.rbac_service import RBACService
+from src.iam.infrastructure.repositories.sqlalchemy_effective_user_permission_repository import (
+    SqlAlchemyEffectiveUserPermissionRepository,
+)
+from src.iam.infrastructure.repositories.sqlalchemy_permission_repository import (
+    SqlAlchemyPermissionRepository,
+)
+from src.iam.infrastructure.repositories.sqlalchemy_policy_repository import (
+    SqlAlchemyPolicyRepository,
+)
+from src.iam.infrastructure.repositories.sqlalchemy_role_repository import (
+    SqlAlchemyRoleRepository,
+)
+from tests.benchmarks.dataset import (
+    ACTIONS,
+    SCALES,
+    SUBJECT_ATTRIBUTES,
+    SyntheticDataset,
+    build_dataset,
+    create_benchmark_engine,
+)
+
+RESULTS_FORMAT_VERSION = 1
+
+
+def measure(
+    name: str, operation: Callable[[int], object], iterations: int, warmup: int
+) -> Dict:
+    """Time ``operation(i)`` per iteration and summarize the latencies."""
+    for index in range(warmup):
+        operation(index)
+
+    samples = []
+    for index in range(iterations):
+        start = time.perf_counter()
+        operation(index)
+        samples.append(time.perf_counter() - start)
+
+    samples.sort()
+    total = sum(samples)
+    return {
+        "name": name,
+        "iterations": iterations,
+        "mean_ms": round(statistics.fmean(samples) * 1000, 4),
+        "p50_ms": round(_percentile(samples, 0.50) * 1000, 4),
+        "p95_ms": round(_percentile(samples, 0.95) * 1000, 4),
+        "p99_ms": round(_percentile(samples, 0.99) * 1000, 4),
+        "ops_per_sec": round(iterations / total, 1) if total else None,
+    }
+
+
+def _percentile(sorted_samples: List[float], quantile: float) -> float:
+    index = min(len(sorted_samples) - 1, int(round(quantile * (len(sorted_samples) - 1))))
+    return sorted_samples[index]
+
+
+def _build_contexts(
+    dataset: SyntheticDataset, count: int, seed: int
+) -> List[EvaluationContext]:
+    rng = random.Random(seed)
+    contexts = []
+    for _ in range(count):
+        user_id, organization_id = dataset.users[rng.randrange(len(dataset.users))]
+        resource_type, action = dataset.permission_keys[
+            rng.randrange(len(dataset.permission_keys))
+        ]
+        contexts.append(
+            EvaluationContext.create(
+                user_id=user_id,
+                resource_type=resource_type,
+                action=action,
+                organization_id=organization_id,
+                **SUBJECT_ATTRIBUTES,
+            )
+        )
+    return contexts
+
+
+def run_scale(
+    session: Session,
+    dataset: SyntheticDataset,
+    iterations: int,
+    warmup: int,
+    seed: int,
+) -> List[Dict]:
+    """Run every benchmark against one generated dataset."""
+    role_repository = SqlAlchemyRoleRepository(session)
+    permission_repository = SqlAlchemyPermissionRepository(session)
+    policy_repository = SqlAlchemyPolicyRepository(session)
+    effective_repository = SqlAlchemyEffectiveUserPermissionRepository(session)
+    effective_repository.rebuild()
+    session.commit()
+
+    # RolePermissionRepository has no SQL implementation and RBAC never reads it
+    hierarchy_rbac = RBACService(role_repository, permission_repository, None)
+    materialized_rbac = RBACService(
+        role_repository,
+        permission_repository,
+        None,
+        effective_permission_repository=effective_repository,
+    )
+    policy_evaluation_service = PolicyEvaluationService()
+    abac = ABACService(
+        policy_repository, policy_evaluation_service, policy_index=PolicyIndex()
+    )
+    authorization = AuthorizationService(materialized_rbac, abac)
+
+    contexts = _build_contexts(dataset, iterations + warmup, seed)
+    organization_policies = {
+        organization_id: policy_repository.find_by_organization(organization_id)
+        for organization_id in dataset.organization_ids
+    }
+    bulk_actions = [action.value for action in ACTIONS]
+
+    def context(index: int) -> EvaluationContext:
+        return contexts[index % len(contexts)]
+
+    def evaluate_organization_policies(index: int) -> None:
+        ctx = context(index)
+        for policy in organization_policies[ctx.organization_id]:
+            policy_evaluation_service.evaluate_policy(policy, ctx)
+
+    benchmarks = {
+        "rbac.get_user_permissions.materialized": lambda i: materialized_rbac.get_user_permissions(
+            context(i).user_id, context(i).organization_id
+        ),
+        "rbac.get_user_permissions.hierarchy": lambda i: hierarchy_rbac.get_user_permissions(
+            context(i).user_id, context(i).organization_id
+        ),
+        "authorization.authorize": lambda i: authorization.authorize(context(i)),
+        "authorization.decide": lambda i: authorization.decide(context(i)),
+        "authorization.check_multiple_permissions": lambda i: authorization.check_multiple_permissions(
+            context(i).user_id,
+            context(i).resource_type,
+            bulk_actions,
+            context(i).organization_id,
+        ),
+        "policy_evaluation.organization_policies": evaluate_organization_policies,
+    }
+
+    results = []
+    for name, operation in benchmarks.items():
+        result = measure(name, operation, iterations, warmup)
+        result["scale"] = dataset.scale.name
+        results.append(result)
+    return results
+
+
+def get_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(
+    scales: List[str],
+    iterations: int = 500,
+    warmup: int = 20,
+    database_url: Optional[str] = None,
+    seed: int = 42,
+) -> Dict:
+    """Run the benchmarks for each scale and return the results document."""
+    report = {
+        "format_version": RESULTS_FORMAT_VERSION,
+        "commit": get_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "database": "sqlite" if not database_url else database_url.split(":")[0],
+        "datasets": [],
+        "results": [],
+    }
+
+    for scale_name in scales:
+        engine = create_benchmark_engine(database_url)
+        with Session(engine) as session:
+            dataset = build_dataset(session, SCALES[scale_name], seed=seed)
+            report["datasets"].append(dataset.describe())
+            report["results"].extend(
+                run_scale(session, dataset, iterations, warmup, seed)
+            )
+        engine.dispose()
+
+    return report
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--scales", nargs="+", choices=sorted(SCALES), default=["small", "medium"]
+    )
+    parser.add_argument("--iterations", type=int, default=500)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--database-url",
+        default=None,
+        help="SQLAlchemy URL of a disposable database (default: in-memory SQLite)",
+    )
+    parser.add_argument("--output", help="Write the JSON results to this file")
+    args = parser.parse_args(argv)
+
+    report = run(
+        args.scales, args.iterations, args.warmup, args.database_url, args.seed
+    )
+    output = json.dumps(report, indent=2)
+
+    if args.output:
+        with open(args.output, "w") as results_file:
+            results_file.write(output + "\n")
+        for result in report["results"]:
+            print(
+                f"{result['scale']:<7} {result['name']:<45} "
+                f"p50 {result['p50_ms']:>9.3f}ms  p99 {result['p99_ms']:>9.3f}ms"
+            )
+    else:
+        print(output)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,287 @@
+"""Synthetic multi-tenant authorization datasets for the benchmarks."""
+
+import random
+from dataclasses import dataclass, field, asdict
+from itertools import cycle
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID, uuid4
+
+from sqlalchemy import create_engine, event, insert, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from src.iam.domain.entities.permission import PermissionAction
+from src.iam.domain.entities.policy import PolicyEffect
+from src.iam.infrastructure.database.models import (
+    EffectiveUserPermissionModel,
+    PermissionActionEnum,
+    PermissionModel,
+    PolicyEffectEnum,
+    PolicyModel,
+    RoleModel,
+    role_permission_association,
+    user_role_assignment,
+)
+from src.shared.infrastructure.database.connection import Base, SCHEMA_NAME
+from tests.factories.organization_factory import OrganizationFactory
+from tests.factories.permission_factory import PermissionFactory
+from tests.factories.policy_factory import PolicyFactory
+from tests.factories.role_factory import RoleFactory
+
+# Actions the permissions table accepts
+ACTIONS = [
+    PermissionAction.CREATE,
+    PermissionAction.READ,
+    PermissionAction.UPDATE,
+    PermissionAction.DELETE,
+    PermissionAction.EXECUTE,
+    PermissionAction.MANAGE,
+]
+
+# One condition per PolicyCondition operator, all satisfiable by SUBJECT_ATTRIBUTES
+CONDITION_TEMPLATES = [
+    ("department", "eq", "engineering"),
+    ("department", "ne", "sales"),
+    ("clearance_level", "gt", 1),
+    ("clearance_level", "lt", 9),
+    ("env_hour", "gte", 0),
+    ("env_hour", "lte", 23),
+    ("department", "in", ["engineering", "operations"]),
+    ("resource_classification", "not_in", ["secret"]),
+    ("groups", "contains", "staff"),
+    ("groups", "intersects", ["staff", "admins"]),
+    ("groups", "not_intersects", ["contractors"]),
+    ("groups", "has_all", ["staff"]),
+    ("groups", "has_any", ["admins", "staff"]),
+]
+
+SUBJECT_ATTRIBUTES = {
+    "user_attributes": {
+        "department": "engineering",
+        "clearance_level": 5,
+        "groups": ["staff", "engineering"],
+    },
+    "resource_attributes": {"classification": "internal"},
+    "environment_attributes": {"hour": 12},
+}
+
+# Every N-th policy denies, so deny-overrides paths are exercised too
+DENY_EVERY = 5
+
+
+@dataclass(frozen=True)
+class BenchmarkScale:
+    """Size of a synthetic dataset."""
+
+    name: str
+    organizations: int
+    users_per_organization: int
+    role_depth: int
+    permissions: int
+    policies_per_organization: int
+
+
+SCALES = {
+    "small": BenchmarkScale("small", 2, 10, 3, 24, 13),
+    "medium": BenchmarkScale("medium", 10, 50, 6, 120, 52),
+    "large": BenchmarkScale("large", 50, 100, 10, 480, 208),
+}
+
+
+@dataclass
+class SyntheticDataset:
+    """Identifiers of a generated dataset used to build benchmark requests."""
+
+    scale: BenchmarkScale
+    organization_ids: List[UUID] = field(default_factory=list)
+    # (user_id, organization_id) of every assigned user
+    users: List[Tuple[UUID, UUID]] = field(default_factory=list)
+    # (resource_type, action) pairs covered by the permissions
+    permission_keys: List[Tuple[str, str]] = field(default_factory=list)
+    policy_count: int = 0
+
+    def describe(self) -> Dict:
+        return {
+            **asdict(self.scale),
+            "users": len(self.users),
+            "policies": self.policy_count,
+        }
+
+
+def create_benchmark_engine(database_url: Optional[str] = None) -> Engine:
+    """Create an engine with the IAM authorization tables.
+
+    Defaults to an in-memory SQLite database with the ``contas`` schema
+    attached; a PostgreSQL URL (for example a local disposable instance) is
+    used as-is.
+    """
+    if not database_url or database_url.startswith("sqlite"):
+        engine = create_engine(
+            database_url or "sqlite://",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+
+        @event.listens_for(engine, "connect")
+        def _attach_schema(dbapi_connection, _):
+            dbapi_connection.execute(f"ATTACH DATABASE ':memory:' AS {SCHEMA_NAME}")
+
+    else:
+        engine = create_engine(database_url)
+        with engine.begin() as conn:
+            conn.execute(text(f"CREATE SCHEMA IF NOT EXISTS {SCHEMA_NAME}"))
+
+    tables = [
+        RoleModel.__table__,
+        PermissionModel.__table__,
+        PolicyModel.__table__,
+        role_permission_association,
+        user_role_assignment,
+        EffectiveUserPermissionModel.__table__,
+    ]
+    Base.metadata.drop_all(engine, tables=tables)
+    Base.metadata.create_all(engine, tables=tables)
+    return engine
+
+
+def build_dataset(
+    session: Session, scale: BenchmarkScale, seed: int = 42
+) -> SyntheticDataset:
+    """Generate and insert a dataset of the given scale.
+
+    Each organization gets a ``role_depth`` deep role chain linked through
+    ``parent_role_id``; permissions are spread across the levels, so users
+    assigned to the deepest roles inherit through the whole chain. Users are
+    only identifiers - authorization never reads the users table.
+    """
+    rng = random.Random(seed)
+    dataset = SyntheticDataset(scale=scale)
+    created_by = uuid4()
+
+    permissions = []
+    for index in range(scale.permissions):
+        resource_type = f"resource_{index // len(ACTIONS)}"
+        action = ACTIONS[index % len(ACTIONS)]
+        permissions.append(
+            PermissionFactory.create_permission(
+                name=f"{resource_type}:{action.value}",
+                resource_type=resource_type,
+                action=action,
+            )
+        )
+        dataset.permission_keys.append((resource_type, action.value))
+
+    session.execute(
+        insert(PermissionModel),
+        [
+            {
+                "id": permission.id,
+                "name": permission.name.value,
+                "description": permission.description,
+                "action": PermissionActionEnum(permission.action.value),
+                "resource_type": permission.resource_type,
+            }
+            for permission in permissions
+        ],
+    )
+
+    role_rows, grant_rows, assignment_rows, policy_rows = [], [], [], []
+    operators = cycle(CONDITION_TEMPLATES)
+
+    for org_index in range(scale.organizations):
+        organization = OrganizationFactory.create_organization(
+            name=f"Benchmark Org {org_index}", owner_id=created_by
+        )
+        dataset.organization_ids.append(organization.id)
+
+        parent_id = None
+        chain = []
+        for level in range(scale.role_depth):
+            role = RoleFactory.create_organization_role(
+                name=f"level_{level}",
+                organization_id=organization.id,
+                created_by=created_by,
+                parent_role_id=parent_id,
+            )
+            chain.append(role)
+            parent_id = role.id
+            role_rows.append(
+                {
+                    "id": role.id,
+                    "name": role.name.value,
+                    "description": role.description,
+                    "organization_id": organization.id,
+                    "parent_role_id": role.parent_role_id,
+                    "created_by": created_by,
+                }
+            )
+
+        # Spread permissions over the chain: the root gets the first slice
+        for index, permission in enumerate(permissions):
+            role = chain[index * len(chain) // len(permissions)]
+            grant_rows.append({"role_id": role.id, "permission_id": permission.id})
+
+        for _ in range(scale.users_per_organization):
+            user_id = uuid4()
+            role = chain[rng.randrange(len(chain))]
+            dataset.users.append((user_id, organization.id))
+            assignment_rows.append(
+                {
+                    "user_id": user_id,
+                    "role_id": role.id,
+                    "organization_id": organization.id,
+                    "assigned_by": created_by,
+                    "is_active": True,
+                }
+            )
+
+        for index in range(scale.policies_per_organization):
+            resource_type, action = dataset.permission_keys[
+                rng.randrange(len(dataset.permission_keys))
+            ]
+            conditions = [
+                PolicyFactory.create_condition(*next(operators))
+                for _ in range(1 + index % 3)
+            ]
+            policy = PolicyFactory.create_policy(
+                name=f"policy_{index}",
+                resource_type=resource_type,
+                action="*" if index % 4 == 0 else action,
+                effect=PolicyEffect.DENY
+                if index % DENY_EVERY == 0
+                else PolicyEffect.ALLOW,
+                conditions=conditions,
+                organization_id=organization.id,
+                created_by=created_by,
+                priority=rng.randrange(100),
+            )
+            policy_rows.append(
+                {
+                    "id": policy.id,
+                    "name": policy.name,
+                    "description": policy.description,
+                    "effect": PolicyEffectEnum(policy.effect.value),
+                    "resource_type": policy.resource_type,
+                    "action": policy.action,
+                    "conditions": [
+                        condition.to_dict() for condition in policy.conditions
+                    ],
+                    "organization_id": organization.id,
+                    "created_by": created_by,
+                    "priority": policy.priority,
+                }
+            )
+
+    for table, rows in (
+        (RoleModel, role_rows),
+        (role_permission_association, grant_rows),
+        (user_role_assignment, assignment_rows),
+        (PolicyModel, policy_rows),
+    ):
+        if rows:
+            session.execute(insert(table), rows)
+
+    dataset.policy_count = len(policy_rows)
+    session.commit()
+    return dataset
@@ -8,6 +8,10 @@ from sqlalchemy.orm import sessionmaker
 from fastapi.testclient import TestClient
 
 from src.main import app
+from src.shared.infrastructure.database.query_stats import (
+    assert_max_queries,
+    instrument_engine,
+)
 # from src.infrastructure.database.connection import Base, get_db
 # from src.infrastructure.repositories.sqlalchemy_unit_of_work import SQLAlchemyUnitOfWork
 
@@ -18,6 +22,7 @@ TEST_DATABASE_URL = os.getenv(
 )
 
 test_engine = create_engine(TEST_DATABASE_URL)
+instrument_engine(test_engine)
 TestSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=test_engine)
 
 
@@ -38,6 +43,7 @@ def db_session() -> Generator:
         conn.commit()
     import src.iam.infrastructure.database.models
     import src.plans.infrastructure.database.models
+    import src.shared.infrastructure.database.models
 
     Base.metadata.create_all(bind=test_engine)
     session = TestSessionLocal()
@@ -106,6 +112,15 @@ def client(db_session) -> Generator:
 #         app.dependency_overrides.clear()
 
 
+@pytest.fixture
+def query_budget():
+    """Fail the test when a block issues more statements than allowed.
+
+    Usage: ``with query_budget(5): ...``
+    """
+    return assert_max_queries
+
+
 @pytest.fixture
 def sample_user_data():
     """Sample user data for testing."""
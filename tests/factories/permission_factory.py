@@ -1,5 +1,5 @@
 from uuid import uuid4
-from src.authorization.domain.entities.permission import Permission, PermissionAction
+from src.iam.domain.entities.permission import Permission, PermissionAction
 
 
 class PermissionFactory:
@@ -0,0 +1,34 @@
+from uuid import uuid4
+from src.iam.domain.entities.policy import Policy, PolicyCondition, PolicyEffect
+
+
+class PolicyFactory:
+    @staticmethod
+    def create_condition(
+        attribute: str = "department", operator: str = "eq", value="engineering"
+    ) -> PolicyCondition:
+        return PolicyCondition(attribute=attribute, operator=operator, value=value)
+
+    @staticmethod
+    def create_policy(
+        name: str = "test_policy",
+        resource_type: str = "test_resource",
+        action: str = "read",
+        effect: PolicyEffect = PolicyEffect.ALLOW,
+        conditions: list = None,
+        organization_id=None,
+        created_by=None,
+        priority: int = 0,
+        description: str = "Test policy",
+    ) -> Policy:
+        return Policy.create(
+            name=name,
+            description=description,
+            effect=effect,
+            resource_type=resource_type,
+            action=action,
+            conditions=conditions or [],
+            created_by=created_by or uuid4(),
+            organization_id=organization_id,
+            priority=priority,
+        )
@@ -28,3 +28,19 @@ class RoleFactory:
         return Role.create(
             name="viewer", description="Read-only viewer role", is_system=False
         )
+
+    @staticmethod
+    def create_organization_role(
+        name: str,
+        organization_id,
+        created_by,
+        parent_role_id=None,
+        description: str = "Test role",
+    ) -> Role:
+        return Role.create(
+            name=name,
+            description=description,
+            created_by=created_by,
+            organization_id=organization_id,
+            parent_role_id=parent_role_id,
+        )
@@ -0,0 +1,70 @@
+"""Integration tests for the feature usage period rollover."""
+
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from sqlalchemy import select
+
+from src.iam.domain.entities.organization import Organization
+from src.iam.infrastructure.repositories.sqlalchemy_organization_repository import SqlAlchemyOrganizationRepository
+from src.plans.domain.entities.feature_usage import FeatureUsage, UsagePeriod
+from src.plans.infrastructure.database.models import FeatureUsageModel
+from src.plans.infrastructure.repositories.sqlalchemy_feature_usage_repository import SqlAlchemyFeatureUsageRepository
+
+
+class TestFeatureUsageRolloverIntegration:
+    """Test the rollover chunk query against the real feature_usage table."""
+
+    def test_open_next_period_chunk_opens_each_counter_once(self, db_session):
+        """Test a chunk inserts a zeroed counter for the new period, once."""
+        organization = SqlAlchemyOrganizationRepository(db_session).save(
+            Organization.create(name="Rollover Org", owner_id=uuid4())
+        )
+        repo = SqlAlchemyFeatureUsageRepository(db_session)
+
+        previous_start, previous_end = FeatureUsage._calculate_period_boundaries(
+            datetime(2026, 9, 15, tzinfo=timezone.utc), UsagePeriod.MONTHLY
+        )
+        previous = repo.save(
+            FeatureUsage(
+                id=uuid4(),
+                organization_id=organization.id,
+                feature_name="chat_messages",
+                usage_period=UsagePeriod.MONTHLY,
+                period_start=previous_start,
+                period_end=previous_end,
+                current_usage=42,
+                limit_value=100,
+                metadata={"source": "test"},
+                created_at=previous_start,
+            )
+        )
+        db_session.commit()
+
+        new_start = datetime(2026, 10, 1, tzinfo=timezone.utc)
+        scanned, inserted, last_id = repo.open_next_period_chunk(
+            UsagePeriod.MONTHLY, new_start
+        )
+        db_session.commit()
+
+        assert (scanned, inserted, last_id) == (1, 1, previous.id)
+
+        # Re-running the chunk is harmless and the scan ends after last_id
+        assert repo.open_next_period_chunk(UsagePeriod.MONTHLY, new_start)[:2] == (1, 0)
+        assert repo.open_next_period_chunk(
+            UsagePeriod.MONTHLY, new_start, after_id=last_id
+        ) == (0, 0, None)
+
+        counters = db_session.execute(
+            select(FeatureUsageModel).where(
+                FeatureUsageModel.organization_id == organization.id
+            ).order_by(FeatureUsageModel.period_start)
+        ).scalars().all()
+
+        assert [counter.period_start for counter in counters] == [
+            previous_start,
+            new_start,
+        ]
+        assert counters[1].current_usage == 0
+        assert counters[1].limit_value == 100
+        assert counters[1].usage_metadata == {}
@@ -0,0 +1,91 @@
+"""Scripted request scenarios for the HTTP load harness."""
+
+import json
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+IAM_PREFIX = "/api/v1/iam"
+
+
+@dataclass(frozen=True)
+class Step:
+    """One request of a scenario.
+
+    ``path``, ``params`` and ``json`` values may use ``{user_id}``,
+    ``{organization_id}``, ``{email}`` and ``{password}`` placeholders, filled
+    from the virtual user issuing the request. Steps with a ``skip_reason``
+    are kept in the scenario but not driven (e.g. routes the app does not
+    mount yet); the runner reports them as skipped.
+    """
+
+    name: str
+    method: str
+    path: str
+    auth: bool = True
+    json: Optional[Dict[str, Any]] = None
+    params: Optional[Dict[str, Any]] = None
+    weight: int = 1
+    expected_status: List[int] = field(default_factory=lambda: [200])
+    skip_reason: Optional[str] = None
+
+
+LOGIN = Step(
+    name="login",
+    method="POST",
+    path=f"{IAM_PREFIX}/auth/login",
+    auth=False,
+    json={"email": "{email}", "password": "{password}"},
+)
+
+DEFAULT_SCENARIO = [
+    LOGIN,
+    Step(name="validate_token", method="GET", path=f"{IAM_PREFIX}/auth/validate", weight=4),
+    Step(name="get_user", method="GET", path=f"{IAM_PREFIX}/users/{{user_id}}", weight=3),
+    Step(
+        name="organization_roles",
+        method="GET",
+        path=f"{IAM_PREFIX}/roles/organization/{{organization_id}}",
+        weight=2,
+    ),
+    Step(
+        name="track_usage",
+        method="POST",
+        path="/api/v1/plans/feature-usage/track",
+        params={
+            "organization_id": "{organization_id}",
+            "feature_name": "api_calls",
+            "amount": 1,
+        },
+        weight=3,
+        skip_reason="/api/v1/plans/feature-usage is not mounted by the app",
+    ),
+]
+
+
+def _fill(value: Any, variables: Dict[str, str]) -> Any:
+    if isinstance(value, str):
+        return value.format(**variables)
+    if isinstance(value, dict):
+        return {key: _fill(item, variables) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_fill(item, variables) for item in value]
+    return value
+
+
+def render_step(step: Step, variables: Dict[str, str]) -> Dict[str, Any]:
+    """Get the request arguments of a step for a virtual user."""
+    request = {"method": step.method, "url": _fill(step.path, variables)}
+    if step.params is not None:
+        request["params"] = _fill(step.params, variables)
+    if step.json is not None:
+        request["json"] = _fill(step.json, variables)
+    return request
+
+
+def load_scenario(path: Optional[str] = None) -> List[Step]:
+    """Load a scenario from a JSON list of steps, or the default scenario."""
+    if not path:
+        return list(DEFAULT_SCENARIO)
+
+    with open(path) as scenario_file:
+        return [Step(**step) for step in json.load(scenario_file)]
@@ -0,0 +1,84 @@
+import pytest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock, MagicMock
+from uuid import uuid4
+
+from src.iam.application.jobs.expired_records_reaper import ExpiredRecordsReaper
+
+
+class TestExpiredRecordsReaper:
+    """Test cases for ExpiredRecordsReaper batching and reporting."""
+
+    NOW = datetime(2026, 11, 1, 3, 0, tzinfo=timezone.utc)
+
+    @pytest.fixture
+    def repositories(self):
+        repositories = {
+            "user_session": Mock(),
+            "user_organization_role": Mock(),
+            "role": Mock(),
+            "effective_user_permission": Mock(),
+        }
+        repositories["user_session"].delete_expired_chunk.return_value = 0
+        repositories["user_organization_role"].delete_expired_chunk.return_value = 0
+        repositories["role"].delete_expired_assignments_chunk.return_value = []
+        return repositories
+
+    @pytest.fixture
+    def reaper(self, repositories):
+        def uow_factory():
+            uow = MagicMock()
+            uow.__enter__.return_value = uow
+            uow.get_repository.side_effect = repositories.__getitem__
+            return uow
+
+        return ExpiredRecordsReaper(
+            uow_factory,
+            session_retention=timedelta(days=7),
+            assignment_retention=timedelta(days=30),
+            chunk_size=2,
+        )
+
+    def test_deletes_in_batches_until_short_chunk(self, reaper, repositories):
+        """Test each table is drained chunk by chunk with its retention cutoff."""
+        sessions = repositories["user_session"]
+        sessions.delete_expired_chunk.side_effect = [2, 2, 1]
+        repositories["user_organization_role"].delete_expired_chunk.return_value = 1
+
+        result = reaper.run(now=self.NOW)
+
+        assert result["sessions_deleted"] == 5
+        assert result["organization_roles_deleted"] == 1
+        assert result["chunks_processed"] == 5
+        assert result["is_completed"] is True
+        assert sessions.delete_expired_chunk.call_args.args == (
+            self.NOW - timedelta(days=7),
+            2,
+        )
+        assert repositories[
+            "user_organization_role"
+        ].delete_expired_chunk.call_args.args[0] == self.NOW - timedelta(days=30)
+
+    def test_deleted_assignments_refresh_effective_permissions(
+        self, reaper, repositories
+    ):
+        """Test users losing assignments get their permissions recomputed."""
+        user_id = uuid4()
+        repositories["role"].delete_expired_assignments_chunk.return_value = [user_id]
+
+        result = reaper.run(now=self.NOW)
+
+        assert result["role_assignments_deleted"] == 1
+        repositories["effective_user_permission"].refresh_users.assert_called_once_with(
+            [user_id]
+        )
+
+    def test_max_chunks_stops_early(self, reaper, repositories):
+        """Test a bounded run reports that rows may be left."""
+        repositories["user_session"].delete_expired_chunk.return_value = 2
+
+        result = reaper.run(now=self.NOW, max_chunks=3)
+
+        assert result["sessions_deleted"] == 6
+        assert result["is_completed"] is False
+        repositories["role"].delete_expired_assignments_chunk.assert_not_called()
@@ -0,0 +1,65 @@
+from unittest.mock import Mock
+from uuid import uuid4
+
+import pytest
+
+from src.iam.application.dtos.role_dto import RolePermissionRemoveDTO
+from src.iam.application.use_cases.role_use_cases import RoleUseCase
+from src.iam.domain.entities.role import Role
+
+
+class TestRoleUseCaseChanges:
+    """Test cases for organization-scoped role changes."""
+
+    def setup_method(self):
+        self.organization_id = uuid4()
+        self.template = Role.create(
+            name="member",
+            description="Organization member",
+            created_by=uuid4(),
+            is_system_role=True,
+        )
+
+        self.role_repository = Mock()
+        self.role_repository.get_by_id.return_value = self.template
+        self.role_repository.get_by_name.return_value = None
+        self.role_repository.get_role_permissions.return_value = []
+        self.role_repository.reassign_organization_role.return_value = []
+        self.role_repository.save.side_effect = lambda role: role
+        self.effective_permission_repository = Mock()
+
+        self.use_case = RoleUseCase(
+            self.role_repository, Mock(), self.effective_permission_repository
+        )
+        self.use_case._build_role_detail_response = Mock()
+
+    def test_template_changes_apply_to_organization_copy(self):
+        """Test a default role is copied before its permissions change."""
+        dto = RolePermissionRemoveDTO(permission_ids=[uuid4()])
+
+        self.use_case.remove_permissions(self.template.id, dto, self.organization_id)
+
+        copy = self.role_repository.save.call_args.args[0]
+        assert copy.id != self.template.id
+        assert copy.organization_id == self.organization_id
+        self.role_repository.remove_permissions.assert_called_once_with(
+            copy.id, dto.permission_ids
+        )
+        self.effective_permission_repository.refresh_roles.assert_called_once_with(
+            [copy.id], self.organization_id
+        )
+
+    def test_roles_of_other_organizations_cannot_change(self):
+        """Test an organization cannot change another organization's role."""
+        self.role_repository.get_by_id.return_value = Role.create(
+            name="auditor",
+            description="Custom role",
+            created_by=uuid4(),
+            organization_id=uuid4(),
+        )
+        dto = RolePermissionRemoveDTO(permission_ids=[uuid4()])
+
+        with pytest.raises(ValueError):
+            self.use_case.remove_permissions(uuid4(), dto, self.organization_id)
+
+        self.role_repository.remove_permissions.assert_not_called()
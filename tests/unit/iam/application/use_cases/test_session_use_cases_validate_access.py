@@ -34,6 +34,7 @@ class TestSessionUseCaseValidateAccess:
             "policy": policy_repo,
             "resource": resource_repo,
             "role_permission": Mock(),
+            "effective_user_permission": None,
         }[name]
 
         return {
@@ -105,7 +106,7 @@ class TestSessionUseCaseValidateAccess:
         # Mock authorization service to allow access
         mock_decision = Mock()
         mock_decision.is_allowed.return_value = True
-        session_use_case._authorization_service.authorize = Mock(
+        session_use_case._authorization_service.decide = Mock(
             return_value=mock_decision
         )
 
@@ -115,7 +116,7 @@ class TestSessionUseCaseValidateAccess:
         )
 
         assert result is True
-        assert session_use_case._authorization_service.authorize.call_count == 2
+        assert session_use_case._authorization_service.decide.call_count == 2
 
     def test_validate_session_access_with_valid_token_and_permissions_denied(
         self, session_use_case, valid_token, sample_user
@@ -130,7 +131,7 @@ class TestSessionUseCaseValidateAccess:
         mock_decision_deny = Mock()
         mock_decision_deny.is_allowed.return_value = False
 
-        session_use_case._authorization_service.authorize = Mock(
+        session_use_case._authorization_service.decide = Mock(
             side_effect=[mock_decision_allow, mock_decision_deny]
         )
 
@@ -140,7 +141,7 @@ class TestSessionUseCaseValidateAccess:
         )
 
         assert result is False
-        assert session_use_case._authorization_service.authorize.call_count == 2
+        assert session_use_case._authorization_service.decide.call_count == 2
 
     def test_validate_session_access_with_organization_scope(
         self, session_use_case, valid_token, sample_user
@@ -152,7 +153,7 @@ class TestSessionUseCaseValidateAccess:
         # Mock authorization service
         mock_decision = Mock()
         mock_decision.is_allowed.return_value = True
-        session_use_case._authorization_service.authorize = Mock(
+        session_use_case._authorization_service.decide = Mock(
             return_value=mock_decision
         )
 
@@ -166,7 +167,7 @@ class TestSessionUseCaseValidateAccess:
         assert result is True
 
         # Verify the authorization context was created with the organization ID
-        call_args = session_use_case._authorization_service.authorize.call_args[0][0]
+        call_args = session_use_case._authorization_service.decide.call_args[0][0]
         assert str(call_args.organization_id) == org_id
 
     def test_validate_session_access_with_resource_details(
@@ -179,7 +180,7 @@ class TestSessionUseCaseValidateAccess:
         # Mock authorization service
         mock_decision = Mock()
         mock_decision.is_allowed.return_value = True
-        session_use_case._authorization_service.authorize = Mock(
+        session_use_case._authorization_service.decide = Mock(
             return_value=mock_decision
         )
 
@@ -194,7 +195,7 @@ class TestSessionUseCaseValidateAccess:
         assert result is True
 
         # Verify the authorization context was created with correct resource details
-        call_args = session_use_case._authorization_service.authorize.call_args[0][0]
+        call_args = session_use_case._authorization_service.decide.call_args[0][0]
         assert call_args.resource_type == "document"
         assert str(call_args.resource_id) == resource_id
 
@@ -208,7 +209,7 @@ class TestSessionUseCaseValidateAccess:
         # Mock authorization service
         mock_decision = Mock()
         mock_decision.is_allowed.return_value = True
-        session_use_case._authorization_service.authorize = Mock(
+        session_use_case._authorization_service.decide = Mock(
             return_value=mock_decision
         )
 
@@ -222,7 +223,7 @@ class TestSessionUseCaseValidateAccess:
         assert result is True
 
         # Verify the authorization context was created correctly
-        call_args = session_use_case._authorization_service.authorize.call_args[0][0]
+        call_args = session_use_case._authorization_service.decide.call_args[0][0]
         assert call_args.action == "admin_access"
         assert call_args.resource_type == "system"
 
@@ -236,7 +237,7 @@ class TestSessionUseCaseValidateAccess:
         # Mock authorization service
         mock_decision = Mock()
         mock_decision.is_allowed.return_value = True
-        session_use_case._authorization_service.authorize = Mock(
+        session_use_case._authorization_service.decide = Mock(
             return_value=mock_decision
         )
 
@@ -247,7 +248,7 @@ class TestSessionUseCaseValidateAccess:
         assert result is True
 
         # Verify the authorization context was created with correct parsing
-        call_args = session_use_case._authorization_service.authorize.call_args[0][0]
+        call_args = session_use_case._authorization_service.decide.call_args[0][0]
         assert call_args.resource_type == "user"
         assert call_args.action == "read"
 
@@ -261,7 +262,7 @@ class TestSessionUseCaseValidateAccess:
         # Mock authorization service
         mock_decision = Mock()
         mock_decision.is_allowed.return_value = True
-        session_use_case._authorization_service.authorize = Mock(
+        session_use_case._authorization_service.decide = Mock(
             return_value=mock_decision
         )
 
@@ -272,7 +273,7 @@ class TestSessionUseCaseValidateAccess:
         assert result is True
 
         # Verify user attributes were included
-        call_args = session_use_case._authorization_service.authorize.call_args[0][0]
+        call_args = session_use_case._authorization_service.decide.call_args[0][0]
         user_attributes = call_args.user_attributes
 
         assert user_attributes["email"] == sample_user.email.value
@@ -290,7 +291,7 @@ class TestSessionUseCaseValidateAccess:
         # Mock authorization service
         mock_decision = Mock()
         mock_decision.is_allowed.return_value = True
-        session_use_case._authorization_service.authorize = Mock(
+        session_use_case._authorization_service.decide = Mock(
             return_value=mock_decision
         )
 
@@ -301,7 +302,7 @@ class TestSessionUseCaseValidateAccess:
         assert result is True
 
         # Verify it calls the main method with correct permission format
-        call_args = session_use_case._authorization_service.authorize.call_args[0][0]
+        call_args = session_use_case._authorization_service.decide.call_args[0][0]
         assert call_args.resource_type == "user"
         assert call_args.action == "read"
 
@@ -315,7 +316,7 @@ class TestSessionUseCaseValidateAccess:
         # Mock authorization service
         mock_decision = Mock()
         mock_decision.is_allowed.return_value = True
-        session_use_case._authorization_service.authorize = Mock(
+        session_use_case._authorization_service.decide = Mock(
             return_value=mock_decision
         )
 
@@ -326,7 +327,7 @@ class TestSessionUseCaseValidateAccess:
         assert result is True
 
         # Verify default resource type "system" was used
-        call_args = session_use_case._authorization_service.authorize.call_args[0][0]
+        call_args = session_use_case._authorization_service.decide.call_args[0][0]
         assert call_args.resource_type == "system"
         assert call_args.action == "manage"
 
@@ -393,7 +394,7 @@ class TestSessionUseCaseValidateAccess:
         # Mock authorization service
         mock_decision = Mock()
         mock_decision.is_allowed.return_value = True
-        session_use_case._authorization_service.authorize = Mock(
+        session_use_case._authorization_service.decide = Mock(
             return_value=mock_decision
         )
 
@@ -410,7 +411,7 @@ class TestSessionUseCaseValidateAccess:
         assert result is True
 
         # Verify UUIDs were properly converted
-        call_args = session_use_case._authorization_service.authorize.call_args[0][0]
+        call_args = session_use_case._authorization_service.decide.call_args[0][0]
         assert isinstance(call_args.organization_id, UUID)
         assert isinstance(call_args.resource_id, UUID)
         assert str(call_args.organization_id) == org_id_str
@@ -426,7 +427,7 @@ class TestSessionUseCaseValidateAccess:
         # Mock authorization service to allow all permissions
         mock_decision = Mock()
         mock_decision.is_allowed.return_value = True
-        session_use_case._authorization_service.authorize = Mock(
+        session_use_case._authorization_service.decide = Mock(
             return_value=mock_decision
         )
 
@@ -441,7 +442,7 @@ class TestSessionUseCaseValidateAccess:
         )
 
         assert result is True
-        assert session_use_case._authorization_service.authorize.call_count == 4
+        assert session_use_case._authorization_service.decide.call_count == 4
 
     def test_authorization_context_user_id_consistency(
         self, session_use_case, valid_token, sample_user
@@ -453,7 +454,7 @@ class TestSessionUseCaseValidateAccess:
         # Mock authorization service
         mock_decision = Mock()
         mock_decision.is_allowed.return_value = True
-        session_use_case._authorization_service.authorize = Mock(
+        session_use_case._authorization_service.decide = Mock(
             return_value=mock_decision
         )
 
@@ -464,5 +465,5 @@ class TestSessionUseCaseValidateAccess:
         assert result is True
 
         # Verify user ID consistency
-        call_args = session_use_case._authorization_service.authorize.call_args[0][0]
+        call_args = session_use_case._authorization_service.decide.call_args[0][0]
         assert call_args.user_id == sample_user.id
@@ -34,6 +34,7 @@ def mock_iam_repositories(mock_iam_uow):
         "policy": policy_repo,
         "resource": resource_repo,
         "role_permission": Mock(),
+        "effective_user_permission": None,
     }[name]
 
     return {
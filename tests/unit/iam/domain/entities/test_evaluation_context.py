@@ -0,0 +1,64 @@
+from unittest.mock import Mock
+from uuid import uuid4
+
+from src.iam.domain.entities.authorization_context import AuthorizationContext
+from src.iam.domain.entities.evaluation_context import EvaluationContext
+
+
+class TestEvaluationContext:
+    """Unit tests for the slotted EvaluationContext."""
+
+    def _authorization_context(self):
+        return AuthorizationContext.create(
+            user_id=uuid4(),
+            resource_type="document",
+            action="read",
+            organization_id=uuid4(),
+            user_attributes={"department": "sales"},
+            resource_attributes={"owner_id": "someone"},
+            environment_attributes={"ip": "10.0.0.1"},
+        )
+
+    def test_flat_view_matches_authorization_context(self):
+        """Test the flat view has the same keys and values as to_dict()."""
+        context = self._authorization_context()
+
+        evaluation_context = EvaluationContext.from_context(context)
+
+        assert evaluation_context.get_flat_attributes() == context.to_dict()
+        assert evaluation_context.to_dict() == context.to_dict()
+
+    def test_flat_view_is_memoized(self):
+        """Test the flat view is built once and shared."""
+        evaluation_context = EvaluationContext.from_context(
+            self._authorization_context()
+        )
+
+        assert (
+            evaluation_context.get_flat_attributes()
+            is evaluation_context.get_flat_attributes()
+        )
+
+    def test_computed_attributes_are_computed_once(self):
+        """Test computed attributes are evaluated once per context."""
+        evaluation_context = EvaluationContext.create(
+            user_id=uuid4(), resource_type="document", action="read"
+        )
+        computed = Mock(return_value={"is_weekend": False})
+
+        first = evaluation_context.get_evaluation_attributes(computed)
+        second = evaluation_context.get_evaluation_attributes(computed)
+
+        assert first is second
+        assert first["is_weekend"] is False
+        assert first["action"] == "read"
+        computed.assert_called_once_with(evaluation_context)
+
+    def test_from_context_reuses_evaluation_context(self):
+        """Test converting an evaluation context returns it unchanged."""
+        evaluation_context = EvaluationContext.create(
+            user_id=uuid4(), resource_type="document", action="read"
+        )
+
+        assert EvaluationContext.from_context(evaluation_context) is evaluation_context
+        assert not hasattr(evaluation_context, "__dict__")
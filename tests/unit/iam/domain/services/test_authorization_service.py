@@ -0,0 +1,61 @@
+from unittest.mock import Mock
+from uuid import uuid4
+
+from src.iam.domain.entities.authorization_context import AuthorizationContext
+from src.iam.domain.services.authorization_service import AuthorizationService
+from src.iam.domain.value_objects.authorization_decision import AccessDecision
+
+
+class TestAuthorizationServiceDecide:
+    """Test cases for the lean AuthorizationService.decide mode."""
+
+    def _context(self):
+        return AuthorizationContext.create(
+            user_id=uuid4(), resource_type="document", action="read"
+        )
+
+    def _service(self, rbac_decision, abac_decision):
+        rbac_service = Mock()
+        rbac_service.decide.return_value = rbac_decision
+        abac_service = Mock()
+        abac_service.decide.return_value = abac_decision
+        return AuthorizationService(rbac_service, abac_service)
+
+    def test_rbac_allow_without_policies(self):
+        """Test RBAC allow stands when no policy applies."""
+        service = self._service(AccessDecision(True, "document:read"), None)
+
+        decision = service.decide(self._context())
+
+        assert decision.allowed
+        assert decision.rule == "document:read"
+
+    def test_policy_deny_overrides_rbac_allow(self):
+        """Test an explicit deny policy overrides an RBAC allow."""
+        service = self._service(
+            AccessDecision(True, "document:read"), AccessDecision(False, "policy:1")
+        )
+
+        decision = service.decide(self._context())
+
+        assert not decision.allowed
+        assert decision.rule == "policy:1"
+
+    def test_policy_allow_overrides_rbac_deny(self):
+        """Test an explicit allow policy grants access RBAC denied."""
+        service = self._service(
+            AccessDecision(False, "rbac_deny"), AccessDecision(True, "policy:2")
+        )
+
+        assert service.decide(self._context()).rule == "policy:2"
+
+    def test_errors_default_to_deny(self):
+        """Test evaluation failures deny access."""
+        service = self._service(None, None)
+        service._rbac_service.decide.side_effect = RuntimeError("boom")
+
+        decision = service.decide(self._context())
+
+        assert not decision.allowed
+        assert decision.rule == "authorization_error"
+        assert not hasattr(decision, "__dict__")
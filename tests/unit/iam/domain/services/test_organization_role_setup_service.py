@@ -0,0 +1,110 @@
+from unittest.mock import MagicMock, Mock
+from uuid import uuid4
+
+from src.iam.domain.entities.authorization_context import AuthorizationContext
+from src.iam.domain.services.organization_role_setup_service import (
+    OrganizationRoleSetupService,
+)
+from src.iam.domain.services.rbac_service import RBACService
+
+
+class InMemoryEffectivePermissions:
+    """Materialized permissions derived from the recorded role assignments."""
+
+    def __init__(self, assignments, role_permissions, permission_names):
+        self.assignments = assignments
+        self.role_permissions = role_permissions
+        self.permission_names = permission_names
+        self.rows = {}
+
+    def refresh_users(self, user_ids):
+        for user_id in user_ids:
+            for assigned_user_id, organization_id, role_id in self.assignments:
+                if assigned_user_id == user_id:
+                    self.rows.setdefault((user_id, organization_id), set()).update(
+                        self.permission_names[permission_id]
+                        for permission_id in self.role_permissions[role_id]
+                    )
+        return len(self.rows)
+
+    def find_matching_permission(self, user_id, organization_id, candidate_keys):
+        held = self.rows.get((user_id, organization_id), set())
+        return next((key for key in candidate_keys if key in held), None)
+
+
+class TestOrganizationRoleSetupService:
+    """Test cases for the default-role setup of new organizations."""
+
+    def setup_method(self):
+        self.assignments = []
+        role_permissions = {}
+        permission_names = {}
+
+        def save_permission(permission):
+            permission_names[permission.id] = permission.name.value
+            return permission
+
+        self.role_repository = Mock()
+        self.role_repository.get_role_templates.return_value = []
+        self.role_repository.save.side_effect = lambda role: role
+        self.role_repository.assign_permissions.side_effect = (
+            lambda role_id, permission_ids: role_permissions.update(
+                {role_id: permission_ids}
+            )
+        )
+        self.role_repository.assign_role_to_user.side_effect = (
+            lambda user_id, role_id, organization_id, assigned_by: (
+                self.assignments.append((user_id, organization_id, role_id))
+            )
+        )
+        permission_repository = Mock()
+        permission_repository.find_by_name.return_value = None
+        permission_repository.save.side_effect = save_permission
+        self.user_org_role_repository = Mock()
+        self.user_org_role_repository.user_has_role_in_organization.return_value = (
+            False
+        )
+        self.effective_permission_repository = InMemoryEffectivePermissions(
+            self.assignments, role_permissions, permission_names
+        )
+
+        repositories = {
+            "role": self.role_repository,
+            "permission": permission_repository,
+            "user_organization_role": self.user_org_role_repository,
+            "effective_user_permission": self.effective_permission_repository,
+        }
+        uow = MagicMock()
+        uow.get_repository.side_effect = repositories.__getitem__
+        self.service = OrganizationRoleSetupService(uow)
+
+    def test_onboarded_owner_is_authorized(self):
+        """Test the owner's permissions are materialized during setup."""
+        organization_id, owner_id = uuid4(), uuid4()
+
+        self.service.setup_default_roles_for_organization(organization_id, owner_id)
+
+        rbac_service = RBACService(
+            role_repository=Mock(),
+            permission_repository=Mock(),
+            role_permission_repository=Mock(),
+            effective_permission_repository=self.effective_permission_repository,
+        )
+        decision = rbac_service.authorize(
+            AuthorizationContext.create(
+                user_id=owner_id,
+                resource_type="user",
+                action="delete",
+                organization_id=organization_id,
+            )
+        )
+
+        assert decision.is_allowed()
+        self.user_org_role_repository.assign_role_to_user.assert_called_once()
+
+    def test_existing_assignment_is_not_repeated(self):
+        """Test assigning a role the user already holds changes nothing."""
+        self.user_org_role_repository.user_has_role_in_organization.return_value = True
+
+        assert self.service.assign_default_member_role(uuid4(), uuid4())
+        self.role_repository.assign_role_to_user.assert_not_called()
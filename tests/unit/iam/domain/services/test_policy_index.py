@@ -0,0 +1,103 @@
+from unittest.mock import Mock
+from uuid import uuid4
+
+from src.iam.domain.entities.policy import Policy, PolicyEffect
+from src.iam.domain.services.policy_index import PolicyIndex
+
+
+def _policy(action, priority=0, organization_id=None, resource_type="document"):
+    return Policy.create(
+        name=f"{resource_type}-{action}-{priority}",
+        description="Test policy",
+        effect=PolicyEffect.ALLOW,
+        resource_type=resource_type,
+        action=action,
+        conditions=[],
+        created_by=uuid4(),
+        organization_id=organization_id,
+        priority=priority,
+    )
+
+
+class TestPolicyIndex:
+    """Test cases for the in-memory policy index."""
+
+    def setup_method(self):
+        self.organization_id = uuid4()
+        self.global_read = _policy("read", priority=1)
+        self.org_wildcard = _policy("*", priority=5, organization_id=self.organization_id)
+        self.org_read = _policy("read", priority=3, organization_id=self.organization_id)
+
+        self.repository = Mock()
+        self.repository.find_global_policies.return_value = [self.global_read]
+        self.repository.find_by_organization.return_value = [
+            self.org_read,
+            self.org_wildcard,
+        ]
+        self.index = PolicyIndex()
+
+    def test_lookup_merges_wildcard_and_global_by_priority(self):
+        """Test a bucket holds exact, wildcard and global policies in priority order."""
+        policies = self.index.get_applicable_policies(
+            self.repository, "document", "read", self.organization_id
+        )
+
+        assert policies == [self.org_wildcard, self.org_read, self.global_read]
+
+    def test_action_without_exact_policies_uses_wildcard(self):
+        """Test actions with no exact policy fall back to the wildcard bucket."""
+        policies = self.index.get_applicable_policies(
+            self.repository, "document", "delete", self.organization_id
+        )
+
+        assert policies == [self.org_wildcard]
+        assert self.index.get_applicable_policies(
+            self.repository, "folder", "read", self.organization_id
+        ) == []
+
+    def test_lookups_reuse_loaded_scope_until_invalidated(self):
+        """Test the repository is read once per scope until invalidation."""
+        for _ in range(3):
+            self.index.get_applicable_policies(
+                self.repository, "document", "read", self.organization_id
+            )
+
+        assert self.repository.find_by_organization.call_count == 1
+
+        self.index.invalidate(self.organization_id)
+        self.index.get_applicable_policies(
+            self.repository, "document", "read", self.organization_id
+        )
+
+        assert self.repository.find_by_organization.call_count == 2
+
+    def test_load_started_before_invalidation_is_not_kept(self):
+        """Test policies read before a concurrent write are not cached."""
+        def load_then_write(organization_id):
+            self.index.invalidate(organization_id)
+            return [self.org_read]
+
+        self.repository.find_by_organization.side_effect = load_then_write
+        self.index.get_applicable_policies(
+            self.repository, "document", "read", self.organization_id
+        )
+
+        self.repository.find_by_organization.side_effect = None
+        policies = self.index.get_applicable_policies(
+            self.repository, "document", "read", self.organization_id
+        )
+
+        assert policies == [self.org_wildcard, self.org_read, self.global_read]
+        assert self.repository.find_by_organization.call_count == 2
+
+    def test_disabled_index_reads_repository(self):
+        """Test a disabled index queries the repository on every lookup."""
+        self.index.disable_cache()
+
+        for _ in range(2):
+            policies = self.index.get_applicable_policies(
+                self.repository, "document", "read", self.organization_id
+            )
+
+        assert policies == [self.org_wildcard, self.org_read, self.global_read]
+        assert self.repository.find_by_organization.call_count == 2
@@ -0,0 +1,74 @@
+import pytest
+from unittest.mock import Mock
+from uuid import uuid4
+
+from src.iam.domain.entities.authorization_context import AuthorizationContext
+from src.iam.domain.services.rbac_service import RBACService
+
+
+class TestRBACServiceEffectivePermissions:
+    """Test cases for RBACService backed by materialized effective permissions."""
+
+    @pytest.fixture
+    def effective_permission_repo(self):
+        """Create a mock effective permission repository."""
+        return Mock()
+
+    @pytest.fixture
+    def rbac_service(self, effective_permission_repo):
+        """Create RBACService reading from the materialized table."""
+        return RBACService(
+            role_repository=Mock(),
+            permission_repository=Mock(),
+            role_permission_repository=Mock(),
+            effective_permission_repository=effective_permission_repo,
+        )
+
+    @pytest.fixture
+    def context(self):
+        """Create a sample authorization context."""
+        return AuthorizationContext.create(
+            user_id=uuid4(),
+            resource_type="user",
+            action="read",
+            organization_id=uuid4(),
+        )
+
+    def test_authorize_allows_with_single_lookup(
+        self, rbac_service, effective_permission_repo, context
+    ):
+        """Test a held permission (or wildcard) allows with one lookup."""
+        effective_permission_repo.find_matching_permission.return_value = "user:*"
+
+        decision = rbac_service.authorize(context)
+
+        assert decision.is_allowed()
+        effective_permission_repo.find_matching_permission.assert_called_once_with(
+            context.user_id,
+            context.organization_id,
+            ["user:read", "user:*", "*:read", "*:*"],
+        )
+        rbac_service._role_repository.get_user_roles.assert_not_called()
+
+    def test_authorize_denies_without_match(
+        self, rbac_service, effective_permission_repo, context
+    ):
+        """Test authorization is denied when no candidate key is held."""
+        effective_permission_repo.find_matching_permission.return_value = None
+
+        decision = rbac_service.authorize(context)
+
+        assert decision.is_denied()
+        assert decision.reasons[0].type == "rbac_deny"
+
+    def test_get_user_permissions_reads_materialized_keys(
+        self, rbac_service, effective_permission_repo
+    ):
+        """Test user permissions come straight from the materialized table."""
+        user_id, organization_id = uuid4(), uuid4()
+        effective_permission_repo.get_permission_keys.return_value = ["user:read"]
+
+        permissions = rbac_service.get_user_permissions(user_id, organization_id)
+
+        assert permissions == ["user:read"]
+        rbac_service._permission_repository.get_role_permissions.assert_not_called()
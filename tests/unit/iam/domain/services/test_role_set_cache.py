@@ -0,0 +1,50 @@
+from uuid import uuid4
+
+from src.iam.domain.services.jwt_service import JWTService
+from src.iam.domain.services.role_set_cache import RoleSetCache, set_role_set_cache
+
+
+class TestRoleSetCache:
+    """Test cases for compact JWT claims resolution."""
+
+    def setup_method(self):
+        self.cache = RoleSetCache()
+        set_role_set_cache(self.cache)
+        self.user_id = str(uuid4())
+        self.organization_id = str(uuid4())
+
+    def test_claims_resolve_through_the_users_current_role_set(self):
+        """Test claims follow the user's roles after they change."""
+        self.cache.put(["admin"], ["user:read"], self.user_id, self.organization_id)
+        self.cache.reload_cache()
+
+        assert self.cache.get(self.user_id, self.organization_id) is None
+
+        self.cache.put(["member"], [], self.user_id, self.organization_id)
+        role_set = self.cache.get(self.user_id, self.organization_id)
+
+        assert role_set.roles == ("member",)
+        assert self.cache.get(self.user_id, str(uuid4())) is None
+
+    def test_compact_token_omits_lists_and_resolves_from_cache(self):
+        """Test compact tokens carry only the user's identity."""
+        jwt_service = JWTService()
+        token = jwt_service.create_access_token(
+            user_id=self.user_id,
+            organization_id=self.organization_id,
+            permissions=["user:read"],
+            roles=["admin"],
+            user_agent="test-agent",
+            compact=True,
+        )
+        payload = jwt_service.decode_token(token)
+
+        assert payload.compact
+        assert payload.permissions == [] and payload.user_agent is None
+        assert set(payload.to_dict()) == {"sub", "exp", "iat", "org_id", "compact"}
+        assert not jwt_service.has_permission(token, "user:read")
+
+        self.cache.put(["admin"], ["user:*"], self.user_id, self.organization_id)
+
+        assert jwt_service.has_permission(token, "user:read")
+        assert jwt_service.get_token_roles(token) == ["admin"]
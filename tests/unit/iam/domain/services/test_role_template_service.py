@@ -0,0 +1,87 @@
+from unittest.mock import Mock
+from uuid import uuid4
+
+from src.iam.domain.entities.permission import Permission, PermissionAction
+from src.iam.domain.entities.role import Role
+from src.iam.domain.services.role_template_service import RoleTemplateService
+
+
+class TestRoleTemplateService:
+    """Test cases for copy-on-write default-role templates."""
+
+    def setup_method(self):
+        self.organization_id = uuid4()
+        self.template = Role.create(
+            name="member",
+            description="Organization member",
+            created_by=uuid4(),
+            is_system_role=True,
+        )
+        self.permission = Permission.create(
+            name="user:read",
+            description="Read users",
+            action=PermissionAction.READ,
+            resource_type="user",
+        )
+
+        self.role_repository = Mock()
+        self.role_repository.get_role_templates.return_value = [self.template]
+        self.role_repository.get_organization_roles.return_value = []
+        self.role_repository.get_by_name.return_value = None
+        self.role_repository.get_role_permissions.return_value = [self.permission]
+        self.role_repository.save.side_effect = lambda role: role
+        self.moved_user_ids = [uuid4(), uuid4()]
+        self.role_repository.reassign_organization_role.return_value = (
+            self.moved_user_ids
+        )
+        self.effective_permission_repository = Mock()
+
+        self.service = RoleTemplateService(
+            self.role_repository, self.effective_permission_repository
+        )
+
+    def test_organization_resolves_to_templates_until_customized(self):
+        """Test organizations without copies see the shared templates."""
+        assert self.service.resolve_organization_roles(self.organization_id) == [
+            self.template
+        ]
+        assert self.service.resolve_role("member", self.organization_id) == self.template
+
+        copy = self.template.model_copy(
+            update={"id": uuid4(), "organization_id": self.organization_id}
+        )
+        self.role_repository.get_organization_roles.return_value = [copy]
+
+        assert self.service.resolve_organization_roles(self.organization_id) == [copy]
+
+    def test_materialize_copies_permissions_and_assignments(self):
+        """Test customizing a template creates an organization copy once."""
+        copy = self.service.materialize(self.template, self.organization_id)
+
+        assert copy.id != self.template.id
+        assert copy.organization_id == self.organization_id
+        assert copy.name == self.template.name
+        assert not copy.is_system_role
+        assert copy.set_parent_role(uuid4()).parent_role_id is not None
+        self.role_repository.assign_permissions.assert_called_once_with(
+            copy.id, [self.permission.id]
+        )
+        self.role_repository.reassign_organization_role.assert_called_once_with(
+            self.organization_id, self.template.id, copy.id
+        )
+        self.effective_permission_repository.refresh_users.assert_called_once_with(
+            self.moved_user_ids
+        )
+
+    def test_materialize_leaves_organization_roles_alone(self):
+        """Test non-template roles are modified in place."""
+        role = Role.create(
+            name="auditor",
+            description="Custom role",
+            created_by=uuid4(),
+            organization_id=self.organization_id,
+        )
+
+        assert self.service.materialize(role, self.organization_id) is role
+        self.role_repository.save.assert_not_called()
+        self.effective_permission_repository.refresh_users.assert_not_called()
@@ -0,0 +1,80 @@
+import pytest
+from uuid import uuid4
+
+from src.iam.domain.entities.role import Role
+from src.iam.domain.value_objects.role_hierarchy import RoleHierarchy
+
+
+class TestRoleHierarchy:
+    """Unit tests for RoleHierarchy value object."""
+
+    @pytest.fixture
+    def roles(self):
+        """Create a chain admin -> manager -> member plus a sibling viewer."""
+        created_by = uuid4()
+        admin = Role.create(name="admin", description="Admin", created_by=created_by)
+        manager = Role.create(
+            name="manager",
+            description="Manager",
+            created_by=created_by,
+            parent_role_id=admin.id,
+        )
+        member = Role.create(
+            name="member",
+            description="Member",
+            created_by=created_by,
+            parent_role_id=manager.id,
+        )
+        viewer = Role.create(
+            name="viewer",
+            description="Viewer",
+            created_by=created_by,
+            parent_role_id=admin.id,
+        )
+        return {"admin": admin, "manager": manager, "member": member, "viewer": viewer}
+
+    def test_path_and_depth(self, roles):
+        """Test paths run from the root ancestor to the role."""
+        hierarchy = RoleHierarchy(roles.values())
+
+        assert hierarchy.get_path(roles["member"].id) == [
+            roles["admin"].id,
+            roles["manager"].id,
+            roles["member"].id,
+        ]
+        assert hierarchy.get_depth(roles["member"].id) == 2
+        assert hierarchy.get_depth(roles["admin"].id) == 0
+        assert [r.id for r in hierarchy.get_ancestors(roles["member"].id)] == [
+            roles["manager"].id,
+            roles["admin"].id,
+        ]
+
+    def test_descendants_depth_first(self, roles):
+        """Test descendants list each subtree right after its root."""
+        hierarchy = RoleHierarchy(roles.values())
+
+        descendants = [r.id for r in hierarchy.get_descendants(roles["admin"].id)]
+
+        assert descendants == [
+            roles["manager"].id,
+            roles["member"].id,
+            roles["viewer"].id,
+        ]
+        assert hierarchy.get_descendants(roles["member"].id) == []
+
+    def test_cycle_detection(self, roles):
+        """Test re-parenting a role under its own descendant is a cycle."""
+        hierarchy = RoleHierarchy(roles.values())
+
+        assert hierarchy.would_create_cycle(roles["admin"].id, roles["member"].id)
+        assert not hierarchy.would_create_cycle(roles["viewer"].id, roles["member"].id)
+        assert hierarchy.is_descendant_of(roles["member"].id, roles["admin"].id)
+        assert not hierarchy.is_descendant_of(roles["viewer"].id, roles["manager"].id)
+
+    def test_walks_stop_on_cycles(self, roles):
+        """Test walks terminate on corrupt, cyclic data."""
+        looped = roles["admin"].set_parent_role(roles["member"].id)
+        hierarchy = RoleHierarchy([looped, roles["manager"], roles["member"]])
+
+        assert len(hierarchy.get_path(roles["member"].id)) == 3
+        assert len(hierarchy.get_descendants(roles["admin"].id)) == 2
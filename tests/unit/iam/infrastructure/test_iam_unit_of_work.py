@@ -0,0 +1,16 @@
+from unittest.mock import Mock
+
+from src.iam.infrastructure.iam_unit_of_work import IAMUnitOfWork
+
+
+class TestIAMUnitOfWork:
+    """Test cases for the IAM unit of work."""
+
+    def test_repositories_are_bound_to_their_own_session(self):
+        """Test units of work on other threads do not replace each other's repositories."""
+        request_uow = IAMUnitOfWork(Mock(), ["user_session", "user"])
+        job_uow = IAMUnitOfWork(Mock(), ["user_session", "role"])
+
+        assert request_uow.get_repository("user_session").session is request_uow.session
+        assert job_uow.get_repository("user_session").session is job_uow.session
+        assert request_uow.get_repository("role") is None
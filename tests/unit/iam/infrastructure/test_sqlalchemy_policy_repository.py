@@ -0,0 +1,81 @@
+import pytest
+from unittest.mock import Mock
+from uuid import uuid4
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from src.iam.domain.entities.policy import Policy, PolicyEffect
+from src.iam.infrastructure.database.models import PolicyModel
+from src.iam.infrastructure.repositories import sqlalchemy_policy_repository
+from src.iam.infrastructure.repositories.sqlalchemy_policy_repository import (
+    SqlAlchemyPolicyRepository,
+)
+from src.shared.infrastructure.database.connection import Base, SCHEMA_NAME
+
+
+class TestSqlAlchemyPolicyRepositoryIndexInvalidation:
+    """Test cases for dropping indexed policies when writes commit."""
+
+    @pytest.fixture
+    def session(self):
+        engine = create_engine(
+            "sqlite://",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+
+        @event.listens_for(engine, "connect")
+        def _attach_schema(dbapi_connection, _):
+            dbapi_connection.execute(f"ATTACH DATABASE ':memory:' AS {SCHEMA_NAME}")
+
+        Base.metadata.create_all(engine, tables=[PolicyModel.__table__])
+        with Session(engine) as session:
+            yield session
+
+    @pytest.fixture
+    def policy_index(self, monkeypatch):
+        policy_index = Mock()
+        monkeypatch.setattr(
+            sqlalchemy_policy_repository, "get_policy_index", lambda: policy_index
+        )
+        return policy_index
+
+    @staticmethod
+    def _policy(organization_id):
+        return Policy.create(
+            name="deny-exports",
+            description="Deny exports",
+            effect=PolicyEffect.DENY,
+            resource_type="document",
+            action="download",
+            conditions=[],
+            created_by=uuid4(),
+            organization_id=organization_id,
+        )
+
+    def test_invalidates_after_commit_only(self, session, policy_index):
+        """Test readers keep the index until the written policies are committed."""
+        organization_id = uuid4()
+        repository = SqlAlchemyPolicyRepository(session)
+
+        policy = repository.save(self._policy(organization_id))
+        policy_index.invalidate.assert_not_called()
+
+        session.commit()
+        policy_index.invalidate.assert_called_once_with(organization_id)
+
+        repository.delete(policy.id)
+        session.commit()
+        assert policy_index.invalidate.call_count == 2
+
+    def test_rolled_back_writes_keep_the_index(self, session, policy_index):
+        """Test a rolled back write does not invalidate on a later commit."""
+        repository = SqlAlchemyPolicyRepository(session)
+
+        repository.save(self._policy(uuid4()))
+        session.rollback()
+        session.commit()
+
+        policy_index.invalidate.assert_not_called()
@@ -0,0 +1,162 @@
+import pytest
+from unittest.mock import Mock
+from uuid import UUID, uuid4
+
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from src.iam.infrastructure.database.models import (
+    AuthorizationSubjectModel,
+    EffectiveUserPermissionModel,
+    OrganizationModel,
+    PermissionModel,
+    RoleModel,
+    UserOrganizationRoleModel,
+    role_permission_association,
+    user_role_assignment,
+)
+from src.orchestration.application.use_cases.bulk_onboard_tenants import (
+    BulkOnboardTenantsUseCase,
+)
+from src.orchestration.domain.value_objects import (
+    TenantProvisioningResult,
+    TenantSetupRequest,
+)
+from src.orchestration.infrastructure.services.bulk_tenant_provisioner import (
+    SqlAlchemyBulkTenantProvisioner,
+)
+from src.plans.infrastructure.database.models import SubscriptionModel
+from src.shared.infrastructure.database.connection import Base, SCHEMA_NAME
+
+
+class RecordingProvisioner:
+    """Provisioner double recording the batches it receives."""
+
+    def __init__(self):
+        self.batches = []
+
+    def provision_batch(self, batch):
+        self.batches.append([request.tenant_name for _, request in batch])
+        return [
+            TenantProvisioningResult(
+                index=index,
+                tenant_name=request.tenant_name,
+                success=True,
+                tenant_id=f"tenant-{index}",
+            )
+            for index, request in batch
+        ]
+
+
+class TestBulkOnboardTenantsUseCase:
+    """Unit tests for bulk tenant onboarding."""
+
+    @pytest.fixture
+    def plans_service(self):
+        service = Mock()
+        service.get_plan.side_effect = lambda plan_id: (
+            {"id": plan_id} if plan_id == "plan-1" else None
+        )
+        return service
+
+    @pytest.fixture
+    def provisioner(self):
+        return RecordingProvisioner()
+
+    @staticmethod
+    def _request(name, plan_id="plan-1"):
+        return TenantSetupRequest(user_id="user-1", plan_id=plan_id, tenant_name=name)
+
+    def test_provisions_in_batches(self, plans_service, provisioner):
+        """Test tenants are chunked and plans validated once each."""
+        use_case = BulkOnboardTenantsUseCase(plans_service, provisioner, batch_size=2)
+
+        results = list(use_case.execute([self._request(f"Tenant {i}") for i in range(5)]))
+
+        assert [result.index for result in results] == [0, 1, 2, 3, 4]
+        assert all(result.success for result in results)
+        assert [len(batch) for batch in provisioner.batches] == [2, 2, 1]
+        plans_service.get_plan.assert_called_once_with("plan-1")
+
+    def test_rejects_unknown_plans_and_repeated_names(self, plans_service, provisioner):
+        """Test invalid tenants fail without reaching the provisioner."""
+        use_case = BulkOnboardTenantsUseCase(plans_service, provisioner)
+
+        results = {
+            result.index: result
+            for result in use_case.execute(
+                [
+                    self._request("Acme Corp"),
+                    self._request("Globex", plan_id="missing"),
+                    self._request("Acme Corp"),
+                ]
+            )
+        }
+
+        assert results[0].success
+        assert results[1].error_message == "Plan missing not found"
+        assert "repeated" in results[2].error_message
+        assert provisioner.batches == [["Acme Corp"]]
+
+
+class TestSqlAlchemyBulkTenantProvisioner:
+    """Tests for the set-based writes of a chunk of tenants."""
+
+    @pytest.fixture
+    def session(self):
+        engine = create_engine(
+            "sqlite://",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+
+        @event.listens_for(engine, "connect")
+        def _attach_schema(dbapi_connection, _):
+            dbapi_connection.execute(f"ATTACH DATABASE ':memory:' AS {SCHEMA_NAME}")
+
+        Base.metadata.create_all(
+            engine,
+            tables=[
+                OrganizationModel.__table__,
+                RoleModel.__table__,
+                PermissionModel.__table__,
+                role_permission_association,
+                UserOrganizationRoleModel.__table__,
+                user_role_assignment,
+                AuthorizationSubjectModel.__table__,
+                EffectiveUserPermissionModel.__table__,
+                SubscriptionModel.__table__,
+            ],
+        )
+        with Session(engine) as session:
+            yield session
+
+    def test_owners_permissions_are_materialized(self, session):
+        """Test the chunk's owners are authorized in their new organizations."""
+        owner_id, plan_id = str(uuid4()), str(uuid4())
+        results = SqlAlchemyBulkTenantProvisioner(session).provision_batch(
+            [
+                (0, TenantSetupRequest(owner_id, plan_id, "Acme Corp")),
+                (1, TenantSetupRequest(owner_id, plan_id, "Globex Inc")),
+            ]
+        )
+
+        assert all(result.success for result in results)
+        for result in results:
+            organization_id = UUID(result.tenant_id)
+            permission_keys = session.execute(
+                select(EffectiveUserPermissionModel.permission_key).where(
+                    EffectiveUserPermissionModel.user_id == UUID(owner_id),
+                    EffectiveUserPermissionModel.organization_id == organization_id,
+                )
+            ).scalars().all()
+            subject = session.execute(
+                select(AuthorizationSubjectModel).where(
+                    AuthorizationSubjectModel.organization_id == organization_id
+                )
+            ).scalar_one()
+
+            assert "user:*" in permission_keys
+            assert subject.subject_type == "user"
+            assert subject.subject_id == UUID(owner_id)
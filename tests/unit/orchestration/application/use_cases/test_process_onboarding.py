@@ -0,0 +1,150 @@
+import pytest
+from datetime import datetime
+from unittest.mock import Mock
+
+from src.orchestration.application.use_cases.onboard_tenant import OnboardTenantUseCase
+from src.orchestration.application.use_cases.process_onboarding import (
+    ProcessOnboardingUseCase,
+)
+from src.orchestration.domain.entities import OnboardingStatus, OnboardingStep
+from src.orchestration.domain.value_objects import TenantSetupRequest
+from src.orchestration.infrastructure.workers import OnboardingWorkerPool
+
+
+class InMemoryOnboardingRepository:
+    """Queue double keeping a snapshot of every save."""
+
+    def __init__(self):
+        self.workflows = {}
+        self.saved_steps = []
+
+    def save(self, workflow):
+        self.workflows[workflow.id] = workflow
+        self.saved_steps.append(list(workflow.completed_steps))
+
+    def get_by_id(self, workflow_id):
+        return self.workflows[workflow_id]
+
+    def claim_next(self, worker_id, lease_seconds=300):
+        now = datetime.utcnow()
+        for workflow in self.workflows.values():
+            if workflow.status == OnboardingStatus.PENDING and workflow.next_attempt_at <= now:
+                workflow.start(worker_id, now)
+                return workflow
+        return None
+
+
+class TestProcessOnboardingUseCase:
+    """Unit tests for the queued onboarding pipeline."""
+
+    @pytest.fixture
+    def repository(self):
+        return InMemoryOnboardingRepository()
+
+    @pytest.fixture
+    def iam_service(self):
+        service = Mock()
+        service.create_tenant.return_value = "tenant-1"
+        service.find_tenant.return_value = None
+        return service
+
+    @pytest.fixture
+    def plans_service(self):
+        service = Mock()
+        service.get_plan.return_value = {"id": "plan-1"}
+        return service
+
+    @pytest.fixture
+    def processor(self, iam_service, plans_service, repository):
+        return ProcessOnboardingUseCase(
+            iam_service, plans_service, repository, retry_backoff_seconds=0
+        )
+
+    @staticmethod
+    def _enqueue(repository, max_attempts=5):
+        return OnboardTenantUseCase(repository, max_attempts=max_attempts).execute(
+            TenantSetupRequest(user_id="user-1", plan_id="plan-1", tenant_name="Acme Corp")
+        )
+
+    def test_enqueue_does_no_provisioning(self, repository, iam_service):
+        """Test the request only queues a pending workflow."""
+        workflow = self._enqueue(repository)
+
+        assert repository.get_by_id(workflow.id).status == OnboardingStatus.PENDING
+        iam_service.create_tenant.assert_not_called()
+
+    def test_runs_all_steps_with_checkpoints(self, processor, repository):
+        """Test a worker completes the workflow, saving after every step."""
+        workflow = self._enqueue(repository)
+
+        processor.process_next("worker-1")
+
+        assert workflow.is_completed()
+        assert workflow.tenant_id == "tenant-1"
+        assert workflow.locked_by is None
+        assert len(repository.saved_steps) == 1 + len(OnboardingStep) + 1
+
+    def test_retry_resumes_after_last_checkpoint(
+        self, processor, repository, iam_service
+    ):
+        """Test a failed step is retried without redoing finished steps."""
+        workflow = self._enqueue(repository)
+        iam_service.assign_user_to_tenant.side_effect = [ConnectionError("db down"), None]
+
+        processor.process_next("worker-1")
+        assert workflow.status == OnboardingStatus.PENDING
+        assert workflow.completed_steps == ["validate_plan", "create_tenant"]
+
+        processor.process_next("worker-2")
+        assert workflow.is_completed()
+        assert workflow.attempts == 2
+        iam_service.create_tenant.assert_called_once()
+
+    def test_retry_reuses_tenant_created_before_checkpoint(
+        self, processor, repository, iam_service
+    ):
+        """Test a retry finds the tenant by name and owner instead of recreating it."""
+        workflow = self._enqueue(repository)
+        save = repository.save
+        repository.save = Mock(side_effect=[None, ConnectionError("db down"), None])
+
+        processor.process_next("worker-1")
+        repository.save = save
+        # The lost checkpoint leaves the workflow as it was before the step
+        workflow.completed_steps = ["validate_plan"]
+        workflow.tenant_id = ""
+        iam_service.find_tenant.return_value = "tenant-1"
+
+        processor.process_next("worker-2")
+        assert workflow.is_completed()
+        assert workflow.tenant_id == "tenant-1"
+        iam_service.create_tenant.assert_called_once_with("Acme Corp", "user-1", None)
+        iam_service.find_tenant.assert_called_once_with("Acme Corp", "user-1")
+
+    def test_validation_errors_and_exhausted_retries_fail(
+        self, processor, repository, plans_service, iam_service
+    ):
+        """Test invalid workflows fail at once and transient errors eventually do."""
+        plans_service.get_plan.return_value = None
+        invalid = self._enqueue(repository)
+        processor.process_next("worker-1")
+
+        plans_service.get_plan.return_value = {"id": "plan-1"}
+        iam_service.create_tenant.side_effect = ConnectionError("db down")
+        flaky = self._enqueue(repository, max_attempts=2)
+        processor.process_next("worker-1")
+        processor.process_next("worker-1")
+
+        assert invalid.is_failed() and invalid.attempts == 1
+        assert flaky.is_failed() and flaky.attempts == 2
+        assert flaky.error_message == "db down"
+
+    def test_worker_pool_drains_queue(self, processor, repository):
+        """Test the pool processes workflows until the queue is empty."""
+        workflows = [self._enqueue(repository) for _ in range(3)]
+        pool = OnboardingWorkerPool(
+            lambda worker_id: processor.process_next(worker_id) is not None
+        )
+
+        assert pool.drain() == 3
+        assert all(workflow.is_completed() for workflow in workflows)
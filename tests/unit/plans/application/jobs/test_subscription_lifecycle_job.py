@@ -0,0 +1,101 @@
+import pytest
+from datetime import datetime, timezone
+from unittest.mock import Mock, MagicMock
+from uuid import uuid4
+
+from plans.application.jobs.subscription_lifecycle_job import SubscriptionLifecycleJob
+from plans.domain.entities.subscription import SubscriptionStatus
+from shared.domain.entities.job_checkpoint import JobCheckpoint
+
+
+class TestSubscriptionLifecycleJob:
+    """Test cases for SubscriptionLifecycleJob phases and resumption."""
+
+    NOW = datetime(2026, 11, 1, 9, 40, tzinfo=timezone.utc)
+    RUN_KEY = "2026-11-01T09:00:00+00:00"
+
+    @pytest.fixture
+    def subscription_repo(self):
+        repo = Mock()
+        repo.renew_due_chunk.return_value = (0, 0, None)
+        repo.expire_due_chunk.return_value = (0, 0, None)
+        return repo
+
+    @pytest.fixture
+    def checkpoint_repo(self):
+        store = {}
+
+        def save(checkpoint):
+            store[checkpoint.job_name] = checkpoint
+            return checkpoint
+
+        repo = Mock()
+        repo.get.side_effect = store.get
+        repo.save.side_effect = save
+        return repo
+
+    @pytest.fixture
+    def job(self, subscription_repo, checkpoint_repo):
+        def uow_factory():
+            uow = MagicMock()
+            uow.__enter__.return_value = uow
+            uow.get_repository.side_effect = lambda name: {
+                "subscription": subscription_repo,
+                "job_checkpoint": checkpoint_repo,
+            }[name]
+            return uow
+
+        return SubscriptionLifecycleJob(uow_factory, chunk_size=2)
+
+    def test_run_walks_every_phase(self, job, subscription_repo):
+        """Test renewals run before expirations and counts are recorded."""
+        first_id, second_id = uuid4(), uuid4()
+        subscription_repo.renew_due_chunk.side_effect = [(2, 2, first_id), (0, 0, None)]
+        subscription_repo.expire_due_chunk.side_effect = [
+            (1, 1, second_id),
+            (0, 0, None),
+            (0, 0, None),
+        ]
+
+        result = job.run(now=self.NOW)
+
+        checkpoint = result["checkpoint"]
+        assert result["chunks_processed"] == 5
+        assert checkpoint["is_completed"] is True
+        assert checkpoint["run_key"] == self.RUN_KEY
+        assert checkpoint["details"]["renewed"] == 2
+        assert checkpoint["details"]["expired"] == 1
+        expire_calls = subscription_repo.expire_due_chunk.call_args_list
+        assert expire_calls[0].args[0] == SubscriptionStatus.ACTIVE
+        assert expire_calls[0].kwargs["after_id"] is None
+        assert expire_calls[1].kwargs["after_id"] == second_id
+        assert expire_calls[2].args[0] == SubscriptionStatus.TRIAL
+        assert subscription_repo.renew_due_chunk.call_args.args[0] == datetime(
+            2026, 11, 1, 9, 0, tzinfo=timezone.utc
+        )
+
+    def test_run_resumes_in_stored_phase(self, job, subscription_repo, checkpoint_repo):
+        """Test an interrupted run continues after the cursor of its phase."""
+        cursor = uuid4()
+        checkpoint_repo.save(
+            JobCheckpoint.start(job.job_name, self.RUN_KEY).advance(
+                str(cursor), 500, 20, details={"phase": "expirations", "expired": 20}
+            )
+        )
+
+        result = job.run(now=self.NOW)
+
+        subscription_repo.renew_due_chunk.assert_not_called()
+        first_call = subscription_repo.expire_due_chunk.call_args_list[0]
+        assert first_call.kwargs["after_id"] == cursor
+        assert result["checkpoint"]["details"]["expired"] == 20
+        assert result["checkpoint"]["is_completed"] is True
+
+    def test_completed_run_is_not_repeated(self, job, subscription_repo, checkpoint_repo):
+        """Test a finished run is skipped until the next hour."""
+        checkpoint_repo.save(JobCheckpoint.start(job.job_name, self.RUN_KEY).complete())
+
+        result = job.run(now=self.NOW)
+
+        assert result["chunks_processed"] == 0
+        subscription_repo.renew_due_chunk.assert_not_called()
@@ -0,0 +1,100 @@
+import pytest
+from datetime import datetime, timezone
+from unittest.mock import Mock, MagicMock
+from uuid import uuid4
+
+from plans.application.jobs.usage_rollover_job import UsageRolloverJob
+from plans.domain.entities.feature_usage import UsagePeriod
+from shared.domain.entities.job_checkpoint import JobCheckpoint
+
+
+class TestUsageRolloverJob:
+    """Test cases for UsageRolloverJob chunking and resumption."""
+
+    NOW = datetime(2026, 11, 1, 0, 5, tzinfo=timezone.utc)
+
+    @pytest.fixture
+    def usage_repo(self):
+        return Mock()
+
+    @pytest.fixture
+    def checkpoint_repo(self):
+        store = {}
+
+        def save(checkpoint):
+            store[checkpoint.job_name] = checkpoint
+            return checkpoint
+
+        repo = Mock()
+        repo.get.side_effect = store.get
+        repo.save.side_effect = save
+        return repo
+
+    @pytest.fixture
+    def job(self, usage_repo, checkpoint_repo):
+        def uow_factory():
+            uow = MagicMock()
+            uow.__enter__.return_value = uow
+            uow.get_repository.side_effect = lambda name: {
+                "feature_usage": usage_repo,
+                "job_checkpoint": checkpoint_repo,
+            }[name]
+            return uow
+
+        return UsageRolloverJob(uow_factory, chunk_size=2)
+
+    def test_run_processes_chunks_until_exhausted(self, job, usage_repo):
+        """Test each chunk advances the cursor and the run completes."""
+        first_id, second_id = uuid4(), uuid4()
+        usage_repo.open_next_period_chunk.side_effect = [
+            (2, 2, first_id),
+            (1, 0, second_id),
+            (0, 0, None),
+        ]
+
+        result = job.run(now=self.NOW)
+
+        assert result["chunks_processed"] == 3
+        assert result["checkpoint"]["processed"] == 3
+        assert result["checkpoint"]["affected"] == 2
+        assert result["checkpoint"]["is_completed"] is True
+        calls = usage_repo.open_next_period_chunk.call_args_list
+        assert calls[0].kwargs["after_id"] is None
+        assert calls[1].kwargs["after_id"] == first_id
+        assert calls[0].args[0] == UsagePeriod.MONTHLY
+
+    def test_run_resumes_from_checkpoint(self, job, usage_repo, checkpoint_repo):
+        """Test an interrupted run continues after the stored cursor."""
+        cursor = uuid4()
+        checkpoint_repo.save(
+            JobCheckpoint.start(job.job_name, "2026-11-01T00:00:00+00:00").advance(
+                str(cursor), 500, 480
+            )
+        )
+        usage_repo.open_next_period_chunk.side_effect = [(0, 0, None)]
+
+        result = job.run(now=self.NOW)
+
+        assert usage_repo.open_next_period_chunk.call_args.kwargs["after_id"] == cursor
+        assert result["checkpoint"]["processed"] == 500
+        assert result["checkpoint"]["is_completed"] is True
+
+    def test_completed_run_is_not_repeated(self, job, usage_repo, checkpoint_repo):
+        """Test a finished period is skipped on later runs."""
+        checkpoint_repo.save(
+            JobCheckpoint.start(job.job_name, "2026-11-01T00:00:00+00:00").complete()
+        )
+
+        result = job.run(now=self.NOW)
+
+        assert result["chunks_processed"] == 0
+        usage_repo.open_next_period_chunk.assert_not_called()
+
+    def test_max_chunks_stops_early(self, job, usage_repo):
+        """Test a bounded run leaves the checkpoint open for resumption."""
+        usage_repo.open_next_period_chunk.return_value = (2, 2, uuid4())
+
+        result = job.run(now=self.NOW, max_chunks=1)
+
+        assert result["chunks_processed"] == 1
+        assert result["checkpoint"]["is_completed"] is False
@@ -0,0 +1,69 @@
+import pytest
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from plans.domain.entities.feature_usage import FeatureUsage, UsagePeriod
+from plans.domain.entities.usage_bucket import UsageBucket
+
+
+class TestUsageBucket:
+    """Unit tests for UsageBucket domain entity."""
+
+    def test_hourly_period_boundaries(self):
+        """Test hourly boundaries cover exactly one clock hour."""
+        moment = datetime(2026, 3, 4, 5, 42, 17, tzinfo=timezone.utc)
+
+        start, end = FeatureUsage._calculate_period_boundaries(
+            moment, UsagePeriod.HOURLY
+        )
+
+        assert start == datetime(2026, 3, 4, 5, 0, tzinfo=timezone.utc)
+        assert end == datetime(2026, 3, 4, 5, 59, 59, 999999, tzinfo=timezone.utc)
+
+    def test_for_moment_aligns_to_granularity(self):
+        """Test bucket boundaries are derived from the granularity."""
+        moment = datetime(2026, 3, 4, 5, 42, tzinfo=timezone.utc)
+
+        bucket = UsageBucket.for_moment(
+            organization_id=uuid4(),
+            feature_name="monthly_messages",
+            granularity=UsagePeriod.MONTHLY,
+            moment=moment,
+            total_usage=7,
+            event_count=3,
+        )
+
+        assert bucket.bucket_start == datetime(2026, 3, 1, tzinfo=timezone.utc)
+        assert bucket.bucket_end.month == 3
+        assert bucket.bucket_end.day == 31
+        assert bucket.total_usage == 7
+        assert bucket.event_count == 3
+
+    def test_to_trend_point(self):
+        """Test trend point serialization."""
+        bucket = UsageBucket.for_moment(
+            organization_id=uuid4(),
+            feature_name="monthly_messages",
+            granularity=UsagePeriod.DAILY,
+            moment=datetime(2026, 3, 4, 5, 42, tzinfo=timezone.utc),
+            total_usage=7,
+            event_count=3,
+        )
+
+        point = bucket.to_trend_point()
+
+        assert point["period_start"] == "2026-03-04T00:00:00+00:00"
+        assert point["usage"] == 7
+        assert point["event_count"] == 3
+
+    def test_bucket_immutability(self):
+        """Test that usage buckets are immutable."""
+        bucket = UsageBucket.for_moment(
+            organization_id=uuid4(),
+            feature_name="monthly_messages",
+            granularity=UsagePeriod.DAILY,
+            moment=datetime(2026, 3, 4, tzinfo=timezone.utc),
+        )
+
+        with pytest.raises(Exception):
+            bucket.total_usage = 10
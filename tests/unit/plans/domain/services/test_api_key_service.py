@@ -0,0 +1,117 @@
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+from uuid import uuid4
+
+from plans.domain.entities.api_key import ApiKeyPrincipal
+from plans.domain.services.api_key_cache import ApiKeyCache
+from plans.domain.services.api_key_service import (
+    ApiKeySecretMissingError,
+    ApiKeyService,
+)
+
+
+class TestApiKeyService:
+    """Unit tests for API key issuing and verification."""
+
+    @pytest.fixture
+    def service(self):
+        return ApiKeyService("test-secret")
+
+    @staticmethod
+    def _repository(service, raw_key, api_key, is_active=True, expires_at=None):
+        repository = Mock()
+        repository.resolve_principal.side_effect = lambda key_prefix: (
+            ApiKeyPrincipal(
+                key_id=api_key.id,
+                key_type=api_key.key_type,
+                key_prefix=api_key.key_prefix,
+                key_digest=api_key.key_digest,
+                application_instance_id=api_key.application_instance_id,
+                organization_id=uuid4(),
+                is_active=is_active,
+                expires_at=expires_at,
+                effective_limits={"api_requests_per_minute": 1000},
+            )
+            if key_prefix == api_key.key_prefix
+            else None
+        )
+        return repository
+
+    def test_generated_key_stores_prefix_and_digest_only(self, service):
+        """Test the plaintext key is not part of the stored entity."""
+        raw_key, api_key = service.generate_api_key(uuid4(), "whatsapp")
+
+        assert raw_key.startswith(f"{api_key.key_prefix}_")
+        assert api_key.key_prefix.startswith("WHA_")
+        assert api_key.key_digest == service.digest(raw_key)
+        assert raw_key not in api_key.model_dump_json()
+
+    def test_authenticates_valid_key(self, service):
+        """Test a valid key resolves to its principal and limits."""
+        raw_key, api_key = service.generate_api_key(uuid4(), "chat")
+        repository = self._repository(service, raw_key, api_key)
+
+        principal = service.authenticate(raw_key, repository)
+
+        assert principal.key_id == api_key.id
+        assert principal.get_limit("api_requests_per_minute") == 1000
+
+    def test_rejects_tampered_malformed_and_foreign_keys(self, service):
+        """Test keys failing the digest check do not authenticate."""
+        raw_key, api_key = service.generate_api_key(uuid4(), "chat")
+        repository = self._repository(service, raw_key, api_key)
+
+        assert service.authenticate(raw_key + "x", repository) is None
+        assert service.authenticate("not-a-key", repository) is None
+        assert ApiKeyService("other-secret").authenticate(raw_key, repository) is None
+
+    def test_requires_a_secret(self):
+        """Test keys cannot be issued or verified without a configured secret."""
+        with pytest.raises(ApiKeySecretMissingError):
+            ApiKeyService(None)
+
+        with pytest.raises(ApiKeySecretMissingError):
+            ApiKeyService("")
+
+    def test_rejects_inactive_and_expired_keys(self, service):
+        """Test revoked keys, inactive instances and expired keys are refused."""
+        raw_key, api_key = service.generate_api_key(uuid4(), "chat")
+
+        inactive = self._repository(service, raw_key, api_key, is_active=False)
+        expired = self._repository(
+            service, raw_key, api_key, expires_at=datetime.utcnow() - timedelta(minutes=1)
+        )
+
+        assert service.authenticate(raw_key, inactive) is None
+        assert service.authenticate(raw_key, expired) is None
+
+    def test_cache_serves_repeated_and_unknown_keys(self, service):
+        """Test known and unknown prefixes only reach the repository once."""
+        raw_key, api_key = service.generate_api_key(uuid4(), "chat")
+        repository = self._repository(service, raw_key, api_key)
+        cache = ApiKeyCache()
+        unknown_key, _ = service.generate_api_key(uuid4(), "chat")
+
+        for _ in range(3):
+            assert service.authenticate(raw_key, repository, cache) is not None
+            assert service.authenticate(unknown_key, repository, cache) is None
+
+        assert repository.resolve_principal.call_count == 2
+        info = cache.get_cache_info()
+        assert info["hits"] == 2
+        assert info["negative_hits"] == 2
+
+    def test_revocation_drops_cached_principal(self, service):
+        """Test revoked and invalidated keys are re-read."""
+        raw_key, api_key = service.generate_api_key(uuid4(), "chat")
+        repository = self._repository(service, raw_key, api_key)
+        cache = ApiKeyCache()
+
+        service.authenticate(raw_key, repository, cache)
+        cache.revoke(api_key.key_prefix)
+        service.authenticate(raw_key, repository, cache)
+        cache.invalidate_instance(api_key.application_instance_id)
+        service.authenticate(raw_key, repository, cache)
+
+        assert repository.resolve_principal.call_count == 3
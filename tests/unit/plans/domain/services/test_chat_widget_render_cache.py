@@ -0,0 +1,61 @@
+import pytest
+from unittest.mock import Mock
+from uuid import uuid4
+
+from plans.domain.services.chat_widget_render_cache import ChatWidgetRenderCache
+from plans.domain.value_objects.chat_configuration import ChatIframeConfiguration
+from plans.domain.value_objects.chat_widget_render import ChatWidgetRender
+
+
+class TestChatWidgetRenderCache:
+    """Test cases for ChatWidgetRenderCache versioning and ETags."""
+
+    ENDPOINT = "https://chat.example.com/widget"
+
+    @pytest.fixture
+    def config(self):
+        return ChatIframeConfiguration(enabled=True, position="top-left")
+
+    def test_render_is_reused_while_version_is_unchanged(self, config):
+        """Test an expired entry of the same version is kept, not re-rendered."""
+        cache = ChatWidgetRenderCache(ttl_seconds=0)
+        organization_id = uuid4()
+        renderer = Mock(
+            side_effect=lambda: ChatWidgetRender.render(
+                config, str(organization_id), self.ENDPOINT, "v1"
+            )
+        )
+
+        first = cache.store(organization_id, self.ENDPOINT, "v1", renderer)
+        again = cache.store(organization_id, self.ENDPOINT, "v1", renderer)
+        cache.store(organization_id, self.ENDPOINT, "v2", renderer)
+
+        assert again is first
+        assert renderer.call_count == 2
+        assert cache.get_fresh(organization_id, self.ENDPOINT) is None
+
+    def test_fresh_entry_served_until_invalidated(self, config):
+        """Test fresh renders skip loading and invalidation drops them."""
+        cache = ChatWidgetRenderCache(ttl_seconds=60)
+        organization_id = uuid4()
+        render = ChatWidgetRender.render(config, str(organization_id), self.ENDPOINT, "v1")
+        cache.store(organization_id, self.ENDPOINT, "v1", lambda: render)
+
+        assert cache.get_fresh(organization_id, self.ENDPOINT) is render
+
+        cache.invalidate(organization_id)
+        assert cache.get_fresh(organization_id, self.ENDPOINT) is None
+
+    def test_etag_follows_content(self, config):
+        """Test equal content shares an ETag and If-None-Match is matched weakly."""
+        organization_id = str(uuid4())
+        render = ChatWidgetRender.render(config, organization_id, self.ENDPOINT, "v1")
+        same = ChatWidgetRender.render(config, organization_id, self.ENDPOINT, "v2")
+        changed = ChatWidgetRender.render(
+            config.update_position("bottom-left"), organization_id, self.ENDPOINT, "v3"
+        )
+
+        assert render.etag == same.etag != changed.etag
+        assert render.matches_etag(f'"other", W/{render.etag}')
+        assert not render.matches_etag(changed.etag)
+        assert not render.matches_etag(None)
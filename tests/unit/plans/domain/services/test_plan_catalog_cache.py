@@ -0,0 +1,64 @@
+import pytest
+from decimal import Decimal
+
+from plans.domain.entities.plan import Plan, PlanType
+from plans.domain.services.plan_catalog_cache import PlanCatalogCache
+from plans.domain.value_objects.pricing import Currency, Pricing, PricingModel
+
+
+class TestPlanCatalogCache:
+    """Unit tests for the process-wide plan catalog."""
+
+    @pytest.fixture
+    def cache(self):
+        return PlanCatalogCache(ttl_seconds=60)
+
+    @staticmethod
+    def _plan(name: str, plan_type: PlanType = PlanType.BASIC) -> Plan:
+        return Plan.create(
+            name=name,
+            description=f"{name} plan",
+            plan_type=plan_type,
+            pricing=Pricing(
+                amount=Decimal("10.00"), currency=Currency.USD, model=PricingModel.FIXED
+            ),
+        )
+
+    def test_catalog_is_loaded_once_and_indexed(self, cache):
+        """Test lookups by id, name and type share one load."""
+        basic, premium = self._plan("Basic"), self._plan("Premium", PlanType.PREMIUM)
+        loads = []
+
+        def loader():
+            loads.append(1)
+            return [basic, premium]
+
+        catalog = cache.get_catalog(loader)
+        assert cache.get_catalog(loader) is catalog
+        assert len(loads) == 1
+
+        assert catalog.get(basic.id) is basic
+        assert catalog.get_by_name("Premium") is premium
+        assert catalog.filter(plan_type="premium") == [premium]
+        assert catalog.filter(is_active=False) == []
+
+    def test_invalidation_discards_loads_in_flight(self, cache):
+        """Test a load that raced an invalidation is not kept."""
+        plans = [self._plan("Basic")]
+
+        def stale_loader():
+            cache.invalidate()
+            return plans
+
+        cache.get_catalog(stale_loader)
+        loads = []
+        cache.get_catalog(lambda: loads.append(1) or plans)
+
+        assert loads == [1]
+        assert cache.get_cache_info()["misses"] == 2
+
+    def test_disabled_cache_defers_to_the_database(self, cache):
+        """Test repositories query directly while the cache is disabled."""
+        cache.disable_cache()
+
+        assert cache.get_catalog(lambda: [self._plan("Basic")]) is None
@@ -0,0 +1,70 @@
+import pytest
+from uuid import uuid4
+
+from plans.domain.entities.feature_usage import FeatureUsage, UsagePeriod
+from plans.domain.services.usage_budget_cache import UsageBudgetCache
+
+
+class TestUsageBudgetCache:
+    """Unit tests for the usage admission fast path."""
+
+    @pytest.fixture
+    def cache(self):
+        return UsageBudgetCache(ttl_seconds=60, margin_ratio=0.1, min_margin=5)
+
+    @staticmethod
+    def _usage(limit_value: int, current_usage: int = 0) -> FeatureUsage:
+        return FeatureUsage.create(
+            organization_id=uuid4(),
+            feature_name="monthly_messages",
+            usage_period=UsagePeriod.MONTHLY,
+            limit_value=limit_value,
+            current_usage=current_usage,
+        )
+
+    def test_unknown_budget_requires_exact_check(self, cache):
+        """Test nothing is admitted before an exact read."""
+        assert cache.admit(uuid4(), "monthly_messages") is None
+
+    def test_unlimited_feature_is_always_admitted(self, cache):
+        """Test unlimited budgets skip the exact check."""
+        usage = self._usage(limit_value=-1)
+        cache.remember(usage)
+
+        assert cache.admit(usage.organization_id, usage.feature_name, 10_000, consume=True) == -1
+
+    def test_admits_until_safety_margin(self, cache):
+        """Test local consumption stops short of the margin."""
+        usage = self._usage(limit_value=100, current_usage=80)
+        cache.remember(usage)
+
+        # 20 remaining, margin is 10 (10% of 100)
+        assert cache.admit(usage.organization_id, usage.feature_name, 6, consume=True) == 14
+        assert cache.admit(usage.organization_id, usage.feature_name, 4, consume=True) == 10
+        assert cache.admit(usage.organization_id, usage.feature_name, 1, consume=True) is None
+
+    def test_check_without_consume_does_not_spend_budget(self, cache):
+        """Test plain access checks leave the budget untouched."""
+        usage = self._usage(limit_value=100)
+        cache.remember(usage)
+
+        for _ in range(5):
+            assert cache.admit(usage.organization_id, usage.feature_name, 50) == 100
+
+    def test_expired_entry_requires_exact_check(self):
+        """Test entries are only trusted for the TTL."""
+        cache = UsageBudgetCache(ttl_seconds=0)
+        usage = self._usage(limit_value=-1)
+        cache.remember(usage)
+
+        assert cache.admit(usage.organization_id, usage.feature_name) is None
+
+    def test_invalidate_organization(self, cache):
+        """Test invalidation drops every feature of the organization."""
+        usage = self._usage(limit_value=-1)
+        cache.remember(usage)
+
+        cache.invalidate(usage.organization_id)
+
+        assert cache.admit(usage.organization_id, usage.feature_name) is None
+        assert cache.get_cache_info()["cache_size"] == 0
@@ -0,0 +1,53 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
+from uuid import uuid4
+
+from plans.domain.entities.feature_usage import FeatureUsage, UsagePeriod
+from plans.domain.entities.usage_bucket import UsageBucket
+from plans.domain.services.usage_tracking_service import UsageTrackingService
+
+
+class TestUsageTrackingServiceTrends:
+    """Unit tests for calendar-month usage trends."""
+
+    def test_months_without_rollups_use_counters_or_zero(self):
+        """Test trends cover every month, newest first, even before rollups existed."""
+        organization_id = uuid4()
+        this_month = datetime.now(timezone.utc).replace(
+            day=1, hour=0, minute=0, second=0, microsecond=0
+        )
+        last_month = (this_month - timedelta(days=1)).replace(day=1)
+
+        counter = FeatureUsage.create(
+            organization_id=organization_id,
+            feature_name="monthly_messages",
+            usage_period=UsagePeriod.MONTHLY,
+            limit_value=100,
+            current_usage=25,
+        ).model_copy(update={"period_start": last_month})
+
+        usage_repository = Mock()
+        usage_repository.get_current_usage.return_value = None
+        usage_repository.get_organization_usage.return_value = [counter]
+        usage_event_repository = Mock()
+        usage_event_repository.get_buckets.return_value = [
+            UsageBucket.for_moment(
+                organization_id=organization_id,
+                feature_name="monthly_messages",
+                granularity=UsagePeriod.MONTHLY,
+                moment=this_month,
+                total_usage=40,
+                event_count=4,
+            )
+        ]
+
+        service = UsageTrackingService(
+            usage_repository, Mock(), Mock(), usage_event_repository
+        )
+        trends = service.get_usage_analytics(organization_id, "monthly_messages", 3)[
+            "trends"
+        ]
+
+        assert [trend["usage"] for trend in trends] == [40, 25, 0]
+        assert trends[1]["period_start"] == last_month.isoformat()
+        assert trends[1]["usage_percentage"] == 25
@@ -0,0 +1,48 @@
+import pytest
+
+from plans.domain.value_objects.chat_configuration import ChatIframeConfiguration
+from plans.domain.value_objects.domain_matcher import DomainMatcher
+
+
+class TestDomainMatcher:
+    """Test cases for DomainMatcher exact and wildcard matching."""
+
+    @pytest.fixture
+    def matcher(self):
+        return DomainMatcher.compile(["Example.com", "*.shop.example.org", "app.test"])
+
+    def test_exact_hosts_match_case_insensitively(self, matcher):
+        """Test exact entries match regardless of case, port and trailing dot."""
+        assert matcher.matches("example.com")
+        assert matcher.matches("EXAMPLE.COM:8443")
+        assert matcher.matches("app.test.")
+        assert not matcher.matches("www.example.com")
+
+    def test_wildcards_match_subdomains_only(self, matcher):
+        """Test *.suffix matches any depth below the suffix but not the suffix."""
+        assert matcher.matches("eu.shop.example.org")
+        assert matcher.matches("a.b.shop.example.org")
+        assert not matcher.matches("shop.example.org")
+        assert not matcher.matches("example.org")
+        assert not matcher.matches("evilshop.example.org")
+
+
+class TestChatIframeConfigurationDomains:
+    """Test cases for ChatIframeConfiguration.is_domain_allowed."""
+
+    def test_matcher_is_reused_until_domains_change(self):
+        """Test copies share the compiled matcher and domain edits recompile it."""
+        config = ChatIframeConfiguration(allowed_domains=["*.example.com"])
+        matcher = config.domain_matcher
+
+        themed = config.update_position("top-left")
+        extended = config.add_allowed_domain("partner.io")
+
+        assert config.is_domain_allowed("www.example.com")
+        assert themed.domain_matcher is matcher
+        assert extended.is_domain_allowed("partner.io")
+        assert not config.is_domain_allowed("partner.io")
+
+    def test_empty_allow_list_allows_all(self):
+        """Test no configured domains keeps embedding open to every host."""
+        assert ChatIframeConfiguration().is_domain_allowed("anything.example")
@@ -0,0 +1,65 @@
+from unittest.mock import Mock
+from uuid import uuid4
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from plans.domain.value_objects.chat_widget_render import ChatWidgetRender
+from plans.presentation.dependencies import get_chat_widget_use_case
+from plans.presentation.routes.chat_widget_routes import router as chat_widget_router
+
+
+ORGANIZATION_ID = uuid4()
+WIDGET = ChatWidgetRender(
+    version="1",
+    etag='"3f9a0c1b2d4e5f60"',
+    client_config_json='{"theme":"light"}',
+    embed_html="<iframe></iframe>",
+)
+
+
+def _client(widget=WIDGET) -> TestClient:
+    use_case = Mock()
+    use_case.get_widget.return_value = widget
+
+    app = FastAPI()
+    app.include_router(chat_widget_router, prefix="/api/v1/plans")
+    app.dependency_overrides[get_chat_widget_use_case] = lambda: use_case
+    return TestClient(app)
+
+
+class TestChatWidgetRoutes:
+    """Tests for the chat widget bootstrap endpoints."""
+
+    def test_config_revalidates_with_etag(self):
+        """Test a request with the returned ETag gets 304 without a body."""
+        client = _client()
+        url = f"/api/v1/plans/chat-widget/{ORGANIZATION_ID}/config"
+
+        first = client.get(url)
+        assert first.status_code == 200
+        assert first.json() == {"theme": "light"}
+        assert first.headers["ETag"] == WIDGET.etag
+
+        second = client.get(url, headers={"If-None-Match": first.headers["ETag"]})
+        assert second.status_code == 304
+        assert second.content == b""
+        assert second.headers["ETag"] == WIDGET.etag
+
+    def test_embed_with_stale_etag_is_sent_again(self):
+        """Test a changed configuration is sent in full."""
+        response = _client().get(
+            f"/api/v1/plans/chat-widget/{ORGANIZATION_ID}/embed",
+            headers={"If-None-Match": '"stale"'},
+        )
+
+        assert response.status_code == 200
+        assert response.text == WIDGET.embed_html
+
+    def test_disabled_widget_is_not_found(self):
+        """Test organizations without the iframe chat get 404."""
+        response = _client(widget=None).get(
+            f"/api/v1/plans/chat-widget/{ORGANIZATION_ID}/config"
+        )
+
+        assert response.status_code == 404
@@ -0,0 +1,52 @@
+import pytest
+from sqlalchemy import create_engine, text
+
+from src.shared.infrastructure.database.query_stats import (
+    QueryBudgetExceededError,
+    assert_max_queries,
+    fingerprint,
+    instrument_engine,
+    track_queries,
+)
+
+
+class TestQueryStats:
+    """Test cases for per-scope SQL statement counting."""
+
+    def setup_method(self):
+        self.engine = create_engine("sqlite://")
+        instrument_engine(self.engine)
+
+    def test_counts_statements_and_repeated_fingerprints(self):
+        """Test statements are counted and repeats grouped by fingerprint."""
+        with track_queries() as stats, self.engine.connect() as conn:
+            for value in range(6):
+                conn.execute(text("SELECT :value"), {"value": value})
+            conn.execute(text("SELECT 1"))
+
+        assert stats.count == 7
+        assert stats.duration >= 0
+        assert stats.get_repeated_statements() == [("SELECT ?", 6)]
+
+    def test_statements_outside_scope_are_not_recorded(self):
+        """Test nothing is recorded when no scope is tracked."""
+        with self.engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+
+        with track_queries() as stats:
+            pass
+
+        assert stats.count == 0
+
+    def test_fingerprint_collapses_in_lists(self):
+        """Test IN lists of different lengths share a fingerprint."""
+        assert fingerprint("SELECT * FROM t WHERE id IN (?, ?, ?)") == fingerprint(
+            "SELECT *\n FROM t WHERE id IN (?, ?)"
+        )
+
+    def test_budget_exceeded_raises(self):
+        """Test exceeding the query budget fails."""
+        with pytest.raises(QueryBudgetExceededError):
+            with assert_max_queries(1), self.engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+                conn.execute(text("SELECT 2"))
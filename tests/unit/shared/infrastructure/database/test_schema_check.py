@@ -0,0 +1,54 @@
+import pytest
+from sqlalchemy import create_engine, event, text
+
+from src.shared.infrastructure.database.schema_check import (
+    SchemaRevisionError,
+    get_head_revisions,
+    verify_schema_revision,
+)
+
+
+@pytest.fixture
+def engine():
+    """SQLite engine with the application schema attached."""
+    engine = create_engine("sqlite://")
+
+    @event.listens_for(engine, "connect")
+    def attach_schema(dbapi_connection, connection_record):
+        dbapi_connection.execute("ATTACH DATABASE ':memory:' AS contas")
+
+    return engine
+
+
+def _stamp(engine, revision):
+    with engine.begin() as connection:
+        connection.execute(
+            text("CREATE TABLE contas.alembic_version (version_num VARCHAR(32))")
+        )
+        connection.execute(
+            text("INSERT INTO contas.alembic_version VALUES (:revision)"),
+            {"revision": revision},
+        )
+
+
+class TestSchemaCheck:
+    """Test cases for the startup schema revision check."""
+
+    def test_head_database_passes(self, engine):
+        """Test a database stamped at the head revision passes."""
+        heads = get_head_revisions()
+        _stamp(engine, next(iter(heads)))
+
+        assert verify_schema_revision(engine) == heads
+
+    def test_outdated_database_fails(self, engine):
+        """Test a database behind the head revision is rejected."""
+        _stamp(engine, "0000000000")
+
+        with pytest.raises(SchemaRevisionError, match="alembic upgrade head"):
+            verify_schema_revision(engine)
+
+    def test_unmigrated_database_fails(self, engine):
+        """Test a database without alembic_version is rejected."""
+        with pytest.raises(SchemaRevisionError, match="none"):
+            verify_schema_revision(engine)
@@ -0,0 +1,82 @@
+import pytest
+from sqlalchemy import Column, Integer, MetaData, String, Table, create_engine, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+from sqlalchemy.schema import CreateIndex
+
+from src.shared.infrastructure.database.search import (
+    TextSearch,
+    count_capped,
+    trigram_index,
+)
+
+metadata = MetaData()
+items = Table(
+    "items",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("name", String(100)),
+    Column("description", String(255)),
+    trigram_index("ix_items_name_trgm", "name"),
+)
+
+
+@pytest.fixture
+def session():
+    """SQLite session over a few searchable rows (plain index fallback)."""
+    engine = create_engine("sqlite://")
+    metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(
+            items.insert(),
+            [
+                {"id": 1, "name": "Enterprise admin", "description": "admin tools"},
+                {"id": 2, "name": "admin", "description": None},
+                {"id": 3, "name": "Starter", "description": "no admin"},
+                {"id": 4, "name": "100% off", "description": "promo"},
+                {"id": 5, "name": "1000 seats", "description": "large"},
+            ],
+        )
+    with Session(engine) as session:
+        yield session
+
+
+class TestTextSearch:
+    """Unit tests for the shared text search query builder."""
+
+    def test_matches_any_column_ranked_by_relevance(self, session):
+        """Test exact matches come first, then prefix matches."""
+        search = TextSearch("admin", items.c.name, items.c.description)
+        stmt = search.ranked(
+            select(items.c.id).where(search.condition()), session
+        ).order_by(items.c.id)
+
+        assert session.execute(stmt).scalars().all() == [2, 1, 3]
+
+    def test_wildcards_are_matched_literally(self, session):
+        """Test % and _ in the term do not act as wildcards."""
+        search = TextSearch("100%", items.c.name)
+
+        ids = session.execute(select(items.c.id).where(search.condition())).scalars()
+        assert list(ids) == [4]
+
+    def test_postgresql_uses_trigram_similarity_and_gin_index(self):
+        """Test PostgreSQL ranks by similarity over gin_trgm_ops indexes."""
+        search = TextSearch("admin", items.c.name, items.c.description)
+        relevance = str(search.relevance("postgresql").compile(dialect=postgresql.dialect()))
+        (index,) = items.indexes
+        ddl = str(CreateIndex(index).compile(dialect=postgresql.dialect()))
+
+        assert "greatest(similarity(items.name" in relevance
+        assert "USING gin (name gin_trgm_ops)" in ddl
+
+
+class TestCountCapped:
+    """Unit tests for capped result counts."""
+
+    def test_counts_matches_up_to_cap(self, session):
+        """Test counting stops at the cap and is exact without one."""
+        stmt = select(items).where(items.c.id > 1).order_by(items.c.name)
+
+        assert count_capped(session, stmt, cap=2) == 2
+        assert count_capped(session, stmt, cap=0) == 4
@@ -0,0 +1,69 @@
+from src.shared.infrastructure.metrics.http_metrics import HttpMetrics, UNMATCHED_ROUTE
+from src.shared.infrastructure.metrics.registry import MetricsRegistry
+
+
+class _Route:
+    def __init__(self, path):
+        self.path = path
+
+
+class TestMetricsRegistry:
+    """Test cases for the Prometheus text metrics registry."""
+
+    def setup_method(self):
+        self.registry = MetricsRegistry()
+
+    def test_histogram_renders_cumulative_buckets(self):
+        """Test histogram buckets are cumulative with sum and count."""
+        histogram = self.registry.histogram(
+            "latency_seconds", "Latency.", ("route",), buckets=(0.1, 1.0)
+        )
+        child = histogram.labels("/users")
+        for value in (0.05, 0.5, 0.7, 3.0):
+            child.observe(value)
+
+        output = self.registry.render()
+
+        assert 'latency_seconds_bucket{route="/users",le="0.1"} 1' in output
+        assert 'latency_seconds_bucket{route="/users",le="1"} 3' in output
+        assert 'latency_seconds_bucket{route="/users",le="+Inf"} 4' in output
+        assert 'latency_seconds_count{route="/users"} 4' in output
+        assert "# TYPE latency_seconds histogram" in output
+
+    def test_collectors_render_numeric_fields(self):
+        """Test collector stats are rendered as labeled gauges."""
+        self.registry.register_collector(
+            "app_cache_info",
+            "Cache state.",
+            lambda: {"hits": 3, "cache_enabled": True, "name": "skipped"},
+            labels={"cache": "policy_index"},
+        )
+
+        output = self.registry.render()
+
+        assert 'app_cache_info{cache="policy_index",field="hits"} 3' in output
+        assert 'app_cache_info{cache="policy_index",field="cache_enabled"} 1' in output
+        assert "skipped" not in output
+
+    def test_route_metrics_use_route_template(self):
+        """Test requests are labeled by route template, unmatched paths grouped."""
+        http_metrics = HttpMetrics(self.registry)
+
+        route_metrics = http_metrics.get_route_metrics("GET", _Route("/users/{id}"))
+        route_metrics.observe(0.02, 200)
+        route_metrics.observe(0.03, 200)
+        http_metrics.get_route_metrics("GET", None).observe(0.01, 404)
+
+        output = self.registry.render()
+
+        assert route_metrics is http_metrics.get_route_metrics(
+            "GET", _Route("/users/{id}")
+        )
+        assert (
+            'http_requests_total{method="GET",route="/users/{id}",status="200"} 2'
+            in output
+        )
+        assert (
+            f'http_requests_total{{method="GET",route="{UNMATCHED_ROUTE}",status="404"}} 1'
+            in output
+        )
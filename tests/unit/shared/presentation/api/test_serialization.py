@@ -0,0 +1,101 @@
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+from uuid import UUID, uuid4
+
+from fastapi import FastAPI, Response
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from src.shared.presentation.serialization import (
+    FastJSONResponse,
+    install_fast_serialization,
+)
+
+
+ITEM_ID = uuid4()
+CREATED_AT = datetime(2024, 1, 2, 3, 4, 5, 678000, tzinfo=timezone.utc)
+
+
+class ItemDTO(BaseModel):
+    id: UUID
+    name: str
+    created_at: datetime
+    description: Optional[str] = None
+
+
+class ItemWithSecretDTO(ItemDTO):
+    secret: str
+
+
+def _build_app(fast: bool) -> FastAPI:
+    app = FastAPI(default_response_class=FastJSONResponse if fast else JSONResponse)
+
+    def item():
+        return ItemDTO(id=ITEM_ID, name="a", created_at=CREATED_AT)
+
+    @app.get("/items", response_model=List[ItemDTO])
+    def list_items():
+        return [item(), item()]
+
+    @app.get("/items/compact", response_model=ItemDTO, response_model_exclude_none=True)
+    def get_compact_item():
+        return item()
+
+    @app.get("/items/subclass", response_model=ItemDTO)
+    def get_subclass_item():
+        return ItemWithSecretDTO(
+            id=ITEM_ID, name="a", created_at=CREATED_AT, secret="hidden"
+        )
+
+    @app.get("/summary", response_model=Dict[str, Any])
+    async def summary():
+        return {"organization_id": ITEM_ID, "generated_at": CREATED_AT, "total": 3}
+
+    @app.get("/untyped")
+    def untyped():
+        return {"organization_id": ITEM_ID, "generated_at": CREATED_AT}
+
+    @app.get("/headers", response_model=ItemDTO)
+    def with_headers(response: Response):
+        response.headers["X-Custom"] = "1"
+        return item()
+
+    if fast:
+        app.installed_routes = install_fast_serialization(app)
+    return app
+
+
+class TestFastSerialization:
+    """Test cases for the fast response serialization path."""
+
+    def setup_method(self):
+        self.fast_app = _build_app(fast=True)
+        self.fast = TestClient(self.fast_app)
+        self.default = TestClient(_build_app(fast=False))
+
+    def test_responses_match_default_serialization(self):
+        """Test fast responses carry the same JSON as FastAPI's encoder."""
+        for path in [
+            "/items",
+            "/items/compact",
+            "/items/subclass",
+            "/summary",
+            "/untyped",
+        ]:
+            fast_response = self.fast.get(path)
+            default_response = self.default.get(path)
+
+            assert fast_response.status_code == default_response.status_code == 200
+            assert fast_response.json() == default_response.json()
+
+    def test_subclass_instances_are_filtered_to_declared_model(self):
+        """Test fields outside the response model are not leaked."""
+        assert "secret" not in self.fast.get("/items/subclass").json()
+
+    def test_routes_with_response_parameter_are_skipped(self):
+        """Test routes setting headers through Response keep the regular path."""
+        response = self.fast.get("/headers")
+
+        assert self.fast_app.installed_routes == 5
+        assert response.headers["X-Custom"] == "1"